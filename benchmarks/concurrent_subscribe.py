@@ -0,0 +1,49 @@
+"""
+같은 이메일 동시 구독 부하 테스트
+
+같은 주소로 구독 요청을 동시에 보낸 뒤 email-index에 남은 사용자 수를 센다.
+정상이라면 항상 1명이어야 한다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/concurrent_subscribe.py -n 100
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.repositories.user_repository import user_repository
+from dailydevq_backend.schemas.user import UserCreate
+from dailydevq_backend.services.user_service import user_service
+
+
+async def run(parallel: int, email: str) -> int:
+    await async_dynamodb_client.start()
+    try:
+        started = time.perf_counter()
+        users = await asyncio.gather(
+            *(user_service.create_user(UserCreate(email=email)) for _ in range(parallel))
+        )
+        elapsed = time.perf_counter() - started
+
+        items = await user_repository.query_index("email-index", "email", email)
+        distinct_ids = {user.id for user in users}
+        print(f"email={email} parallel={parallel} elapsed={elapsed * 1000:.0f}ms")
+        print(f"users in table={len(items)} distinct ids returned={len(distinct_ids)}")
+        return 0 if len(items) == 1 and len(distinct_ids) == 1 else 1
+    finally:
+        await async_dynamodb_client.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--parallel", type=int, default=100)
+    parser.add_argument("--email", default=None)
+    args = parser.parse_args()
+    email = args.email or f"race-{uuid4().hex[:12]}@example.com"
+    raise SystemExit(asyncio.run(run(args.parallel, email)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+설정 다시 읽기 벤치마크 (CORS_ORIGINS/JWT 키 변경: 다시 읽기 vs 워커 재시작)
+
+`python -m dailydevq_backend.server --workers N`을 CONFIG_FILE(임시 env 파일)로 띄우고,
+--connections개 연결로 Origin 헤더를 붙인 GET /api/v1/ping을 계속 보내는 동안 env 파일의
+CORS_ORIGINS와 JWT_SECRET을 바꾼다. 모든 응답이 새 origin을 허용할 때까지의 시간, 그 사이
+실패한 요청 수, 최대 지연 시간을 두 방식으로 잰다.
+
+1) reload: CONFIG_RELOAD_SECONDS마다 워커가 파일을 확인해 스냅샷만 교체
+2) restart: 부모 프로세스에 SIGHUP (uvicorn이 워커를 모두 새로 띄운다, 콜드 스타트)
+
+스냅샷 하나를 만드는 데 드는 시간(HS256/ES256 키 파싱 포함)도 함께 출력한다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/config_reload.py --workers 2
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from dailydevq_backend.core.config import Settings
+from dailydevq_backend.core.runtime_config import RuntimeConfig
+from dailydevq_backend.utils.jwt import KEY_SETTINGS, build_keys
+
+OLD_ORIGIN = "http://old.example.com"
+NEW_ORIGIN = "http://new.example.com"
+RELOAD_INTERVAL = 0.5
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def write_config(path: str, origin: str, secret: str) -> None:
+    with open(path, "w") as f:
+        f.write(f"CORS_ORIGINS={origin}\nJWT_SECRET={secret}\n")
+
+
+def snapshot_cost(n: int) -> None:
+    """스냅샷 하나를 새로 만드는 시간 (다시 읽기에서 워커가 멈추는 시간)"""
+    pem = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    for algorithm, extra in (("HS256", {}), ("ES256", {"JWT_PRIVATE_KEY": pem})):
+        config = RuntimeConfig(Settings(JWT_ALGORITHM=algorithm, **extra))
+        config.derive("jwt", KEY_SETTINGS, build_keys)
+        current = config.current
+        started = time.perf_counter()
+        for i in range(n):
+            changed = current.settings.model_copy(update={"JWT_SECRET": f"s{i}"})
+            config._build(changed, current.version + 1, previous=current)
+        elapsed = (time.perf_counter() - started) / n
+        print(f"  스냅샷 생성 ({algorithm}) {elapsed * 1e6:8.1f} µs")
+
+
+def start_server(workers: int, port: int, config_path: str, interval: float) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "CONFIG_FILE": config_path,
+        "CONFIG_RELOAD_SECONDS": str(interval),
+        "RATE_LIMIT_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+    }
+    command = [sys.executable, "-m", "dailydevq_backend.server", "--workers", str(workers)]
+    process = subprocess.Popen(command + ["--host", "127.0.0.1", "--port", str(port)], env=env)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise Exception("Failed to start server: no response from /health within 60s")
+
+
+async def switch(base_url: str, connections: int, change, timeout: float) -> Dict[str, float]:
+    """부하를 보내는 중에 change()를 실행하고, 모든 연결이 새 origin을 볼 때까지 측정"""
+    stats: Dict[str, List[float]] = {"latencies": [], "failures": []}
+    switched_at: Dict[int, float] = {}
+    done = asyncio.Event()
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        async def loop(index: int) -> None:
+            # 연결마다 새 origin 응답을 연속 3번 받으면 전환된 것으로 본다
+            streak = 0
+            while not done.is_set():
+                sent = time.perf_counter()
+                try:
+                    response = await client.get("/api/v1/ping", headers={"Origin": NEW_ORIGIN})
+                except httpx.TransportError:
+                    stats["failures"].append(1)
+                    await asyncio.sleep(0.05)
+                    continue
+                stats["latencies"].append(time.perf_counter() - sent)
+                if response.status_code != 200:
+                    stats["failures"].append(1)
+                allowed = response.headers.get("access-control-allow-origin") == NEW_ORIGIN
+                streak = streak + 1 if allowed else 0
+                if streak == 3 and index not in switched_at:
+                    switched_at[index] = time.perf_counter()
+                    if len(switched_at) == connections:
+                        done.set()
+
+        tasks = [asyncio.create_task(loop(i)) for i in range(connections)]
+        await asyncio.sleep(1)
+        started = time.perf_counter()
+        change()
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except TimeoutError:
+            pass
+        done.set()
+        await asyncio.gather(*tasks)
+
+    converged = max(switched_at.values()) - started if len(switched_at) == connections else None
+    return {
+        "converged": converged,
+        "failures": len(stats["failures"]),
+        "max_latency_ms": max(stats["latencies"], default=0) * 1000,
+    }
+
+
+def run(mode: str, args: argparse.Namespace) -> Dict[str, float]:
+    with tempfile.NamedTemporaryFile("w", suffix=".env", delete=False) as f:
+        path = f.name
+    write_config(path, OLD_ORIGIN, "old-secret")
+    port = free_port()
+    # restart는 파일 확인을 꺼서 재시작한 워커만 새 설정을 읽게 한다
+    server = start_server(args.workers, port, path, RELOAD_INTERVAL if mode == "reload" else 0)
+    try:
+
+        def change() -> None:
+            write_config(path, NEW_ORIGIN, "new-secret")
+            if mode == "restart":
+                server.send_signal(signal.SIGHUP)
+
+        base_url = f"http://127.0.0.1:{port}"
+        return asyncio.run(switch(base_url, args.connections, change, args.timeout))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+        os.unlink(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("-n", type=int, default=200, help="스냅샷 생성 시간 측정 횟수")
+    args = parser.parse_args()
+
+    print(f"[워커 {args.workers}, 연결 {args.connections}, 파일 확인 주기 {RELOAD_INTERVAL}s]")
+    snapshot_cost(args.n)
+    ok = True
+    for mode in ("reload", "restart"):
+        result = run(mode, args)
+        converged = result["converged"]
+        shown = f"{converged:6.2f}s" if converged is not None else "  시간 초과"
+        print(
+            f"  {mode:<8} 전환 {shown} | 실패 요청 {result['failures']} | "
+            f"최대 지연 {result['max_latency_ms']:7.1f}ms"
+        )
+        if mode == "reload":
+            ok = converged is not None and result["failures"] == 0
+    if not ok:
+        print("❌ 다시 읽기 중 요청이 실패했거나 새 설정이 반영되지 않았습니다")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
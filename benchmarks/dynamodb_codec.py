@@ -0,0 +1,97 @@
+"""
+DynamoDB 스캔 페이지 디코딩 벤치마크
+
+1MB(스캔 한 페이지 최대 크기) 분량의 사용자 아이템을 저수준 형식으로 만들어 두고,
+같은 페이지를 다음 방법으로 디코딩하는 처리량을 비교한다.
+
+1) resource: boto3 resource 계층이 하는 변환(TransformationInjector, Decimal) + UserModel.from_dict
+2) decode_item: repositories.codec.decode_item (프로젝션 조회/스캔 경로)
+3) from_wire: UserModel.from_wire (사용자 조회 경로)
+
+응답 JSON 파싱(json.loads)은 세 경로가 똑같이 거치므로 참고용으로 따로 출력한다.
+
+    python benchmarks/dynamodb_codec.py --pages 20
+"""
+
+import argparse
+import copy
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from boto3.dynamodb.transform import TransformationInjector
+from botocore.session import get_session
+
+from dailydevq_backend.models.user import UserModel
+from dailydevq_backend.repositories.codec import decode_item
+from dailydevq_backend.schemas.user import AuthProvider
+
+PAGE_BYTES = 1024 * 1024
+
+
+def build_page() -> List[Dict[str, Any]]:
+    """JSON 크기 기준 1MB가 될 때까지 사용자 아이템을 채운 스캔 페이지"""
+    items = []
+    size = 0
+    i = 0
+    while size < PAGE_BYTES:
+        if i % 3 == 0:
+            user = UserModel(
+                email=f"user{i}@example.com",
+                auth_provider=AuthProvider.GOOGLE,
+                google_id=f"1{i:020d}",
+                name=f"사용자 {i}",
+                profile_image=f"https://lh3.googleusercontent.com/a/{i:032d}=s96-c",
+            )
+        else:
+            user = UserModel(email=f"user{i}@example.com")
+        item = user.to_wire()
+        size += len(json.dumps(item))
+        items.append(item)
+        i += 1
+    return items
+
+
+def measure(
+    label: str, func: Callable[[List[Dict[str, Any]]], Any], page, pages: int, copy_page: bool = False
+) -> float:
+    elapsed = 0.0
+    for _ in range(pages):
+        # resource 변환은 응답을 제자리에서 바꾸므로 매번 새 페이지를 준다 (복사 시간은 제외)
+        data = copy.deepcopy(page) if copy_page else page
+        started = time.perf_counter()
+        func(data)
+        elapsed += time.perf_counter() - started
+    per_page = elapsed / pages
+    print(
+        f"  {label:<12} {per_page * 1000:7.2f}ms/페이지  {len(page) / per_page:10.0f} 아이템/s"
+        f"  {1 / per_page:7.1f}MB/s"
+    )
+    return per_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+
+    page = build_page()
+    body = json.dumps({"Items": page, "Count": len(page), "ScannedCount": len(page)})
+    operation = get_session().get_service_model("dynamodb").operation_model("Scan")
+    injector = TransformationInjector()
+
+    def resource(items):
+        parsed = {"Items": items}
+        injector.inject_attribute_value_output(parsed, operation)
+        return [UserModel.from_dict(item) for item in parsed["Items"]]
+
+    print(f"[스캔 페이지 {len(body) / 1024 / 1024:.2f}MB, 아이템 {len(page)}개, {args.pages}회 평균]")
+    measure("json.loads", lambda _: json.loads(body), page, args.pages)
+    before = measure("resource", resource, page, args.pages, copy_page=True)
+    measure("decode_item", lambda items: [decode_item(item) for item in items], page, args.pages)
+    after = measure("from_wire", lambda items: [UserModel.from_wire(item) for item in items], page, args.pages)
+    print(f"  resource → from_wire {before / after:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+DynamoDB 장애 주입 벤치마크 (스로틀 폭주/응답 지연/5xx에서 워커가 버티는지)
+
+DynamoDB JSON 프로토콜을 흉내 내는 로컬 서버를 별도 스레드에 띄우고 구독 상태 조회
+(UserService.get_subscription_status)를 동시에 보낸다.
+
+1) 정상 응답으로 이메일 절반을 캐시에 채우고 로컬 TTL이 지나 만료되기를 기다린다
+2) 서버를 장애 모드로 바꾸고 --seconds 동안 -c개의 동시 사용자가 --think-ms 간격으로 조회를 보낸다
+   (캐시에 있던 이메일과 처음 보는 이메일을 반반 섞는다)
+3) 장애 구간이 끝난 뒤 진행 중인 호출이 모두 끝날 때까지 걸린 시간을 잰다
+4) 서버를 정상으로 되돌리고 서킷이 다시 닫히는지 확인한다 (policy만)
+
+같은 시나리오를 botocore 기본 설정(legacy 재시도, 읽기 타임아웃 60초, 커넥션 10개, 서킷/stale 없음)과
+이 저장소의 정책(dynamodb_config + 서킷 브레이커 + stale 캐시)으로 각각 실행한다.
+이벤트 루프 지연은 10ms 주기 타이머가 늦어진 정도로, 같은 워커의 다른 요청(/health/live 등)이
+기다리는 시간에 해당한다. policy 결과가 기준(루프 지연 p99 --max-lag-ms, 호출 시간 예산)을 넘으면 종료 코드 1.
+
+    python benchmarks/dynamodb_faults.py --fault throttle -c 100 --seconds 10
+    python benchmarks/dynamodb_faults.py --fault slow --policies policy
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+from dailydevq_backend.core.cache import TwoTierCache
+from dailydevq_backend.core.circuit_breaker import CLOSED, CircuitBreaker, CircuitOpenError
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.repositories.user_repository import UserRepository
+from dailydevq_backend.services.user_service import UserService, user_cache
+
+ERROR_TYPE = "com.amazonaws.dynamodb.v20120810#{}"
+
+# botocore 기본값 (DynamoDB legacy 재시도는 최대 10회 시도)
+BASELINE_SETTINGS = {
+    "DYNAMODB_RETRY_MODE": "legacy",
+    "DYNAMODB_MAX_ATTEMPTS": 10,
+    "DYNAMODB_CONNECT_TIMEOUT_SECONDS": 60.0,
+    "DYNAMODB_REQUEST_DEADLINE_SECONDS": 10 * 120.0,
+    "DYNAMODB_MAX_POOL_CONNECTIONS": 10,
+}
+
+
+class StandIn:
+    """장애 모드를 바꿀 수 있는 DynamoDB 대역 서버 (ok | throttle | slow | error)"""
+
+    def __init__(self, port: int, slow_seconds: float):
+        self.port = port
+        self.slow_seconds = slow_seconds
+        self.mode = "ok"
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._loop = None
+
+    def reset_counters(self) -> None:
+        self.requests = 0
+        self.max_in_flight = self.in_flight
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await self._respond(request)
+        finally:
+            self.in_flight -= 1
+
+    async def _respond(self, request: web.Request) -> web.Response:
+        operation = request.headers.get("X-Amz-Target", "").rsplit(".", 1)[-1]
+        body = await request.json()
+        if self.mode == "throttle":
+            return self._error(400, "ProvisionedThroughputExceededException")
+        if self.mode == "error":
+            return self._error(500, "InternalServerError")
+        if self.mode == "slow":
+            await asyncio.sleep(self.slow_seconds)
+
+        if operation == "GetItem":
+            key = body["Key"]["id"]["S"]
+            # 캐시에 없던 이메일은 "처음 보는" 사용자로 나눠 두기 위해 이름으로 구분한다
+            if key.startswith("missing"):
+                return self._json({})
+            return self._json({"Item": {"id": {"S": key}, "subscription_status": {"S": "active"}}})
+        if operation == "Query":
+            return self._json({"Items": [], "Count": 0, "ScannedCount": 0})
+        return self._json({})
+
+    def _json(self, payload: Dict[str, Any], status: int = 200) -> web.Response:
+        return web.json_response(payload, status=status, content_type="application/x-amz-json-1.0")
+
+    def _error(self, status: int, code: str) -> web.Response:
+        return self._json({"__type": ERROR_TYPE.format(code), "message": code}, status=status)
+
+    def start(self) -> None:
+        ready = threading.Event()
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            app = web.Application()
+            app.router.add_post("/", self.handle)
+            runner = web.AppRunner(app, access_log=None)
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, "127.0.0.1", self.port, backlog=1024)
+            loop.run_until_complete(site.start())
+            self._loop = loop
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        ready.wait()
+
+    def stop(self) -> None:
+        """slow 모드에서 아직 응답하지 않은 요청을 취소하고 서버 루프 종료"""
+        if self._loop is None:
+            return
+
+        async def cancel_pending():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(cancel_pending(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> List[float]:
+    """interval마다 깨어나는 타이머가 늦어진 시간 목록 (ms)"""
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+    return lags
+
+
+async def run_policy(policy: str, stand_in: StandIn, args: argparse.Namespace) -> Dict[str, Any]:
+    overrides = BASELINE_SETTINGS if policy == "baseline" else {}
+    saved = {name: getattr(settings, name) for name in BASELINE_SETTINGS}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+    breaker = None
+    if policy == "policy":
+        breaker = CircuitBreaker(
+            "dynamodb",
+            failure_threshold=settings.DYNAMODB_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=args.reset_seconds,
+        )
+    client = AsyncDynamoDBClient(breaker=breaker)
+    await client.start()
+
+    # policy는 user_cache와 같은 stale 설정 (로컬 TTL만 짧게 해 바로 만료시킨다)
+    cache = TwoTierCache(
+        namespace="faults",
+        local_maxsize=100_000,
+        local_ttl=0.5,
+        redis_ttl=0,
+        negative_ttl=0,
+        stale_ttl=user_cache.local.stale_ttl if policy == "policy" else 0,
+        serve_stale_on=user_cache.serve_stale_on if policy == "policy" else (),
+    )
+    service = UserService(UserRepository(client), cache)
+
+    cached = [f"user{i}@example.com" for i in range(args.emails)]
+    unseen = [f"missing{i}@example.com" for i in range(args.emails)]
+    stand_in.mode = "ok"
+    for email in cached:
+        await service.get_subscription_status(email)
+    # 로컬 TTL이 지나 캐시 값이 모두 만료되게 한다
+    await asyncio.sleep(1.0)
+
+    outcomes: Counter = Counter()
+    latencies: List[float] = []
+    in_flight = 0
+    storm_end = time.monotonic() + args.seconds
+
+    async def user() -> None:
+        nonlocal in_flight
+        while time.monotonic() < storm_end:
+            email = random.choice(cached) if random.random() < 0.5 else random.choice(unseen)
+            in_flight += 1
+            started = time.perf_counter()
+            try:
+                await service.get_subscription_status(email)
+                outcomes["ok"] += 1
+            except CircuitOpenError:
+                outcomes["fast_fail"] += 1
+            except Exception:
+                outcomes["error"] += 1
+            finally:
+                in_flight -= 1
+            latencies.append((time.perf_counter() - started) * 1000)
+            # 사용자마다 요청 사이에 쉬어 두 정책에 같은 부하를 준다
+            await asyncio.sleep(args.think_ms / 1000)
+
+    stand_in.mode = args.fault
+    stand_in.reset_counters()
+    stop_lag = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop_lag))
+    users = [asyncio.create_task(user()) for _ in range(args.concurrency)]
+    started = time.monotonic()
+
+    await asyncio.sleep(args.seconds)
+    in_flight_at_end = in_flight
+    _, pending = await asyncio.wait(users, timeout=args.drain_seconds)
+    drain_seconds = time.monotonic() - started - args.seconds
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    stop_lag.set()
+    loop_lags = await lag_task
+    elapsed = time.monotonic() - started
+
+    recovered = None
+    if breaker is not None:
+        stand_in.mode = "ok"
+        await asyncio.sleep(args.reset_seconds)
+        await service.get_subscription_status("recovery@example.com")
+        recovered = breaker.state == CLOSED
+
+    await client.stop()
+    for name, value in saved.items():
+        setattr(settings, name, value)
+    return {
+        "policy": policy,
+        "calls": sum(outcomes.values()),
+        "outcomes": outcomes,
+        "stale": cache.stats()["stale_hits"],
+        "throughput": sum(outcomes.values()) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies, default=0.0),
+        "sent": stand_in.requests,
+        "peak_connections": stand_in.max_in_flight,
+        "in_flight_at_end": in_flight_at_end,
+        "drain_seconds": drain_seconds,
+        "stuck": len(pending),
+        "loop_lag_p99": percentile(loop_lags, 99),
+        "loop_lag_max": max(loop_lags, default=0.0),
+        "opened": breaker.stats()["opened"] if breaker is not None else None,
+        "recovered": recovered,
+    }
+
+
+def report(result: Dict[str, Any]) -> None:
+    outcomes = result["outcomes"]
+    print(f"  [{result['policy']}]")
+    print(
+        f"    호출 {result['calls']}회 ({result['throughput']:.0f}/s)  성공 {outcomes['ok']}"
+        f" (stale {result['stale']})  즉시 실패 {outcomes['fast_fail']}  오류 {outcomes['error']}"
+    )
+    print(
+        f"    지연 p50 {result['p50']:.1f}ms  p99 {result['p99']:.1f}ms  최대 {result['max']:.1f}ms"
+        f"  이벤트 루프 지연 p99 {result['loop_lag_p99']:.1f}ms 최대 {result['loop_lag_max']:.1f}ms"
+    )
+    print(
+        f"    대역 서버 요청 {result['sent']}회  최대 동시 연결 {result['peak_connections']}"
+        f"  종료 시 진행 중 {result['in_flight_at_end']}  정리까지 {result['drain_seconds']:.1f}s"
+        f"  (미완료 {result['stuck']})"
+    )
+    if result["opened"] is not None:
+        print(f"    서킷 열림 {result['opened']}회  복구 후 닫힘 {result['recovered']}")
+
+
+async def run(args: argparse.Namespace) -> int:
+    settings.DYNAMODB_ENDPOINT = f"http://127.0.0.1:{args.port}"
+    settings.METRICS_ENABLED = False
+    stand_in = StandIn(args.port, args.slow_seconds)
+    stand_in.start()
+    print(
+        f"[장애 {args.fault}, 동시 사용자 {args.concurrency}, {args.seconds:.0f}s,"
+        f" 호출 시간 예산 {settings.DYNAMODB_REQUEST_DEADLINE_SECONDS}s]"
+    )
+
+    failed = []
+    try:
+        for policy in args.policies.split(","):
+            result = await run_policy(policy, stand_in, args)
+            report(result)
+            if policy != "policy":
+                continue
+            budget_ms = settings.DYNAMODB_REQUEST_DEADLINE_SECONDS * 1000 * 1.5
+            if result["max"] > budget_ms:
+                failed.append(f"최대 지연 {result['max']:.0f}ms > {budget_ms:.0f}ms")
+            if result["stuck"]:
+                failed.append(f"정리되지 않은 호출 {result['stuck']}개")
+            if result["loop_lag_p99"] > args.max_lag_ms:
+                failed.append(f"이벤트 루프 지연 p99 {result['loop_lag_p99']:.0f}ms > {args.max_lag_ms}ms")
+            if result["recovered"] is False:
+                failed.append("장애 해소 후에도 서킷이 닫히지 않음")
+    finally:
+        stand_in.stop()
+
+    for message in failed:
+        print(f"  ❌ {message}")
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fault", choices=["throttle", "slow", "error"], default="throttle")
+    parser.add_argument("--policies", default="baseline,policy", help="baseline,policy 중 실행할 것")
+    parser.add_argument("-c", "--concurrency", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=10.0, help="장애 지속 시간")
+    parser.add_argument("--think-ms", type=float, default=100.0, help="사용자별 요청 간격")
+    parser.add_argument(
+        "--drain-seconds", type=float, default=30.0, help="장애 후 진행 중 호출을 기다리는 최대 시간"
+    )
+    parser.add_argument("--emails", type=int, default=500, help="미리 캐시에 채울 이메일 수")
+    parser.add_argument("--slow-seconds", type=float, default=20.0, help="slow 모드 응답 지연")
+    parser.add_argument("--reset-seconds", type=float, default=2.0, help="서킷 시험 호출 대기 시간")
+    parser.add_argument("--max-lag-ms", type=float, default=100.0, help="이벤트 루프 지연 p99 기준")
+    parser.add_argument("--port", type=int, default=8765)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
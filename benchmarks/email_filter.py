@@ -0,0 +1,164 @@
+"""
+이메일 필터 벤치마크 (Bloom filter 오탐률/메모리, 새 주소 조회의 DynamoDB 호출 수)
+
+1) Bloom filter: 이메일 --emails개를 넣은 필터에 넣지 않은 이메일을 같은 수만큼 확인해
+   실제 오탐률, 이메일 100만 개당 메모리, 확인 1회 시간을 잰다.
+2) DynamoDB: 벤치마크용 임시 테이블에 사용자 --users명(그중 --legacy-ratio는 이메일로 id를 알 수
+   없는 사용자)을 채우고 이메일 필터를 만든 뒤(build_email_filter), 처음 보는 이메일의 구독 상태 조회를
+   필터 없이(GetItem + email-status-index Query)와 필터로(GetItem만) 비교한다.
+
+캐시는 거치지 않는다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/email_filter.py
+    python benchmarks/email_filter.py --skip-dynamodb --emails 1000000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+
+from dailydevq_backend.core.bloom import BloomFilter
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.migrations.versions import EMAIL_STATUS_GSI, THROUGHPUT
+from dailydevq_backend.models.user import EMAIL_INDEX, UserModel, user_id_for_email
+from dailydevq_backend.repositories.user_repository import BATCH_WRITE_LIMIT, UserRepository
+from dailydevq_backend.services.email_filter import build_email_filter
+from dailydevq_backend.services.user_service import STATUS_PROJECTION
+
+BENCH_TABLE = "email-filter-bench"
+
+
+def bloom_stats(emails: int, error_rate: float) -> None:
+    bloom = BloomFilter(emails, error_rate)
+    started = time.perf_counter()
+    for i in range(emails):
+        bloom.add(f"user{i}@example.com")
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    false_positives = sum(f"new{i}@example.com" in bloom for i in range(emails))
+    check = (time.perf_counter() - started) / emails
+
+    per_million = bloom.memory_bytes / emails * 1_000_000
+    print(f"[Bloom filter: 이메일 {emails}개, 목표 오탐률 {error_rate}, 해시 {bloom.hash_count}개]")
+    print(f"  오탐률      {false_positives / emails:.5f} ({false_positives}/{emails})")
+    memory = f"{bloom.memory_bytes / 2**20:.2f} MiB (100만 개당 {per_million / 2**20:.2f} MiB)"
+    print(f"  메모리      {memory}")
+    print(f"  생성        {build:.2f}s | 확인 {check * 1e6:.2f} µs/회")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+class CallCounter:
+    """botocore 훅으로 DynamoDB 호출 수 집계"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def after_call(self, **kwargs) -> None:
+        self.calls += 1
+
+
+async def create_table(
+    client: AsyncDynamoDBClient, repository: UserRepository, users: int, legacy_ratio: float
+) -> None:
+    dynamodb = await client.get_client()
+    table_name = client.table_name(BENCH_TABLE)
+    await dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "email", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[EMAIL_STATUS_GSI],
+        ProvisionedThroughput=THROUGHPUT,
+    )
+    await dynamodb.get_waiter("table_exists").wait(TableName=table_name)
+
+    legacy = int(users * legacy_ratio)
+    items = []
+    for i in range(users):
+        # 앞쪽 legacy명은 이메일 기반 ID 도입 전처럼 임의 id로 만든다
+        user_id = str(uuid.uuid4()) if i < legacy else ""
+        items.append(UserModel(id=user_id, email=f"user{i}@example.com").to_wire())
+    for i in range(0, len(items), BATCH_WRITE_LIMIT):
+        await repository.batch_put(items[i : i + BATCH_WRITE_LIMIT])
+
+
+async def measure(
+    label: str, lookup: Callable[[str], Awaitable[Any]], emails: List[str], counter: CallCounter
+) -> None:
+    counter.calls = 0
+    latencies = []
+    for email in emails:
+        started = time.perf_counter()
+        if await lookup(email) is not None:
+            raise RuntimeError(f"{label}: unexpected user for {email}")
+        latencies.append((time.perf_counter() - started) * 1000)
+    print(
+        f"  {label:<9} 호출/요청 {counter.calls / len(emails):4.2f}"
+        f"  p50 {percentile(latencies, 50):6.2f}ms  p99 {percentile(latencies, 99):6.2f}ms"
+    )
+
+
+async def run_dynamodb(args: argparse.Namespace) -> None:
+    settings.DYNAMODB_USERS_TABLE = BENCH_TABLE
+    settings.METRICS_ENABLED = False
+    client = AsyncDynamoDBClient()
+    await client.start()
+    repository = UserRepository(client)
+    counter = CallCounter()
+    bloom = BloomFilter(1)
+
+    async def status(email: str, use_filter: bool) -> Dict[str, Any]:
+        item = await repository.get_item(user_id_for_email(email), projection=STATUS_PROJECTION)
+        if item is None and (not use_filter or email in bloom):
+            items = await repository.query_index(EMAIL_INDEX, "email", email)
+            item = items[0] if items else None
+        return item
+
+    try:
+        await create_table(client, repository, args.users, args.legacy_ratio)
+        started = time.perf_counter()
+        bloom, scanned = await build_email_filter(
+            repository, args.users, args.error_rate, page_size=None, interval=0
+        )
+        print(
+            f"[DynamoDB: 사용자 {scanned}명, 인덱스 조회 대상 비율 {args.legacy_ratio},"
+            f" 새 이메일 조회 {args.requests}회 | 필터 생성 {time.perf_counter() - started:.2f}s]"
+        )
+        client.client.meta.events.register("after-call.dynamodb", counter.after_call)
+        emails = [f"new{i}@example.com" for i in range(args.requests)]
+        await measure("no-filter", lambda email: status(email, False), emails, counter)
+        await measure("filter", lambda email: status(email, True), emails, counter)
+    finally:
+        await (await client.get_client()).delete_table(TableName=client.table_name(BENCH_TABLE))
+        await client.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=1_000_000)
+    parser.add_argument("--error-rate", type=float, default=settings.USER_EMAIL_FILTER_ERROR_RATE)
+    parser.add_argument("-n", "--users", type=int, default=2000)
+    parser.add_argument("--legacy-ratio", type=float, default=0.1)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--skip-dynamodb", action="store_true")
+    args = parser.parse_args()
+
+    bloom_stats(args.emails, args.error_rate)
+    if not args.skip_dynamodb:
+        asyncio.run(run_dynamodb(args))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
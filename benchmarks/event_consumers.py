@@ -0,0 +1,118 @@
+"""
+이벤트 소비자 수별 처리량 벤치마크
+
+벤치마크용 Redis 스트림에 구독 이벤트 N개를 넣고, 처리마다 --latency-ms가 걸리는 핸들러
+(SMTP 발송 흉내)로 소비자 수를 바꿔 가며 모든 이벤트를 ACK할 때까지의 시간을 잰다.
+--fail-rate를 주면 그 비율만큼 핸들러가 실패하고, 실패한 이벤트는 claim_stale로 다시 처리된다.
+마지막에 중복 처리된 이벤트가 없는지(핸들러 호출 수 == 이벤트 수) 확인한다.
+
+    docker-compose up -d redis
+    REDIS_URL=redis://:redis123@localhost:6379/0 python benchmarks/event_consumers.py -n 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+import uuid
+
+import redis.asyncio as redis
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.services.events import SUBSCRIBED, EventConsumer, UserEvent
+
+
+class SlowHandler:
+    name = "bench"
+    types = frozenset({SUBSCRIBED})
+
+    def __init__(self, latency: float, fail_rate: float):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.handled = set()
+
+    async def handle(self, event: UserEvent) -> None:
+        await asyncio.sleep(self.latency)
+        if random.random() < self.fail_rate:
+            raise Exception("Failed to handle event: simulated failure")
+        self.handled.add(event.event_id)
+
+
+async def run_once(client, args: argparse.Namespace, consumers: int) -> bool:
+    run_id = uuid.uuid4().hex[:8]
+    stream, group = f"bench:events:{run_id}", "bench"
+    async with client.pipeline(transaction=False) as pipe:
+        for i in range(args.n):
+            event = UserEvent(f"{run_id}-{i}", SUBSCRIBED, f"user-{i}", 0, f"user{i}@example.com")
+            pipe.xadd(stream, event.to_fields())
+        await pipe.execute()
+
+    handler = SlowHandler(args.latency_ms / 1000, args.fail_rate)
+    workers = [
+        EventConsumer(
+            client,
+            [handler],
+            name=f"c{i}",
+            batch_size=args.batch_size,
+            block_ms=100,
+            claim_idle_seconds=0.2,
+            done_ttl=600,
+            stream=stream,
+            group=group,
+        )
+        for i in range(consumers)
+    ]
+    stopping = asyncio.Event()
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(worker.run(stopping)) for worker in workers]
+    while sum(worker.stats.processed for worker in workers) < args.n:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    stopping.set()
+    await asyncio.gather(*tasks)
+
+    calls = sum(worker.stats.per_handler.get(handler.name, 0) for worker in workers)
+    retried = sum(worker.stats.failed for worker in workers)
+    print(
+        f"  consumers {consumers:<3} {elapsed:7.2f}s  {args.n / elapsed:8.1f} events/s"
+        f"  재시도 {retried:4d}  성공 처리 {calls}"
+    )
+    done_keys = [key async for key in client.scan_iter(f"events:done:bench:{run_id}-*")]
+    await client.delete(stream, *done_keys)
+    return calls == len(handler.handled) == args.n
+
+
+async def run(args: argparse.Namespace) -> int:
+    # 의도한 실패마다 찍히는 경고는 숨긴다
+    logging.getLogger("dailydevq_backend.services.events").setLevel(logging.ERROR)
+    client = redis.Redis.from_url(args.redis_url or settings.REDIS_URL)
+    print(
+        f"[이벤트 {args.n}개, 핸들러 지연 {args.latency_ms}ms, 배치 {args.batch_size}, "
+        f"실패율 {args.fail_rate:.0%}]"
+    )
+    ok = True
+    try:
+        for consumers in args.consumers:
+            ok &= await run_once(client, args, consumers)
+    finally:
+        await client.aclose()
+    if not ok:
+        print("❌ 중복되거나 빠진 처리가 있습니다")
+    return 0 if ok else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--consumers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--redis-url", default=None)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+JSON 응답 직렬화 벤치마크 (직렬화 마이크로 벤치마크 + 엔드포인트 초당 요청 수)
+
+1) 직렬화: 같은 응답 모델을 다음 방식으로 -n번 직렬화한다.
+   - fastapi: FastAPI 기본 경로 흉내 (model_dump → 재검증 → jsonable_encoder → json.dumps)
+   - model_dump_json / to_json: pydantic-core가 모델에서 바로 JSON 바이트를 만든다
+   - orjson: 설치되어 있으면 참고용으로 (model_dump → orjson.dumps)
+2) 엔드포인트: 같은 라우트를 가진 두 앱을 ASGI로 직접 호출해(네트워크 없음) 초당 요청 수를 잰다.
+   - default: 모델/dict 반환 + 기본 JSONResponse
+   - fast: 기본 응답 클래스 FastJSONResponse, 고정 응답은 미리 직렬화한 바이트 (main.py와 같은 방식)
+
+FastAPI 0.130 이후 버전은 response_model 라우트에서 이미 pydantic-core로 바로 직렬화하므로
+모델 라우트의 차이가 줄어든다 (실행한 FastAPI 버전을 함께 출력한다).
+
+    python benchmarks/json_response.py -n 20000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import fastapi
+from fastapi import FastAPI, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic_core import to_json
+
+from dailydevq_backend.core.responses import FastJSONResponse
+from dailydevq_backend.models.user import UserModel
+from dailydevq_backend.schemas.user import GoogleAuthResponse, SubscribeResponse, UserResponse
+
+USER = UserResponse.model_validate(
+    UserModel(email="bench@example.com", name="벤치마크", profile_image="https://example.com/a.png")
+)
+SUBSCRIBE = SubscribeResponse(success=True, message="구독이 완료되었습니다!", user=USER)
+GOOGLE = GoogleAuthResponse(
+    success=True,
+    message="Google 로그인에 성공했습니다",
+    user=USER,
+    access_token="a" * 400,
+    refresh_token="r" * 64,
+    expires_in=900,
+)
+MODELS = {"UserResponse": USER, "SubscribeResponse": SUBSCRIBE, "GoogleAuthResponse": GOOGLE}
+
+
+def per_call_us(fn: Callable[[], Any], n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def fastapi_default(model) -> bytes:
+    """FastAPI(0.118) response_model 경로: dict로 풀고 다시 검증한 뒤 jsonable 변환 + json.dumps"""
+    validated = type(model).model_validate(model.model_dump())
+    content = jsonable_encoder(validated)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def serialization(n: int) -> None:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    print(f"[직렬화, {n}회 평균 µs]")
+    print(f"  {'model':<20} {'fastapi':>9} {'dump_json':>10} {'to_json':>9} {'orjson':>8}")
+    for name, model in MODELS.items():
+        default = per_call_us(lambda: fastapi_default(model), n)
+        dump_json = per_call_us(lambda: model.model_dump_json().encode(), n)
+        fast = per_call_us(lambda: to_json(model), n)
+        row = f"  {name:<20} {default:9.1f} {dump_json:10.1f} {fast:9.1f}"
+        if orjson is not None:
+            row += f" {per_call_us(lambda: orjson.dumps(model.model_dump(mode='json')), n):8.1f}"
+        print(row + f"   ({default / fast:.1f}x)")
+
+
+def build_apps() -> Dict[str, FastAPI]:
+    default = FastAPI()
+    fast = FastAPI(default_response_class=FastJSONResponse)
+    root = {"service": "DailyDevQ API", "version": "1.0.0", "status": "running"}
+    root_body = to_json(root)
+
+    @default.get("/")
+    async def default_root():
+        return root
+
+    @fast.get("/")
+    async def fast_root():
+        return Response(root_body, media_type="application/json")
+
+    @default.get("/user", response_model=UserResponse)
+    async def default_user():
+        return USER
+
+    @fast.get("/user", response_model=UserResponse)
+    async def fast_user():
+        return USER
+
+    @default.post("/subscribe", response_model=SubscribeResponse)
+    async def default_subscribe():
+        return SUBSCRIBE
+
+    @fast.post("/subscribe", response_model=SubscribeResponse)
+    async def fast_subscribe():
+        return SUBSCRIBE
+
+    @default.post("/google", response_model=GoogleAuthResponse)
+    async def default_google():
+        return GOOGLE
+
+    @fast.post("/google", response_model=GoogleAuthResponse)
+    async def fast_google():
+        return GOOGLE
+
+    return {"default": default, "fast": fast}
+
+
+async def call(app: FastAPI, method: str, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    chunks: List[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def endpoints(n: int) -> bool:
+    apps = build_apps()
+    routes = [("GET", "/"), ("GET", "/user"), ("POST", "/subscribe"), ("POST", "/google")]
+    print(f"\n[엔드포인트, ASGI 직접 호출 {n}회, FastAPI {fastapi.__version__}]")
+    print(f"  {'route':<16} {'default':>10} {'fast':>10}")
+    ok = True
+    for method, path in routes:
+        bodies = [json.loads(await call(app, method, path)) for app in apps.values()]
+        ok &= bodies[0] == bodies[1]
+        rates = []
+        for app in apps.values():
+            started = time.perf_counter()
+            for _ in range(n):
+                await call(app, method, path)
+            rates.append(n / (time.perf_counter() - started))
+        print(
+            f"  {method + ' ' + path:<16} {rates[0]:8.0f}/s {rates[1]:8.0f}/s"
+            f"   ({rates[1] / rates[0]:.2f}x)"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=20000)
+    args = parser.parse_args()
+
+    serialization(args.n)
+    same = asyncio.run(endpoints(args.n))
+    if not same:
+        print("❌ 두 방식의 응답 본문이 다릅니다")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+JWT 검증 마이크로 벤치마크 (단일 코어)
+
+HS256/ES256 각각 서명 검증 경로(캐시 미사용)와 claims 캐시 적중 경로의
+초당 검증 횟수를 측정하고, 세션 폐기 확인(Bloom filter에서 걸러지는 경로)의
+요청당 비용을 측정한다. 외부 서비스는 필요 없다.
+
+    python benchmarks/jwt_verify.py -n 20000
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from dailydevq_backend.core.bloom import BloomFilter
+from dailydevq_backend.core.runtime_config import runtime_config
+from dailydevq_backend.services.session_service import SessionService
+from dailydevq_backend.utils import jwt as jwt_utils
+
+
+def _es256_private_key() -> str:
+    key = ec.generate_private_key(ec.SECP256R1())
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def measure(tokens: list[str], use_cache: bool) -> float:
+    started = time.perf_counter()
+    for token in tokens:
+        if jwt_utils.verify_token(token, use_cache=use_cache) is None:
+            raise RuntimeError("verification failed")
+    return len(tokens) / (time.perf_counter() - started)
+
+
+def run(algorithm: str, total: int, distinct: int) -> None:
+    if algorithm == "ES256":
+        ring = jwt_utils.JWTKeyRing(
+            algorithm="ES256", key_id="bench", private_key=_es256_private_key(), verify_keys={}
+        )
+    else:
+        ring = jwt_utils.JWTKeyRing(algorithm=algorithm, key_id="bench", verify_keys={})
+    keys = jwt_utils.JWTKeys(ring, jwt_utils.ClaimsCache())
+    runtime_config.derive("jwt", jwt_utils.KEY_SETTINGS, lambda _: keys)
+
+    # 실제 트래픽처럼 적은 수의 활성 토큰이 반복해서 들어온다고 가정
+    pool = [jwt_utils.create_access_token(str(uuid4())) for _ in range(distinct)]
+    tokens = [pool[i % distinct] for i in range(total)]
+
+    uncached = measure(tokens[: max(1, total // 10)], use_cache=False)
+    measure(pool, use_cache=True)  # 캐시 채우기
+    cached = measure(tokens, use_cache=True)
+    print(
+        f"{algorithm:6s} 캐시 미사용 {uncached:>10,.0f} /s | "
+        f"캐시 적중 {cached:>10,.0f} /s | x{cached / uncached:.1f}"
+    )
+
+
+async def revocation_check(total: int, revoked: int) -> None:
+    """폐기되지 않은 세션 확인 비용 (Bloom filter가 음성이면 Redis를 조회하지 않는다)"""
+    service = SessionService()
+    service._bloom = BloomFilter(max(service.bloom_capacity, revoked * 2))
+    for _ in range(revoked):
+        service._bloom.add(uuid4().hex)
+    session_ids = [uuid4().hex for _ in range(1000)]
+
+    started = time.perf_counter()
+    for i in range(total):
+        if await service.is_revoked(session_ids[i % len(session_ids)]):
+            raise RuntimeError("unexpected revoked session")
+    elapsed = time.perf_counter() - started
+    print(f"폐기 확인 (폐기 세션 {revoked:,}개) {elapsed / total * 1e6:.2f} µs/요청")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--requests", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=1000, help="서로 다른 토큰 수")
+    args = parser.parse_args()
+
+    for algorithm in ("HS256", "ES256"):
+        run(algorithm, args.requests, args.distinct)
+    asyncio.run(revocation_check(args.requests, revoked=10000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+프로덕션 서버 부하 테스트 (워커 수별 초당 요청 수, p50/p99, SIGTERM 드레인)
+
+워커 수마다 `python -m dailydevq_backend.server --workers N`을 새로 띄우고, 부하 프로세스
+--client-processes개가 --connections개의 연결로 --duration초 동안 다음 비율로 요청을 보낸다.
+
+    구독 상태 조회 GET /api/v1/subscribe/status/{email}   70%
+    구독 POST /api/v1/subscribe/email                      20%
+    핑 GET /api/v1/ping                                    10%
+
+이메일은 --users개 중에서 고르므로 상태 조회는 대부분 캐시에 적중한다. 속도 제한은 끈다
+(부하가 한 IP에서 나간다). 마지막 워커 수에서는 부하 도중 SIGTERM을 보내, 처리 중이던 요청이
+끝까지 응답받는지(끊긴 요청 0) 확인한다. 이때 부하 프로세스는 로드밸런서처럼 /health/ready를
+0.2초마다 확인해 draining이 되면 새 요청을 보내지 않는다 (SERVER_DRAIN_SECONDS 기본 3초).
+
+    docker-compose up -d dynamodb-local redis
+    DYNAMODB_ENDPOINT=http://localhost:8000 python -m dailydevq_backend.utils.migrate
+    DYNAMODB_ENDPOINT=http://localhost:8000 REDIS_URL=redis://:redis123@localhost:6379/0 \\
+        python benchmarks/load_test.py --workers 1 2 4 --duration 20
+
+부하 프로세스도 같은 머신의 CPU를 쓰므로, 워커 수에 따른 확장은 코어가 충분한 머신에서 잰다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import httpx
+
+ENDPOINTS = [("status", 70), ("subscribe", 20), ("ping", 10)]
+READINESS_INTERVAL = 0.2
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def empty_results() -> Dict[str, Dict[str, list]]:
+    keys = ("latencies", "errors", "dropped", "refused")
+    return {name: {key: [] for key in keys} for name, _ in ENDPOINTS}
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {**os.environ, "RATE_LIMIT_ENABLED": "false", "LOG_LEVEL": "WARNING"}
+    env.setdefault("SERVER_DRAIN_SECONDS", "3")
+    env.setdefault("SERVER_FORWARDED_ALLOW_IPS", "127.0.0.1")
+    env.setdefault("HEALTH_REQUIRED_DEPENDENCIES", "dynamodb")
+    command = [sys.executable, "-m", "dailydevq_backend.server", "--workers", str(workers)]
+    process = subprocess.Popen(command + ["--host", "127.0.0.1", "--port", str(port)], env=env)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise Exception("Failed to start server: no response from /health within 60s")
+
+
+async def _client(
+    base_url: str, connections: int, duration: float, users: int, follow_readiness: bool
+) -> Tuple[Dict[str, Dict[str, list]], float]:
+    names = [name for name, _ in ENDPOINTS]
+    weights = [weight for _, weight in ENDPOINTS]
+    results = empty_results()
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    started = time.perf_counter()
+    deadline = started + duration
+
+    draining = asyncio.Event()
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        async def watch_readiness() -> None:
+            # 로드밸런서 흉내: 드레인이 시작되면 이 대상으로 새 요청을 보내지 않는다
+            async with httpx.AsyncClient(base_url=base_url, timeout=1) as probe:
+                while not draining.is_set() and time.perf_counter() < deadline:
+                    try:
+                        response = await probe.get("/health/ready")
+                        if response.json().get("status") == "draining":
+                            draining.set()
+                    except httpx.TransportError:
+                        draining.set()
+                    await asyncio.sleep(READINESS_INTERVAL)
+
+        async def loop() -> None:
+            while time.perf_counter() < deadline and not draining.is_set():
+                name = random.choices(names, weights)[0]
+                email = f"load{random.randrange(users)}@example.com"
+                sent = time.perf_counter()
+                try:
+                    if name == "status":
+                        response = await client.get(f"/api/v1/subscribe/status/{email}")
+                    elif name == "subscribe":
+                        body = {"email": email}
+                        response = await client.post("/api/v1/subscribe/email", json=body)
+                    else:
+                        response = await client.get("/api/v1/ping")
+                except httpx.ConnectError:
+                    # 서버가 새 연결을 받지 않음 (종료 중)
+                    results[name]["refused"].append(1)
+                    await asyncio.sleep(0.05)
+                    continue
+                except httpx.TransportError as e:
+                    # 보낸 요청이 응답 없이 끊김
+                    results[name]["dropped"].append(repr(e))
+                    continue
+                elapsed = (time.perf_counter() - sent) * 1000
+                if response.status_code < 400:
+                    results[name]["latencies"].append(elapsed)
+                else:
+                    results[name]["errors"].append(response.status_code)
+
+        watcher = [watch_readiness()] if follow_readiness else []
+        await asyncio.gather(*watcher, *(loop() for _ in range(connections)))
+    return results, time.perf_counter() - started
+
+
+def run_client(base_url: str, connections: int, duration: float, users: int, follow: bool):
+    return asyncio.run(_client(base_url, connections, duration, users, follow))
+
+
+def run_load(
+    args: argparse.Namespace, base_url: str, duration: float, follow_readiness: bool = False
+) -> Tuple[Dict[str, Dict[str, list]], float]:
+    per_process = max(1, args.connections // args.client_processes)
+    with ProcessPoolExecutor(args.client_processes) as pool:
+        futures = [
+            pool.submit(run_client, base_url, per_process, duration, args.users, follow_readiness)
+            for _ in range(args.client_processes)
+        ]
+        parts = [future.result() for future in futures]
+    elapsed = max(part_elapsed for _, part_elapsed in parts)
+    merged = empty_results()
+    for part, _ in parts:
+        for name, result in part.items():
+            for key, values in result.items():
+                merged[name][key].extend(values)
+    return merged, elapsed
+
+
+def percentile(values: List[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def report(workers: int, results: Dict[str, Dict[str, list]], elapsed: float) -> None:
+    latencies = [v for r in results.values() for v in r["latencies"]]
+    errors = sum(len(r["errors"]) for r in results.values())
+    print(
+        f"  workers {workers:<3} {len(latencies) / elapsed:8.0f} req/s"
+        f"  p50 {percentile(latencies, 50):6.1f}ms  p99 {percentile(latencies, 99):6.1f}ms"
+        f"  오류 {errors}"
+    )
+    for name, result in results.items():
+        values = result["latencies"]
+        print(
+            f"    {name:<10} {len(values) / elapsed:8.0f} req/s"
+            f"  p50 {percentile(values, 50):6.1f}ms  p99 {percentile(values, 99):6.1f}ms"
+        )
+
+
+def drain_check(args: argparse.Namespace, workers: int) -> bool:
+    """부하 도중 SIGTERM: 처리 중이던 요청이 끊기지 않는지 확인"""
+    port = free_port()
+    server = start_server(workers, port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    def terminate() -> None:
+        time.sleep(args.drain_after)
+        server.send_signal(signal.SIGTERM)
+
+    thread = threading.Thread(target=terminate)
+    thread.start()
+    results, _ = run_load(args, base_url, args.drain_after + 10, follow_readiness=True)
+    thread.join()
+    exit_code = server.wait(timeout=60)
+
+    ok = sum(len(r["latencies"]) for r in results.values())
+    subscribes = len(results["subscribe"]["latencies"])
+    dropped = [e for r in results.values() for e in r["dropped"]]
+    refused = sum(len(r["refused"]) for r in results.values())
+    print(
+        f"  SIGTERM 드레인 (workers {workers}): 응답 {ok} (구독 {subscribes}) | "
+        f"끊김 {len(dropped)} | 종료 후 거부 {refused} | 종료 코드 {exit_code}"
+    )
+    for sample in dropped[:3]:
+        print(f"    ❌ {sample}")
+    # 단일 워커는 정리를 마친 뒤 받은 SIGTERM을 다시 일으켜 종료한다 (uvicorn 동작)
+    return not dropped and exit_code in (0, -signal.SIGTERM)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--warmup", type=float, default=3)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--client-processes", type=int, default=2)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--drain-after", type=float, default=2.0, help="드레인 확인에서 SIGTERM까지 (초)")
+    parser.add_argument("--no-drain", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"[연결 {args.connections} (부하 프로세스 {args.client_processes}), "
+        f"{args.duration}s, CPU {os.cpu_count()}]"
+    )
+    for workers in args.workers:
+        port = free_port()
+        server = start_server(workers, port)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            run_load(args, base_url, args.warmup)
+            results, elapsed = run_load(args, base_url, args.duration)
+            report(workers, results, elapsed)
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+
+    ok = True if args.no_drain else drain_check(args, args.workers[-1])
+    if not ok:
+        print("❌ SIGTERM 중 처리 중이던 요청이 끊겼습니다")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
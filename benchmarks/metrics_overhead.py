@@ -0,0 +1,154 @@
+"""
+지표 수집 오버헤드 벤치마크
+
+1) 같은 FastAPI 앱을 MetricsMiddleware 없이/있이 ASGI로 직접 호출해 요청당 p50/p99 차이를 비교한다.
+2) botocore 훅 4개를 직접 호출해 DynamoDB 호출 1회당 훅 비용을 잰다.
+3) 실제 DynamoDB(또는 로컬 에뮬레이터)에 GetItem을 보내 훅 유무에 따른 지연 차이를 비교한다.
+   로컬 에뮬레이터는 응답 시간 편차가 커서 2)의 값이 더 정확하다.
+4) /metrics 응답 생성 시간을 잰다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/metrics_overhead.py -n 20000
+
+DynamoDB 항목은 utils.migrate로 테이블을 만든 뒤에만 측정한다 (--skip-dynamodb로 생략).
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI
+
+from dailydevq_backend.core import metrics
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.core.metrics import MetricsMiddleware, render_metrics
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    return app
+
+
+async def measure_http(app, total: int) -> list[float]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"unexpected status {message['status']}")
+
+    latencies = []
+    for i in range(total):
+        path = f"/items/{i}"
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+class GetItemModel:
+    name = "GetItem"
+
+
+def measure_hooks(total: int) -> float:
+    """DynamoDB 호출 1회에 해당하는 훅 호출 비용 (마이크로초)"""
+    parsed = {"ConsumedCapacity": {"CapacityUnits": 0.5}, "ResponseMetadata": {"RetryAttempts": 0}}
+    started = time.perf_counter()
+    for _ in range(total):
+        context = {}
+        metrics._before_parameter_build(params={"TableName": "bench"}, model=GetItemModel, context=context)
+        metrics._before_call(model=GetItemModel, context=context)
+        metrics._on_attempt(response=(None, parsed), operation=GetItemModel)
+        metrics._after_call(parsed=parsed, model=GetItemModel, context=context)
+    return (time.perf_counter() - started) / total * 1_000_000
+
+
+async def measure_dynamodb(instrumented: bool, total: int) -> list[float]:
+    # start()는 METRICS_ENABLED일 때만 botocore 훅을 건다
+    settings.METRICS_ENABLED = instrumented
+    client = AsyncDynamoDBClient()
+    await client.start()
+    table = await client.get_table("users")
+    latencies = []
+    try:
+        for i in range(total):
+            started = time.perf_counter()
+            await table.get_item(Key={"id": f"bench-{i}"})
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        await client.stop()
+    return latencies
+
+
+def report(label: str, base: list[float], measured: list[float]) -> float:
+    p50 = percentile(measured, 50) - percentile(base, 50)
+    p99 = percentile(measured, 99) - percentile(base, 99)
+    print(f"[{label}]")
+    print(f"  계측 없음  p50 {percentile(base, 50):.3f}ms  p99 {percentile(base, 99):.3f}ms")
+    print(f"  계측 있음  p50 {percentile(measured, 50):.3f}ms  p99 {percentile(measured, 99):.3f}ms")
+    print(f"  오버헤드   p50 {p50:.3f}ms  p99 {p99:.3f}ms")
+    return p99
+
+
+async def run(args: argparse.Namespace) -> int:
+    bare = build_app()
+    measured = MetricsMiddleware(build_app())
+    await measure_http(bare, 500)
+    await measure_http(measured, 500)
+    base = await measure_http(bare, args.requests)
+    with_metrics = await measure_http(measured, args.requests)
+    http_p99 = report(f"HTTP 미들웨어, 요청 {args.requests}", base, with_metrics)
+
+    print(f"[botocore 훅] 호출 1회당 {measure_hooks(100_000):.1f}us")
+
+    if not args.skip_dynamodb:
+        await measure_dynamodb(False, 50)
+        base = await measure_dynamodb(False, args.dynamodb_requests)
+        with_hooks = await measure_dynamodb(True, args.dynamodb_requests)
+        report(f"DynamoDB GetItem, 요청 {args.dynamodb_requests}", base, with_hooks)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        body, _ = render_metrics()
+    print(f"[/metrics] 응답 생성 {(time.perf_counter() - started) * 10:.3f}ms, {len(body)} bytes")
+
+    return 0 if http_p99 < args.budget_ms else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--requests", type=int, default=20000)
+    parser.add_argument("--dynamodb-requests", type=int, default=1000)
+    parser.add_argument("--skip-dynamodb", action="store_true")
+    parser.add_argument("--budget-ms", type=float, default=0.1, help="HTTP 미들웨어 p99 오버헤드 상한")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+뉴스레터 대량 발송 벤치마크
+
+활성 구독자 N명을 시드한 뒤 aiosmtpd(프로세스 내) 또는 MailHog로 발송하고,
+처리량과 시간 예산 충족 여부를 출력한다. (aiosmtpd는 개발 의존성)
+
+    docker-compose up -d dynamodb-local redis
+    DYNAMODB_ENDPOINT=http://localhost:8000 python -m dailydevq_backend.utils.migrate
+    DYNAMODB_ENDPOINT=http://localhost:8000 REDIS_URL=redis://:redis123@localhost:6379/0 \\
+        python benchmarks/newsletter_fanout.py -n 100000 --budget-seconds 600
+
+목표: 10만 통을 10분(600초) 안에 발송 (SMTP 풀 20, 속도 제한 없음 기준).
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.models.user import UserModel
+from dailydevq_backend.repositories.user_repository import BATCH_WRITE_LIMIT, user_repository
+from dailydevq_backend.services.mailer import SMTPMailer
+from dailydevq_backend.services.newsletter_service import (
+    NewsletterCheckpoint,
+    NewsletterIssue,
+    NewsletterService,
+)
+
+ISSUE = NewsletterIssue(
+    issue_id="bench",
+    subject="[DailyDevQ] 오늘의 면접 질문",
+    questions=[
+        {"category": "Database", "title": "인덱스가 느려지는 경우는?", "body": "설명해 보세요."},
+        {"category": "Network", "title": "HTTP/2의 멀티플렉싱이란?", "body": "설명해 보세요."},
+    ],
+)
+
+
+class CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):  # noqa: N802
+        self.received += 1
+        return "250 OK"
+
+
+async def seed(total: int) -> None:
+    semaphore = asyncio.Semaphore(8)
+
+    async def put(chunk):
+        async with semaphore:
+            await user_repository.batch_put(chunk)
+
+    items = [UserModel(email=f"fanout-{uuid4().hex}@example.com").to_dict() for _ in range(total)]
+    await asyncio.gather(
+        *(put(items[i : i + BATCH_WRITE_LIMIT]) for i in range(0, total, BATCH_WRITE_LIMIT))
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    handler = None
+    host, port = args.smtp_host, args.smtp_port
+    if host is None:
+        from aiosmtpd.controller import Controller
+
+        handler = CountingHandler()
+        controller = Controller(handler, hostname="127.0.0.1", port=args.smtp_port)
+        controller.start()
+        host = "127.0.0.1"
+
+    redis_client = redis.Redis.from_url(args.redis_url or settings.REDIS_URL)
+    await async_dynamodb_client.start()
+    smtp = SMTPMailer(hostname=host, port=port, pool_size=args.pool, rate_per_second=args.rate)
+    service = NewsletterService(smtp=smtp)
+    try:
+        if not args.skip_seed:
+            started = time.perf_counter()
+            await seed(args.requests)
+            print(f"seeded {args.requests} users in {time.perf_counter() - started:.1f}s")
+
+        await smtp.start()
+        run_id = f"bench-{uuid4().hex[:8]}"
+        report = await service.send_issue(ISSUE, NewsletterCheckpoint(redis_client, run_id))
+    finally:
+        await smtp.stop()
+        await async_dynamodb_client.stop()
+        await redis_client.aclose()
+        if handler is not None:
+            controller.stop()
+
+    print(f"sent={report.sent} skipped={report.skipped} failed={report.failed}")
+    print(f"elapsed={report.elapsed_seconds}s throughput={report.messages_per_second} msg/s")
+    if handler is not None:
+        print(f"smtp received={handler.received}")
+    within_budget = report.elapsed_seconds <= args.budget_seconds
+    print(f"budget={args.budget_seconds}s -> {'OK' if within_budget else 'EXCEEDED'}")
+    return 0 if within_budget and report.failed == 0 else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--requests", type=int, default=100_000, help="시드할 구독자 수")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--smtp-host", default=None, help="지정하지 않으면 aiosmtpd를 띄운다")
+    parser.add_argument("--smtp-port", type=int, default=8025 + 1000)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--pool", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=0)
+    parser.add_argument("--budget-seconds", type=float, default=600)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+질문 생성 파이프라인 벤치마크 (동시 요청 수별 처리량, 재실행 시 캐시 효과)
+
+FakeProvider(응답마다 --latency-ms 지연)로 --days일 × 분야 수만큼 질문을 생성한다.
+동시 요청 수를 바꿔 가며 처리량을 재고, 마지막으로 같은 저장소에서 다시 실행해
+LLM 요청 없이 캐시만으로 끝나는지 확인한다. 비용은 --model 가격표로 어림한다
+(토큰 수는 FakeProvider의 글자 수 기반 추정치).
+
+    python benchmarks/question_generation.py --days 20 --latency-ms 500
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.storage import LocalObjectStore
+from dailydevq_backend.services.llm import FakeProvider
+from dailydevq_backend.services.question_generation import GenerationStats, QuestionGenerator
+
+
+def report(label: str, stats: GenerationStats) -> None:
+    print(
+        f"  {label:<14} {stats.elapsed_seconds:7.2f}s  {stats.questions_per_second:7.1f} 질문/s"
+        f"  LLM 요청 {stats.llm_requests:4d}  캐시 {stats.cache_hits:4d}  ${stats.cost_usd:.4f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    categories = [c.strip() for c in settings.QUESTION_CATEGORIES.split(",")]
+    dates = [f"2030-01-{day:02d}" for day in range(1, args.days + 1)]
+    print(
+        f"[{args.days}일 × {len(categories)}개 분야, 응답 지연 {args.latency_ms}ms, "
+        f"가격 기준 {args.model}]"
+    )
+
+    ok = True
+    for concurrency in args.concurrency:
+        with tempfile.TemporaryDirectory() as root:
+            provider = FakeProvider(model=args.model, latency=args.latency_ms / 1000)
+            generator = QuestionGenerator(provider, LocalObjectStore(root), concurrency=concurrency)
+            _, result = await generator.run(dates, categories)
+            report(f"concurrency {concurrency}", result)
+
+            # 같은 저장소로 재실행: 모든 응답이 캐시에서 나와야 한다
+            _, rerun = await generator.run(dates, categories)
+            if concurrency == args.concurrency[-1]:
+                report("rerun (cache)", rerun)
+            ok &= rerun.llm_requests == 0 and rerun.cache_hits == result.llm_requests
+
+    if not ok:
+        print("❌ 재실행에서 LLM 요청이 발생했습니다")
+    return 0 if ok else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--latency-ms", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--model", default="gpt-4o-mini")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+속도 제한 미들웨어 오버헤드 벤치마크
+
+같은 FastAPI 앱을 미들웨어 없이/있이 ASGI로 직접 호출해 요청당 지연 시간의
+p50/p99 차이를 비교한다. Redis에 연결할 수 없으면 로컬 fallback 경로를 측정한다.
+
+    REDIS_URL=redis://:redis123@localhost:6379/0 python benchmarks/rate_limit_overhead.py -n 20000
+
+목표: p99 오버헤드 1ms 미만.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI
+
+from dailydevq_backend.core.rate_limit import RateLimiter, RateLimitMiddleware, RateLimitRule
+from dailydevq_backend.core.redis import RedisClient
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/limited")
+    async def limited():
+        return {"ok": True}
+
+    return app
+
+
+async def measure(app, total: int, clients: int) -> list[float]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"unexpected status {message['status']}")
+
+    latencies = []
+    for i in range(total):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/limited",
+            "raw_path": b"/limited",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "client": (f"10.0.{i % clients // 256}.{i % 256}", 50000),
+            "server": ("testserver", 80),
+        }
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def run(args: argparse.Namespace) -> int:
+    redis = RedisClient(args.redis_url)
+    await redis.start()
+    limiter = RateLimiter(redis=redis)
+    # 제한에 걸리지 않을 만큼 큰 한도: 순수 오버헤드만 측정
+    rule = RateLimitRule("bench", 1_000_000, 60)
+    bare = build_app()
+    limited = RateLimitMiddleware(build_app(), limiter=limiter, rules={"/limited": rule})
+
+    await measure(bare, 500, args.clients)
+    await measure(limited, 500, args.clients)
+    backend = "local fallback" if limiter._redis_retry_at else "redis"
+
+    base = await measure(bare, args.requests, args.clients)
+    with_limit = await measure(limited, args.requests, args.clients)
+    await redis.stop()
+
+    p50 = percentile(with_limit, 50) - percentile(base, 50)
+    p99 = percentile(with_limit, 99) - percentile(base, 99)
+    print(f"백엔드: {backend}, 요청 {args.requests}, 클라이언트 IP {args.clients}개")
+    print(f"미들웨어 없음  p50 {percentile(base, 50):.3f}ms  p99 {percentile(base, 99):.3f}ms")
+    print(f"미들웨어 있음  p50 {percentile(with_limit, 50):.3f}ms  p99 {percentile(with_limit, 99):.3f}ms")
+    print(f"오버헤드       p50 {p50:.3f}ms  p99 {p99:.3f}ms (목표 p99 < {args.budget_ms}ms)")
+    return 0 if p99 < args.budget_ms else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--requests", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=1000, help="서로 다른 클라이언트 IP 수")
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
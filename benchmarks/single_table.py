@@ -0,0 +1,239 @@
+"""
+단일 테이블 접근 패턴 벤치마크 (오늘의 질문 화면 한 번에 드는 요청 수, RCU, 지연 시간)
+
+벤치마크용 임시 테이블에 날짜별 질문과 사용자 N명의 답변 기록/스트릭을 채운 뒤,
+"오늘의 질문 + 내 스트릭 + 최근 답변 기록" 화면을 다음 방식으로 읽어 비교한다.
+
+1) normalized: 질문 GetItem + 스트릭 GetItem + 답변 Query + 답변마다 질문 GetItem (N gets)
+2) normalized-batch: 1)에서 답변별 질문을 BatchGetItem 한 번으로 읽음
+3) single-table-cold: 사용자 파티션 Query 한 번 + 질문 GetItem (질문 캐시 없음)
+4) single-table: 사용자 파티션 Query 한 번 (질문은 워커 캐시, QuestionService.get_today)
+
+1), 2)는 답변에 질문 제목을 복사해 두지 않는 정규화 설계를 흉내 낸다 (같은 테이블을 쓰되
+복사된 제목은 쓰지 않는다). RCU는 응답의 ConsumedCapacity 합계이고, 로컬 에뮬레이터가
+ConsumedCapacity를 주지 않으면 "-"로 표시한다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/single_table.py -n 200 --days 60
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, List
+
+from dailydevq_backend.core.cache import LRUCache
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.migrations.versions import GSI1, THROUGHPUT
+from dailydevq_backend.models.question import (
+    ANSWER_SK_PREFIX,
+    GSI1PK,
+    GSI1SK,
+    PK,
+    QUESTION_SK,
+    SK,
+    Answer,
+    DailyQuestion,
+    Streak,
+    question_pk,
+    today_kst,
+    user_pk,
+)
+from dailydevq_backend.repositories.single_table import SingleTableRepository
+from dailydevq_backend.services.question_service import QuestionService
+
+BENCH_TABLE = "single-table-bench"
+BATCH_WRITE_LIMIT = 25
+CAPACITY_OPERATIONS = {"GetItem", "Query", "BatchGetItem"}
+
+
+class CallStats:
+    """botocore 훅으로 호출 수와 소비 용량 수집"""
+
+    def __init__(self):
+        self.calls = 0
+        self.capacity: List[float] = []
+
+    def before_parameter_build(self, params: Dict[str, Any], model, **kwargs) -> None:
+        if model.name in CAPACITY_OPERATIONS:
+            params.setdefault("ReturnConsumedCapacity", "TOTAL")
+
+    def after_call(self, parsed: Dict[str, Any], **kwargs) -> None:
+        self.calls += 1
+        consumed = parsed.get("ConsumedCapacity")
+        if isinstance(consumed, dict):
+            consumed = [consumed]
+        for entry in consumed or []:
+            self.capacity.append(entry.get("CapacityUnits", 0))
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.capacity.clear()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def build_items(users: int, days: int) -> List[Dict[str, Any]]:
+    """질문 days개, 사용자마다 최근 days일 중 70%에 답변한 기록과 스트릭"""
+    today = date.fromisoformat(today_kst())
+    dates = [(today - timedelta(days=i)).isoformat() for i in range(days)]
+    questions = {
+        day: DailyQuestion(
+            date=day,
+            title=f"{day} 면접 질문: 프로세스와 스레드의 차이를 설명하세요",
+            body="운영체제 관점에서 " * 40,
+            category=random.choice(["os", "network", "database", "python"]),
+        )
+        for day in dates
+    }
+    items = [question.to_wire() for question in questions.values()]
+    for i in range(users):
+        user_id = f"user-{i}"
+        streak = Streak(user_id=user_id)
+        for day in reversed(dates[1:]):  # 오늘은 아직 답하지 않은 상태
+            if random.random() < 0.7:
+                question = questions[day]
+                items.append(
+                    Answer(
+                        user_id=user_id,
+                        date=day,
+                        answer="답변 " * 100,
+                        question_title=question.title,
+                        category=question.category,
+                    ).to_wire()
+                )
+                streak = streak.advance(day)
+        items.append(streak.to_wire())
+    return items
+
+
+async def create_table(client: AsyncDynamoDBClient, users: int, days: int) -> None:
+    dynamodb = await client.get_client()
+    table_name = client.table_name(BENCH_TABLE)
+    await dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[
+            {"AttributeName": PK, "KeyType": "HASH"},
+            {"AttributeName": SK, "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": name, "AttributeType": "S"} for name in (PK, SK, GSI1PK, GSI1SK)
+        ],
+        GlobalSecondaryIndexes=[GSI1],
+        ProvisionedThroughput=THROUGHPUT,
+    )
+    await dynamodb.get_waiter("table_exists").wait(TableName=table_name)
+
+    items = build_items(users, days)
+    for i in range(0, len(items), BATCH_WRITE_LIMIT):
+        requests = [{"PutRequest": {"Item": item}} for item in items[i : i + BATCH_WRITE_LIMIT]]
+        while requests:
+            response = await dynamodb.batch_write_item(RequestItems={table_name: requests})
+            requests = response.get("UnprocessedItems", {}).get(table_name, [])
+    print(f"[사용자 {users}명, 질문 {days}개, 아이템 {len(items)}개]")
+
+
+async def measure(
+    label: str, view: Callable[[str], Awaitable[int]], user_ids: List[str], stats: CallStats
+) -> None:
+    for user_id in user_ids[:20]:
+        await view(user_id)
+    stats.reset()
+    latencies = []
+    for user_id in user_ids:
+        started = time.perf_counter()
+        answers = await view(user_id)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if answers == 0:
+            raise RuntimeError(f"{label}: no history for {user_id}")
+
+    views = len(user_ids)
+    rcu = f"{sum(stats.capacity) / views:.1f}" if stats.capacity else "-"
+    print(
+        f"  {label:<18} 요청/화면 {stats.calls / views:5.1f}  RCU/화면 {rcu:>5}"
+        f"  p50 {percentile(latencies, 50):6.2f}ms  p99 {percentile(latencies, 99):6.2f}ms"
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    settings.METRICS_ENABLED = False
+    client = AsyncDynamoDBClient()
+    await client.start()
+    repository = SingleTableRepository(client, BENCH_TABLE)
+    table_name = client.table_name(BENCH_TABLE)
+    stats = CallStats()
+
+    async def normalized_head(user_id: str):
+        dynamodb = await client.get_client()
+        today = today_kst()
+        _, _, answers = await asyncio.gather(
+            repository.get(DailyQuestion, {PK: question_pk(today), SK: QUESTION_SK}),
+            repository.get(Streak, Streak(user_id=user_id).key),
+            repository.query(
+                Answer, user_pk(user_id), ANSWER_SK_PREFIX, limit=args.history, newest_first=True
+            ),
+        )
+        return dynamodb, answers
+
+    async def normalized(user_id: str) -> int:
+        _, answers = await normalized_head(user_id)
+        await asyncio.gather(
+            *(
+                repository.get(DailyQuestion, {PK: question_pk(answer.date), SK: QUESTION_SK})
+                for answer in answers
+            )
+        )
+        return len(answers)
+
+    async def normalized_batch(user_id: str) -> int:
+        dynamodb, answers = await normalized_head(user_id)
+        keys = [{PK: {"S": question_pk(a.date)}, SK: {"S": QUESTION_SK}} for a in answers]
+        while keys:
+            response = await dynamodb.batch_get_item(RequestItems={table_name: {"Keys": keys}})
+            keys = response.get("UnprocessedKeys", {}).get(table_name, {}).get("Keys", [])
+        return len(answers)
+
+    # TTL 0이면 매번 만료되어 질문을 다시 읽는다
+    cold_service = QuestionService(repository, LRUCache(maxsize=1, ttl=0))
+    warm_service = QuestionService(repository, LRUCache(maxsize=64, ttl=3600))
+
+    async def single_table_cold(user_id: str) -> int:
+        return len((await cold_service.get_today(user_id, args.history)).history)
+
+    async def single_table(user_id: str) -> int:
+        return len((await warm_service.get_today(user_id, args.history)).history)
+
+    try:
+        await create_table(client, args.users, args.days)
+        events = client.client.meta.events
+        events.register("before-parameter-build.dynamodb", stats.before_parameter_build)
+        events.register("after-call.dynamodb", stats.after_call)
+        user_ids = [f"user-{random.randrange(args.users)}" for _ in range(args.requests)]
+        print(f"[화면 {args.requests}회, 최근 답변 {args.history}개]")
+        await measure("normalized", normalized, user_ids, stats)
+        await measure("normalized-batch", normalized_batch, user_ids, stats)
+        await measure("single-table-cold", single_table_cold, user_ids, stats)
+        await measure("single-table", single_table, user_ids, stats)
+    finally:
+        await (await client.get_client()).delete_table(TableName=table_name)
+        await client.stop()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--users", type=int, default=200)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--history", type=int, default=settings.QUESTION_HISTORY_LIMIT)
+    parser.add_argument("--requests", type=int, default=500)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
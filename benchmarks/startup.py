@@ -0,0 +1,118 @@
+"""
+콜드 스타트 벤치마크 (import 시간 + 첫 응답까지 걸린 시간)
+
+1) `python -X importtime -c "import dailydevq_backend.main"`을 새 프로세스로 여러 번 실행해
+   import 시간 중앙값과 가장 무거운 모듈을 출력한다.
+2) uvicorn을 새 프로세스로 띄우고 첫 200 응답이 올 때까지의 시간(time-to-first-response)을 잰다.
+   기본 경로는 DynamoDB를 읽는 /api/v1/subscribe/status/... 이다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python -m dailydevq_backend.utils.migrate
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/startup.py --runs 5
+
+중앙값이 --max-import-ms 또는 --max-ttfr-ms를 넘으면 종료 코드 1 (make bench-startup에서 회귀 검사로 사용).
+"""
+
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import() -> tuple[float, list[tuple[int, str]]]:
+    """import 시간(ms)과 최상위 모듈별 누적 시간(us)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import dailydevq_backend.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    top_level = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        _, cumulative, indent, module = match.groups()
+        if module == "dailydevq_backend.main":
+            total = int(cumulative)
+        elif len(indent) <= 3:
+            top_level.append((int(cumulative), module))
+    return total / 1000, sorted(top_level, reverse=True)
+
+
+def measure_first_response(path: str, timeout: float) -> float:
+    """프로세스 시작부터 첫 200 응답까지 (ms)"""
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "dailydevq_backend.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=timeout) as client:
+            while time.perf_counter() - started < timeout:
+                try:
+                    if client.get(f"http://127.0.0.1:{port}{path}").status_code == 200:
+                        return (time.perf_counter() - started) * 1000
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+        raise RuntimeError(f"{timeout}초 안에 {path} 응답을 받지 못했습니다")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/api/v1/subscribe/status/startup-bench@example.com")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-ttfr-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10, help="출력할 무거운 모듈 수")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.getcwd())
+    import_times = []
+    top_level = []
+    for _ in range(args.runs):
+        elapsed, top_level = measure_import()
+        import_times.append(elapsed)
+    ttfr_times = [measure_first_response(args.path, args.timeout) for _ in range(args.runs)]
+
+    import_ms = statistics.median(import_times)
+    ttfr_ms = statistics.median(ttfr_times)
+    print(f"import dailydevq_backend.main  중앙값 {import_ms:.0f}ms  (최소 {min(import_times):.0f}ms)")
+    print(f"첫 응답 {args.path}  중앙값 {ttfr_ms:.0f}ms  (최소 {min(ttfr_times):.0f}ms)")
+    print("무거운 import (누적):")
+    for cumulative, module in top_level[: args.top]:
+        print(f"  {cumulative / 1000:8.1f}ms  {module}")
+
+    failed = False
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"❌ import 시간이 기준({args.max_import_ms:.0f}ms)을 넘었습니다")
+        failed = True
+    if args.max_ttfr_ms is not None and ttfr_ms > args.max_ttfr_ms:
+        print(f"❌ 첫 응답 시간이 기준({args.max_ttfr_ms:.0f}ms)을 넘었습니다")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
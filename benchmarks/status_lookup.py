@@ -0,0 +1,167 @@
+"""
+구독 상태 확인 비용 벤치마크 (요청당 RCU, 응답 크기, 지연 시간)
+
+벤치마크용 임시 테이블에 예전 email-index(ALL)와 email-status-index(INCLUDE)를 함께 만들고
+사용자 N명을 채운 뒤, 같은 이메일들로 다음 조회를 비교한다.
+
+1) before: email-index(ALL) Query로 사용자 전체를 읽어 상태 확인 (예전 get_user_by_email)
+2) after: subscription_status만 프로젝션한 GetItem (이메일로 정해지는 id, 대부분의 사용자)
+3) after-legacy: email-status-index Query (이메일 기반 ID 도입 전 사용자)
+
+캐시는 거치지 않는다. RCU는 응답의 ConsumedCapacity 합계다. 로컬 에뮬레이터가
+ConsumedCapacity를 주지 않으면 "-"로 표시한다.
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 python benchmarks/status_lookup.py -n 2000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.core.metrics import CAPACITY_OPERATIONS
+from dailydevq_backend.migrations.versions import EMAIL_GSI, EMAIL_STATUS_GSI, THROUGHPUT
+from dailydevq_backend.models.user import (
+    EMAIL_INDEX,
+    LEGACY_EMAIL_INDEX,
+    UserModel,
+    user_id_for_email,
+)
+from dailydevq_backend.repositories.codec import decode_item
+from dailydevq_backend.repositories.user_repository import BATCH_WRITE_LIMIT, UserRepository
+from dailydevq_backend.schemas.user import AuthProvider
+from dailydevq_backend.services.user_service import STATUS_PROJECTION
+
+BENCH_TABLE = "status-lookup-bench"
+
+
+class CallStats:
+    """botocore 훅으로 호출별 소비 용량과 응답 크기 수집"""
+
+    def __init__(self):
+        self.capacity: List[float] = []
+        self.response_bytes: List[int] = []
+
+    def before_parameter_build(self, params: Dict[str, Any], model, **kwargs) -> None:
+        if model.name in CAPACITY_OPERATIONS:
+            params.setdefault("ReturnConsumedCapacity", "TOTAL")
+
+    def after_call(self, http_response, parsed: Dict[str, Any], **kwargs) -> None:
+        consumed = parsed.get("ConsumedCapacity")
+        if consumed is not None:
+            self.capacity.append(consumed.get("CapacityUnits", 0))
+        self.response_bytes.append(int(http_response.headers.get("content-length", 0)))
+
+    def reset(self) -> None:
+        self.capacity.clear()
+        self.response_bytes.clear()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def create_table(client: AsyncDynamoDBClient, repository: UserRepository, users: int) -> None:
+    dynamodb = await client.get_client()
+    table_name = client.table_name(BENCH_TABLE)
+    await dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "email", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[EMAIL_GSI, EMAIL_STATUS_GSI],
+        ProvisionedThroughput=THROUGHPUT,
+    )
+    await dynamodb.get_waiter("table_exists").wait(TableName=table_name)
+
+    items = []
+    for i in range(users):
+        # Google 로그인 사용자 크기 (이름, 프로필 이미지 URL 포함)
+        items.append(
+            UserModel(
+                email=f"user{i}@example.com",
+                auth_provider=AuthProvider.GOOGLE,
+                google_id=f"1{i:020d}",
+                name=f"사용자 {i}",
+                profile_image=f"https://lh3.googleusercontent.com/a/{i:064d}=s96-c",
+            ).to_wire()
+        )
+    for i in range(0, len(items), BATCH_WRITE_LIMIT):
+        await repository.batch_put(items[i : i + BATCH_WRITE_LIMIT])
+
+
+async def measure(
+    label: str, lookup: Callable[[str], Awaitable[Any]], emails: List[str], stats: CallStats
+) -> None:
+    for email in emails[:50]:
+        await lookup(email)
+    stats.reset()
+    latencies = []
+    for email in emails:
+        started = time.perf_counter()
+        status = await lookup(email)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if status != "active":
+            raise RuntimeError(f"{label}: unexpected status {status!r} for {email}")
+
+    rcu = f"{statistics.mean(stats.capacity):.2f}" if stats.capacity else "-"
+    print(
+        f"  {label:<13} RCU/요청 {rcu:>5}  응답 {statistics.mean(stats.response_bytes):6.0f}B"
+        f"  p50 {percentile(latencies, 50):6.2f}ms  p99 {percentile(latencies, 99):6.2f}ms"
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    settings.DYNAMODB_USERS_TABLE = BENCH_TABLE
+    settings.METRICS_ENABLED = False
+    client = AsyncDynamoDBClient()
+    await client.start()
+    repository = UserRepository(client)
+    stats = CallStats()
+
+    async def before(email: str):
+        items = await repository.query_index(LEGACY_EMAIL_INDEX, "email", email)
+        return UserModel.from_wire(items[0]).subscription_status if items else None
+
+    async def after(email: str):
+        item = await repository.get_item(user_id_for_email(email), projection=STATUS_PROJECTION)
+        return decode_item(item)["subscription_status"] if item else None
+
+    async def after_legacy(email: str):
+        items = await repository.query_index(EMAIL_INDEX, "email", email)
+        return decode_item(items[0])["subscription_status"] if items else None
+
+    try:
+        await create_table(client, repository, args.users)
+        # 조회 호출만 측정 (BatchWriteItem은 테이블별 소비 용량 목록을 돌려준다)
+        events = client.client.meta.events
+        events.register("before-parameter-build.dynamodb", stats.before_parameter_build)
+        events.register("after-call.dynamodb", stats.after_call)
+        emails = [f"user{random.randrange(args.users)}@example.com" for _ in range(args.requests)]
+        print(f"[사용자 {args.users}명, 조회 {args.requests}회]")
+        await measure("before", before, emails, stats)
+        await measure("after", after, emails, stats)
+        await measure("after-legacy", after_legacy, emails, stats)
+    finally:
+        await (await client.get_client()).delete_table(TableName=client.table_name(BENCH_TABLE))
+        await client.stop()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--users", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=1000)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+/api/v1/subscribe/email 동시 요청 지연 시간 벤치마크
+
+DynamoDB Local과 백엔드를 띄운 뒤 실행한다.
+
+    docker-compose up -d dynamodb-local
+    DYNAMODB_ENDPOINT=http://localhost:8000 python -m dailydevq_backend.utils.migrate
+    DYNAMODB_ENDPOINT=http://localhost:8000 uvicorn dailydevq_backend.main:app --port 8001
+    python benchmarks/subscribe_latency.py --base-url http://localhost:8001 -n 2000 -c 100
+
+요청마다 새 이메일을 사용하므로 매 요청이 조회 + 저장 경로를 모두 탄다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import uuid4
+
+import httpx
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run(base_url: str, total: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+
+        async def one() -> None:
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/v1/subscribe/email",
+                        json={"email": f"bench-{uuid4().hex}@example.com"},
+                    )
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append((time.perf_counter() - started) * 1000)
+                if not ok:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    print(f"requests={total} concurrency={concurrency} errors={errors}")
+    print(f"throughput={total / elapsed:.1f} req/s")
+    print(
+        "latency ms: "
+        f"p50={percentile(latencies, 50):.1f} "
+        f"p95={percentile(latencies, 95):.1f} "
+        f"p99={percentile(latencies, 99):.1f} "
+        f"max={max(latencies):.1f} "
+        f"mean={statistics.fmean(latencies):.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("-n", "--requests", type=int, default=2000)
+    parser.add_argument("-c", "--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
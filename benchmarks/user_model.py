@@ -0,0 +1,88 @@
+"""
+UserModel 직렬화 벤치마크
+
+사용자 N명에 대해 다음 단계를 따로 재고, 단계별 시간(사용자 1명당)과 할당량을 출력한다.
+
+1) decode: DynamoDB 아이템(숫자는 Decimal) → UserModel.from_dict
+2) encode: UserModel.to_dict → DynamoDB 아이템
+3) response: UserResponse.model_validate(user) → JSON 바이트 (API 응답 경로)
+
+시간은 tracemalloc 없이 따로 재고(tracemalloc은 할당마다 느려진다), 할당량은 같은 단계를
+tracemalloc으로 한 번 더 실행해 결과 N개를 들고 있을 때 메모리와 단계 중 최대 메모리를 잰다.
+
+    python benchmarks/user_model.py -n 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from dailydevq_backend.models.user import UserModel
+from dailydevq_backend.schemas.user import AuthProvider, UserResponse
+
+
+def build_items(total: int) -> List[Dict[str, Any]]:
+    """DynamoDB에서 읽은 것과 같은 모양의 아이템 (resource 계층은 숫자를 Decimal로 준다)"""
+    items = []
+    for i in range(total):
+        if i % 3 == 0:
+            user = UserModel(
+                email=f"user{i}@example.com",
+                auth_provider=AuthProvider.GOOGLE,
+                google_id=f"g-{i}",
+                name=f"사용자 {i}",
+                profile_image=f"https://example.com/{i}.png",
+            )
+        else:
+            user = UserModel(email=f"user{i}@example.com")
+        item = user.to_dict()
+        items.append({k: Decimal(v) if isinstance(v, int) else v for k, v in item.items()})
+    return items
+
+
+def measure(label: str, func: Callable[[], List[Any]], total: int) -> Tuple[List[Any], float]:
+    gc.collect()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:<9} {elapsed / total * 1_000_000:7.2f}us/명  {elapsed * 1000:8.1f}ms"
+        f"  보유 {current / 1024 / 1024:7.1f}MiB  최대 {peak / 1024 / 1024:7.1f}MiB"
+    )
+    return result, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--users", type=int, default=100_000)
+    args = parser.parse_args()
+
+    items = build_items(args.users)
+    # 첫 호출의 import/스키마 빌드 비용은 제외
+    UserResponse.model_validate(UserModel.from_dict(items[0])).model_dump_json()
+
+    print(f"[사용자 {args.users}명]")
+    users, decode = measure("decode", lambda: [UserModel.from_dict(item) for item in items], args.users)
+    _, encode = measure("encode", lambda: [user.to_dict() for user in users], args.users)
+    _, response = measure(
+        "response",
+        lambda: [UserResponse.model_validate(user).model_dump_json() for user in users],
+        args.users,
+    )
+    cycle = decode + encode
+    print(f"  decode+encode 1회 왕복 {cycle / args.users * 1_000_000:.2f}us/명")
+    print(f"  API 응답까지 {(cycle + response) / args.users * 1_000_000:.2f}us/명")
+
+
+if __name__ == "__main__":
+    main()
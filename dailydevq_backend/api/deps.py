@@ -0,0 +1,68 @@
+"""
+API 공통 의존성
+"""
+
+import hmac
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, Header, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.rate_limit import RateLimitRule, rate_limiter
+from dailydevq_backend.schemas.user import normalize_email
+from dailydevq_backend.services.session_service import session_service
+from dailydevq_backend.utils.jwt import verify_token
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+EMAIL_RATE_LIMIT = RateLimitRule("email", settings.RATE_LIMIT_EMAIL_PER_HOUR, 3600)
+
+
+async def require_admin(x_admin_key: Optional[str] = Header(default=None)):
+    """관리자 API 키 확인 (ADMIN_API_KEY 미설정 시 관리자 API 비활성화)"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다")
+    if not x_admin_key or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(status_code=401, detail="관리자 인증에 실패했습니다")
+
+
+async def get_current_claims(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> Dict[str, Any]:
+    """Bearer 토큰 검증 후 claims 반환 (서명 검증 결과는 만료 전까지 캐시)"""
+    if credentials is None:
+        raise HTTPException(
+            status_code=401,
+            detail="인증이 필요합니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    claims = verify_token(credentials.credentials)
+    # 로그아웃한 세션의 토큰은 만료 전이라도 거부 (sid 없는 예전 토큰은 만료까지 유효)
+    if claims is not None and "sid" in claims and await session_service.is_revoked(claims["sid"]):
+        claims = None
+    if claims is None:
+        raise HTTPException(
+            status_code=401,
+            detail="유효하지 않거나 만료된 토큰입니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
+
+
+async def get_current_user_id(claims: Dict[str, Any] = Depends(get_current_claims)) -> str:
+    """인증된 사용자 ID"""
+    return claims["sub"]
+
+
+async def check_email_rate_limit(email: str) -> None:
+    """같은 이메일 주소로 반복되는 구독/구독 취소 요청 제한 (IP를 바꿔 가며 보내는 경우 대비)"""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    result = await rate_limiter.hit(normalize_email(email), EMAIL_RATE_LIMIT)
+    if not result.allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="같은 이메일로 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers=result.headers(),
+        )
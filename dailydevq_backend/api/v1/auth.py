@@ -2,17 +2,25 @@
 인증 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, HTTPException
+from redis.exceptions import RedisError
+from dailydevq_backend.api.deps import get_current_claims, get_current_user_id
+from dailydevq_backend.core.circuit_breaker import CircuitOpenError
 from dailydevq_backend.schemas.user import (
     GoogleAuthRequest,
     GoogleAuthResponse,
+    LogoutResponse,
+    RefreshTokenRequest,
+    TokenResponse,
     UserCreate,
     UserResponse,
     AuthProvider,
 )
 from dailydevq_backend.services.user_service import user_service
 from dailydevq_backend.services.google_oauth import google_oauth_service
-from dailydevq_backend.utils.jwt import create_access_token
+from dailydevq_backend.services.session_service import InvalidRefreshTokenError, session_service
+from dailydevq_backend.utils.jwt import current_keys
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -42,29 +50,77 @@ async def google_auth(request: GoogleAuthRequest):
 
         user = await user_service.create_user(user_data)
 
-        # 3. JWT Access Token 생성
-        access_token = create_access_token(user.id)
+        # 3. 세션 생성 (짧은 access token + refresh token)
+        tokens = await session_service.issue(user.id)
 
         # 4. 응답 반환
-        user_response = UserResponse(
-            id=user.id,
-            email=user.email,
-            auth_provider=AuthProvider(user.auth_provider),
-            subscription_status=user.subscription_status,
-            name=user.name,
-            profile_image=user.profile_image,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        user_response = UserResponse.model_validate(user)
 
         return GoogleAuthResponse(
             success=True,
             message="Google 로그인에 성공했습니다",
             user=user_response,
-            access_token=access_token,
+            access_token=tokens.access_token,
+            refresh_token=tokens.refresh_token,
+            expires_in=tokens.expires_in,
         )
 
-    except HTTPException:
+    except (HTTPException, CircuitOpenError):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Google 인증 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(request: RefreshTokenRequest):
+    """refresh token으로 새 토큰 쌍 발급 (기존 refresh token은 무효화)"""
+    try:
+        tokens = await session_service.rotate(request.refresh_token)
+    except InvalidRefreshTokenError:
+        raise HTTPException(status_code=401, detail="유효하지 않거나 만료된 refresh token입니다")
+    except RedisError:
+        raise HTTPException(status_code=503, detail="세션 저장소를 사용할 수 없습니다")
+
+    return TokenResponse(
+        access_token=tokens.access_token,
+        refresh_token=tokens.refresh_token,
+        expires_in=tokens.expires_in,
+    )
+
+
+@router.post("/logout", response_model=LogoutResponse)
+async def logout(claims: Dict[str, Any] = Depends(get_current_claims)):
+    """현재 세션 로그아웃"""
+    if "sid" not in claims:
+        return LogoutResponse(success=True, revoked_sessions=0)
+    try:
+        await session_service.revoke_session(claims["sub"], claims["sid"])
+    except RedisError:
+        raise HTTPException(status_code=503, detail="세션 저장소를 사용할 수 없습니다")
+    return LogoutResponse(success=True, revoked_sessions=1)
+
+
+@router.post("/logout-all", response_model=LogoutResponse)
+async def logout_all(user_id: str = Depends(get_current_user_id)):
+    """모든 기기에서 로그아웃"""
+    try:
+        revoked = await session_service.revoke_all(user_id)
+    except RedisError:
+        raise HTTPException(status_code=503, detail="세션 저장소를 사용할 수 없습니다")
+    return LogoutResponse(success=True, revoked_sessions=revoked)
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_me(user_id: str = Depends(get_current_user_id)):
+    """현재 로그인한 사용자 정보"""
+    user = await user_service.get_user_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+
+    return UserResponse.model_validate(user)
+
+
+@router.get("/jwks")
+async def get_jwks():
+    """토큰 검증용 공개키 (ES256 등 비대칭 알고리즘일 때만 키가 있다)"""
+    return current_keys().ring.public_jwks()
@@ -0,0 +1,84 @@
+"""
+오늘의 질문 API 엔드포인트
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from dailydevq_backend.api.deps import get_current_user_id, require_admin
+from dailydevq_backend.models.question import DailyQuestion, Streak, today_kst
+from dailydevq_backend.schemas.question import (
+    AnswerRequest,
+    AnswerResponse,
+    AnswerSubmitResponse,
+    QuestionCreate,
+    QuestionResponse,
+    StreakResponse,
+    TodayResponse,
+)
+from dailydevq_backend.services.question_service import AnswerExistsError, question_service
+
+router = APIRouter(prefix="/questions", tags=["Questions"])
+
+
+def _streak_response(streak: Streak, current: int) -> StreakResponse:
+    return StreakResponse(current=current, longest=streak.longest, last_date=streak.last_date)
+
+
+@router.get("/today", response_model=TodayResponse)
+async def get_today(user_id: str = Depends(get_current_user_id)):
+    """오늘의 질문과 내 스트릭/답변 기록"""
+    view = await question_service.get_today(user_id)
+    return TodayResponse(
+        question=QuestionResponse.model_validate(view.question) if view.question else None,
+        answered=view.today_answer is not None,
+        streak=_streak_response(view.streak, view.current_streak),
+        history=[AnswerResponse.model_validate(answer) for answer in view.history],
+    )
+
+
+@router.post("/today/answer", response_model=AnswerSubmitResponse, status_code=201)
+async def submit_answer(request: AnswerRequest, user_id: str = Depends(get_current_user_id)):
+    """오늘의 질문에 답변 (하루 한 번)"""
+    try:
+        result = await question_service.submit_answer(user_id, request.answer)
+    except AnswerExistsError:
+        raise HTTPException(status_code=409, detail="오늘의 질문에 이미 답변했습니다")
+    if result is None:
+        raise HTTPException(status_code=404, detail="오늘의 질문이 아직 없습니다")
+
+    answer, streak = result
+    return AnswerSubmitResponse(
+        success=True,
+        answer=AnswerResponse.model_validate(answer),
+        streak=_streak_response(streak, streak.current),
+    )
+
+
+@router.get("/{question_date}", response_model=QuestionResponse)
+async def get_question(question_date: date):
+    """날짜별 질문 (미래 날짜의 질문은 공개하지 않는다)"""
+    if question_date.isoformat() > today_kst():
+        raise HTTPException(status_code=404, detail="질문을 찾을 수 없습니다")
+    question = await question_service.get_question(question_date.isoformat())
+    if question is None:
+        raise HTTPException(status_code=404, detail="질문을 찾을 수 없습니다")
+    return QuestionResponse.model_validate(question)
+
+
+@router.put(
+    "/{question_date}", response_model=QuestionResponse, dependencies=[Depends(require_admin)]
+)
+async def publish_question(question_date: date, request: QuestionCreate):
+    """질문 발행 또는 수정 (관리자 전용, X-Admin-Key 헤더 필요)"""
+    question = await question_service.publish_question(
+        DailyQuestion(
+            date=question_date.isoformat(),
+            title=request.title,
+            body=request.body,
+            category=request.category,
+            difficulty=request.difficulty.value,
+        )
+    )
+    return QuestionResponse.model_validate(question)
@@ -2,14 +2,23 @@
 구독 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from dailydevq_backend.api.deps import check_email_rate_limit, require_admin
+from dailydevq_backend.core.circuit_breaker import CircuitOpenError
 from dailydevq_backend.schemas.user import (
     SubscribeRequest,
     SubscribeResponse,
+    SubscriptionStatus,
     UserCreate,
     UserResponse,
     AuthProvider,
 )
+from dailydevq_backend.services.subscription_import import (
+    iter_emails,
+    subscription_import_service,
+)
 from dailydevq_backend.services.user_service import user_service
 
 router = APIRouter(prefix="/subscribe", tags=["Subscribe"])
@@ -18,6 +27,7 @@ router = APIRouter(prefix="/subscribe", tags=["Subscribe"])
 @router.post("/email", response_model=SubscribeResponse)
 async def subscribe_with_email(request: SubscribeRequest):
     """이메일로 구독하기"""
+    await check_email_rate_limit(request.email)
     try:
         # 사용자 생성
         user_data = UserCreate(
@@ -27,22 +37,15 @@ async def subscribe_with_email(request: SubscribeRequest):
         user = await user_service.create_user(user_data)
 
         # 응답 변환
-        user_response = UserResponse(
-            id=user.id,
-            email=user.email,
-            auth_provider=AuthProvider(user.auth_provider),
-            subscription_status=user.subscription_status,
-            name=user.name,
-            profile_image=user.profile_image,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        user_response = UserResponse.model_validate(user)
 
         return SubscribeResponse(
             success=True,
             message="구독이 완료되었습니다! 평일 오전 7시에 뉴스레터를 받아보실 수 있습니다.",
             user=user_response,
         )
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"구독 처리 중 오류가 발생했습니다: {str(e)}")
 
@@ -50,6 +53,7 @@ async def subscribe_with_email(request: SubscribeRequest):
 @router.delete("/unsubscribe")
 async def unsubscribe(email: str):
     """구독 취소"""
+    await check_email_rate_limit(email)
     try:
         success = await user_service.unsubscribe_user(email)
         if not success:
@@ -59,7 +63,7 @@ async def unsubscribe(email: str):
             "success": True,
             "message": "구독이 취소되었습니다",
         }
-    except HTTPException:
+    except (HTTPException, CircuitOpenError):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"구독 취소 중 오류가 발생했습니다: {str(e)}")
@@ -69,17 +73,48 @@ async def unsubscribe(email: str):
 async def get_subscription_status(email: str):
     """구독 상태 확인"""
     try:
-        user = await user_service.get_user_by_email(email)
-        if not user:
+        status = await user_service.get_subscription_status(email)
+        if status is None:
             return {
                 "subscribed": False,
                 "message": "구독 정보를 찾을 수 없습니다",
             }
 
         return {
-            "subscribed": user.subscription_status == "active",
-            "status": user.subscription_status,
-            "email": user.email,
+            "subscribed": status == SubscriptionStatus.ACTIVE.value,
+            "status": status,
+            "email": email,
         }
+    except CircuitOpenError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"구독 상태 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/import", dependencies=[Depends(require_admin)])
+async def import_subscribers(
+    request: Request,
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+):
+    """구독자 대량 가져오기 (CSV/NDJSON 스트리밍 업로드)"""
+    try:
+        report = await subscription_import_service.import_emails(
+            iter_emails(request.stream(), fmt)
+        )
+        return report.to_dict()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"구독자 가져오기 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.get("/export", dependencies=[Depends(require_admin)])
+async def export_subscribers(
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    status: Optional[SubscriptionStatus] = None,
+):
+    """구독자 내보내기 (테이블을 페이지 단위로 스트리밍)"""
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        subscription_import_service.export(fmt, status.value if status else None),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="subscribers.{fmt}"'},
+    )
@@ -0,0 +1,65 @@
+"""
+Bloom filter (프로세스 내부)
+"""
+
+import hashlib
+import math
+import struct
+
+# 직렬화 헤더: capacity, error_rate, size, hash_count, count
+_HEADER = struct.Struct("<QdQIQ")
+
+
+class BloomFilter:
+    """확률적 집합
+
+    "없다"는 답은 항상 정확하고, "있다"는 답은 error_rate 확률로 틀릴 수 있다.
+    항목 삭제는 지원하지 않으므로 필요하면 새로 만들어 교체한다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # 128비트 해시 하나를 둘로 나눠 k개의 위치를 만든다 (double hashing)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def to_bytes(self) -> bytes:
+        """직렬화 (프로세스 사이에 공유할 때)"""
+        header = _HEADER.pack(
+            self.capacity, self.error_rate, self.size, self.hash_count, self.count
+        )
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """to_bytes()로 직렬화한 필터 복원"""
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.error_rate, bloom.size, bloom.hash_count, bloom.count = (
+            _HEADER.unpack_from(data)
+        )
+        bloom._bits = bytearray(data[_HEADER.size :])
+        if len(bloom._bits) != (bloom.size + 7) // 8:
+            raise ValueError("invalid bloom filter data")
+        return bloom
@@ -0,0 +1,254 @@
+"""
+캐시 (프로세스 내부 LRU + Redis 2단계)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from dailydevq_backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 캐시에 키가 없음을 나타내는 표식 (None은 "없는 사용자"를 캐싱할 때 쓴다)
+MISSING = object()
+
+
+class LRUCache:
+    """크기 제한과 TTL이 있는 프로세스 내부 LRU 캐시
+
+    stale_ttl을 주면 만료된 항목을 그만큼 더 남겨 두고 get_stale()로 꺼낼 수 있다
+    (원본을 읽을 수 없을 때 대신 쓰는 값).
+    """
+
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """값 반환 (없거나 만료되면 MISSING)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        now = time.monotonic()
+        if expires_at < now:
+            if expires_at + self.stale_ttl < now:
+                del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Any:
+        """만료됐더라도 stale_ttl 안이면 값 반환 (아니면 MISSING)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at + self.stale_ttl < time.monotonic():
+            return MISSING
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (가장 오래 쓰지 않은 항목부터 밀어낸다)"""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, *keys: Hashable) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class TwoTierCache:
+    """LRU → Redis → 원본 순서로 조회하는 read-through 캐시
+
+    값은 JSON으로 직렬화 가능한 dict 또는 None(없는 항목)이어야 한다. Redis에
+    연결할 수 없으면 LRU만으로 동작한다.
+
+    loader가 serve_stale_on 예외(원본 장애)로 실패하면 LRU에 stale_ttl 동안 남아 있는
+    만료된 값을 대신 반환한다. 무효화된 키는 남아 있지 않으므로 오래된 값만 돌려준다.
+
+    invalidate()는 Redis pub/sub({namespace}:invalidations)으로 다른 워커에도 알려 각 워커의
+    LRU에서 지우게 한다. 구독이 끊겼다 다시 연결되면 그 사이 무효화를 놓쳤을 수 있으므로 LRU를
+    비운다. Redis를 쓸 수 없는 동안에는 다른 워커의 LRU가 최대 local_ttl 동안 예전 값을 준다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local_maxsize: int,
+        local_ttl: float,
+        redis_ttl: int,
+        negative_ttl: int,
+        stale_ttl: float = 0,
+        serve_stale_on: Tuple[Type[BaseException], ...] = (),
+    ):
+        self.namespace = namespace
+        self.local = LRUCache(local_maxsize, local_ttl, stale_ttl)
+        self.redis_ttl = redis_ttl
+        self.negative_ttl = negative_ttl
+        self.serve_stale_on = serve_stale_on
+        self._redis: Optional[redis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._counters: Dict[str, int] = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "negative_hits": 0,
+            "stale_hits": 0,
+            "invalidations": 0,
+            "remote_invalidations": 0,  # 다른 워커가 알려 LRU에서 지운 키
+            "redis_errors": 0,
+        }
+
+    async def start(self, redis_url: Optional[str] = None):
+        """Redis 연결 (실패하면 LRU만 사용)"""
+        if self._redis is not None:
+            return
+        client = redis.Redis.from_url(redis_url or settings.REDIS_URL)
+        try:
+            await client.ping()
+        except (RedisError, OSError) as e:
+            logger.warning("Redis 캐시를 사용할 수 없어 로컬 캐시만 사용합니다: %s", e)
+            await client.aclose()
+            return
+        self._redis = client
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+        self._redis = None
+        self.local.clear()
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    @property
+    def _channel(self) -> str:
+        return f"{self.namespace}:invalidations"
+
+    async def _listen(self) -> None:
+        """다른 워커가 무효화한 키를 LRU에서 지운다"""
+        pubsub = None
+        try:
+            while True:
+                try:
+                    if pubsub is None:
+                        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                        await pubsub.subscribe(self._channel)
+                        # 구독하기 전(또는 끊긴 동안)의 무효화를 놓쳤을 수 있다
+                        self.local.clear()
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        keys = json.loads(message["data"])
+                        self.local.delete(*keys)
+                        self._counters["remote_invalidations"] += len(keys)
+                except (RedisError, OSError) as e:
+                    logger.warning("캐시 무효화 구독 실패: %s", e)
+                    self._counters["redis_errors"] += 1
+                    if pubsub is not None:
+                        await pubsub.aclose()
+                    pubsub = None
+                    await asyncio.sleep(1.0)
+        finally:
+            if pubsub is not None:
+                await pubsub.aclose()
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """캐시에서 조회하고, 없으면 loader 결과를 두 계층에 저장"""
+        value = self.local.get(key)
+        if value is not MISSING:
+            self._counters["local_hits"] += 1
+            if value is None:
+                self._counters["negative_hits"] += 1
+            return value
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(self._redis_key(key))
+            except RedisError:
+                self._counters["redis_errors"] += 1
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                self._counters["redis_hits"] += 1
+                if value is None:
+                    self._counters["negative_hits"] += 1
+                self._set_local(key, value)
+                return value
+
+        self._counters["misses"] += 1
+        try:
+            value = await loader()
+        except self.serve_stale_on:
+            value = self.local.get_stale(key)
+            if value is MISSING:
+                raise
+            self._counters["stale_hits"] += 1
+            return value
+        await self.set(key, value)
+        return value
+
+    def _set_local(self, key: str, value: Optional[Dict[str, Any]]) -> None:
+        if value is None:
+            self.local.set(key, None, ttl=min(self.local.ttl, self.negative_ttl))
+        else:
+            self.local.set(key, value)
+
+    async def set(self, key: str, value: Optional[Dict[str, Any]]) -> None:
+        self._set_local(key, value)
+        if self._redis is None:
+            return
+        ttl = self.redis_ttl if value is not None else self.negative_ttl
+        try:
+            await self._redis.set(self._redis_key(key), json.dumps(value), ex=ttl)
+        except RedisError:
+            self._counters["redis_errors"] += 1
+
+    async def invalidate(self, *keys: str) -> None:
+        """두 계층에서 모두 삭제하고 다른 워커의 LRU에도 알린다"""
+        self._counters["invalidations"] += 1
+        self.local.delete(*keys)
+        if self._redis is None or not keys:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.delete(*(self._redis_key(key) for key in keys))
+                pipe.publish(self._channel, json.dumps(keys))
+                await pipe.execute()
+        except RedisError:
+            self._counters["redis_errors"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 카운터"""
+        hits = self._counters["local_hits"] + self._counters["redis_hits"]
+        lookups = hits + self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "local_size": len(self.local),
+            "redis_connected": self._redis is not None,
+        }
@@ -0,0 +1,122 @@
+"""
+서킷 브레이커 (의존성이 계속 실패하면 잠시 호출하지 않고 바로 실패)
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Prometheus 게이지 값
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않았음 (retry_after초 뒤 다시 시도)"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit is open (retry after {retry_after:.1f}s)")
+        self.name = name
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry-After 헤더 값"""
+        return max(1, math.ceil(self.retry_after))
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커
+
+    closed: 모든 호출 허용, 연속 failure_threshold번 실패하면 open
+    open: reset_timeout 동안 모든 호출을 CircuitOpenError로 바로 거부
+    half_open: 시험 호출 하나만 허용, 성공하면 closed, 실패하면 다시 open
+
+    시험 호출이 결과를 알리지 못하고 끝나면(취소 등) reset_timeout 뒤 다른 호출을 시험 호출로 보낸다.
+    botocore 훅처럼 스레드에서 불릴 수 있어 상태 변경은 잠금 안에서 한다. on_open()으로 등록한
+    콜백은 서킷이 열릴 때 record_failure()를 부른 스레드에서 실행된다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {"opened": 0, "rejected": 0}
+        self._listeners: List[Callable[[], None]] = []
+
+    def on_open(self, callback: Callable[[], None]) -> None:
+        """서킷이 열릴 때 호출할 콜백 등록"""
+        self._listeners.append(callback)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._elapsed(self._opened_at) >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def _elapsed(self, since: float) -> float:
+        return time.monotonic() - since
+
+    def before_call(self) -> None:
+        """호출 전 확인 (거부할 때 CircuitOpenError)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            if self._state == OPEN:
+                remaining = self.reset_timeout - self._elapsed(self._opened_at)
+                if remaining > 0:
+                    self._counters["rejected"] += 1
+                    raise CircuitOpenError(self.name, remaining)
+                self._state = HALF_OPEN
+                self._probe_started_at = time.monotonic()
+                return
+            # half_open: 진행 중인 시험 호출이 있으면 거부
+            remaining = self.reset_timeout - self._elapsed(self._probe_started_at)
+            if remaining > 0:
+                self._counters["rejected"] += 1
+                raise CircuitOpenError(self.name, remaining)
+            self._probe_started_at = time.monotonic()
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("서킷 닫힘 (%s)", self.name)
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            opened = self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            )
+            if opened:
+                if self._state == CLOSED:
+                    logger.warning("서킷 열림 (%s): 연속 실패 %d회", self.name, self._failures)
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._counters["opened"] += 1
+        if opened:
+            for callback in self._listeners:
+                callback()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self._failures, **self._counters}
@@ -2,8 +2,10 @@
 애플리케이션 설정
 """
 
+import os
+
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -13,6 +15,36 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     LOG_LEVEL: str = "DEBUG"
     BACKEND_PORT: int = 8001
+    WORKER_MAX_CONCURRENCY: int = 100  # 워커당 동시에 처리하는 요청 수 (DynamoDB 커넥션 풀 크기 기준)
+
+    # 프로덕션 서버 설정 (python -m dailydevq_backend.server)
+    SERVER_WORKERS: int = 0  # 0이면 CPU 수
+    SERVER_LOOP: str = "uvloop"  # uvloop | asyncio
+    SERVER_HTTP: str = "httptools"  # httptools | h11
+    SERVER_KEEPALIVE_SECONDS: int = 75  # 로드밸런서 idle timeout(ALB 기본 60초)보다 길게
+    SERVER_BACKLOG: int = 2048
+    SERVER_DRAIN_SECONDS: float = 0  # SIGTERM 후 readiness를 실패시키고 요청을 계속 받는 시간
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30  # 드레인 후 처리 중인 요청을 기다리는 시간
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = None  # 워커당 연결+요청 수 상한 (넘으면 503)
+    # X-Forwarded-For를 믿을 프록시 IP/CIDR (쉼표 구분, "*"는 모두). 속도 제한이 클라이언트 IP를
+    # 구분하려면 로드밸런서 주소가 들어 있어야 하므로 배포마다 반드시 지정한다
+    SERVER_FORWARDED_ALLOW_IPS: Optional[str] = None
+    SERVER_ACCESS_LOG: bool = False
+
+    # 설정 다시 읽기 (CORS/JWT 키를 재시작 없이 반영, core/runtime_config.py)
+    CONFIG_FILE: Optional[str] = None  # .env.local 대신 읽고 다시 읽을 env 파일 (환경 변수로 지정)
+    CONFIG_RELOAD_SECONDS: float = 0  # env 파일 변경 확인 주기, 0이면 SIGHUP으로만 다시 읽는다
+
+    # 모니터링 설정
+    METRICS_ENABLED: bool = True  # Prometheus /metrics 엔드포인트
+    OTEL_ENABLED: bool = False  # OpenTelemetry 트레이싱 (otel extra 필요)
+    OTEL_SERVICE_NAME: str = "dailydevq-backend"
+
+    # 헬스체크 설정 (/health/ready는 백그라운드 점검 결과만 읽는다)
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 2.0
+    # 실패 시 readiness 503. Redis는 로컬 캐시/레이트리밋으로 대체되므로 degraded로만 보고한다
+    HEALTH_REQUIRED_DEPENDENCIES: str = "dynamodb"
 
     # CORS 설정
     CORS_ORIGINS: str = "http://localhost:3000"
@@ -23,6 +55,35 @@ class Settings(BaseSettings):
     # Redis 설정
     REDIS_URL: str = "redis://:redis123@redis:6379/0"
 
+    # 속도 제한 설정 (Redis 토큰 버킷, Redis 장애 시 워커별 로컬 제한)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_SUBSCRIBE_PER_MINUTE: int = 10  # IP당 구독/구독 취소
+    RATE_LIMIT_AUTH_PER_MINUTE: int = 20  # IP당 로그인/토큰 갱신
+    RATE_LIMIT_EMAIL_PER_HOUR: int = 5  # 이메일 주소당 구독/구독 취소
+
+    # 사용자 캐시 설정
+    USER_CACHE_LOCAL_MAXSIZE: int = 10000
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 10.0
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+    USER_CACHE_NEGATIVE_TTL_SECONDS: int = 30  # 존재하지 않는 사용자 캐싱 시간
+    USER_CACHE_STALE_TTL_SECONDS: float = 600.0  # DynamoDB 서킷이 열렸을 때 만료 후에도 대신 쓰는 시간
+
+    # 이메일 필터 설정 (이메일로 id를 알 수 없는 사용자의 Bloom filter, 이벤트 워커가 만들어 Redis에 저장)
+    USER_EMAIL_FILTER_ENABLED: bool = True  # 끄면 GetItem이 없을 때마다 email-status-index를 조회
+    USER_EMAIL_FILTER_CAPACITY: int = 100000
+    USER_EMAIL_FILTER_ERROR_RATE: float = 0.001
+    USER_EMAIL_FILTER_RELOAD_SECONDS: float = 60.0  # 저장된 필터가 바뀌었는지 확인하는 간격
+    # 이벤트 워커가 다시 만드는 주기 (배포 중 예전 워커가 만든 사용자를 이 시간 안에 반영)
+    USER_EMAIL_FILTER_REBUILD_SECONDS: float = 3600.0
+    USER_EMAIL_FILTER_TTL_SECONDS: int = 3 * 3600  # 이벤트 워커가 멈추면 만료되어 인덱스 조회로 돌아간다
+    USER_EMAIL_FILTER_SCAN_PAGE_SIZE: int = 100  # 필터를 만들 때 스캔 페이지당 아이템 수
+    USER_EMAIL_FILTER_SCAN_INTERVAL_SECONDS: float = 1.0  # 스캔 페이지 사이 대기 (읽기 용량 보호)
+
+    # 오늘의 질문 설정
+    QUESTION_HISTORY_LIMIT: int = 30  # 오늘의 질문 화면에 보여 주는 최근 답변 수
+    QUESTION_CACHE_MAXSIZE: int = 64
+    QUESTION_CACHE_TTL_SECONDS: float = 300.0  # 관리자가 질문을 고치면 워커마다 이 시간 안에 반영
+
     # AWS 설정
     AWS_REGION: str = "ap-northeast-2"
     AWS_ACCESS_KEY_ID: str = "test"
@@ -33,6 +94,16 @@ class Settings(BaseSettings):
     DYNAMODB_ENDPOINT: Optional[str] = "http://dynamodb-local:8000"  # 프로덕션에서는 None
     DYNAMODB_TABLE_PREFIX: str = "dailydevq-dev"
     DYNAMODB_USERS_TABLE: str = "users"
+    DYNAMODB_APP_TABLE: str = "app"  # 질문/답변/스트릭 단일 테이블 (PK/SK)
+    DYNAMODB_MAX_POOL_CONNECTIONS: Optional[int] = None  # 없으면 WORKER_MAX_CONCURRENCY
+    DYNAMODB_RETRY_MODE: str = "adaptive"  # legacy | standard | adaptive (스로틀 시 클라이언트 측 속도 제한)
+    DYNAMODB_MAX_ATTEMPTS: int = 3  # 첫 시도 포함
+    DYNAMODB_CONNECT_TIMEOUT_SECONDS: float = 0.5
+    DYNAMODB_REQUEST_DEADLINE_SECONDS: float = 6.0  # 재시도 포함 호출 하나의 시간 예산
+    DYNAMODB_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패(스로틀/5xx/타임아웃) 횟수
+    DYNAMODB_CIRCUIT_RESET_SECONDS: float = 10.0  # 서킷이 열린 뒤 시험 호출까지 대기 시간
+    ACTIVE_SUBSCRIBER_SHARDS: int = 8  # active-subscribers-index 파티션 수 (변경 시 재색인 필요)
+    SCHEMA_CHECK_MODE: str = "warn"  # 시작 시 스키마 점검: fail | warn | off
 
     # S3 설정
     S3_BUCKET_NAME: str = "dailydevq-dev-bucket"
@@ -41,7 +112,22 @@ class Settings(BaseSettings):
     # JWT 설정
     JWT_SECRET: str = "dev-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
-    JWT_EXPIRE_HOURS: int = 24
+    JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    JWT_KEY_ID: str = "k1"  # 현재 서명 키 ID (토큰 헤더 kid)
+    JWT_PRIVATE_KEY: Optional[str] = None  # ES256 등 비대칭 알고리즘의 서명 키 (PEM)
+    JWT_VERIFY_KEYS: Dict[str, str] = {}  # 교체 전 검증 전용 키 (JSON: {"kid": "시크릿 또는 공개키 PEM"})
+    JWT_CLAIMS_CACHE_SIZE: int = 10000
+    JWT_CLAIMS_CACHE_TTL_SECONDS: float = 300.0
+
+    # 세션 폐기 목록 설정
+    AUTH_REVOCATION_BLOOM: bool = True  # 워커별 Bloom filter로 폐기되지 않은 세션은 Redis 조회 생략
+    AUTH_REVOCATION_BLOOM_CAPACITY: int = 100000
+    AUTH_REVOCATION_SYNC_SECONDS: float = 60.0  # Bloom filter 전체 재구성 주기
+
+    # 관리자 API 설정 (미설정 시 가져오기/내보내기 API 비활성화)
+    ADMIN_API_KEY: Optional[str] = None
+    BULK_IMPORT_CONCURRENCY: int = 4  # 동시에 쓰는 청크 수 (청크당 조건부 PutItem 25개)
 
     # API 문서 설정
     ENABLE_SWAGGER: bool = True
@@ -53,19 +139,56 @@ class Settings(BaseSettings):
     # Anthropic 설정
     ANTHROPIC_API_KEY: Optional[str] = None
 
+    # 질문 생성 설정 (utils/generate_questions.py)
+    QUESTION_LLM_PROVIDER: str = "openai"  # openai | anthropic | fake
+    QUESTION_LLM_MODEL: Optional[str] = None  # 없으면 제공자 기본 모델
+    QUESTION_LLM_CONCURRENCY: int = 4  # 동시에 보내는 LLM 요청 수
+    QUESTION_LLM_MAX_TOKENS: int = 1500
+    QUESTION_LLM_TIMEOUT_SECONDS: float = 60.0
+    QUESTION_LLM_MAX_RETRIES: int = 3  # SDK의 429/5xx 재시도
+    QUESTION_LLM_MAX_ATTEMPTS: int = 3  # 형식이 잘못된 응답을 다시 요청하는 횟수 (첫 요청 포함)
+    QUESTION_CATEGORIES: str = "운영체제,네트워크,데이터베이스,자료구조,알고리즘"  # 하루에 분야별로 하나씩
+
     # Google OAuth 설정
     GOOGLE_CLIENT_ID: Optional[str] = None
     GOOGLE_CLIENT_SECRET: Optional[str] = None
     GOOGLE_REDIRECT_URI: str = "http://localhost:3000/auth/google/callback"
 
+    # 외부 HTTP 클라이언트 설정
+    HTTP_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+
     # Email 설정
     SMTP_HOST: str = "mailhog"
     SMTP_PORT: int = 1025
     SMTP_FROM: str = "noreply@dailydevq.dev"
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = False
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    SMTP_POOL_SIZE: int = 10
+    SMTP_RATE_LIMIT_PER_SECOND: float = 0  # 0이면 제한 없음
+
+    # 사용자 이벤트 설정 (DynamoDB Streams → Redis Streams, utils/event_worker.py)
+    EVENTS_STREAM_MAXLEN: int = 100000  # Redis 스트림에 남기는 이벤트 수 (근사치)
+    EVENTS_BATCH_SIZE: int = 100  # 소비자가 한 번에 읽는 이벤트 수
+    EVENTS_BLOCK_MS: int = 1000
+    EVENTS_CLAIM_IDLE_SECONDS: float = 60.0  # 이 시간 동안 처리되지 않은 이벤트는 다른 소비자가 가져간다
+    EVENTS_MAX_DELIVERIES: int = 5  # 넘으면 dead letter 스트림으로 옮긴다
+    EVENTS_DONE_TTL_SECONDS: int = 7 * 24 * 3600  # 핸들러별 처리 완료 기록 보관 시간
+    EVENTS_RELAY_POLL_SECONDS: float = 1.0  # 새 스트림 레코드가 없을 때 다시 읽기까지 대기 시간
+    WELCOME_EMAIL_ENABLED: bool = True
+
+    # 뉴스레터 발송 설정
+    NEWSLETTER_UNSUBSCRIBE_URL: str = "http://localhost:3000/unsubscribe"
+    NEWSLETTER_CHECKPOINT_TTL_SECONDS: int = 7 * 24 * 3600
 
     class Config:
         env_file = ".env.local"
         case_sensitive = True
 
 
-settings = Settings()
+# CONFIG_FILE(환경 변수)을 주면 .env.local 대신 읽는다 (core/runtime_config.py가 다시 읽는 파일)
+settings = Settings(_env_file=os.environ.get("CONFIG_FILE") or Settings.model_config["env_file"])
@@ -0,0 +1,24 @@
+"""
+CORS (허용 origin을 설정 스냅샷에서 읽는다)
+"""
+
+from starlette.middleware.cors import CORSMiddleware
+
+from dailydevq_backend.core.runtime_config import RuntimeConfig, runtime_config
+
+
+class DynamicCORSMiddleware(CORSMiddleware):
+    """허용 origin을 요청마다 현재 스냅샷의 미리 만든 집합에서 확인하는 CORS 미들웨어
+
+    Starlette CORSMiddleware는 allow_origins를 생성할 때 고정하므로 CORS_ORIGINS를 바꾸려면
+    재시작해야 한다. 여기서는 origin 확인만 바꾸고 나머지 헤더 처리는 그대로 쓴다.
+    allow_credentials=True로 쓰므로 "*"도 요청 origin을 그대로 돌려준다 (Starlette와 같다).
+    """
+
+    def __init__(self, app, config: RuntimeConfig = runtime_config, **options):
+        super().__init__(app, **options)
+        self.config = config
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        snapshot = self.config.current
+        return snapshot.cors_allow_all or origin in snapshot.cors_origins
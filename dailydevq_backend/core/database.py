@@ -2,13 +2,96 @@
 DynamoDB 클라이언트 설정
 """
 
-import boto3
-from typing import Optional
+import asyncio
+import importlib
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from dailydevq_backend.core.circuit_breaker import STATE_VALUES, CircuitBreaker, CircuitOpenError
 from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.metrics import (
+    DYNAMODB_CIRCUIT_REJECTIONS,
+    DYNAMODB_CIRCUIT_STATE,
+    THROTTLE_CODES,
+    dynamodb_call_scope,
+    instrument_dynamodb,
+)
+
+# DynamoDB가 과부하/장애 상태라는 뜻인 오류 (조건 실패 같은 요청 오류는 제외)
+DEGRADED_ERROR_CODES = THROTTLE_CODES | {"InternalServerError", "ServiceUnavailable"}
+
+# 시도당 읽기 타임아웃 하한 (시간 예산이 너무 작게 설정돼도 정상 응답은 받을 수 있게)
+MIN_READ_TIMEOUT_SECONDS = 0.1
+
+
+def dynamodb_config():
+    """DynamoDB 클라이언트 정책 (재시도, 타임아웃, 커넥션 풀)
+
+    adaptive 재시도 모드는 스로틀 응답을 받으면 클라이언트 쪽 토큰 버킷으로 보내는 속도를 줄인다.
+    (연결 + 읽기) 타임아웃 × 시도 횟수를 DYNAMODB_REQUEST_DEADLINE_SECONDS에 맞춘다
+    (botocore 기본값은 읽기 60초). 재시도 대기와 토큰 버킷 대기는 AsyncDynamoDBClient.deadline()이
+    제한한다.
+    커넥션 풀은 워커의 동시 요청 수만큼 잡아 요청이 풀 대기열에 쌓이지 않게 한다.
+    """
+    from botocore.config import Config
+
+    attempts = settings.DYNAMODB_MAX_ATTEMPTS
+    connect_timeout = settings.DYNAMODB_CONNECT_TIMEOUT_SECONDS
+    read_timeout = max(
+        settings.DYNAMODB_REQUEST_DEADLINE_SECONDS / attempts - connect_timeout,
+        MIN_READ_TIMEOUT_SECONDS,
+    )
+    return Config(
+        retries={"mode": settings.DYNAMODB_RETRY_MODE, "total_max_attempts": attempts},
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        max_pool_connections=(
+            settings.DYNAMODB_MAX_POOL_CONNECTIONS or settings.WORKER_MAX_CONCURRENCY
+        ),
+    )
+
+
+def guard_dynamodb(client, breaker: CircuitBreaker) -> None:
+    """botocore 이벤트로 DynamoDB 호출에 서킷 브레이커 적용
+
+    SDK 재시도의 시도마다 결과를 센다 (adaptive 모드는 스로틀 후 보내는 속도를 크게 줄이므로
+    호출 단위로 세면 서킷이 열리기 전에 호출이 쌓인다). 스로틀/5xx 응답과 타임아웃/연결 오류는
+    실패, 그 밖의 응답(조건 실패 등 요청 오류 포함)은 성공이다. 서킷이 열려 있으면 요청을
+    보내지 않고 before-call에서 CircuitOpenError를 낸다.
+    """
+
+    def before_call(model, **kwargs) -> None:
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            DYNAMODB_CIRCUIT_REJECTIONS.labels(model.name).inc()
+            raise
+
+    def on_attempt(response, caught_exception=None, **kwargs) -> None:
+        if response is None:
+            failed = caught_exception is not None
+        else:
+            http_response, parsed = response
+            code = parsed.get("Error", {}).get("Code")
+            failed = code in DEGRADED_ERROR_CODES or http_response.status_code >= 500
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        DYNAMODB_CIRCUIT_STATE.set(STATE_VALUES[breaker.state])
+
+    events = client.meta.events
+    # 거부된 호출은 지표/트레이싱 훅이 시작되기 전에 끝나야 하므로 맨 앞에 건다
+    events.register_first("before-call.dynamodb", before_call)
+    # 재시도 핸들러가 재시도를 결정하면 뒤의 needs-retry 핸들러는 불리지 않으므로 맨 앞에 건다
+    events.register_first("needs-retry.dynamodb", on_attempt)
 
 
 class DynamoDBClient:
-    """DynamoDB 클라이언트 싱글톤"""
+    """DynamoDB 클라이언트 싱글톤 (동기, CLI/스크립트용)
+
+    boto3 import와 서비스 모델 로딩이 무거우므로 처음 사용할 때 만든다.
+    """
 
     _instance: Optional["DynamoDBClient"] = None
     _dynamodb = None
@@ -19,28 +102,30 @@ class DynamoDBClient:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if self._dynamodb is None:
-            self._initialize_client()
-
     def _initialize_client(self):
         """DynamoDB 클라이언트 초기화"""
+        import boto3
+
         session = boto3.Session(
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION,
         )
 
+        config = dynamodb_config()
+
         # DynamoDB Resource (고수준 API)
         self._dynamodb = session.resource(
             "dynamodb",
             endpoint_url=settings.DYNAMODB_ENDPOINT,
+            config=config,
         )
 
         # DynamoDB Client (저수준 API)
         self._client = session.client(
             "dynamodb",
             endpoint_url=settings.DYNAMODB_ENDPOINT,
+            config=config,
         )
 
     @property
@@ -63,5 +148,171 @@ class DynamoDBClient:
         return self.dynamodb.Table(full_table_name)
 
 
+class AsyncDynamoDBClient:
+    """aioboto3 기반 비동기 DynamoDB 클라이언트
+
+    워커 하나가 세션 하나와 크기가 제한된 커넥션 풀을 공유하므로 요청마다 클라이언트를
+    만들지 않는다. aioboto3 import와 리소스 생성은 무거우므로 import 시점이 아니라
+    start() 또는 첫 resource()/get_table() 호출 때 한 번만 하고, 정리는 앱 lifespan이 맡는다.
+    breaker를 주면 두 클라이언트의 모든 호출에 서킷 브레이커를 건다.
+    """
+
+    def __init__(self, breaker: Optional[CircuitBreaker] = None):
+        self.breaker = breaker
+        # deadline() 안에서 진행 중인 호출의 시간 제한 (서킷이 열리면 바로 만료시킨다)
+        self._deadlines: Set[asyncio.Timeout] = set()
+        self._cut_deadlines: Set[asyncio.Timeout] = set()
+        if breaker is not None:
+            breaker.on_open(self._cut_in_flight)
+        self._session = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._dynamodb = None
+        self._client = None
+        self._tables: Dict[str, object] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._dynamodb is not None
+
+    async def start(self):
+        """세션과 커넥션 풀 생성 (동시에 여러 번 호출돼도 한 번만 만든다)"""
+        if self._dynamodb is not None:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._dynamodb is None:
+                await self._create_resource()
+
+    async def _create_resource(self):
+        # aioboto3 import는 수백 ms가 걸리므로 스레드에서 불러와 그동안 이벤트 루프가 다른 요청을 처리하게 한다
+        aioboto3 = await asyncio.to_thread(importlib.import_module, "aioboto3")
+
+        self._session = aioboto3.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+        )
+        config = dynamodb_config()
+
+        exit_stack = AsyncExitStack()
+        dynamodb = await exit_stack.enter_async_context(
+            self._session.resource(
+                "dynamodb",
+                endpoint_url=settings.DYNAMODB_ENDPOINT,
+                config=config,
+            )
+        )
+        # resource.meta.client는 resource 계층의 변환 훅(Decimal 변환 등)이 걸려 있으므로
+        # 저수준 형식을 그대로 쓰는 조회용 클라이언트를 따로 만든다
+        client = await exit_stack.enter_async_context(
+            self._session.client(
+                "dynamodb",
+                endpoint_url=settings.DYNAMODB_ENDPOINT,
+                config=config,
+            )
+        )
+        if settings.METRICS_ENABLED:
+            instrument_dynamodb(dynamodb.meta.client)
+            instrument_dynamodb(client)
+        if self.breaker is not None:
+            guard_dynamodb(dynamodb.meta.client, self.breaker)
+            guard_dynamodb(client, self.breaker)
+        self._exit_stack = exit_stack
+        self._client = client
+        self._dynamodb = dynamodb
+
+    async def stop(self):
+        """커넥션 풀 정리"""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._dynamodb = None
+        self._client = None
+        self._session = None
+        self._tables.clear()
+
+    @property
+    def dynamodb(self):
+        """DynamoDB Resource 반환"""
+        if self._dynamodb is None:
+            raise RuntimeError("AsyncDynamoDBClient가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+        return self._dynamodb
+
+    @property
+    def client(self):
+        """DynamoDB Client 반환 (저수준 API, 속성 값이 {"S": ...} 형식 그대로 오간다)"""
+        if self._client is None:
+            raise RuntimeError("AsyncDynamoDBClient가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+        return self._client
+
+    async def resource(self):
+        """DynamoDB Resource 반환 (아직 없으면 생성)"""
+        if self._dynamodb is None:
+            await self.start()
+        return self._dynamodb
+
+    async def get_client(self):
+        """DynamoDB Client 반환 (아직 없으면 생성)"""
+        if self._client is None:
+            await self.start()
+        return self._client
+
+    @asynccontextmanager
+    async def deadline(self) -> AsyncIterator[None]:
+        """요청 경로 호출 하나의 전체 시간 제한 (재시도 대기, 클라이언트 측 속도 제한 대기 포함)
+
+        타임아웃은 시도 하나만 제한하므로 스로틀이 이어지면 adaptive 모드의 토큰 버킷에서
+        기다리는 호출이 계속 쌓인다. 시간을 넘기면 서킷 실패로 세고 TimeoutError를 낸다.
+        기다리던 중 서킷이 열리면 남은 시간을 기다리지 않고 CircuitOpenError를 낸다.
+        """
+        timeout = asyncio.timeout(settings.DYNAMODB_REQUEST_DEADLINE_SECONDS)
+        # 시간을 넘겨 취소된 호출도 지연 시간을 기록하고 span을 닫는다
+        with dynamodb_call_scope():
+            try:
+                async with timeout:
+                    self._deadlines.add(timeout)
+                    try:
+                        yield
+                    finally:
+                        self._deadlines.discard(timeout)
+            except TimeoutError:
+                if timeout in self._cut_deadlines:
+                    self._cut_deadlines.discard(timeout)
+                    raise CircuitOpenError(self.breaker.name, self.breaker.reset_timeout) from None
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                raise
+
+    def _cut_in_flight(self) -> None:
+        """서킷이 열리면 진행 중인 호출(대부분 토큰 버킷 대기)을 바로 끝낸다"""
+        if not self._deadlines:
+            return
+        now = asyncio.get_running_loop().time()
+        for timeout in self._deadlines:
+            self._cut_deadlines.add(timeout)
+            timeout.reschedule(now)
+
+    def table_name(self, table_name: str) -> str:
+        """접두사가 붙은 실제 테이블 이름 (저수준 Client 호출용)"""
+        return f"{settings.DYNAMODB_TABLE_PREFIX}-{table_name}"
+
+    async def get_table(self, table_name: str):
+        """DynamoDB 테이블 반환"""
+        full_table_name = self.table_name(table_name)
+        table = self._tables.get(full_table_name)
+        if table is None:
+            table = await (await self.resource()).Table(full_table_name)
+            self._tables[full_table_name] = table
+        return table
+
+
 # 싱글톤 인스턴스
+dynamodb_breaker = CircuitBreaker(
+    "dynamodb",
+    failure_threshold=settings.DYNAMODB_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.DYNAMODB_CIRCUIT_RESET_SECONDS,
+)
 dynamodb_client = DynamoDBClient()
+async_dynamodb_client = AsyncDynamoDBClient(breaker=dynamodb_breaker)
@@ -0,0 +1,246 @@
+"""
+의존성 헬스체크 (백그라운드 주기 점검 + 결과 캐시)
+"""
+
+import asyncio
+import logging
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient, async_dynamodb_client
+from dailydevq_backend.core.metrics import DEPENDENCY_LATENCY, DEPENDENCY_UP
+from dailydevq_backend.core.redis import RedisClient, redis_client
+from dailydevq_backend.core.runtime_config import runtime_config
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class ProbeResult:
+    healthy: bool
+    latency_ms: float
+    checked_at: str
+    error: Optional[str] = None
+
+
+class HealthMonitor:
+    """등록된 의존성을 interval마다 동시에 점검하고 결과를 캐시한다
+
+    readiness 요청은 캐시된 스냅샷만 읽으므로 로드밸런서가 아무리 자주 호출해도
+    외부 I/O가 생기지 않는다. 첫 점검이 끝나기 전(starting)이나 점검 루프가 멈춰 결과가
+    오래되면(stale) 준비되지 않은 것으로 본다. 필수가 아닌 의존성만 실패하면 준비된 상태로 두고
+    degraded로 보고한다.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.HEALTH_CHECK_INTERVAL_SECONDS,
+        timeout: float = settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self._probes: Dict[str, Probe] = {}
+        self._required: Dict[str, bool] = {}
+        self._results: Dict[str, ProbeResult] = {}
+        self._updated_at = float("-inf")
+        self._task: Optional[asyncio.Task] = None
+        self.draining = False
+
+    def register(self, name: str, probe: Probe, required: bool = True) -> None:
+        """점검 함수 등록 (required=False면 결과만 보고하고 readiness에는 영향 없음)"""
+        self._probes[name] = probe
+        self._required[name] = required
+
+    async def start(self):
+        """백그라운드 점검 시작 (첫 점검을 기다리지 않으므로 기동이 느려지지 않는다)"""
+        if self._task is not None:
+            return
+        self.draining = False
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """점검 중단 (이후 readiness는 draining으로 실패)"""
+        self.draining = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                logger.exception("헬스체크 실패: %s", e)
+            await asyncio.sleep(self.interval)
+
+    async def _run(self, name: str, probe: Probe) -> ProbeResult:
+        started = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(probe(), timeout=self.timeout)
+        except TimeoutError:
+            error = f"timeout after {self.timeout}s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        DEPENDENCY_UP.labels(name).set(0 if error else 1)
+        DEPENDENCY_LATENCY.labels(name).set(latency_ms / 1000)
+        previous = self._results.get(name)
+        if error and (previous is None or previous.healthy):
+            logger.warning("의존성 점검 실패 (%s): %s", name, error)
+        elif not error and previous is not None and not previous.healthy:
+            logger.info("의존성 복구 (%s)", name)
+
+        return ProbeResult(
+            healthy=error is None,
+            latency_ms=round(latency_ms, 2),
+            checked_at=datetime.now(UTC).isoformat(),
+            error=error,
+        )
+
+    async def check(self) -> None:
+        """모든 의존성을 동시에 한 번 점검"""
+        names = list(self._probes)
+        results = await asyncio.gather(*(self._run(name, self._probes[name]) for name in names))
+        self._results = dict(zip(names, results))
+        self._updated_at = time.monotonic()
+
+    @property
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._updated_at > self.interval * 3 + self.timeout
+
+    @property
+    def is_ready(self) -> bool:
+        if self.draining or self.is_stale:
+            return False
+        return all(
+            result.healthy for name, result in self._results.items() if self._required[name]
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """마지막 점검 결과 (외부 호출 없음)"""
+        if self.draining:
+            status = "draining"
+        elif not self._results:
+            status = "starting"
+        elif self.is_stale:
+            status = "stale"
+        else:
+            status = "not_ready"
+            if self.is_ready:
+                healthy = all(result.healthy for result in self._results.values())
+                status = "ready" if healthy else "degraded"
+        return {
+            "status": status,
+            "checks": {
+                name: {**result.__dict__, "required": self._required[name]}
+                for name, result in self._results.items()
+            },
+        }
+
+
+def dynamodb_probe(client: AsyncDynamoDBClient = async_dynamodb_client) -> Probe:
+    async def probe() -> None:
+        await (await client.get_client()).describe_table(
+            TableName=runtime_config.current.users_table
+        )
+
+    return probe
+
+
+def redis_probe(client: RedisClient = redis_client) -> Probe:
+    async def probe() -> None:
+        await client.client.ping()
+
+    return probe
+
+
+def smtp_probe(hostname: str = settings.SMTP_HOST, port: int = settings.SMTP_PORT) -> Probe:
+    """SMTP 서버 인사말(220) 확인 (TLS/로그인 없이 연결만 점검)"""
+
+    async def probe() -> None:
+        reader, writer = await asyncio.open_connection(hostname, port)
+        try:
+            greeting = await reader.readline()
+            if not greeting.startswith(b"220"):
+                raise ConnectionError(f"unexpected SMTP greeting: {greeting[:100]!r}")
+            writer.write(b"QUIT\r\n")
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    return probe
+
+
+health_monitor = HealthMonitor()
+required_dependencies = {
+    name.strip() for name in settings.HEALTH_REQUIRED_DEPENDENCIES.split(",") if name.strip()
+}
+health_monitor.register("dynamodb", dynamodb_probe(), required="dynamodb" in required_dependencies)
+health_monitor.register("redis", redis_probe(), required="redis" in required_dependencies)
+health_monitor.register("smtp", smtp_probe(), required="smtp" in required_dependencies)
+
+
+class DrainMiddleware:
+    """드레인 중에는 응답마다 Connection: close를 붙여 keep-alive 연결을 하나씩 닫는다
+
+    종료할 때 유휴 keep-alive 연결을 서버가 먼저 닫으면, 그 연결로 막 보낸 요청은 응답 없이
+    끊긴다. 응답과 함께 닫으면 클라이언트가 다음 요청을 새 연결로 보낸다.
+    """
+
+    def __init__(self, app: ASGIApp, monitor: HealthMonitor = health_monitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_close(message: Message) -> None:
+            # 요청 도중 드레인이 시작될 수 있으므로 응답을 시작할 때 확인한다
+            if message["type"] == "http.response.start" and self.monitor.draining:
+                message["headers"] = [*message.get("headers", []), (b"connection", b"close")]
+            await send(message)
+
+        await self.app(scope, receive, send_with_close)
+
+
+def install_drain_handler(seconds: float, monitor: HealthMonitor = health_monitor) -> None:
+    """SIGTERM을 받으면 seconds 동안 드레인한 뒤 uvicorn 종료 절차로 넘긴다
+
+    lifespan 시작 시점에 설치된 uvicorn의 SIGTERM 핸들러를 감싼다. 드레인 중에는 요청을 계속
+    받으면서 readiness를 실패시키고(로드밸런서가 대상에서 뺀다) keep-alive 연결을 닫는다. 그 뒤
+    uvicorn이 새 연결을 막고 처리 중인 요청을 SERVER_GRACEFUL_TIMEOUT_SECONDS까지 기다린다.
+    드레인 중 SIGTERM을 다시 받으면 바로 종료 절차로 넘어간다.
+    """
+    if seconds <= 0 or threading.current_thread() is not threading.main_thread():
+        return
+    exit_handler = signal.getsignal(signal.SIGTERM)
+    if not callable(exit_handler):
+        return  # uvicorn 밖에서 실행 중
+    loop = asyncio.get_running_loop()
+
+    def drain(sig, frame) -> None:
+        if monitor.draining:
+            exit_handler(sig, frame)
+            return
+        monitor.draining = True
+        loop.call_soon_threadsafe(loop.call_later, seconds, exit_handler, sig, None)
+
+    signal.signal(signal.SIGTERM, drain)
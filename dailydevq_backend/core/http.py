@@ -0,0 +1,55 @@
+"""
+공유 HTTP 클라이언트
+"""
+
+from typing import Optional
+
+import httpx
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.metrics import HTTPX_EVENT_HOOKS
+
+
+class HTTPClient:
+    """앱 lifespan이 소유하는 httpx.AsyncClient
+
+    외부 API 호출마다 TCP/TLS 핸드셰이크를 새로 하지 않도록 HTTP/2 keep-alive
+    커넥션 풀을 워커 전체가 공유한다. TLS 컨텍스트 생성 비용이 있어 처음 쓸 때 만든다.
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self):
+        """커넥션 풀 생성"""
+        self._create()
+
+    def _create(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(
+                settings.HTTP_TIMEOUT_SECONDS, connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            event_hooks=HTTPX_EVENT_HOOKS if settings.METRICS_ENABLED else None,
+        )
+        return self._client
+
+    async def stop(self):
+        """커넥션 풀 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or self._create()
+
+
+http_client = HTTPClient()
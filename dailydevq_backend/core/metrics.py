@@ -0,0 +1,277 @@
+"""
+Prometheus 지표 (HTTP 요청, DynamoDB 호출, 외부 HTTP 호출)
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dailydevq_backend.core import tracing
+
+# 지연 시간 구간 (초): 1ms ~ 10s
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP 요청 수", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수", multiprocess_mode="livesum")
+
+DYNAMODB_LATENCY = Histogram(
+    "dynamodb_operation_duration_seconds",
+    "DynamoDB 호출 시간 (SDK 재시도 포함)",
+    ["operation", "table"],
+    buckets=LATENCY_BUCKETS,
+)
+DYNAMODB_CONSUMED_CAPACITY = Counter(
+    "dynamodb_consumed_capacity_units_total", "DynamoDB 소비 용량 (RCU+WCU)", ["operation", "table"]
+)
+DYNAMODB_RETRIES = Counter("dynamodb_retries_total", "DynamoDB SDK 재시도 횟수", ["operation"])
+DYNAMODB_ERRORS = Counter("dynamodb_errors_total", "DynamoDB 오류 응답", ["operation", "code"])
+DYNAMODB_THROTTLES = Counter(
+    "dynamodb_throttles_total", "DynamoDB 처리량 초과 응답 (재시도된 시도 포함)", ["operation"]
+)
+
+DYNAMODB_CIRCUIT_STATE = Gauge(
+    "dynamodb_circuit_state",
+    "DynamoDB 서킷 상태 (0: closed, 1: half_open, 2: open)",
+    multiprocess_mode="liveall",
+)
+DYNAMODB_CIRCUIT_REJECTIONS = Counter(
+    "dynamodb_circuit_rejections_total", "서킷이 열려 보내지 않은 DynamoDB 호출", ["operation"]
+)
+
+EXTERNAL_LATENCY = Histogram(
+    "external_request_duration_seconds",
+    "외부 HTTP 호출 시간",
+    ["host", "method", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DEPENDENCY_UP = Gauge(
+    "dependency_up", "의존성 점검 결과 (1: 정상)", ["dependency"], multiprocess_mode="liveall"
+)
+DEPENDENCY_LATENCY = Gauge(
+    "dependency_probe_latency_seconds", "의존성 점검 소요 시간", ["dependency"], multiprocess_mode="liveall"
+)
+
+THROTTLE_CODES = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+}
+
+# ReturnConsumedCapacity를 받는 작업
+CAPACITY_OPERATIONS = {
+    "GetItem",
+    "PutItem",
+    "UpdateItem",
+    "DeleteItem",
+    "Query",
+    "Scan",
+    "BatchGetItem",
+    "BatchWriteItem",
+    "TransactGetItems",
+    "TransactWriteItems",
+}
+
+
+# dynamodb_call_scope() 안에서 시작해 아직 끝나지 않은 DynamoDB 호출의 context
+_open_calls: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "dynamodb_open_calls", default=None
+)
+
+
+class MetricsMiddleware:
+    """요청별 지연 시간, 상태 코드, 처리 중 요청 수 기록 (ASGI 미들웨어)
+
+    route 라벨은 실제 경로가 아니라 라우트 템플릿(/status/{email})이라 라벨 수가 늘지 않는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_LATENCY.labels(method, route_path).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route_path, str(status)).inc()
+
+
+def _consumed_units(consumed: Any) -> float:
+    if isinstance(consumed, list):
+        return sum(item.get("CapacityUnits", 0) for item in consumed)
+    if isinstance(consumed, dict):
+        return consumed.get("CapacityUnits", 0)
+    return 0
+
+
+def _before_parameter_build(params: Dict[str, Any], model, context: Dict[str, Any], **kwargs) -> None:
+    if model.name in CAPACITY_OPERATIONS:
+        params.setdefault("ReturnConsumedCapacity", "TOTAL")
+    # Batch*/Transact*는 테이블이 여러 개일 수 있어 "-"로 묶는다
+    context["metrics_table"] = params.get("TableName", "-")
+
+
+def _before_call(model, context: Dict[str, Any], **kwargs) -> None:
+    context["metrics_started"] = time.perf_counter()
+    context["metrics_operation"] = model.name
+    open_calls = _open_calls.get()
+    if open_calls is not None:
+        open_calls.append(context)
+    span = tracing.start_client_span(
+        f"DynamoDB.{model.name}",
+        {
+            "db.system": "dynamodb",
+            "db.operation": model.name,
+            "aws.dynamodb.table_names": [context.get("metrics_table", "-")],
+        },
+    )
+    if span is not None:
+        context["metrics_span"] = span
+
+
+def _on_attempt(response: Tuple[Any, Dict[str, Any]], operation, **kwargs) -> None:
+    # 재시도 여부를 판단하는 needs-retry 이벤트는 시도마다 발생한다 (None 반환이라 재시도 판단에 영향 없음)
+    if response is not None and response[1].get("Error", {}).get("Code") in THROTTLE_CODES:
+        DYNAMODB_THROTTLES.labels(operation.name).inc()
+
+
+def _finish_call(
+    context: Dict[str, Any], parsed: Optional[Dict[str, Any]] = None, error: Optional[str] = None
+) -> None:
+    """호출 하나의 시간/소비 용량/재시도/오류 기록과 span 종료 (호출마다 한 번만)"""
+    started = context.pop("metrics_started", None)
+    if started is None:
+        return
+    open_calls = _open_calls.get()
+    if open_calls is not None and context in open_calls:
+        open_calls.remove(context)
+    operation = context.get("metrics_operation", "-")
+    table = context.pop("metrics_table", "-")
+    DYNAMODB_LATENCY.labels(operation, table).observe(time.perf_counter() - started)
+
+    parsed = parsed or {}
+    retries = parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+    if retries:
+        DYNAMODB_RETRIES.labels(operation).inc(retries)
+    units = _consumed_units(parsed.get("ConsumedCapacity"))
+    if units:
+        DYNAMODB_CONSUMED_CAPACITY.labels(operation, table).inc(units)
+
+    code = error or parsed.get("Error", {}).get("Code")
+    if code:
+        DYNAMODB_ERRORS.labels(operation, code).inc()
+
+    span = context.pop("metrics_span", None)
+    if span is not None:
+        span.set_attribute("aws.dynamodb.consumed_capacity", units)
+        span.set_attribute("aws.dynamodb.retry_attempts", retries)
+        tracing.end_span(span, error=code)
+
+
+def _after_call(parsed: Dict[str, Any], context: Dict[str, Any], **kwargs) -> None:
+    _finish_call(context, parsed=parsed)
+
+
+def _after_call_error(exception: Exception, context: Dict[str, Any], **kwargs) -> None:
+    # 응답을 받지 못한 호출 (연결 실패, 읽기 타임아웃 등 전송 오류)
+    _finish_call(context, error=type(exception).__name__)
+
+
+@contextmanager
+def dynamodb_call_scope() -> Iterator[None]:
+    """범위 안에서 시작한 호출이 응답 없이 취소되면(호출 시간 제한 등) 기록과 span을 마무리
+
+    취소는 botocore의 after-call/after-call-error 이벤트를 거치지 않는다.
+    """
+    open_calls: List[Dict[str, Any]] = []
+    token = _open_calls.set(open_calls)
+    try:
+        yield
+    except BaseException as e:
+        for context in list(open_calls):
+            _finish_call(context, error=type(e).__name__)
+        raise
+    finally:
+        _open_calls.reset(token)
+
+
+def instrument_dynamodb(client) -> None:
+    """botocore 이벤트로 모든 DynamoDB 호출의 시간/소비 용량/재시도/스로틀 기록
+
+    저장소 코드를 고치지 않아도 UserRepository를 거치는 모든 호출이 측정된다. 응답을 받지 못한
+    호출(전송 오류)도 after-call-error에서 기록하고 span을 닫는다.
+    응답에 소비 용량을 받기 위해 ReturnConsumedCapacity=TOTAL을 기본으로 붙인다 (추가 비용 없음).
+    """
+    events = client.meta.events
+    events.register("before-parameter-build.dynamodb", _before_parameter_build)
+    events.register("before-call.dynamodb", _before_call)
+    # 재시도 핸들러가 재시도를 결정하면 뒤의 needs-retry 핸들러는 불리지 않으므로 맨 앞에 건다
+    events.register_first("needs-retry.dynamodb", _on_attempt)
+    events.register("after-call.dynamodb", _after_call)
+    events.register("after-call-error.dynamodb", _after_call_error)
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions["metrics_started"] = time.perf_counter()
+
+
+async def _on_response(response: httpx.Response) -> None:
+    started = response.request.extensions.get("metrics_started")
+    if started is not None:
+        EXTERNAL_LATENCY.labels(
+            response.request.url.host, response.request.method, str(response.status_code)
+        ).observe(time.perf_counter() - started)
+
+
+# httpx.AsyncClient(event_hooks=...)에 넘기는 외부 호출 측정 훅 (Google OAuth/JWKS 등)
+HTTPX_EVENT_HOOKS = {"request": [_on_request], "response": [_on_response]}
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """/metrics 응답 본문과 Content-Type
+
+    여러 워커로 띄울 때는 PROMETHEUS_MULTIPROC_DIR을 지정해 모든 워커의 값을 합쳐서 내보낸다.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,204 @@
+"""
+요청 속도 제한 (Redis 토큰 버킷 + 로컬 fallback)
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from redis.exceptions import RedisError
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dailydevq_backend.core.redis import RedisClient, redis_client
+
+logger = logging.getLogger(__name__)
+
+# 토큰 버킷 (KEYS[1]: 버킷 키, ARGV: 용량, ms당 충전량, 소모량)
+# 시계는 Redis TIME을 써서 워커 간 시간 차이의 영향을 받지 않는다.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now_parts = redis.call('TIME')
+local now = now_parts[1] * 1000 + math.floor(now_parts[2] / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_after = math.ceil((cost - tokens) / rate)
+end
+local reset = math.ceil((capacity - tokens) / rate)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], reset + 1000)
+return {allowed, math.floor(tokens), retry_after, reset}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """period초 동안 limit회 (토큰 버킷: 최대 limit회 몰아서 허용)"""
+
+    name: str
+    limit: int
+    period: float
+
+    @property
+    def rate_per_ms(self) -> float:
+        return self.limit / (self.period * 1000)
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after_ms: int
+    reset_ms: int
+
+    def headers(self) -> Dict[str, str]:
+        """RateLimit-* (IETF draft) 및 Retry-After 헤더"""
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(math.ceil(self.reset_ms / 1000)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after_ms / 1000)))
+        return headers
+
+
+class LocalTokenBucket:
+    """Redis를 쓸 수 없을 때 쓰는 워커 내부 토큰 버킷 (키 수 제한 LRU)"""
+
+    def __init__(self, maxsize: int = 100000):
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+    def hit(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        now = time.monotonic() * 1000
+        tokens, updated_at = self._buckets.get(key, (float(rule.limit), now))
+        tokens = min(rule.limit, tokens + (now - updated_at) * rule.rate_per_ms)
+        allowed = tokens >= cost
+        retry_after = 0
+        if allowed:
+            tokens -= cost
+        else:
+            retry_after = math.ceil((cost - tokens) / rule.rate_per_ms)
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return RateLimitResult(
+            allowed=allowed,
+            limit=rule.limit,
+            remaining=int(tokens),
+            retry_after_ms=retry_after,
+            reset_ms=math.ceil((rule.limit - tokens) / rule.rate_per_ms),
+        )
+
+
+class RateLimiter:
+    """Redis Lua 토큰 버킷 (모든 워커가 같은 버킷을 공유)
+
+    Redis 호출이 실패하면 RETRY_INTERVAL 동안 로컬 버킷으로 제한하고, 그 뒤 다시
+    Redis를 시도한다. 장애 중에도 워커 단위로는 제한이 유지된다.
+    """
+
+    RETRY_INTERVAL = 5.0
+
+    def __init__(self, redis: RedisClient = redis_client, prefix: str = "ratelimit"):
+        self._redis = redis
+        self.prefix = prefix
+        self.local = LocalTokenBucket()
+        self._script = None
+        self._redis_retry_at = 0.0
+
+    async def hit(self, key: str, rule: RateLimitRule, cost: int = 1) -> RateLimitResult:
+        """요청 한 번을 기록하고 허용 여부 반환"""
+        if time.monotonic() >= self._redis_retry_at:
+            try:
+                return await self._redis_hit(key, rule, cost)
+            except (RedisError, OSError, RuntimeError) as e:
+                logger.warning("Redis 속도 제한을 쓸 수 없어 로컬 제한으로 전환합니다: %s", e)
+                self._redis_retry_at = time.monotonic() + self.RETRY_INTERVAL
+        return self.local.hit(f"{rule.name}:{key}", rule, cost)
+
+    async def _redis_hit(self, key: str, rule: RateLimitRule, cost: int) -> RateLimitResult:
+        client = self._redis.client
+        if self._script is None:
+            self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+        allowed, remaining, retry_after, reset = await self._script(
+            keys=[f"{self.prefix}:{rule.name}:{key}"],
+            args=[rule.limit, rule.rate_per_ms, cost],
+            client=client,
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=rule.limit,
+            remaining=int(remaining),
+            retry_after_ms=int(retry_after),
+            reset_ms=int(reset),
+        )
+
+
+class RateLimitMiddleware:
+    """경로별 클라이언트 IP 속도 제한 (ASGI 미들웨어)
+
+    프록시 뒤에서는 uvicorn --proxy-headers로 실제 클라이언트 IP가 scope에 들어와야 한다.
+    SERVER_FORWARDED_ALLOW_IPS에 프록시 주소가 없으면 모든 요청이 프록시 IP 하나의 버킷을 쓴다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter,
+        rules: Dict[str, RateLimitRule],
+        enabled: bool = True,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.rules = rules
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        rule: Optional[RateLimitRule] = None
+        if self.enabled and scope["type"] == "http":
+            rule = self.rules.get(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        result = await self.limiter.hit(f"ip:{client[0] if client else 'unknown'}", rule)
+        if not result.allowed:
+            response = JSONResponse(
+                {"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."},
+                status_code=429,
+                headers=result.headers(),
+            )
+            await response(scope, receive, send)
+            return
+
+        extra_headers = [
+            (name.lower().encode(), value.encode()) for name, value in result.headers().items()
+        ]
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,45 @@
+"""
+공유 Redis 클라이언트
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from dailydevq_backend.core.config import settings
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+class RedisClient:
+    """앱 lifespan이 소유하는 redis.asyncio 클라이언트 (커넥션 풀 공유)
+
+    처음 사용할 때 만들고(연결은 첫 명령에서 맺는다) stop()에서 정리한다.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        self._url = url
+        self._client: Optional[redis.Redis] = None
+
+    async def start(self):
+        """커넥션 풀 생성 (연결은 첫 명령에서 맺는다)"""
+        self._create()
+
+    def _create(self) -> "redis.Redis":
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.Redis.from_url(self._url or settings.REDIS_URL)
+        return self._client
+
+    async def stop(self):
+        """커넥션 풀 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+
+    @property
+    def client(self) -> "redis.Redis":
+        return self._client or self._create()
+
+
+redis_client = RedisClient()
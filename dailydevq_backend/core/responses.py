@@ -0,0 +1,21 @@
+"""
+JSON 응답 (pydantic-core 직렬화)
+"""
+
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """pydantic-core(Rust)로 바로 JSON 바이트를 만드는 응답 (앱 기본 응답 클래스)
+
+    엔드포인트는 모델을 그대로 반환하고, FastAPI가 response_model로 검증/필터링한 결과를
+    json.dumps 대신 to_json으로 직렬화한다. 이 응답 객체를 직접 반환하면 response_model
+    검증을 건너뛰므로 엔드포인트에서는 쓰지 않는다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
@@ -0,0 +1,179 @@
+"""
+설정 스냅샷과 재시작 없는 다시 읽기 (CORS 허용 origin, JWT 키)
+
+요청 경로는 runtime_config.current(ConfigSnapshot)만 읽는다. 스냅샷은 검증을 마친 설정과 미리
+계산한 파생 값(origin 집합, 실제 테이블 이름, derive()로 등록한 JWT 키 등)을 담고 바꾸지 않으며,
+다시 읽을 때는 새 스냅샷을 모두 만든 뒤 참조 하나만 바꾼다. 다시 읽기는 await 없이 한 번에
+실행되므로 같은 워커의 요청이 옛 값과 새 값을 섞어 보는 일이 없다.
+
+다시 읽는 방법 (워커마다 따로 반영한다):
+- 워커 프로세스에 SIGHUP (`pkill -HUP -P <uvicorn 부모 pid>`). 부모 프로세스가 SIGHUP을 받으면
+  uvicorn이 워커를 새로 띄운다 (재시작).
+- CONFIG_RELOAD_SECONDS > 0이면 env 파일(CONFIG_FILE, 없으면 .env.local)의 변경을 주기적으로 확인
+
+환경 변수가 env 파일보다 우선하므로, 재시작 없이 바꿀 값은 env 파일에만 둔다. 다시 읽기로
+바뀌는 설정은 RELOADABLE_SETTINGS와 derive()로 등록한 설정뿐이다. 나머지(커넥션 풀, 테이블 이름 등)는
+시작할 때 만든 객체가 이미 쓰고 있으므로 경고만 남기고 무시한다.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from pydantic import ValidationError
+
+from dailydevq_backend.core.config import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+# 요청마다 스냅샷에서 읽는 설정 (derive()로 등록한 설정도 다시 읽기 대상이 된다)
+RELOADABLE_SETTINGS = frozenset({"CORS_ORIGINS"})
+
+Builder = Callable[[Settings], Any]
+
+
+def parse_origins(value: str) -> FrozenSet[str]:
+    return frozenset(origin.strip().rstrip("/") for origin in value.split(",") if origin.strip())
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """검증을 마친 설정과 파생 값 (settings는 읽기 전용으로 쓴다)"""
+
+    settings: Settings
+    version: int
+    cors_origins: FrozenSet[str]
+    cors_allow_all: bool
+    users_table: str
+    app_table: str
+    derived: Mapping[str, Any]
+
+
+class RuntimeConfig:
+    """현재 설정 스냅샷 보관 및 교체"""
+
+    def __init__(self, initial: Settings = settings, path: Optional[str] = None):
+        self.path = path or initial.CONFIG_FILE or Settings.model_config.get("env_file")
+        self._builders: Dict[str, Tuple[FrozenSet[str], Builder]] = {}
+        self.current = self._build(initial, version=1)
+        self._signature = self._file_signature()
+        self._task: Optional[asyncio.Task] = None
+        self._signal_installed = False
+
+    @property
+    def reloadable(self) -> FrozenSet[str]:
+        fields = set(RELOADABLE_SETTINGS)
+        for depends_on, _ in self._builders.values():
+            fields |= depends_on
+        return frozenset(fields)
+
+    def derive(self, name: str, depends_on: Iterable[str], build: Builder) -> None:
+        """파생 값 등록 (현재 스냅샷에 바로 만들어 넣는다)
+
+        다시 읽을 때 depends_on 중 하나라도 바뀌면 새로 만들고, 아니면 이전 값을 그대로 쓴다.
+        build가 실패하면(잘못된 키 등) 새 설정 전체를 버리고 이전 스냅샷을 유지한다.
+        """
+        self._builders[name] = (frozenset(depends_on), build)
+        derived = {**self.current.derived, name: build(self.current.settings)}
+        self.current = replace(self.current, derived=MappingProxyType(derived))
+
+    def _build(
+        self, config: Settings, version: int, previous: Optional[ConfigSnapshot] = None
+    ) -> ConfigSnapshot:
+        derived = {}
+        for name, (depends_on, build) in self._builders.items():
+            unchanged = previous is not None and all(
+                getattr(config, field) == getattr(previous.settings, field) for field in depends_on
+            )
+            derived[name] = previous.derived[name] if unchanged else build(config)
+        origins = parse_origins(config.CORS_ORIGINS)
+        return ConfigSnapshot(
+            settings=config,
+            version=version,
+            cors_origins=origins,
+            cors_allow_all="*" in origins,
+            users_table=f"{config.DYNAMODB_TABLE_PREFIX}-{config.DYNAMODB_USERS_TABLE}",
+            app_table=f"{config.DYNAMODB_TABLE_PREFIX}-{config.DYNAMODB_APP_TABLE}",
+            derived=MappingProxyType(derived),
+        )
+
+    def reload(self) -> bool:
+        """env 파일과 환경 변수를 다시 읽어 바뀐 값을 반영 (반영했으면 True)"""
+        try:
+            loaded = Settings(_env_file=self.path)
+        except ValidationError as e:
+            logger.error("설정 다시 읽기 실패, 이전 설정을 유지합니다: %s", e)
+            return False
+
+        current = self.current
+        changed = {
+            field
+            for field in Settings.model_fields
+            if getattr(loaded, field) != getattr(current.settings, field)
+        }
+        reloadable = self.reloadable
+        ignored = changed - reloadable
+        if ignored:
+            logger.warning("재시작해야 반영되는 설정은 무시합니다: %s", ", ".join(sorted(ignored)))
+        applied = changed & reloadable
+        if not applied:
+            return False
+
+        config = current.settings.model_copy(
+            update={field: getattr(loaded, field) for field in applied}
+        )
+        try:
+            snapshot = self._build(config, current.version + 1, previous=current)
+        except Exception as e:
+            logger.error("설정 다시 읽기 실패, 이전 설정을 유지합니다: %s", e)
+            return False
+
+        self.current = snapshot
+        logger.info("설정 반영 (version %d): %s", snapshot.version, ", ".join(sorted(applied)))
+        return True
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except (OSError, TypeError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    async def _watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            signature = self._file_signature()
+            # 파일이 사라진 경우는 무시한다 (기본값으로 되돌아가면 JWT 키 등이 바뀐다)
+            if signature is not None and signature != self._signature:
+                self._signature = signature
+                self.reload()
+
+    def start(self, interval: float = settings.CONFIG_RELOAD_SECONDS) -> None:
+        """SIGHUP 핸들러와 파일 확인 작업 시작 (lifespan에서 워커마다 호출)"""
+        loop = asyncio.get_running_loop()
+        if threading.current_thread() is threading.main_thread():
+            try:
+                loop.add_signal_handler(signal.SIGHUP, self.reload)
+                self._signal_installed = True
+            except (NotImplementedError, RuntimeError, AttributeError):
+                pass  # SIGHUP이 없는 플랫폼
+        if interval > 0 and self._task is None:
+            self._signature = self._file_signature()
+            self._task = asyncio.create_task(self._watch(interval))
+
+    async def stop(self) -> None:
+        if self._signal_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+            self._signal_installed = False
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+runtime_config = RuntimeConfig()
@@ -0,0 +1,124 @@
+"""
+오브젝트 저장소 (S3, 로컬 디렉터리)
+"""
+
+import asyncio
+import importlib
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Optional, Protocol
+
+from dailydevq_backend.core.config import settings
+
+
+class ObjectStore(Protocol):
+    """키 → 바이트 저장소"""
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def put(self, key: str, body: bytes, content_type: str = "application/json") -> None: ...
+
+
+class S3ObjectStore:
+    """aioboto3 기반 S3 저장소 (S3_BUCKET_NAME)
+
+    aioboto3 import와 클라이언트 생성은 무거우므로 처음 쓸 때 만든다.
+    """
+
+    def __init__(self, bucket: str = settings.S3_BUCKET_NAME):
+        self.bucket = bucket
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def start(self):
+        if self._client is not None:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._client is None:
+                aioboto3 = await asyncio.to_thread(importlib.import_module, "aioboto3")
+                session = aioboto3.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_REGION,
+                )
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    session.client("s3", endpoint_url=settings.S3_ENDPOINT)
+                )
+                self._exit_stack = exit_stack
+
+    async def stop(self):
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._client = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        await self.start()
+        try:
+            response = await self._client.get_object(Bucket=self.bucket, Key=key)
+        except self._client.exceptions.NoSuchKey:
+            return None
+        async with response["Body"] as stream:
+            return await stream.read()
+
+    async def put(self, key: str, body: bytes, content_type: str = "application/json") -> None:
+        await self.start()
+        await self._client.put_object(
+            Bucket=self.bucket, Key=key, Body=body, ContentType=content_type
+        )
+
+    def url(self, key: str) -> str:
+        return f"s3://{self.bucket}/{key}"
+
+
+class LocalObjectStore:
+    """로컬 디렉터리 저장소 (S3 없이 실행하거나 결과를 미리 볼 때)"""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"invalid key: {key}")
+        return path
+
+    async def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def put(self, key: str, body: bytes, content_type: str = "application/json") -> None:
+        path = self._path(key)
+
+        def write():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(body)
+            tmp.replace(path)
+
+        await asyncio.to_thread(write)
+
+    def url(self, key: str) -> str:
+        return str(self._path(key))
+
+
+def object_store(location: Optional[str] = None) -> "S3ObjectStore | LocalObjectStore":
+    """저장 위치로 저장소 선택 (없거나 s3://bucket이면 S3, 그 외에는 로컬 디렉터리)"""
+    if location is None:
+        return S3ObjectStore()
+    if location.startswith("s3://"):
+        return S3ObjectStore(location.removeprefix("s3://").strip("/"))
+    return LocalObjectStore(location)
@@ -0,0 +1,64 @@
+"""
+OpenTelemetry 트레이싱 (선택, OTEL_ENABLED=true + `otel` extra 설치 시)
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI
+
+from dailydevq_backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# setup_tracing() 전이나 비활성화 시 None (DynamoDB 훅은 이 값을 보고 span을 만든다)
+tracer = None
+
+
+def setup_tracing(app: FastAPI) -> None:
+    """FastAPI/httpx 자동 계측 + OTLP 내보내기 설정
+
+    내보낼 주소 등은 OTEL_EXPORTER_OTLP_ENDPOINT 같은 OpenTelemetry 표준 환경 변수를 따른다.
+    http_client.start()보다 먼저 호출해야 httpx 클라이언트가 계측된다.
+    """
+    global tracer
+    if not settings.OTEL_ENABLED or tracer is not None:
+        return
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError as e:
+        logger.warning("OpenTelemetry 패키지가 없어 트레이싱을 끕니다 (uv sync --extra otel): %s", e)
+        return
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+
+    FastAPIInstrumentor.instrument_app(app, excluded_urls="metrics,health")
+    HTTPXClientInstrumentor().instrument()
+    tracer = trace.get_tracer("dailydevq_backend")
+
+
+def start_client_span(name: str, attributes: Dict[str, Any]):
+    """외부 호출 span 시작 (트레이싱이 꺼져 있으면 None)"""
+    if tracer is None:
+        return None
+    from opentelemetry.trace import SpanKind
+
+    return tracer.start_span(name, kind=SpanKind.CLIENT, attributes=attributes)
+
+
+def end_span(span, error: Optional[str] = None) -> None:
+    if error:
+        from opentelemetry.trace import StatusCode
+
+        span.set_attribute("error.type", error)
+        span.set_status(StatusCode.ERROR, error)
+    span.end()
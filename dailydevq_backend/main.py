@@ -2,10 +2,96 @@
 FastAPI 메인 애플리케이션
 """
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+from dailydevq_backend.core.circuit_breaker import CircuitOpenError
 from dailydevq_backend.core.config import settings
-from dailydevq_backend.api.v1 import subscribe, auth
+from dailydevq_backend.core.cors import DynamicCORSMiddleware
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.core.health import DrainMiddleware, health_monitor, install_drain_handler
+from dailydevq_backend.core.http import http_client
+from dailydevq_backend.core.metrics import MetricsMiddleware, render_metrics
+from dailydevq_backend.core.rate_limit import RateLimitMiddleware, RateLimitRule, rate_limiter
+from dailydevq_backend.core.redis import redis_client
+from dailydevq_backend.core.responses import FastJSONResponse
+from dailydevq_backend.core.runtime_config import runtime_config
+from dailydevq_backend.core.tracing import setup_tracing
+from dailydevq_backend.migrations.check import check_schema
+from dailydevq_backend.services.email_filter import legacy_email_filter
+from dailydevq_backend.services.google_oauth import google_oauth_service
+from dailydevq_backend.services.session_service import session_service
+from dailydevq_backend.services.user_service import user_cache
+from dailydevq_backend.api.deps import require_admin
+from dailydevq_backend.api.v1 import subscribe, auth, questions
+
+# LOG_LEVEL은 앱 로거에만 적용 (botocore 등 라이브러리의 DEBUG 로그는 요청마다 서명까지 찍는다)
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+)
+logging.getLogger("dailydevq_backend").setLevel(settings.LOG_LEVEL)
+
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up():
+    """연결 생성, 스키마 점검, 폐기 목록/JWKS 미리 받기, 이메일 필터 읽기(Redis)를 동시에 진행
+
+    모두 처음 쓰는 요청에서도 필요한 만큼 만들어지므로, 끝나기 전에 들어온 요청도 처리된다.
+    """
+    async def start_dynamodb():
+        await async_dynamodb_client.start()
+        if settings.SCHEMA_CHECK_MODE != "fail":  # fail이면 lifespan에서 이미 점검함
+            await check_schema()
+
+    results = await asyncio.gather(
+        start_dynamodb(),
+        user_cache.start(),
+        session_service.start(),
+        google_oauth_service.start(),
+        legacy_email_filter.start(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("워밍업 실패: %s", result)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """워커 단위 리소스 초기화 및 정리
+
+    클라이언트는 처음 쓸 때 만들어지므로 네트워크 I/O를 기다리지 않고 바로 요청을 받는다.
+    SCHEMA_CHECK_MODE=fail이면 스키마 점검이 끝날 때까지 기동을 막는다.
+    """
+    if settings.SCHEMA_CHECK_MODE == "fail":
+        await async_dynamodb_client.start()
+        await check_schema()
+    warm_up_task = asyncio.create_task(warm_up())
+    await health_monitor.start()
+    install_drain_handler(settings.SERVER_DRAIN_SECONDS)
+    runtime_config.start()
+    try:
+        yield
+    finally:
+        # 먼저 readiness를 실패시켜 로드밸런서가 새 요청을 보내지 않게 한다
+        await health_monitor.stop()
+        await runtime_config.stop()
+        warm_up_task.cancel()
+        await asyncio.gather(warm_up_task, return_exceptions=True)
+        await google_oauth_service.stop()
+        await http_client.stop()
+        await session_service.stop()
+        await redis_client.stop()
+        await user_cache.stop()
+        await legacy_email_filter.stop()
+        await async_dynamodb_client.stop()
+
 
 app = FastAPI(
     title="DailyDevQ API",
@@ -13,46 +99,108 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.ENABLE_SWAGGER else None,
     redoc_url="/redoc" if settings.ENABLE_REDOC else None,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
-# CORS 설정
-cors_origins = settings.CORS_ORIGINS.split(",")
+# 트레이싱 (OTEL_ENABLED일 때만, httpx 계측을 위해 lifespan보다 먼저)
+setup_tracing(app)
+
+# 속도 제한: 인증 없이 DynamoDB 쓰기나 Google 호출을 일으키는 경로 (IP 기준)
+# 429 응답에도 CORS 헤더가 붙도록 CORS 미들웨어보다 먼저 등록한다 (안쪽에서 실행)
+subscribe_rule = RateLimitRule("subscribe", settings.RATE_LIMIT_SUBSCRIBE_PER_MINUTE, 60)
+auth_rule = RateLimitRule("auth", settings.RATE_LIMIT_AUTH_PER_MINUTE, 60)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
+    RateLimitMiddleware,
+    limiter=rate_limiter,
+    rules={
+        "/api/v1/subscribe/email": subscribe_rule,
+        "/api/v1/subscribe/unsubscribe": subscribe_rule,
+        "/api/v1/auth/google": auth_rule,
+        "/api/v1/auth/refresh": auth_rule,
+    },
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
+# CORS 설정 (허용 origin은 설정 스냅샷에서 읽으므로 CORS_ORIGINS는 재시작 없이 바뀐다)
+app.add_middleware(
+    DynamicCORSMiddleware,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After", "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset"],
 )
 
+# SIGTERM 드레인 중 keep-alive 연결 정리 (SERVER_DRAIN_SECONDS, dailydevq_backend/server.py)
+app.add_middleware(DrainMiddleware)
+
+# 요청 지표: 가장 바깥에서 측정해야 429, CORS preflight까지 포함된다
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # API 라우터 등록
 app.include_router(subscribe.router, prefix="/api/v1")
 app.include_router(auth.router, prefix="/api/v1")
+app.include_router(questions.router, prefix="/api/v1")
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    """서킷이 열려 DynamoDB를 호출하지 않은 요청 (캐시로 대신할 수 없는 경우) → 503"""
+    return JSONResponse(
+        {"detail": "일시적으로 요청을 처리할 수 없습니다. 잠시 후 다시 시도해주세요."},
+        status_code=503,
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
+# 내용이 바뀌지 않는 응답은 시작할 때 한 번만 직렬화한다
+ROOT_BODY = to_json({"service": "DailyDevQ API", "version": "1.0.0", "status": "running"})
+HEALTH_BODY = to_json({"status": "healthy", "service": "dailydevq-backend"})
+PING_BODY = to_json({"message": "pong"})
 
 
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
-    return {
-        "service": "DailyDevQ API",
-        "version": "1.0.0",
-        "status": "running",
-    }
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
+@app.get("/health/live")
 async def health_check():
-    """헬스체크 엔드포인트"""
-    return {
-        "status": "healthy",
-        "service": "dailydevq-backend",
-    }
+    """liveness: 프로세스가 요청을 처리할 수 있는지만 확인 (의존성 점검 없음)"""
+    return Response(HEALTH_BODY, media_type="application/json")
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """readiness: 캐시된 의존성 점검 결과 (준비되지 않았으면 503)"""
+    return JSONResponse(
+        health_monitor.snapshot(),
+        status_code=200 if health_monitor.is_ready else 503,
+    )
+
+
+@app.get("/api/v1/cache/stats", dependencies=[Depends(require_admin)])
+async def cache_stats():
+    """사용자 캐시 적중/미스 통계 (관리자 전용)"""
+    return user_cache.stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 지표"""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
 
 
 @app.get("/api/v1/ping")
 async def ping():
     """핑 엔드포인트"""
-    return {"message": "pong"}
+    return Response(PING_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""
+애플리케이션 시작 시 DynamoDB 스키마 점검
+"""
+
+import logging
+from typing import List
+
+from botocore.exceptions import ClientError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient, async_dynamodb_client
+from dailydevq_backend.migrations.runner import MIGRATIONS_TABLE, full_table_name
+from dailydevq_backend.migrations.versions import LATEST_VERSION, REQUIRED_INDEXES
+
+logger = logging.getLogger(__name__)
+
+
+async def check_schema(
+    client: AsyncDynamoDBClient = async_dynamodb_client,
+    mode: str = settings.SCHEMA_CHECK_MODE,
+) -> List[str]:
+    """필요한 테이블/인덱스와 마이그레이션 버전 확인
+
+    인덱스가 없으면 해당 조회는 실패하므로(스캔으로 대체하지 않는다) 배포 직후 바로
+    알 수 있도록 mode가 fail이면 예외를 던지고, warn이면 경고만 남긴다.
+    """
+    if mode == "off":
+        return []
+
+    problems = []
+    dynamodb = await client.get_client()
+    for table_name, index_names in REQUIRED_INDEXES.items():
+        try:
+            table = (await dynamodb.describe_table(TableName=full_table_name(table_name)))["Table"]
+        except ClientError as e:
+            problems.append(f"{table_name} 테이블을 확인할 수 없습니다: {str(e)}")
+            continue
+
+        statuses = {
+            index["IndexName"]: index["IndexStatus"]
+            for index in table.get("GlobalSecondaryIndexes", [])
+        }
+        for index_name in index_names:
+            status = statuses.get(index_name)
+            if status is None:
+                problems.append(f"인덱스가 없습니다: {table_name}/{index_name}")
+            elif status != "ACTIVE":
+                problems.append(f"인덱스가 아직 {status} 상태입니다: {table_name}/{index_name}")
+
+    try:
+        response = await dynamodb.scan(
+            TableName=full_table_name(MIGRATIONS_TABLE), ProjectionExpression="version"
+        )
+        version = max((int(item["version"]["N"]) for item in response["Items"]), default=0)
+    except ClientError:
+        version = 0
+    if version < LATEST_VERSION:
+        problems.append(
+            f"적용되지 않은 마이그레이션이 있습니다 (현재 {version}, 최신 {LATEST_VERSION}): "
+            "python -m dailydevq_backend.utils.migrate"
+        )
+
+    if problems and mode == "fail":
+        raise RuntimeError("DynamoDB 스키마 점검 실패: " + "; ".join(problems))
+    for problem in problems:
+        logger.warning("DynamoDB 스키마 점검: %s", problem)
+    return problems
@@ -0,0 +1,210 @@
+"""
+DynamoDB 스키마 마이그레이션 실행기
+
+적용한 버전은 {prefix}-schema-migrations 테이블에 기록하고, 아직 적용하지 않은
+마이그레이션만 버전 순서대로 실행한다. 마이그레이션은 여러 번 실행해도 결과가 같아야
+한다(이미 있는 테이블/인덱스는 건너뛴다).
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from dailydevq_backend.core.config import settings
+
+if TYPE_CHECKING:
+    from boto3.dynamodb.conditions import ConditionBase
+
+MIGRATIONS_TABLE = "schema-migrations"
+
+
+def full_table_name(table_name: str) -> str:
+    return f"{settings.DYNAMODB_TABLE_PREFIX}-{table_name}"
+
+
+class MigrationContext:
+    """마이그레이션에서 쓰는 boto3 클라이언트와 테이블/인덱스 도우미"""
+
+    POLL_INTERVAL = 5
+
+    def __init__(self):
+        # 앱 시작 시 스키마 점검(migrations.check)은 상수만 쓰므로 boto3는 여기서 불러온다
+        import boto3
+
+        session = boto3.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+        )
+        self.client = session.client("dynamodb", endpoint_url=settings.DYNAMODB_ENDPOINT)
+        self.resource = session.resource("dynamodb", endpoint_url=settings.DYNAMODB_ENDPOINT)
+
+    def table_exists(self, table_name: str) -> bool:
+        try:
+            self.client.describe_table(TableName=full_table_name(table_name))
+        except self.client.exceptions.ResourceNotFoundException:
+            return False
+        return True
+
+    def create_table(self, table_name: str, **params) -> None:
+        """테이블이 없으면 생성하고 ACTIVE가 될 때까지 대기"""
+        name = full_table_name(table_name)
+        if self.table_exists(table_name):
+            print(f"   테이블이 이미 존재합니다: {name}")
+            return
+        self.client.create_table(TableName=name, **params)
+        self.client.get_waiter("table_exists").wait(TableName=name)
+        print(f"   테이블 생성: {name}")
+
+    def index_statuses(self, table_name: str) -> Dict[str, str]:
+        """GSI 이름 → 상태(CREATING/ACTIVE/...)"""
+        table = self.client.describe_table(TableName=full_table_name(table_name))["Table"]
+        return {
+            index["IndexName"]: index["IndexStatus"]
+            for index in table.get("GlobalSecondaryIndexes", [])
+        }
+
+    def create_index(
+        self,
+        table_name: str,
+        index: Dict[str, Any],
+        attribute_definitions: List[Dict[str, str]],
+        timeout: float = 3600,
+    ) -> None:
+        """GSI가 없으면 추가하고 ACTIVE가 될 때까지 대기
+
+        DynamoDB가 기존 아이템을 인덱스에 채우는(backfill) 동안은 CREATING 상태다.
+        """
+        index_name = index["IndexName"]
+        if index_name not in self.index_statuses(table_name):
+            self.client.update_table(
+                TableName=full_table_name(table_name),
+                AttributeDefinitions=attribute_definitions,
+                GlobalSecondaryIndexUpdates=[{"Create": index}],
+            )
+            print(f"   인덱스 생성 요청: {index_name}")
+
+        deadline = time.monotonic() + timeout
+        while self.index_statuses(table_name).get(index_name) != "ACTIVE":
+            if time.monotonic() > deadline:
+                raise Exception(f"Failed to create index {index_name}: timed out")
+            time.sleep(self.POLL_INTERVAL)
+        print(f"   인덱스 ACTIVE: {index_name}")
+
+    def delete_index(self, table_name: str, index_name: str, timeout: float = 3600) -> None:
+        """GSI가 있으면 삭제하고 사라질 때까지 대기"""
+        if index_name in self.index_statuses(table_name):
+            self.client.update_table(
+                TableName=full_table_name(table_name),
+                GlobalSecondaryIndexUpdates=[{"Delete": {"IndexName": index_name}}],
+            )
+            print(f"   인덱스 삭제 요청: {index_name}")
+
+        deadline = time.monotonic() + timeout
+        while index_name in self.index_statuses(table_name):
+            if time.monotonic() > deadline:
+                raise Exception(f"Failed to delete index {index_name}: timed out")
+            time.sleep(self.POLL_INTERVAL)
+        print(f"   인덱스 삭제됨: {index_name}")
+
+    def enable_stream(self, table_name: str, view_type: str = "NEW_AND_OLD_IMAGES") -> None:
+        """DynamoDB Streams 켜기 (이미 같은 설정으로 켜져 있으면 건너뛴다)"""
+        table = self.client.describe_table(TableName=full_table_name(table_name))["Table"]
+        spec = table.get("StreamSpecification", {})
+        if spec.get("StreamEnabled") and spec.get("StreamViewType") == view_type:
+            print(f"   스트림이 이미 켜져 있습니다: {view_type}")
+            return
+        if spec.get("StreamEnabled"):
+            raise Exception(
+                f"Failed to enable stream: already enabled with {spec.get('StreamViewType')}"
+            )
+        self.client.update_table(
+            TableName=full_table_name(table_name),
+            StreamSpecification={"StreamEnabled": True, "StreamViewType": view_type},
+        )
+        print(f"   스트림 켜짐: {view_type}")
+
+    def backfill(
+        self,
+        table_name: str,
+        filter_condition: "ConditionBase",
+        update: Callable[[Any, Dict[str, Any]], bool],
+        projection: str = "id",
+    ) -> int:
+        """조건에 맞는 아이템을 페이지 단위로 스캔하며 update(table, item) 적용
+
+        update가 True를 반환한 아이템 수를 돌려준다.
+        """
+        table = self.resource.Table(full_table_name(table_name))
+        params: Dict[str, Any] = {
+            "ProjectionExpression": projection,
+            "FilterExpression": filter_condition,
+        }
+        updated = 0
+        while True:
+            response = table.scan(**params)
+            for item in response["Items"]:
+                if update(table, item):
+                    updated += 1
+            if "LastEvaluatedKey" not in response:
+                return updated
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+@dataclass
+class Migration:
+    """스키마 마이그레이션 한 단계"""
+
+    version: int
+    description: str
+    apply: Callable[[MigrationContext], None]
+
+
+class MigrationRunner:
+    """적용하지 않은 마이그레이션을 버전 순서대로 실행"""
+
+    def __init__(self, migrations: List[Migration], context: Optional[MigrationContext] = None):
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+        self.context = context or MigrationContext()
+
+    def _ensure_state_table(self) -> None:
+        if self.context.table_exists(MIGRATIONS_TABLE):
+            return
+        self.context.create_table(
+            MIGRATIONS_TABLE,
+            KeySchema=[{"AttributeName": "version", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "version", "AttributeType": "N"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+    def applied_versions(self) -> set[int]:
+        if not self.context.table_exists(MIGRATIONS_TABLE):
+            return set()
+        table = self.context.resource.Table(full_table_name(MIGRATIONS_TABLE))
+        response = table.scan(ProjectionExpression="version", ConsistentRead=True)
+        return {int(item["version"]) for item in response["Items"]}
+
+    def pending(self) -> List[Migration]:
+        applied = self.applied_versions()
+        return [migration for migration in self.migrations if migration.version not in applied]
+
+    def migrate(self, target: Optional[int] = None) -> List[Migration]:
+        """target 버전까지(기본값: 최신) 적용하고 적용한 마이그레이션 목록 반환"""
+        self._ensure_state_table()
+        state = self.context.resource.Table(full_table_name(MIGRATIONS_TABLE))
+        applied = []
+        for migration in self.pending():
+            if target is not None and migration.version > target:
+                break
+            print(f"▶ {migration.version:04d} {migration.description}")
+            migration.apply(self.context)
+            state.put_item(
+                Item={
+                    "version": migration.version,
+                    "description": migration.description,
+                    "applied_at": datetime.now(UTC).isoformat(),
+                }
+            )
+            applied.append(migration)
+        return applied
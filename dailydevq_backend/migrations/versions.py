@@ -0,0 +1,288 @@
+"""
+DynamoDB 스키마 마이그레이션 목록
+
+새 마이그레이션은 목록 끝에 다음 버전 번호로 추가한다. 이미 배포된 마이그레이션은
+수정하지 않는다.
+"""
+
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.migrations.runner import Migration, MigrationContext
+from dailydevq_backend.models.question import GSI1_INDEX, GSI1PK, GSI1SK, PK, SK
+from dailydevq_backend.models.user import (
+    ACTIVE_SUBSCRIBERS_INDEX,
+    EMAIL_INDEX,
+    GOOGLE_ID_INDEX,
+    LEGACY_EMAIL_INDEX,
+    active_shard_for,
+    to_epoch_ms,
+    user_id_for_email,
+)
+from dailydevq_backend.schemas.user import SubscriptionStatus, normalize_email
+
+USERS_TABLE = settings.DYNAMODB_USERS_TABLE
+APP_TABLE = settings.DYNAMODB_APP_TABLE
+
+THROUGHPUT = {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5}
+
+EMAIL_GSI = {
+    "IndexName": LEGACY_EMAIL_INDEX,
+    "KeySchema": [{"AttributeName": "email", "KeyType": "HASH"}],
+    "Projection": {"ProjectionType": "ALL"},
+    "ProvisionedThroughput": THROUGHPUT,
+}
+
+# 이메일 조회용 인덱스. 구독 상태 확인은 이 인덱스만으로 끝나고, 전체 사용자가 필요하면
+# id로 GetItem한다. ALL 대비 인덱스 저장 용량과 인덱스 쓰기 크기가 작다.
+EMAIL_STATUS_GSI = {
+    "IndexName": EMAIL_INDEX,
+    "KeySchema": [{"AttributeName": "email", "KeyType": "HASH"}],
+    "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["subscription_status"]},
+    "ProvisionedThroughput": THROUGHPUT,
+}
+
+# 활성 구독자만 들어가는 희소 GSI (active_shard가 있는 아이템만 색인된다)
+ACTIVE_SUBSCRIBERS_GSI = {
+    "IndexName": ACTIVE_SUBSCRIBERS_INDEX,
+    "KeySchema": [
+        {"AttributeName": "active_shard", "KeyType": "HASH"},
+        {"AttributeName": "id", "KeyType": "RANGE"},
+    ],
+    "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["email"]},
+    "ProvisionedThroughput": THROUGHPUT,
+}
+
+# Google 로그인 사용자만 들어가는 희소 GSI
+GOOGLE_ID_GSI = {
+    "IndexName": GOOGLE_ID_INDEX,
+    "KeySchema": [{"AttributeName": "google_id", "KeyType": "HASH"}],
+    "Projection": {"ProjectionType": "ALL"},
+    "ProvisionedThroughput": THROUGHPUT,
+}
+
+# 단일 테이블의 다용도 GSI (엔티티마다 GSI1PK/GSI1SK에 다른 값을 넣는다, models.question 참고)
+GSI1 = {
+    "IndexName": GSI1_INDEX,
+    "KeySchema": [
+        {"AttributeName": GSI1PK, "KeyType": "HASH"},
+        {"AttributeName": GSI1SK, "KeyType": "RANGE"},
+    ],
+    "Projection": {"ProjectionType": "ALL"},
+    "ProvisionedThroughput": THROUGHPUT,
+}
+
+# 애플리케이션이 조회에 사용하는 테이블별 인덱스 (시작 시 점검 대상)
+REQUIRED_INDEXES = {
+    USERS_TABLE: [EMAIL_INDEX, ACTIVE_SUBSCRIBERS_INDEX, GOOGLE_ID_INDEX],
+    APP_TABLE: [GSI1_INDEX],
+}
+
+
+def create_users_table(ctx: MigrationContext) -> None:
+    """Users 테이블 생성 (기존 스크립트로 만든 테이블은 그대로 사용)"""
+    ctx.create_table(
+        USERS_TABLE,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "email", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[EMAIL_GSI],
+        ProvisionedThroughput=THROUGHPUT,
+    )
+
+
+def add_active_subscribers_index(ctx: MigrationContext) -> None:
+    """활성 구독자 인덱스 추가 후, 기존 활성 구독자에게 active_shard 채우기"""
+    from boto3.dynamodb.conditions import Attr
+
+    ctx.create_index(
+        USERS_TABLE,
+        ACTIVE_SUBSCRIBERS_GSI,
+        [
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "active_shard", "AttributeType": "S"},
+        ],
+    )
+
+    def set_shard(table, item) -> bool:
+        try:
+            # 그 사이 구독을 취소한 사용자는 건너뛴다
+            table.update_item(
+                Key={"id": item["id"]},
+                UpdateExpression="SET active_shard = :shard",
+                ConditionExpression=Attr("subscription_status").eq(SubscriptionStatus.ACTIVE.value),
+                ExpressionAttributeValues={":shard": active_shard_for(item["id"])},
+            )
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+        return True
+
+    count = ctx.backfill(
+        USERS_TABLE,
+        Attr("subscription_status").eq(SubscriptionStatus.ACTIVE.value)
+        & Attr("active_shard").not_exists(),
+        set_shard,
+    )
+    print(f"   active_shard 백필: {count}명")
+
+
+def add_google_id_index(ctx: MigrationContext) -> None:
+    """google-id-index 추가
+
+    예전 코드는 google_id가 없으면 NULL로 저장했다. 인덱스 키 속성이 NULL인 아이템은
+    색인되지 않고 이후 쓰기도 거부되므로, 먼저 속성을 지운 뒤 인덱스를 만든다.
+    """
+    from boto3.dynamodb.conditions import Attr
+
+    def remove_null(table, item) -> bool:
+        try:
+            table.update_item(
+                Key={"id": item["id"]},
+                UpdateExpression="REMOVE google_id",
+                ConditionExpression=Attr("google_id").attribute_type("NULL"),
+            )
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+        return True
+
+    count = ctx.backfill(USERS_TABLE, Attr("google_id").attribute_type("NULL"), remove_null)
+    print(f"   NULL google_id 정리: {count}명")
+
+    ctx.create_index(
+        USERS_TABLE,
+        GOOGLE_ID_GSI,
+        [{"AttributeName": "google_id", "AttributeType": "S"}],
+    )
+
+
+def convert_timestamps_to_epoch(ctx: MigrationContext) -> None:
+    """created_at/updated_at을 ISO 문자열에서 epoch 밀리초 숫자로 변환
+
+    애플리케이션은 두 형식을 모두 읽으므로 배포 후 아무 때나 실행해도 된다.
+    그 사이 다시 쓰인 아이템(updated_at이 바뀜)은 조건 실패로 건너뛴다.
+    """
+    from boto3.dynamodb.conditions import Attr
+
+    def convert(table, item) -> bool:
+        updates = {
+            name: to_epoch_ms(item[name])
+            for name in ("created_at", "updated_at")
+            if isinstance(item.get(name), str)
+        }
+        if not updates:
+            return False
+        condition = Attr("id").exists()
+        if "updated_at" in item:
+            condition &= Attr("updated_at").eq(item["updated_at"])
+        try:
+            table.update_item(
+                Key={"id": item["id"]},
+                UpdateExpression="SET " + ", ".join(f"{name} = :{name}" for name in updates),
+                ConditionExpression=condition,
+                ExpressionAttributeValues={f":{name}": value for name, value in updates.items()},
+            )
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+        return True
+
+    count = ctx.backfill(
+        USERS_TABLE,
+        Attr("created_at").attribute_type("S") | Attr("updated_at").attribute_type("S"),
+        convert,
+        projection="id, created_at, updated_at",
+    )
+    print(f"   시각 속성 변환: {count}명")
+
+
+def add_email_status_index(ctx: MigrationContext) -> None:
+    """email-status-index 추가 (email-index는 다음 마이그레이션에서 삭제)
+
+    GSI 프로젝션은 바꿀 수 없어 새 이름으로 만든다. 예전 버전 인스턴스가 아직 email-index를
+    쓰고 있다면 `--target 5`로 여기까지만 적용하고, 배포가 끝난 뒤 나머지를 적용한다.
+    """
+    ctx.create_index(
+        USERS_TABLE,
+        EMAIL_STATUS_GSI,
+        [{"AttributeName": "email", "AttributeType": "S"}],
+    )
+
+
+def drop_legacy_email_index(ctx: MigrationContext) -> None:
+    """프로젝션이 ALL인 email-index 삭제"""
+    ctx.delete_index(USERS_TABLE, LEGACY_EMAIL_INDEX)
+
+
+def create_app_table(ctx: MigrationContext) -> None:
+    """질문/답변/스트릭 단일 테이블 생성 (PK/SK 복합 키 + GSI1)"""
+    ctx.create_table(
+        APP_TABLE,
+        KeySchema=[
+            {"AttributeName": PK, "KeyType": "HASH"},
+            {"AttributeName": SK, "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": name, "AttributeType": "S"} for name in (PK, SK, GSI1PK, GSI1SK)
+        ],
+        GlobalSecondaryIndexes=[GSI1],
+        ProvisionedThroughput=THROUGHPUT,
+    )
+
+
+def enable_users_stream(ctx: MigrationContext) -> None:
+    """users 테이블 DynamoDB Streams 켜기 (사용자 변경 이벤트, services.events 참고)
+
+    구독/구독 취소의 후속 작업(환영 메일 등)은 요청 경로가 아니라 스트림 레코드를 읽는
+    이벤트 워커가 처리한다. 이전/이후 이미지가 모두 있어야 상태 변화를 구분할 수 있다.
+    """
+    ctx.enable_stream(USERS_TABLE, "NEW_AND_OLD_IMAGES")
+
+
+def normalize_user_emails(ctx: MigrationContext) -> None:
+    """저장된 email을 정규화한 형태(소문자, 앞뒤 공백 제거)로 변환
+
+    id는 바꾸지 않는다 (app 테이블과 세션이 id를 참조한다). 정규화 전 이메일로 만든 사용자는
+    이메일로 id를 알 수 없는 사용자로 남아 이메일 필터에 담긴다. 새 버전 배포 직후 실행한다.
+    이미 정규화한 이메일로 다른 사용자가 생겼으면(중복) 변환은 하되 개수를 출력한다.
+    """
+    from boto3.dynamodb.conditions import Attr
+
+    conflicts = 0
+
+    def normalize(table, item) -> bool:
+        nonlocal conflicts
+        canonical = normalize_email(item["email"])
+        if canonical == item["email"]:
+            return False
+        canonical_id = user_id_for_email(canonical)
+        if canonical_id != item["id"] and "Item" in table.get_item(Key={"id": canonical_id}):
+            conflicts += 1
+        try:
+            # 그 사이 이메일이 바뀐 사용자는 건너뛴다
+            table.update_item(
+                Key={"id": item["id"]},
+                UpdateExpression="SET email = :email",
+                ConditionExpression=Attr("email").eq(item["email"]),
+                ExpressionAttributeValues={":email": canonical},
+            )
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+        return True
+
+    count = ctx.backfill(USERS_TABLE, Attr("email").exists(), normalize, projection="id, email")
+    print(f"   이메일 정규화: {count}명 (같은 이메일의 다른 사용자: {conflicts}명)")
+
+
+MIGRATIONS = [
+    Migration(1, "create users table", create_users_table),
+    Migration(2, "add active-subscribers-index", add_active_subscribers_index),
+    Migration(3, "add google-id-index", add_google_id_index),
+    Migration(4, "convert timestamps to epoch milliseconds", convert_timestamps_to_epoch),
+    Migration(5, "add email-status-index", add_email_status_index),
+    Migration(6, "drop email-index", drop_legacy_email_index),
+    Migration(7, "create app table", create_app_table),
+    Migration(8, "enable users stream", enable_users_stream),
+    Migration(9, "normalize user emails", normalize_user_emails),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
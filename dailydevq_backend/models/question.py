@@ -0,0 +1,217 @@
+"""
+면접 질문 콘텐츠 모델 (단일 테이블)
+
+오늘의 질문, 사용자별 답변 기록, 연속 답변 기록(스트릭)을 한 테이블에 PK/SK 복합 키로 저장한다.
+
+    QUESTION#{date}  QUESTION         오늘의 질문 (GSI1: CATEGORY#{category} / {date})
+    USER#{user_id}   ANSWER#{date}    답변 (질문 제목/분류를 복사해 둔다, GSI1: QUESTION#{date} / USER#{user_id})
+    USER#{user_id}   STREAK           스트릭
+
+사용자 파티션을 SK 내림차순으로 Query하면 STREAK, 최근 답변 순서로 나오므로
+"내 스트릭 + 답변 기록"이 Query 한 번으로 끝난다. 답변에 질문 제목을 복사해 두어 기록을
+보여 줄 때 질문을 다시 읽지 않는다 (질문은 발행 후 바뀌지 않는다).
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, ClassVar, Dict, Optional
+
+from dailydevq_backend.models.user import now_ms
+from dailydevq_backend.repositories.codec import WireItem
+
+# 단일 테이블 키 속성과 GSI 이름 (정의는 dailydevq_backend.migrations)
+PK = "PK"
+SK = "SK"
+GSI1_INDEX = "gsi1"
+GSI1PK = "GSI1PK"
+GSI1SK = "GSI1SK"
+
+# 질문은 한국 시간 기준 하루에 하나 (평일 오전 7시 뉴스레터와 같은 날짜)
+KST = timezone(timedelta(hours=9))
+
+QUESTION_SK = "QUESTION"
+STREAK_SK = "STREAK"
+ANSWER_SK_PREFIX = "ANSWER#"
+
+
+def today_kst() -> str:
+    """오늘 날짜 (KST, YYYY-MM-DD)"""
+    return datetime.now(KST).date().isoformat()
+
+
+def question_pk(question_date: str) -> str:
+    return f"QUESTION#{question_date}"
+
+
+def user_pk(user_id: str) -> str:
+    return f"USER#{user_id}"
+
+
+def category_pk(category: str) -> str:
+    return f"CATEGORY#{category}"
+
+
+def _s(item: WireItem, name: str) -> Optional[str]:
+    value = item.get(name)
+    return value["S"] if value is not None else None
+
+
+def _n(item: WireItem, name: str) -> int:
+    value = item.get(name)
+    return int(value["N"]) if value is not None else 0
+
+
+@dataclass(slots=True)
+class DailyQuestion:
+    """오늘의 질문"""
+
+    TYPE: ClassVar[str] = "question"
+
+    date: str
+    title: str
+    body: str
+    category: str
+    difficulty: str = "medium"
+    created_at: int = 0
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = now_ms()
+
+    @property
+    def key(self) -> Dict[str, str]:
+        return {PK: question_pk(self.date), SK: QUESTION_SK}
+
+    def to_wire(self) -> WireItem:
+        return {
+            PK: {"S": question_pk(self.date)},
+            SK: {"S": QUESTION_SK},
+            GSI1PK: {"S": category_pk(self.category)},
+            GSI1SK: {"S": self.date},
+            "type": {"S": self.TYPE},
+            "date": {"S": self.date},
+            "title": {"S": self.title},
+            "body": {"S": self.body},
+            "category": {"S": self.category},
+            "difficulty": {"S": self.difficulty},
+            "created_at": {"N": str(self.created_at)},
+        }
+
+    @classmethod
+    def from_wire(cls, item: WireItem) -> "DailyQuestion":
+        return cls(
+            date=item["date"]["S"],
+            title=item["title"]["S"],
+            body=item["body"]["S"],
+            category=item["category"]["S"],
+            difficulty=_s(item, "difficulty") or "medium",
+            created_at=_n(item, "created_at"),
+        )
+
+
+@dataclass(slots=True)
+class Answer:
+    """사용자의 답변 (날짜당 하나)"""
+
+    TYPE: ClassVar[str] = "answer"
+
+    user_id: str
+    date: str
+    answer: str
+    question_title: str
+    category: str
+    created_at: int = 0
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = now_ms()
+
+    @property
+    def key(self) -> Dict[str, str]:
+        return {PK: user_pk(self.user_id), SK: f"{ANSWER_SK_PREFIX}{self.date}"}
+
+    def to_wire(self) -> WireItem:
+        return {
+            PK: {"S": user_pk(self.user_id)},
+            SK: {"S": f"{ANSWER_SK_PREFIX}{self.date}"},
+            GSI1PK: {"S": question_pk(self.date)},
+            GSI1SK: {"S": user_pk(self.user_id)},
+            "type": {"S": self.TYPE},
+            "user_id": {"S": self.user_id},
+            "date": {"S": self.date},
+            "answer": {"S": self.answer},
+            "question_title": {"S": self.question_title},
+            "category": {"S": self.category},
+            "created_at": {"N": str(self.created_at)},
+        }
+
+    @classmethod
+    def from_wire(cls, item: WireItem) -> "Answer":
+        return cls(
+            user_id=item["user_id"]["S"],
+            date=item["date"]["S"],
+            answer=item["answer"]["S"],
+            question_title=item["question_title"]["S"],
+            category=item["category"]["S"],
+            created_at=_n(item, "created_at"),
+        )
+
+
+@dataclass(slots=True)
+class Streak:
+    """연속 답변 기록 (KST 날짜 기준)"""
+
+    TYPE: ClassVar[str] = "streak"
+
+    user_id: str
+    current: int = 0
+    longest: int = 0
+    last_date: Optional[str] = None  # 마지막으로 답한 날짜
+    updated_at: int = 0
+
+    @property
+    def key(self) -> Dict[str, str]:
+        return {PK: user_pk(self.user_id), SK: STREAK_SK}
+
+    def advance(self, answered_date: str) -> "Streak":
+        """answered_date에 답했을 때의 다음 스트릭 (전날에도 답했으면 이어진다)"""
+        previous = (date.fromisoformat(answered_date) - timedelta(days=1)).isoformat()
+        current = self.current + 1 if self.last_date == previous else 1
+        return Streak(
+            user_id=self.user_id,
+            current=current,
+            longest=max(self.longest, current),
+            last_date=answered_date,
+            updated_at=now_ms(),
+        )
+
+    def current_as_of(self, today: str) -> int:
+        """오늘 기준 유효한 스트릭 (어제나 오늘 답하지 않았으면 끊긴 것으로 본다)"""
+        if self.last_date is None:
+            return 0
+        yesterday = (date.fromisoformat(today) - timedelta(days=1)).isoformat()
+        return self.current if self.last_date in (today, yesterday) else 0
+
+    def to_wire(self) -> WireItem:
+        item: Dict[str, Any] = {
+            PK: {"S": user_pk(self.user_id)},
+            SK: {"S": STREAK_SK},
+            "type": {"S": self.TYPE},
+            "user_id": {"S": self.user_id},
+            "current": {"N": str(self.current)},
+            "longest": {"N": str(self.longest)},
+            "updated_at": {"N": str(self.updated_at)},
+        }
+        if self.last_date is not None:
+            item["last_date"] = {"S": self.last_date}
+        return item
+
+    @classmethod
+    def from_wire(cls, item: WireItem) -> "Streak":
+        return cls(
+            user_id=item["user_id"]["S"],
+            current=_n(item, "current"),
+            longest=_n(item, "longest"),
+            last_date=_s(item, "last_date"),
+            updated_at=_n(item, "updated_at"),
+        )
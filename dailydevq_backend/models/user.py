@@ -2,69 +2,202 @@
 사용자 모델 (DynamoDB)
 """
 
-from datetime import datetime
-from typing import Optional
-from uuid import uuid4
+import time
+import zlib
+from dataclasses import dataclass, fields
+from datetime import UTC, datetime
+from typing import Any, Optional
+from uuid import UUID, uuid5
+from dailydevq_backend.core.config import settings
 from dailydevq_backend.schemas.user import AuthProvider, SubscriptionStatus
 
+# 이메일 → 사용자 ID 매핑용 네임스페이스 (변경 금지: 기존 아이템 키가 바뀐다)
+USER_ID_NAMESPACE = UUID("6f0c3a52-9d7e-4c55-8a1b-2f4e7d9c0b13")
 
+
+def user_id_for_email(email: str) -> str:
+    """이메일에서 결정적으로 사용자 ID 생성
+
+    같은 이메일은 항상 같은 기본 키에 매핑되므로, 기본 키 조건부 쓰기만으로
+    이메일 중복 가입을 막을 수 있다.
+    """
+    return str(uuid5(USER_ID_NAMESPACE, email))
+
+
+# 사용자 테이블 GSI 이름 (정의는 dailydevq_backend.migrations)
+# 이메일 → (id, subscription_status)만 담는 인덱스. 예전 email-index(ALL)를 대신한다.
+EMAIL_INDEX = "email-status-index"
+LEGACY_EMAIL_INDEX = "email-index"
+GOOGLE_ID_INDEX = "google-id-index"
+# 활성 구독자만 들어가는 희소(sparse) GSI. 구독 중인 사용자에게만 active_shard 속성이 있다.
+ACTIVE_SUBSCRIBERS_INDEX = "active-subscribers-index"
+
+
+# 아이템 변환마다 Enum.value 조회를 하지 않도록 미리 꺼내 둔 값
+EMAIL_PROVIDER = AuthProvider.EMAIL.value
+ACTIVE_STATUS = SubscriptionStatus.ACTIVE.value
+
+
+def now_ms() -> int:
+    """현재 시각 (epoch 밀리초)"""
+    return time.time_ns() // 1_000_000
+
+
+def to_epoch_ms(value: Any) -> int:
+    """아이템의 시각 값을 epoch 밀리초로 (없으면 0)
+
+    DynamoDB에서 읽은 숫자는 Decimal이다. 예전 아이템의 ISO 문자열(UTC)도 읽는다.
+    """
+    if isinstance(value, str) and value:
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=UTC)
+        return int(parsed.timestamp() * 1000)
+    return int(value) if value else 0
+
+
+def epoch_ms_to_iso(value: int) -> str:
+    """epoch 밀리초를 ISO 8601 문자열(UTC)로 (내보내기 등 사람이 읽는 출력용)"""
+    return datetime.fromtimestamp(value / 1000, tz=UTC).isoformat(timespec="milliseconds")
+
+
+def active_shard_for(user_id: str) -> str:
+    """활성 구독자 인덱스의 파티션 키 (쓰기가 한 파티션에 몰리지 않도록 분산)"""
+    return str(zlib.crc32(user_id.encode()) % settings.ACTIVE_SUBSCRIBER_SHARDS)
+
+
+def active_shards() -> list[str]:
+    """활성 구독자 인덱스의 모든 파티션 키"""
+    return [str(shard) for shard in range(settings.ACTIVE_SUBSCRIBER_SHARDS)]
+
+
+@dataclass(slots=True)
 class UserModel:
-    """DynamoDB 사용자 모델"""
-
-    def __init__(
-        self,
-        email: str,
-        auth_provider: AuthProvider = AuthProvider.EMAIL,
-        user_id: Optional[str] = None,
-        google_id: Optional[str] = None,
-        name: Optional[str] = None,
-        profile_image: Optional[str] = None,
-        subscription_status: SubscriptionStatus = SubscriptionStatus.ACTIVE,
-        created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None,
-    ):
-        self.id = user_id or str(uuid4())
-        self.email = email
-        self.auth_provider = auth_provider.value if isinstance(auth_provider, AuthProvider) else auth_provider
-        self.google_id = google_id
-        self.name = name
-        self.profile_image = profile_image
-        self.subscription_status = subscription_status.value if isinstance(subscription_status, SubscriptionStatus) else subscription_status
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+    """DynamoDB 사용자 모델
+
+    created_at/updated_at은 epoch 밀리초(정수)다. 아이템을 읽고 쓸 때 날짜 문자열을
+    파싱/포맷하지 않으며, UserResponse.model_validate(user)가 datetime으로 바꾼다.
+    """
+
+    email: str
+    auth_provider: str = EMAIL_PROVIDER
+    id: str = ""
+    google_id: Optional[str] = None
+    name: Optional[str] = None
+    profile_image: Optional[str] = None
+    subscription_status: str = ACTIVE_STATUS
+    created_at: int = 0
+    updated_at: int = 0
+
+    def __post_init__(self):
+        if not self.id:
+            self.id = user_id_for_email(self.email)
+        if isinstance(self.auth_provider, AuthProvider):
+            self.auth_provider = self.auth_provider.value
+        if isinstance(self.subscription_status, SubscriptionStatus):
+            self.subscription_status = self.subscription_status.value
+        if not self.created_at:
+            self.created_at = now_ms()
+        if not self.updated_at:
+            self.updated_at = self.created_at
 
     def to_dict(self) -> dict:
-        """DynamoDB 아이템으로 변환"""
-        return {
+        """DynamoDB 아이템으로 변환
+
+        값이 없는 속성은 NULL로 저장하지 않고 뺀다. GSI 키(google_id 등)에 NULL을
+        쓰면 요청이 거부되고, 빠진 아이템은 인덱스에도 들어가지 않는다.
+        """
+        item = {
             "id": self.id,
             "email": self.email,
             "auth_provider": self.auth_provider,
-            "google_id": self.google_id,
-            "name": self.name,
-            "profile_image": self.profile_image,
             "subscription_status": self.subscription_status,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
+        if self.google_id is not None:
+            item["google_id"] = self.google_id
+        if self.name is not None:
+            item["name"] = self.name
+        if self.profile_image is not None:
+            item["profile_image"] = self.profile_image
+        if self.subscription_status == ACTIVE_STATUS:
+            item["active_shard"] = active_shard_for(self.id)
+        return item
 
     @classmethod
     def from_dict(cls, data: dict) -> "UserModel":
-        """DynamoDB 아이템에서 생성"""
+        """resource 계층 아이템(UpdateItem 응답 등, 숫자는 Decimal)에서 생성"""
         return cls(
-            user_id=data.get("id"),
+            id=data.get("id", ""),
             email=data["email"],
-            auth_provider=data.get("auth_provider", AuthProvider.EMAIL.value),
+            auth_provider=data.get("auth_provider", EMAIL_PROVIDER),
             google_id=data.get("google_id"),
             name=data.get("name"),
             profile_image=data.get("profile_image"),
-            subscription_status=data.get("subscription_status", SubscriptionStatus.ACTIVE.value),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            updated_at=datetime.fromisoformat(data["updated_at"]) if data.get("updated_at") else None,
+            subscription_status=data.get("subscription_status", ACTIVE_STATUS),
+            created_at=to_epoch_ms(data.get("created_at")),
+            updated_at=to_epoch_ms(data.get("updated_at")),
+        )
+
+    def to_wire(self) -> dict:
+        """저수준 DynamoDB 아이템({"email": {"S": ...}})으로 바로 변환 (Client/BatchWriteItem용)"""
+        item = {
+            "id": {"S": self.id},
+            "email": {"S": self.email},
+            "auth_provider": {"S": self.auth_provider},
+            "subscription_status": {"S": self.subscription_status},
+            "created_at": {"N": str(self.created_at)},
+            "updated_at": {"N": str(self.updated_at)},
+        }
+        if self.google_id is not None:
+            item["google_id"] = {"S": self.google_id}
+        if self.name is not None:
+            item["name"] = {"S": self.name}
+        if self.profile_image is not None:
+            item["profile_image"] = {"S": self.profile_image}
+        if self.subscription_status == ACTIVE_STATUS:
+            item["active_shard"] = {"S": active_shard_for(self.id)}
+        return item
+
+    @classmethod
+    def from_wire(cls, item: dict) -> "UserModel":
+        """저수준 DynamoDB 아이템에서 바로 생성 (Decimal/TypeDeserializer를 거치지 않는다)
+
+        예전 코드가 NULL로 저장한 속성({"NULL": true})은 None으로 읽는다.
+        """
+        get = item.get
+        return cls(
+            id=item["id"]["S"],
+            email=item["email"]["S"],
+            auth_provider=get("auth_provider", _NO_VALUE).get("S", EMAIL_PROVIDER),
+            google_id=get("google_id", _NO_VALUE).get("S"),
+            name=get("name", _NO_VALUE).get("S"),
+            profile_image=get("profile_image", _NO_VALUE).get("S"),
+            subscription_status=get("subscription_status", _NO_VALUE).get("S", ACTIVE_STATUS),
+            created_at=_wire_epoch_ms(get("created_at")),
+            updated_at=_wire_epoch_ms(get("updated_at")),
         )
 
     def update(self, **kwargs):
-        """모델 업데이트"""
+        """모델 업데이트 (None 값은 무시)"""
         for key, value in kwargs.items():
-            if hasattr(self, key) and value is not None:
+            if key not in USER_FIELDS:
+                raise TypeError(f"UserModel has no field {key!r}")
+            if value is not None:
                 setattr(self, key, value)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now_ms()
+
+
+_NO_VALUE: dict = {}
+
+
+def _wire_epoch_ms(value: Optional[dict]) -> int:
+    if value is None:
+        return 0
+    if "N" in value:
+        return int(value["N"])
+    return to_epoch_ms(value.get("S"))
+
+
+USER_FIELDS = frozenset(field.name for field in fields(UserModel))
@@ -0,0 +1,76 @@
+"""
+DynamoDB 저수준 속성 형식({"S": ...}, {"N": ...}) ↔ 파이썬 값 변환
+
+boto3 resource 계층(TypeSerializer/TypeDeserializer)은 숫자를 모두 Decimal로 만들고
+속성마다 타입 검사를 여러 번 거친다. 이 저장소의 아이템은 거의 문자열/정수뿐이므로
+그 경우만 바로 변환하고, 나머지 타입(L, M, SS 등)만 boto3 변환기에 맡긴다.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+Item = Dict[str, Any]
+WireItem = Dict[str, Dict[str, Any]]
+
+_serializer = None
+_deserializer = None
+
+
+def _number(text: str) -> Any:
+    """정수는 int, 소수/지수 표기는 Decimal (float로 바꾸면 정밀도가 깨진다)"""
+    try:
+        return int(text)
+    except ValueError:
+        return Decimal(text)
+
+
+def decode_value(value: Dict[str, Any]) -> Any:
+    if "S" in value:
+        return value["S"]
+    if "N" in value:
+        return _number(value["N"])
+    if "BOOL" in value:
+        return value["BOOL"]
+    if "NULL" in value:
+        return None
+
+    global _deserializer
+    if _deserializer is None:
+        from boto3.dynamodb.types import TypeDeserializer
+
+        _deserializer = TypeDeserializer()
+    return _deserializer.deserialize(value)
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, str):
+        return {"S": value}
+    # bool은 int의 하위 클래스라 먼저 확인한다
+    if isinstance(value, bool):
+        return {"BOOL": value}
+    if isinstance(value, (int, Decimal)):
+        return {"N": str(value)}
+    if value is None:
+        return {"NULL": True}
+
+    global _serializer
+    if _serializer is None:
+        from boto3.dynamodb.types import TypeSerializer
+
+        _serializer = TypeSerializer()
+    return _serializer.serialize(value)
+
+
+def decode_item(item: WireItem) -> Item:
+    """저수준 아이템 → 파이썬 dict (문자열 속성은 함수 호출 없이 꺼낸다)"""
+    return {name: value["S"] if "S" in value else decode_value(value) for name, value in item.items()}
+
+
+def encode_item(item: Item) -> WireItem:
+    """파이썬 dict → 저수준 아이템"""
+    return {name: encode_value(value) for name, value in item.items()}
+
+
+def decode_key(key: Optional[WireItem]) -> Optional[Item]:
+    """LastEvaluatedKey → 저장해 두었다가 다시 넘길 수 있는 dict (JSON으로 저장 가능)"""
+    return decode_item(key) if key else None
@@ -0,0 +1,186 @@
+"""
+단일 테이블 저장소 (PK/SK 복합 키, 엔티티 타입별 변환)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Protocol, Type, TypeVar
+
+from botocore.exceptions import ClientError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient, async_dynamodb_client
+from dailydevq_backend.models.question import GSI1PK, GSI1SK, PK, SK
+from dailydevq_backend.repositories.codec import WireItem, encode_value
+
+
+class Entity(Protocol):
+    """단일 테이블에 저장하는 엔티티 (models.question 참고)"""
+
+    TYPE: str
+
+    @property
+    def key(self) -> Dict[str, str]: ...
+
+    def to_wire(self) -> WireItem: ...
+
+    @classmethod
+    def from_wire(cls, item: WireItem) -> Any: ...
+
+
+E = TypeVar("E", bound=Entity)
+
+# 아이템을 만든 조건이 이미 있는 아이템과 겹치지 않게 하는 조건식
+NOT_EXISTS = f"attribute_not_exists({PK})"
+
+
+@dataclass
+class Put:
+    """트랜잭션 쓰기 하나 (condition이 거짓이면 트랜잭션 전체가 취소된다)"""
+
+    entity: Entity
+    condition: Optional[str] = None
+    values: Optional[Dict[str, Any]] = None  # 조건식 값 (파이썬 값)
+
+
+class TransactionConflictError(Exception):
+    """조건식 때문에 트랜잭션이 취소됨 (reasons: 쓰기 순서대로 취소 사유 코드, 없으면 None)"""
+
+    def __init__(self, reasons: List[Optional[str]]):
+        super().__init__(f"transaction cancelled: {reasons}")
+        self.reasons = reasons
+
+
+def _wire_key(key: Dict[str, str]) -> WireItem:
+    return {name: {"S": value} for name, value in key.items()}
+
+
+class SingleTableRepository:
+    """단일 테이블 접근 계층
+
+    엔티티 클래스를 넘기면 그 타입으로 변환한 결과를 돌려준다(get/query). 한 파티션에 여러
+    타입이 섞인 아이템 모음은 query_collection()이 type 속성으로 나눠 변환한다.
+    모든 호출은 API 요청 경로에서 쓰이므로 호출 시간 제한(deadline) 안에서 한다.
+    """
+
+    def __init__(
+        self,
+        client: AsyncDynamoDBClient = async_dynamodb_client,
+        table_name: str = settings.DYNAMODB_APP_TABLE,
+    ):
+        self._client = client
+        self._table_name = client.table_name(table_name)
+
+    async def get(self, entity_type: Type[E], key: Dict[str, str]) -> Optional[E]:
+        """기본 키로 엔티티 하나 조회"""
+        client = await self._client.get_client()
+        async with self._client.deadline():
+            response = await client.get_item(TableName=self._table_name, Key=_wire_key(key))
+        item = response.get("Item")
+        return entity_type.from_wire(item) if item else None
+
+    async def put(self, entity: Entity, condition: Optional[str] = None) -> None:
+        """엔티티 저장 (condition이 거짓이면 ClientError ConditionalCheckFailedException)"""
+        params: Dict[str, Any] = {"TableName": self._table_name, "Item": entity.to_wire()}
+        if condition is not None:
+            params["ConditionExpression"] = condition
+        client = await self._client.get_client()
+        async with self._client.deadline():
+            await client.put_item(**params)
+
+    async def _query_items(
+        self,
+        pk: str,
+        sk_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+        index: Optional[str] = None,
+    ) -> List[WireItem]:
+        pk_name, sk_name = (GSI1PK, GSI1SK) if index else (PK, SK)
+        params: Dict[str, Any] = {
+            "TableName": self._table_name,
+            "KeyConditionExpression": "#pk = :pk",
+            "ExpressionAttributeNames": {"#pk": pk_name},
+            "ExpressionAttributeValues": {":pk": {"S": pk}},
+            "ScanIndexForward": not newest_first,
+        }
+        if index:
+            params["IndexName"] = index
+        if sk_prefix:
+            params["KeyConditionExpression"] += " AND begins_with(#sk, :sk)"
+            params["ExpressionAttributeNames"]["#sk"] = sk_name
+            params["ExpressionAttributeValues"][":sk"] = {"S": sk_prefix}
+
+        client = await self._client.get_client()
+        items: List[WireItem] = []
+        while True:
+            if limit is not None:
+                params["Limit"] = limit - len(items)
+            async with self._client.deadline():
+                response = await client.query(**params)
+            items.extend(response["Items"])
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key or (limit is not None and len(items) >= limit):
+                return items
+            params["ExclusiveStartKey"] = last_key
+
+    async def query(
+        self,
+        entity_type: Type[E],
+        pk: str,
+        sk_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+        index: Optional[str] = None,
+    ) -> List[E]:
+        """파티션 하나에서 한 타입의 엔티티 조회 (sk_prefix로 SK 범위를 좁힌다)"""
+        items = await self._query_items(pk, sk_prefix, limit, newest_first, index)
+        return [entity_type.from_wire(item) for item in items]
+
+    async def query_collection(
+        self,
+        pk: str,
+        entity_types: List[Type[Entity]],
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> Dict[str, List[Any]]:
+        """파티션 하나의 아이템 모음을 타입별로 변환 (모르는 타입은 건너뛴다)
+
+        반환값은 엔티티 TYPE → 엔티티 목록 (SK 순서 유지).
+        """
+        types = {entity_type.TYPE: entity_type for entity_type in entity_types}
+        collection: Dict[str, List[Any]] = {name: [] for name in types}
+        for item in await self._query_items(pk, limit=limit, newest_first=newest_first):
+            entity_type = types.get(item["type"]["S"])
+            if entity_type is not None:
+                collection[entity_type.TYPE].append(entity_type.from_wire(item))
+        return collection
+
+    async def transact_put(self, *puts: Put) -> None:
+        """여러 엔티티를 한 트랜잭션으로 저장 (조건이 하나라도 거짓이면 TransactionConflictError)"""
+        transact_items = []
+        for put in puts:
+            request: Dict[str, Any] = {"TableName": self._table_name, "Item": put.entity.to_wire()}
+            if put.condition is not None:
+                request["ConditionExpression"] = put.condition
+            if put.values:
+                request["ExpressionAttributeValues"] = {
+                    name: encode_value(value) for name, value in put.values.items()
+                }
+            transact_items.append({"Put": request})
+
+        client = await self._client.get_client()
+        try:
+            async with self._client.deadline():
+                await client.transact_write_items(TransactItems=transact_items)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            reasons = [
+                None if reason.get("Code") in (None, "None") else reason["Code"]
+                for reason in e.response.get("CancellationReasons", [])
+            ]
+            raise TransactionConflictError(reasons) from e
+
+
+# 싱글톤 인스턴스
+single_table_repository = SingleTableRepository()
@@ -0,0 +1,340 @@
+"""
+사용자 저장소 (비동기 DynamoDB)
+"""
+
+import asyncio
+import random
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient, async_dynamodb_client
+from dailydevq_backend.repositories.codec import WireItem, decode_item, decode_key, encode_item
+
+if TYPE_CHECKING:
+    from boto3.dynamodb.conditions import ConditionBase
+
+
+def _projection_params(projection: Optional[List[str]]) -> Dict[str, Any]:
+    if not projection:
+        return {}
+    return {
+        "ProjectionExpression": ", ".join(f"#p{i}" for i in range(len(projection))),
+        "ExpressionAttributeNames": {f"#p{i}": name for i, name in enumerate(projection)},
+    }
+
+
+def _key_condition_params(attribute: str, value: str) -> Dict[str, Any]:
+    return {
+        "KeyConditionExpression": "#k = :k",
+        "ExpressionAttributeNames": {"#k": attribute},
+        "ExpressionAttributeValues": {":k": {"S": value}},
+    }
+
+
+def _merge_params(*parts: Dict[str, Any]) -> Dict[str, Any]:
+    """ExpressionAttributeNames/Values는 합치고 나머지는 덮어쓴다"""
+    params: Dict[str, Any] = {}
+    for part in parts:
+        for key, value in part.items():
+            if key in ("ExpressionAttributeNames", "ExpressionAttributeValues"):
+                params.setdefault(key, {}).update(value)
+            else:
+                params[key] = value
+    return params
+
+
+def _filter_params(condition: "ConditionBase") -> Dict[str, Any]:
+    """boto3 조건 객체를 저수준 FilterExpression으로 (resource 계층이 하던 변환)"""
+    from boto3.dynamodb.conditions import ConditionExpressionBuilder
+
+    built = ConditionExpressionBuilder().build_expression(condition)
+    return {
+        "FilterExpression": built.condition_expression,
+        "ExpressionAttributeNames": built.attribute_name_placeholders,
+        "ExpressionAttributeValues": encode_item(built.attribute_value_placeholders),
+    }
+
+
+# BatchGetItem / BatchWriteItem 요청당 최대 아이템 수
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+
+
+async def _backoff(attempt: int, base: float = 0.05, cap: float = 5.0) -> None:
+    """지수 백오프 (full jitter)"""
+    await asyncio.sleep(random.uniform(0, min(cap, base * 2**attempt)))
+
+
+class ConditionalCheckFailedError(Exception):
+    """조건부 쓰기 실패 (기존 아이템이 있으면 item에 담긴다)"""
+
+    def __init__(self, item: Optional[Dict[str, Any]] = None):
+        super().__init__("The conditional request failed")
+        self.item = item
+
+
+class UserRepository:
+    """사용자 테이블 접근 계층
+
+    모든 호출은 aioboto3를 통해 이벤트 루프를 막지 않고 수행된다. 조건식이 필요한 쓰기는
+    resource 계층(Table)을 쓰고, 조회는 resource 변환을 건너뛰는 저수준 Client로 한다.
+    get_item/query_index는 저수준 아이템을 그대로 돌려주고(UserModel.from_wire로 변환),
+    나머지 조회는 codec.decode_item으로 변환한 dict를 돌려준다 (숫자는 Decimal이 아닌 int).
+    API 요청 경로의 단건 호출은 호출 시간 제한(deadline) 안에서 하고, 배치/스캔은 adaptive
+    속도 제한에 맞춰 느려지도록 제한 없이 기다린다.
+    """
+
+    def __init__(self, client: AsyncDynamoDBClient = async_dynamodb_client):
+        self._client = client
+        self._table_name = client.table_name(settings.DYNAMODB_USERS_TABLE)
+
+    async def _table(self):
+        return await self._client.get_table(settings.DYNAMODB_USERS_TABLE)
+
+    async def put_item(self, item: Dict[str, Any]) -> None:
+        """아이템 저장"""
+        table = await self._table()
+        async with self._client.deadline():
+            await table.put_item(Item=item)
+
+    async def update_item(
+        self,
+        user_id: str,
+        updates: Dict[str, Any],
+        defaults: Optional[Dict[str, Any]] = None,
+        condition: Optional["ConditionBase"] = None,
+        removes: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """변경된 속성만 기록하는 UpdateItem
+
+        updates는 항상 덮어쓰고, defaults는 속성이 없을 때만 기록하며(if_not_exists),
+        removes의 속성은 삭제한다. condition이 실패하면 기존 아이템을 담은
+        ConditionalCheckFailedError를 던진다.
+        """
+        clauses = []
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        for i, (attribute, value) in enumerate(updates.items()):
+            names[f"#u{i}"] = attribute
+            values[f":u{i}"] = value
+            clauses.append(f"#u{i} = :u{i}")
+        for i, (attribute, value) in enumerate((defaults or {}).items()):
+            names[f"#d{i}"] = attribute
+            values[f":d{i}"] = value
+            clauses.append(f"#d{i} = if_not_exists(#d{i}, :d{i})")
+        expression = "SET " + ", ".join(clauses)
+        if removes:
+            names.update({f"#r{i}": attribute for i, attribute in enumerate(removes)})
+            expression += " REMOVE " + ", ".join(f"#r{i}" for i in range(len(removes)))
+
+        params: Dict[str, Any] = {
+            "Key": {"id": user_id},
+            "UpdateExpression": expression,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+            "ReturnValues": "ALL_NEW",
+        }
+        if condition is not None:
+            params["ConditionExpression"] = condition
+            params["ReturnValuesOnConditionCheckFailure"] = "ALL_OLD"
+
+        table = await self._table()
+        try:
+            async with self._client.deadline():
+                response = await table.update_item(**params)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            # 오류 응답의 기존 아이템은 resource 계층을 거치지 않아 저수준 형식이다
+            raise ConditionalCheckFailedError(e.response.get("Item")) from e
+        return response["Attributes"]
+
+    async def get_item(
+        self, user_id: str, projection: Optional[List[str]] = None
+    ) -> Optional[WireItem]:
+        """기본 키로 아이템 조회 (저수준 형식, projection이 있으면 그 속성만 받는다)"""
+        client = await self._client.get_client()
+        async with self._client.deadline():
+            response = await client.get_item(
+                TableName=self._table_name,
+                Key={"id": {"S": user_id}},
+                **_projection_params(projection),
+            )
+        return response.get("Item")
+
+    async def query_index(
+        self, index_name: str, attribute: str, value: str, projection: Optional[List[str]] = None
+    ) -> List[WireItem]:
+        """GSI 조회 (저수준 형식)
+
+        GSI 조회는 인덱스에 프로젝션된 속성만 돌려준다. 그 밖의 속성이 필요하면 id로 get_item한다.
+        """
+        client = await self._client.get_client()
+        async with self._client.deadline():
+            response = await client.query(
+                **_merge_params(
+                    {"TableName": self._table_name, "IndexName": index_name},
+                    _key_condition_params(attribute, value),
+                    _projection_params(projection),
+                )
+            )
+        return response["Items"]
+
+    async def query_index_pages(
+        self,
+        index_name: str,
+        attribute: str,
+        value: str,
+        projection: Optional[List[str]] = None,
+        start_key: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """GSI 파티션 하나를 (아이템, 다음 페이지 시작 키) 단위로 순회"""
+        client = await self._client.get_client()
+        params = _merge_params(
+            {"TableName": self._table_name, "IndexName": index_name},
+            _key_condition_params(attribute, value),
+            _projection_params(projection),
+        )
+        if start_key:
+            params["ExclusiveStartKey"] = encode_item(start_key)
+
+        while True:
+            response = await client.query(**params)
+            last_key = response.get("LastEvaluatedKey")
+            yield [decode_item(item) for item in response["Items"]], decode_key(last_key)
+            if not last_key:
+                return
+            params["ExclusiveStartKey"] = last_key
+
+    async def count_index(self, index_name: str, attribute: str, value: str) -> int:
+        """GSI 파티션 하나의 아이템 수 (Select=COUNT, 아이템 본문은 받지 않는다)"""
+        client = await self._client.get_client()
+        params = {
+            "TableName": self._table_name,
+            "IndexName": index_name,
+            "Select": "COUNT",
+            **_key_condition_params(attribute, value),
+        }
+        count = 0
+        while True:
+            response = await client.query(**params)
+            count += response["Count"]
+            if "LastEvaluatedKey" not in response:
+                return count
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    async def batch_get(
+        self, user_ids: List[str], projection: Optional[List[str]] = None, max_attempts: int = 8
+    ) -> List[Dict[str, Any]]:
+        """BatchGetItem으로 최대 100개 조회 (UnprocessedKeys는 백오프 후 재시도)"""
+        client = await self._client.get_client()
+        request: Dict[str, Any] = {"Keys": [{"id": {"S": user_id}} for user_id in user_ids]}
+        request.update(_projection_params(projection))
+
+        items: List[Dict[str, Any]] = []
+        table_name = self._table_name
+        request_items = {table_name: request}
+        for attempt in range(max_attempts):
+            response = await client.batch_get_item(RequestItems=request_items)
+            items.extend(decode_item(item) for item in response["Responses"].get(table_name, []))
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                return items
+            await _backoff(attempt)
+        raise Exception(f"Failed to batch get users: {len(request_items[table_name]['Keys'])} keys unprocessed")
+
+    async def batch_put(self, items: List[WireItem], max_attempts: int = 8) -> int:
+        """BatchWriteItem으로 최대 25개 저장 (아이템은 저수준 형식, UserModel.to_wire)
+
+        UnprocessedItems는 백오프 후 재시도하고, 끝내 처리되지 않은 아이템 수를 반환한다.
+        """
+        client = await self._client.get_client()
+        table_name = self._table_name
+        request_items = {table_name: [{"PutRequest": {"Item": item}} for item in items]}
+        for attempt in range(max_attempts):
+            try:
+                response = await client.batch_write_item(RequestItems=request_items)
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ProvisionedThroughputExceededException":
+                    raise
+                await _backoff(attempt)
+                continue
+            request_items = response.get("UnprocessedItems") or {}
+            if not request_items:
+                return 0
+            await _backoff(attempt)
+        return len(request_items.get(table_name, []))
+
+    async def put_new_item(self, item: WireItem, max_attempts: int = 8) -> bool:
+        """아이템이 없을 때만 저장 (저수준 형식, 이미 있으면 False)
+
+        처리량 초과는 백오프 후 재시도한다. 배치 쓰기처럼 속도 제한에 맞춰 제한 없이 기다린다.
+        """
+        client = await self._client.get_client()
+        for attempt in range(max_attempts):
+            try:
+                await client.put_item(
+                    TableName=self._table_name,
+                    Item=item,
+                    ConditionExpression="attribute_not_exists(id)",
+                )
+                return True
+            except ClientError as e:
+                code = e.response["Error"]["Code"]
+                if code == "ConditionalCheckFailedException":
+                    return False
+                if code != "ProvisionedThroughputExceededException":
+                    raise
+                await _backoff(attempt)
+        raise Exception(f"Failed to put user: throughput exceeded after {max_attempts} attempts")
+
+    async def scan_pages(
+        self,
+        projection: Optional[List[str]] = None,
+        filter_condition: Optional["ConditionBase"] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """테이블 전체를 페이지(최대 1MB, page_size가 있으면 그 아이템 수) 단위로 순회"""
+        async for items, _ in self.scan_segment(projection, filter_condition, page_size=page_size):
+            if items:
+                yield items
+
+    async def scan_segment(
+        self,
+        projection: Optional[List[str]] = None,
+        filter_condition: Optional["ConditionBase"] = None,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+        start_key: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """(병렬) 스캔 세그먼트를 (아이템, 다음 페이지 시작 키) 단위로 순회
+
+        다음 시작 키를 저장해 두면 중단된 지점부터 이어서 스캔할 수 있다.
+        """
+        client = await self._client.get_client()
+        params = _merge_params(
+            {"TableName": self._table_name},
+            _projection_params(projection),
+            _filter_params(filter_condition) if filter_condition is not None else {},
+        )
+        if total_segments is not None:
+            params["Segment"] = segment
+            params["TotalSegments"] = total_segments
+        if start_key:
+            params["ExclusiveStartKey"] = encode_item(start_key)
+        if page_size:
+            params["Limit"] = page_size
+
+        while True:
+            response = await client.scan(**params)
+            last_key = response.get("LastEvaluatedKey")
+            yield [decode_item(item) for item in response["Items"]], decode_key(last_key)
+            if not last_key:
+                return
+            params["ExclusiveStartKey"] = last_key
+
+
+user_repository = UserRepository()
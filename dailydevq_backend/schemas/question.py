@@ -0,0 +1,84 @@
+"""
+오늘의 질문 스키마
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Difficulty(str, Enum):
+    """질문 난이도"""
+    EASY = "easy"
+    MEDIUM = "medium"
+    HARD = "hard"
+
+
+class QuestionCreate(BaseModel):
+    """질문 발행 요청 스키마 (날짜는 경로로 받는다)"""
+    title: str = Field(min_length=1, max_length=200)
+    body: str = Field(min_length=1, max_length=5000)
+    category: str = Field(min_length=1, max_length=50)
+    difficulty: Difficulty = Difficulty.MEDIUM
+
+
+class QuestionResponse(BaseModel):
+    """질문 응답 스키마 (DailyQuestion에서 바로 변환)"""
+    date: str
+    title: str
+    body: str
+    category: str
+    difficulty: Difficulty
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AnswerRequest(BaseModel):
+    """답변 제출 요청 스키마"""
+    answer: str = Field(min_length=1, max_length=10000)
+
+
+class AnswerResponse(BaseModel):
+    """답변 기록 스키마 (Answer에서 바로 변환)"""
+    date: str
+    answer: str
+    question_title: str
+    category: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class StreakResponse(BaseModel):
+    """스트릭 스키마"""
+    current: int  # 오늘 기준 (어제나 오늘 답하지 않았으면 0)
+    longest: int
+    last_date: Optional[str] = None
+
+
+class TodayResponse(BaseModel):
+    """오늘의 질문 화면 응답 스키마"""
+    question: Optional[QuestionResponse] = None
+    answered: bool
+    streak: StreakResponse
+    history: List[AnswerResponse]
+
+
+class AnswerSubmitResponse(BaseModel):
+    """답변 제출 응답 스키마"""
+    success: bool
+    answer: AnswerResponse
+    streak: StreakResponse
+
+
+class GeneratedQuestion(BaseModel):
+    """LLM이 생성한 질문 (응답 JSON 검증용)"""
+    title: str = Field(min_length=1, max_length=200)
+    body: str = Field(min_length=1, max_length=5000)
+    explanation: str = Field(min_length=1, max_length=10000)  # 모범 답안 해설
+    difficulty: Difficulty = Difficulty.MEDIUM
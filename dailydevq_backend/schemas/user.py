@@ -2,12 +2,26 @@
 사용자 스키마
 """
 
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, EmailStr, Field
+from typing import Annotated, Optional
 from datetime import datetime
 from enum import Enum
 
 
+def normalize_email(email: str) -> str:
+    """정규화한 이메일 (사용자 ID, 이메일 인덱스, 캐시 키에 쓰는 형태)
+
+    앞뒤 공백을 빼고 로컬 파트까지 소문자로 바꾼다. 대부분의 메일 서비스가 대소문자를
+    구분하지 않으므로 Foo@Gmail.com과 foo@gmail.com은 같은 사용자다. Gmail의 점이나
+    +태그는 지우지 않는다 (+태그 주소는 사용자가 따로 쓰려고 만든 주소다).
+    """
+    return email.strip().lower()
+
+
+# 검증 후 정규화한 이메일 (요청 스키마용)
+NormalizedEmail = Annotated[EmailStr, AfterValidator(normalize_email)]
+
+
 class SubscriptionStatus(str, Enum):
     """구독 상태"""
     ACTIVE = "active"
@@ -23,7 +37,7 @@ class AuthProvider(str, Enum):
 
 class UserBase(BaseModel):
     """사용자 기본 스키마"""
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class UserCreate(UserBase):
@@ -35,12 +49,15 @@ class UserCreate(UserBase):
 
 
 class UserResponse(UserBase):
-    """사용자 응답 스키마"""
+    """사용자 응답 스키마 (UserResponse.model_validate(user)로 UserModel에서 바로 변환)"""
+    # 저장된 이메일은 가입 요청에서 이미 검증했으므로 응답마다 EmailStr로 다시 검증하지 않는다
+    email: str = Field(json_schema_extra={"format": "email"})
     id: str
     auth_provider: AuthProvider
     subscription_status: SubscriptionStatus
     name: Optional[str] = None
     profile_image: Optional[str] = None
+    # UserModel의 epoch 밀리초 정수를 받는다 (pydantic은 2e10보다 큰 숫자를 밀리초로 해석)
     created_at: datetime
     updated_at: datetime
 
@@ -50,7 +67,7 @@ class UserResponse(UserBase):
 
 class SubscribeRequest(BaseModel):
     """구독 요청 스키마"""
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class SubscribeResponse(BaseModel):
@@ -72,3 +89,24 @@ class GoogleAuthResponse(BaseModel):
     message: str
     user: Optional[UserResponse] = None
     access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # access token 유효 시간(초)
+
+
+class RefreshTokenRequest(BaseModel):
+    """토큰 갱신 요청 스키마"""
+    refresh_token: str
+
+
+class TokenResponse(BaseModel):
+    """토큰 갱신 응답 스키마"""
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+    expires_in: int
+
+
+class LogoutResponse(BaseModel):
+    """로그아웃 응답 스키마"""
+    success: bool
+    revoked_sessions: int
@@ -0,0 +1,79 @@
+"""
+프로덕션 서버 실행 (uvicorn 멀티 워커, uvloop + httptools)
+
+    python -m dailydevq_backend.server
+    python -m dailydevq_backend.server --workers 4 --port 8000
+
+main.py의 __main__은 개발용(reload, 단일 프로세스)이다. 여기서는 워커 프로세스마다 앱을 새로
+import하고 lifespan에서 DynamoDB/Redis/HTTP 커넥션 풀을 따로 만든다 (프로세스 간에 연결을
+공유하지 않는다). 죽은 워커는 uvicorn이 다시 띄운다.
+
+SIGTERM을 받으면 각 워커는 SERVER_DRAIN_SECONDS 동안 readiness를 실패시키면서 요청을 계속
+받고 keep-alive 연결을 응답과 함께 닫는다 (core/health.py). 그 뒤 새 연결을 막고 처리 중인 요청
+(구독 쓰기 포함)이 끝나기를 SERVER_GRACEFUL_TIMEOUT_SECONDS까지 기다린 다음 lifespan 정리를
+실행한다. 배포 플랫폼의 종료 유예 시간은 두 값의 합보다 길게 잡는다.
+
+클라이언트 IP(속도 제한 키)는 --forwarded-allow-ips(SERVER_FORWARDED_ALLOW_IPS)에 있는 프록시가
+보낸 X-Forwarded-For에서만 읽는다. 지정하지 않으면 모든 요청이 로드밸런서 IP 하나로 보여
+사용자 전체가 버킷 하나를 나눠 쓰므로, 지정하지 않으면 서버를 띄우지 않는다.
+"""
+
+import argparse
+import os
+from typing import Any, Dict, Optional
+
+import uvicorn
+
+from dailydevq_backend.core.config import settings
+
+APP = "dailydevq_backend.main:app"
+
+
+def server_options(
+    workers: int,
+    host: str,
+    port: int,
+    forwarded_allow_ips: Optional[str] = settings.SERVER_FORWARDED_ALLOW_IPS,
+) -> Dict[str, Any]:
+    """uvicorn.run 인자 (benchmarks/load_test.py도 같은 설정으로 띄운다)"""
+    if not forwarded_allow_ips:
+        raise Exception(
+            "Failed to start server: SERVER_FORWARDED_ALLOW_IPS is not set "
+            "(load balancer IP/CIDR, or * when only the platform proxy can reach the server)"
+        )
+    return {
+        "host": host,
+        "port": port,
+        "workers": workers,
+        "loop": settings.SERVER_LOOP,
+        "http": settings.SERVER_HTTP,
+        "backlog": settings.SERVER_BACKLOG,
+        "timeout_keep_alive": settings.SERVER_KEEPALIVE_SECONDS,
+        "timeout_graceful_shutdown": settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "limit_concurrency": settings.SERVER_LIMIT_CONCURRENCY,
+        "proxy_headers": True,
+        "forwarded_allow_ips": forwarded_allow_ips,
+        "access_log": settings.SERVER_ACCESS_LOG,
+        "server_header": False,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="프로덕션 서버 실행")
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="0이면 CPU 수")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", settings.BACKEND_PORT)))
+    parser.add_argument(
+        "--forwarded-allow-ips",
+        default=settings.SERVER_FORWARDED_ALLOW_IPS,
+        help="X-Forwarded-For를 믿을 프록시 IP/CIDR (쉼표 구분, *는 모두)",
+    )
+    args = parser.parse_args()
+
+    # sched_getaffinity는 컨테이너의 cpuset을 반영한다 (os.cpu_count는 호스트 CPU 수)
+    workers = args.workers or len(os.sched_getaffinity(0))
+    uvicorn.run(APP, **server_options(workers, args.host, args.port, args.forwarded_allow_ips))
+
+
+if __name__ == "__main__":
+    main()
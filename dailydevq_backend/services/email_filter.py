@@ -0,0 +1,201 @@
+"""
+이메일로 id를 알 수 없는 사용자 필터 (Redis에 저장해 워커가 공유하는 Bloom filter)
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import List, Optional, Tuple
+
+import redis.asyncio as redis
+from botocore.exceptions import BotoCoreError, ClientError
+from redis.exceptions import RedisError
+
+from dailydevq_backend.core.bloom import BloomFilter
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.core.redis import RedisClient, redis_client
+from dailydevq_backend.models.user import user_id_for_email
+from dailydevq_backend.repositories.user_repository import UserRepository
+from dailydevq_backend.schemas.user import normalize_email
+
+logger = logging.getLogger(__name__)
+
+# 필터 형식이나 "이메일로 id를 알 수 없는" 기준이 바뀌면 버전을 올려 새로 만들게 한다
+FILTER_KEY = "user:email-filter:v1"
+VERSION_KEY = f"{FILTER_KEY}:version"  # 만들 때마다 바뀌는 값 (API 워커는 이것만 보고 다시 읽는다)
+BUILD_LOCK_KEY = f"{FILTER_KEY}:build"
+BUILD_LOCK_TTL_SECONDS = 3600
+
+
+class LegacyEmailFilter:
+    """정규화한 이메일로 정해지는 id(user_id_for_email)에 없는 사용자의 이메일 집합
+
+    대부분의 사용자는 GetItem 한 번으로 찾는다. 이메일 기반 ID 도입 전 사용자와 정규화 전
+    이메일로 만든 사용자만 email-status-index로 찾아야 하는데, 이런 사용자는 더 생기지 않는다
+    (새 사용자는 모두 정규화한 이메일로 id를 만든다). 그래서 한 번 만든 필터가 "없다"고 하면
+    GetItem이 없을 때 인덱스를 조회하지 않아도 된다. 새 주소의 구독, 상태 확인, 구독 취소가
+    인덱스 조회를 건너뛴다.
+
+    다만 배포 중에는 예전 코드의 워커가 정규화 전 이메일로 id를 만들 수 있으므로, 필터는 이벤트
+    워커가 주기적으로 다시 만들어 TTL을 두고 Redis에 저장한다(maintain_email_filter). API 워커는
+    reload_interval마다 버전 키를 확인해 바뀌었을 때만 필터를 다시 읽는다. 저장된 필터가 없거나
+    만료됐으면(이벤트 워커가 멈춘 경우) 모든 이메일을 "있을 수 있다"로 보고 인덱스를 조회한다.
+
+    모든 이메일을 담은 필터는 다른 워커가 방금 만든 사용자를 모르므로 "없다"가 틀릴 수 있어 쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        enabled: bool = settings.USER_EMAIL_FILTER_ENABLED,
+        reload_interval: float = settings.USER_EMAIL_FILTER_RELOAD_SECONDS,
+    ):
+        self.redis = redis
+        self.enabled = enabled
+        self.reload_interval = reload_interval
+        self._bloom: Optional[BloomFilter] = None
+        self._version: Optional[bytes] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._bloom is not None
+
+    def might_contain(self, email: str) -> bool:
+        """email-status-index를 조회해야 하는지 (정규화한 이메일)"""
+        return self._bloom is None or email in self._bloom
+
+    async def load(self) -> bool:
+        """Redis에 저장된 필터 읽기 (필터를 쓸 수 있으면 True)
+
+        저장된 필터가 없거나 만료됐으면 가지고 있던 필터도 버린다. Redis를 읽지 못하면 가지고
+        있던 필터를 그대로 쓴다.
+        """
+        client = self.redis.client
+        try:
+            version = await client.get(VERSION_KEY)
+            if version is not None and version == self._version:
+                return True
+            raw = await client.get(FILTER_KEY) if version is not None else None
+        except RedisError as e:
+            logger.warning("이메일 필터를 읽지 못했습니다: %s", e)
+            return self._bloom is not None
+        if raw is None:
+            self._bloom, self._version = None, None
+            return False
+        self._bloom, self._version = BloomFilter.from_bytes(raw), version
+        logger.info("이메일 필터: 인덱스 조회 대상 %d명", self._bloom.count)
+        return True
+
+    async def start(self) -> None:
+        """저장된 필터 읽기와 주기적 확인 시작 (DynamoDB는 호출하지 않는다)"""
+        if not self.enabled or self._task is not None:
+            return
+        await self.load()
+        self._task = asyncio.create_task(self._reload())
+
+    async def _reload(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            await self.load()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._bloom, self._version = None, None
+
+
+async def build_email_filter(
+    repository: UserRepository,
+    capacity: int = settings.USER_EMAIL_FILTER_CAPACITY,
+    error_rate: float = settings.USER_EMAIL_FILTER_ERROR_RATE,
+    page_size: Optional[int] = settings.USER_EMAIL_FILTER_SCAN_PAGE_SIZE,
+    interval: float = settings.USER_EMAIL_FILTER_SCAN_INTERVAL_SECONDS,
+) -> Tuple[BloomFilter, int]:
+    """테이블을 스캔해 필터 생성 ((필터, 스캔한 사용자 수), id와 email만 읽는다)
+
+    page_size개씩 읽고 페이지 사이에 interval초 쉬어 테이블 읽기 용량을 조금씩만 쓴다.
+    """
+    emails: List[str] = []
+    scanned = 0
+    async for page in repository.scan_pages(["id", "email"], page_size=page_size):
+        for item in page:
+            if "email" not in item:
+                continue
+            email = normalize_email(item["email"])
+            if item["id"] != user_id_for_email(email):
+                emails.append(email)
+        scanned += len(page)
+        if interval:
+            await asyncio.sleep(interval)
+
+    bloom = BloomFilter(max(capacity, len(emails) * 2), error_rate)
+    for email in emails:
+        bloom.add(email)
+    return bloom, scanned
+
+
+async def store_email_filter(client: redis.Redis, bloom: BloomFilter, ttl: int) -> None:
+    """필터와 새 버전을 함께 저장 (ttl초 뒤 만료)"""
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.set(FILTER_KEY, bloom.to_bytes(), ex=ttl)
+        pipe.set(VERSION_KEY, uuid.uuid4().hex, ex=ttl)
+        await pipe.execute()
+
+
+async def publish_email_filter(
+    client: redis.Redis,
+    page_size: Optional[int] = settings.USER_EMAIL_FILTER_SCAN_PAGE_SIZE,
+    interval: float = settings.USER_EMAIL_FILTER_SCAN_INTERVAL_SECONDS,
+    rebuild_interval: float = settings.USER_EMAIL_FILTER_REBUILD_SECONDS,
+    ttl: int = settings.USER_EMAIL_FILTER_TTL_SECONDS,
+) -> bool:
+    """저장된 필터가 없거나 rebuild_interval보다 오래됐으면 만들어 Redis에 저장
+
+    이벤트 워커 중 하나만 만든다. 서킷 브레이커가 없는 별도 DynamoDB 클라이언트로 스캔하므로,
+    스캔이 스로틀돼도 API 요청 경로의 서킷을 열지 않는다.
+    """
+    token = uuid.uuid4().hex
+    try:
+        # 남은 TTL로 만든 지 얼마나 됐는지 안다 (없으면 -2, TTL이 없으면 -1)
+        if await client.ttl(VERSION_KEY) > ttl - rebuild_interval:
+            return False
+        if not await client.set(BUILD_LOCK_KEY, token, nx=True, ex=BUILD_LOCK_TTL_SECONDS):
+            return False
+    except RedisError as e:
+        logger.warning("이메일 필터를 만들지 못했습니다: %s", e)
+        return False
+
+    dynamodb = AsyncDynamoDBClient()
+    try:
+        bloom, scanned = await build_email_filter(
+            UserRepository(dynamodb), page_size=page_size, interval=interval
+        )
+        await store_email_filter(client, bloom, ttl)
+    except (ClientError, BotoCoreError, RedisError) as e:
+        logger.warning("이메일 필터를 만들지 못했습니다: %s", e)
+        return False
+    finally:
+        await dynamodb.stop()
+        try:
+            if await client.get(BUILD_LOCK_KEY) == token.encode():
+                await client.delete(BUILD_LOCK_KEY)
+        except RedisError:
+            pass
+    logger.info("이메일 필터 저장: 사용자 %d명 중 인덱스 조회 대상 %d명", scanned, bloom.count)
+    return True
+
+
+async def maintain_email_filter(
+    client: redis.Redis, check_interval: float = settings.USER_EMAIL_FILTER_RELOAD_SECONDS
+) -> None:
+    """이벤트 워커에서 필터를 주기적으로 다시 만든다 (취소될 때까지)"""
+    while True:
+        await publish_email_filter(client)
+        await asyncio.sleep(check_interval)
+
+
+legacy_email_filter = LegacyEmailFilter()
@@ -0,0 +1,107 @@
+"""
+사용자 이벤트 핸들러 (services.events.EventConsumer가 호출)
+
+같은 이벤트가 다시 전달될 수 있으므로 핸들러는 멱등이어야 한다. 소비자가 성공한 (핸들러, 이벤트)를
+기록해 건너뛰지만, 핸들러가 끝난 뒤 기록하기 전에 멈추면 한 번 더 호출된다.
+"""
+
+from datetime import datetime
+from email.message import EmailMessage
+from typing import List
+from urllib.parse import urlencode
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.models.question import KST
+from dailydevq_backend.services.events import (
+    DELETED,
+    RESUBSCRIBED,
+    SUBSCRIBED,
+    UNSUBSCRIBED,
+    UPDATED,
+    EventHandler,
+    UserEvent,
+)
+from dailydevq_backend.services.mailer import SMTPMailer
+from dailydevq_backend.services.user_service import UserService
+
+# 이벤트마다 한 번만 센다 (SET NX가 성공한 경우에만 증가)
+_COUNT_ONCE = """
+if redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[3]) then
+    return redis.call('HINCRBY', KEYS[2], ARGV[1], ARGV[2])
+end
+return false
+"""
+
+
+class WelcomeEmailHandler:
+    """구독(재구독) 환영 메일"""
+
+    name = "welcome-email"
+    types = frozenset({SUBSCRIBED, RESUBSCRIBED})
+
+    def __init__(self, mailer: SMTPMailer):
+        self.mailer = mailer
+
+    def build_message(self, event: UserEvent) -> EmailMessage:
+        query = urlencode({"email": event.email})
+        unsubscribe_url = f"{settings.NEWSLETTER_UNSUBSCRIBE_URL}?{query}"
+        message = EmailMessage()
+        message["From"] = settings.SMTP_FROM
+        message["To"] = event.email
+        message["Subject"] = "[DailyDevQ] 구독해 주셔서 감사합니다"
+        message["List-Unsubscribe"] = f"<{unsubscribe_url}>"
+        message.set_content(
+            "DailyDevQ를 구독해 주셔서 감사합니다.\n"
+            "내일 아침부터 매일 기술 면접 질문을 보내 드립니다.\n\n"
+            f"구독 취소: {unsubscribe_url}"
+        )
+        return message
+
+    async def handle(self, event: UserEvent) -> None:
+        if event.email:
+            await self.mailer.send(self.build_message(event))
+
+
+class SubscriptionStatsHandler:
+    """일별 구독/구독 취소 수 (stats:subscriptions:{날짜} 해시, KST 기준)"""
+
+    name = "subscription-stats"
+    types = frozenset({SUBSCRIBED, RESUBSCRIBED, UNSUBSCRIBED})
+
+    def __init__(self, redis, ttl: int = settings.EVENTS_DONE_TTL_SECONDS):
+        self.ttl = ttl
+        self._count_once = redis.register_script(_COUNT_ONCE)
+
+    async def handle(self, event: UserEvent) -> None:
+        day = datetime.fromtimestamp(event.occurred_at / 1000, KST).date().isoformat()
+        await self._count_once(
+            keys=[f"stats:counted:{event.event_id}", f"stats:subscriptions:{day}"],
+            args=[event.type, 1, self.ttl],
+        )
+
+
+class UserCacheInvalidationHandler:
+    """사용자 조회 캐시(Redis 계층) 무효화
+
+    UserService를 거친 쓰기는 요청 중에 이미 무효화하지만, 가져오기나 콘솔 수정처럼 서비스를
+    거치지 않은 변경은 이 핸들러가 무효화한다. 무효화는 몇 번 반복해도 결과가 같다.
+    """
+
+    name = "user-cache"
+    types = frozenset({SUBSCRIBED, RESUBSCRIBED, UNSUBSCRIBED, UPDATED, DELETED})
+
+    def __init__(self, service: UserService):
+        self.service = service
+
+    async def handle(self, event: UserEvent) -> None:
+        await self.service.invalidate(event.user_id, event.email, event.google_id)
+
+
+def default_handlers(redis, mailer: SMTPMailer, service: UserService) -> List[EventHandler]:
+    handlers: List[EventHandler] = [
+        SubscriptionStatsHandler(redis),
+        UserCacheInvalidationHandler(service),
+    ]
+    if settings.WELCOME_EMAIL_ENABLED:
+        handlers.append(WelcomeEmailHandler(mailer))
+    return handlers
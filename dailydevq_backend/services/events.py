@@ -0,0 +1,461 @@
+"""
+사용자 변경 이벤트 (DynamoDB Streams → Redis Streams 소비자 그룹)
+
+users 테이블의 스트림 레코드가 아웃박스 역할을 한다. 레코드는 사용자 쓰기와 함께 DynamoDB가
+남기므로 요청 경로는 UpdateItem 한 번으로 끝나고, 후속 작업은 이벤트 워커가 처리한다.
+
+    DynamoDB Streams ──StreamRelay(워커 하나)──▶ Redis 스트림 events:user
+        ──EventConsumer × N (소비자 그룹 side-effects)──▶ 핸들러 (환영 메일, 통계, 캐시 무효화)
+
+전달은 최소 한 번이다. 중계가 재시작하면 같은 레코드를 다시 넣을 수 있고, 처리 중 멈춘 이벤트는
+다른 소비자가 다시 처리한다. 그래서 핸들러마다 이벤트 ID로 처리 완료를 기록하고 건너뛴다.
+"""
+
+import asyncio
+import importlib
+import logging
+import uuid
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Set, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+from redis.exceptions import RedisError, ResponseError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient, async_dynamodb_client
+from dailydevq_backend.repositories.codec import WireItem
+from dailydevq_backend.schemas.user import SubscriptionStatus
+
+logger = logging.getLogger(__name__)
+
+EVENT_STREAM = "events:user"
+DEAD_LETTER_STREAM = "events:user:dead"
+CONSUMER_GROUP = "side-effects"
+RELAY_CHECKPOINT = "events:relay:checkpoint"  # 해시: 샤드 ID → 마지막으로 넣은 순번
+RELAY_LOCK = "events:relay:lock"
+SHARD_DONE = "done"
+
+SUBSCRIBED = "user.subscribed"
+RESUBSCRIBED = "user.resubscribed"
+UNSUBSCRIBED = "user.unsubscribed"
+UPDATED = "user.updated"
+DELETED = "user.deleted"
+
+ACTIVE = SubscriptionStatus.ACTIVE.value
+UNSUBSCRIBED_STATUS = SubscriptionStatus.UNSUBSCRIBED.value
+
+# 잠금을 가진 경우에만 만료 시간을 늘린다
+_REFRESH_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+@dataclass(slots=True)
+class UserEvent:
+    """사용자 변경 이벤트 하나"""
+
+    event_id: str  # DynamoDB 스트림 레코드 ID (다시 전달되어도 같다)
+    type: str
+    user_id: str
+    occurred_at: int  # epoch 밀리초
+    email: Optional[str] = None
+    google_id: Optional[str] = None
+
+    def to_fields(self) -> Dict[str, str]:
+        fields = {
+            "event_id": self.event_id,
+            "type": self.type,
+            "user_id": self.user_id,
+            "occurred_at": str(self.occurred_at),
+        }
+        if self.email:
+            fields["email"] = self.email
+        if self.google_id:
+            fields["google_id"] = self.google_id
+        return fields
+
+    @classmethod
+    def from_fields(cls, fields: Dict[Any, Any]) -> "UserEvent":
+        data = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in fields.items()
+        }
+        return cls(
+            event_id=data["event_id"],
+            type=data["type"],
+            user_id=data["user_id"],
+            occurred_at=int(data["occurred_at"]),
+            email=data.get("email"),
+            google_id=data.get("google_id"),
+        )
+
+
+def _s(image: Optional[WireItem], name: str) -> Optional[str]:
+    value = (image or {}).get(name)
+    return value.get("S") if value else None
+
+
+def event_from_record(record: Dict[str, Any]) -> UserEvent:
+    """스트림 레코드(이전/이후 이미지)에서 이벤트 종류 결정"""
+    change = record["dynamodb"]
+    old, new = change.get("OldImage"), change.get("NewImage")
+    old_status, new_status = _s(old, "subscription_status"), _s(new, "subscription_status")
+    if record["eventName"] == "REMOVE":
+        event_type = DELETED
+    elif new_status == ACTIVE and old_status != ACTIVE:
+        event_type = SUBSCRIBED if old is None else RESUBSCRIBED
+    elif old_status == ACTIVE and new_status == UNSUBSCRIBED_STATUS:
+        event_type = UNSUBSCRIBED
+    else:
+        event_type = UPDATED
+
+    image = new or old or {}
+    created = change.get("ApproximateCreationDateTime")
+    return UserEvent(
+        event_id=record["eventID"],
+        type=event_type,
+        user_id=change["Keys"]["id"]["S"],
+        occurred_at=int(created.timestamp() * 1000) if created is not None else 0,
+        email=_s(image, "email"),
+        google_id=_s(image, "google_id"),
+    )
+
+
+async def _wait(stopping: asyncio.Event, seconds: float) -> None:
+    try:
+        await asyncio.wait_for(stopping.wait(), seconds)
+    except TimeoutError:
+        pass
+
+
+class StreamRelay:
+    """DynamoDB Streams 레코드를 Redis 스트림으로 옮기는 중계
+
+    여러 워커에서 실행해도 Redis 잠금을 가진 하나만 중계한다. 샤드별로 Redis 스트림에 넣은 뒤에
+    순번을 체크포인트로 저장하므로, 그 사이에 멈추면 재시작 후 같은 레코드를 다시 넣는다.
+    부모 샤드를 모두 읽은 뒤에 자식 샤드를 읽어 같은 사용자의 이벤트 순서를 지킨다.
+    DynamoDB/Redis 호출이 실패하면 (연결 오류 포함) 실패가 이어질수록 길게 기다렸다가 다시 시도한다.
+    """
+
+    LOCK_TTL_SECONDS = 30.0
+    RECORDS_PER_CALL = 1000
+    MAX_BACKOFF_SECONDS = 30.0
+
+    def __init__(
+        self,
+        redis,
+        dynamodb: AsyncDynamoDBClient = async_dynamodb_client,
+        table_name: str = settings.DYNAMODB_USERS_TABLE,
+        poll_seconds: float = settings.EVENTS_RELAY_POLL_SECONDS,
+        maxlen: int = settings.EVENTS_STREAM_MAXLEN,
+    ):
+        self.redis = redis
+        self.dynamodb = dynamodb
+        self.table_name = dynamodb.table_name(table_name)
+        self.poll_seconds = poll_seconds
+        self.maxlen = maxlen
+        self.token = uuid.uuid4().hex
+        self.relayed = 0
+        self._refresh_lock = redis.register_script(_REFRESH_LOCK)
+        self._streams = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._stream_arn: Optional[str] = None
+        self._iterators: Dict[str, str] = {}
+
+    async def start(self):
+        aioboto3 = await asyncio.to_thread(importlib.import_module, "aioboto3")
+        session = aioboto3.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+        )
+        self._exit_stack = AsyncExitStack()
+        self._streams = await self._exit_stack.enter_async_context(
+            session.client("dynamodbstreams", endpoint_url=settings.DYNAMODB_ENDPOINT)
+        )
+        client = await self.dynamodb.get_client()
+        table = (await client.describe_table(TableName=self.table_name))["Table"]
+        self._stream_arn = table.get("LatestStreamArn")
+        if not self._stream_arn:
+            raise Exception(
+                f"Failed to start event relay: {self.table_name} has no stream "
+                "(python -m dailydevq_backend.utils.migrate)"
+            )
+
+    async def stop(self):
+        await self.redis.eval(
+            "if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) end",
+            1,
+            RELAY_LOCK,
+            self.token,
+        )
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+
+    async def _hold_lock(self) -> bool:
+        ttl_ms = int(self.LOCK_TTL_SECONDS * 1000)
+        if await self.redis.set(RELAY_LOCK, self.token, nx=True, px=ttl_ms):
+            logger.info("이벤트 중계 시작 (%s)", self.token)
+            return True
+        return bool(await self._refresh_lock(keys=[RELAY_LOCK], args=[self.token, ttl_ms]))
+
+    async def run(self, stopping: asyncio.Event) -> None:
+        failures = 0
+        while not stopping.is_set():
+            try:
+                if not await self._hold_lock():
+                    # 다른 워커가 중계 중: 잠금이 풀리면 이어받는다
+                    await _wait(stopping, self.LOCK_TTL_SECONDS / 2)
+                    continue
+                moved = await self.relay_once()
+            except (ClientError, BotoCoreError, RedisError, OSError) as e:
+                failures += 1
+                delay = min(self.MAX_BACKOFF_SECONDS, self.poll_seconds * 2**failures)
+                logger.warning("이벤트 중계 실패 (%.1f초 뒤 다시 시도): %s", delay, e)
+                await _wait(stopping, delay)
+                continue
+            failures = 0
+            if not moved:
+                await _wait(stopping, self.poll_seconds)
+
+    async def _list_shards(self) -> List[Dict[str, Any]]:
+        shards: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {"StreamArn": self._stream_arn}
+        while True:
+            description = (await self._streams.describe_stream(**params))["StreamDescription"]
+            shards.extend(description["Shards"])
+            last = description.get("LastEvaluatedShardId")
+            if not last:
+                return shards
+            params["ExclusiveStartShardId"] = last
+
+    async def _shard_iterator(self, shard_id: str, checkpoint: Optional[str]) -> str:
+        params = {"StreamArn": self._stream_arn, "ShardId": shard_id}
+        if checkpoint:
+            params.update(ShardIteratorType="AFTER_SEQUENCE_NUMBER", SequenceNumber=checkpoint)
+        else:
+            params.update(ShardIteratorType="TRIM_HORIZON")
+        return (await self._streams.get_shard_iterator(**params))["ShardIterator"]
+
+    async def relay_once(self) -> int:
+        """모든 샤드에서 한 번씩 읽어 Redis 스트림에 넣는다 (넣은 이벤트 수)"""
+        shards = await self._list_shards()
+        raw = await self.redis.hgetall(RELAY_CHECKPOINT)
+        checkpoints = {k.decode(): v.decode() for k, v in raw.items()}
+        shard_ids = {shard["ShardId"] for shard in shards}
+        moved = 0
+        for shard in shards:
+            shard_id = shard["ShardId"]
+            if checkpoints.get(shard_id) == SHARD_DONE:
+                continue
+            parent = shard.get("ParentShardId")
+            if parent in shard_ids and checkpoints.get(parent) != SHARD_DONE:
+                continue
+            moved += await self._relay_shard(shard_id, checkpoints.get(shard_id))
+        return moved
+
+    async def _relay_shard(self, shard_id: str, checkpoint: Optional[str]) -> int:
+        iterator = self._iterators.get(shard_id)
+        if iterator is None:
+            iterator = await self._shard_iterator(shard_id, checkpoint)
+        try:
+            response = await self._streams.get_records(
+                ShardIterator=iterator, Limit=self.RECORDS_PER_CALL
+            )
+        except ClientError as e:
+            self._iterators.pop(shard_id, None)
+            if e.response["Error"]["Code"] == "TrimmedDataAccessException":
+                # 24시간 보관 기간이 지난 레코드: 남아 있는 가장 오래된 레코드부터 다시 읽는다
+                logger.error("스트림 보관 기간이 지나 이벤트가 유실되었습니다 (%s)", shard_id)
+                await self.redis.hdel(RELAY_CHECKPOINT, shard_id)
+                return 0
+            if e.response["Error"]["Code"] == "ExpiredIteratorException":
+                return 0
+            raise
+
+        records = response["Records"]
+        if records:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for record in records:
+                    pipe.xadd(
+                        EVENT_STREAM,
+                        event_from_record(record).to_fields(),
+                        maxlen=self.maxlen,
+                        approximate=True,
+                    )
+                pipe.hset(RELAY_CHECKPOINT, shard_id, records[-1]["dynamodb"]["SequenceNumber"])
+                await pipe.execute()
+            self.relayed += len(records)
+
+        next_iterator = response.get("NextShardIterator")
+        if next_iterator is None:
+            # 닫힌 샤드를 끝까지 읽음
+            await self.redis.hset(RELAY_CHECKPOINT, shard_id, SHARD_DONE)
+            self._iterators.pop(shard_id, None)
+        else:
+            self._iterators[shard_id] = next_iterator
+        return len(records)
+
+
+class EventHandler(Protocol):
+    """이벤트 핸들러 (name은 처리 완료 기록 키에 쓰이므로 바꾸지 않는다)"""
+
+    name: str
+    types: FrozenSet[str]  # 처리하는 이벤트 종류
+
+    async def handle(self, event: UserEvent) -> None: ...
+
+
+@dataclass
+class ConsumerStats:
+    processed: int = 0  # 모든 핸들러가 처리를 마친(ACK한) 이벤트
+    duplicates: int = 0  # 이미 처리한 것으로 기록되어 건너뛴 핸들러 호출
+    failed: int = 0  # 실패해 다시 전달될 핸들러 호출
+    dead: int = 0
+    per_handler: Dict[str, int] = field(default_factory=dict)
+
+
+class EventConsumer:
+    """Redis 스트림 소비자 그룹의 소비자 하나
+
+    이벤트를 batch_size개씩 읽어 핸들러별로 동시에 처리하고, 모든 핸들러가 성공한 이벤트만 ACK한다.
+    실패한 이벤트는 대기 목록(PEL)에 남아 claim_idle_seconds 뒤 아무 소비자나 다시 가져가며,
+    max_deliveries번 넘게 전달된 이벤트는 dead letter 스트림으로 옮긴다.
+    핸들러가 성공하면 (핸들러, 이벤트 ID)를 기록해 두고 다시 전달된 이벤트에서는 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        redis,
+        handlers: List[EventHandler],
+        name: str,
+        batch_size: int = settings.EVENTS_BATCH_SIZE,
+        block_ms: int = settings.EVENTS_BLOCK_MS,
+        claim_idle_seconds: float = settings.EVENTS_CLAIM_IDLE_SECONDS,
+        max_deliveries: int = settings.EVENTS_MAX_DELIVERIES,
+        done_ttl: int = settings.EVENTS_DONE_TTL_SECONDS,
+        stream: str = EVENT_STREAM,
+        group: str = CONSUMER_GROUP,
+    ):
+        self.redis = redis
+        self.handlers = handlers
+        self.name = name
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = int(claim_idle_seconds * 1000)
+        self.max_deliveries = max_deliveries
+        self.done_ttl = done_ttl
+        self.stream = stream
+        self.group = group
+        self.stats = ConsumerStats()
+
+    async def ensure_group(self) -> None:
+        """소비자 그룹 생성 (처음 만들 때는 스트림의 처음부터 읽는다)"""
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self, stopping: asyncio.Event) -> None:
+        await self.ensure_group()
+        loop = asyncio.get_running_loop()
+        next_claim = 0.0
+        while not stopping.is_set():
+            try:
+                if loop.time() >= next_claim:
+                    await self.claim_stale()
+                    next_claim = loop.time() + self.claim_idle_ms / 2000
+                response = await self.redis.xreadgroup(
+                    self.group,
+                    self.name,
+                    {self.stream: ">"},
+                    count=self.batch_size,
+                    block=self.block_ms,
+                )
+                for _, entries in response or []:
+                    await self.process(entries)
+            except (RedisError, OSError) as e:
+                # 처리 중이던 이벤트는 대기 목록에 남아 다시 전달된다
+                logger.warning("이벤트 소비 실패 (%s): %s", self.name, e)
+                await _wait(stopping, 1.0)
+
+    def _done_key(self, handler: EventHandler, event: UserEvent) -> str:
+        return f"events:done:{handler.name}:{event.event_id}"
+
+    async def _run_handler(
+        self, handler: EventHandler, events: List[Tuple[Any, UserEvent]]
+    ) -> Set[Any]:
+        """핸들러 하나로 배치 처리 (실패한 엔트리 ID 반환)"""
+        targets = [(entry_id, event) for entry_id, event in events if event.type in handler.types]
+        if not targets:
+            return set()
+        done = await self.redis.mget([self._done_key(handler, event) for _, event in targets])
+        todo = [target for target, flag in zip(targets, done) if flag is None]
+        self.stats.duplicates += len(targets) - len(todo)
+
+        results = await asyncio.gather(
+            *(handler.handle(event) for _, event in todo), return_exceptions=True
+        )
+        failed = set()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for (entry_id, event), result in zip(todo, results):
+                if isinstance(result, Exception):
+                    failed.add(entry_id)
+                    logger.warning("%s 처리 실패 (%s): %s", handler.name, event.event_id, result)
+                else:
+                    pipe.set(self._done_key(handler, event), 1, ex=self.done_ttl)
+            await pipe.execute()
+        succeeded = len(todo) - len(failed)
+        per_handler = self.stats.per_handler
+        per_handler[handler.name] = per_handler.get(handler.name, 0) + succeeded
+        self.stats.failed += len(failed)
+        return failed
+
+    async def process(self, entries: List[Tuple[Any, Dict[Any, Any]]]) -> None:
+        """엔트리 배치 처리 후 성공한 엔트리 ACK"""
+        events = []
+        for entry_id, fields in entries:
+            try:
+                events.append((entry_id, UserEvent.from_fields(fields)))
+            except (KeyError, ValueError) as e:
+                await self._dead_letter(entry_id, fields, f"invalid event: {e}")
+        failures = await asyncio.gather(*(self._run_handler(h, events) for h in self.handlers))
+        failed = set().union(*failures)
+        acked = [entry_id for entry_id, _ in events if entry_id not in failed]
+        if acked:
+            await self.redis.xack(self.stream, self.group, *acked)
+        self.stats.processed += len(acked)
+
+    async def claim_stale(self) -> None:
+        """처리가 멈춘 이벤트 회수 (다른 소비자가 죽었거나 핸들러가 실패한 경우)"""
+        pending = await self.redis.xpending_range(
+            self.stream, self.group, "-", "+", self.batch_size, idle=self.claim_idle_ms
+        )
+        if not pending:
+            return
+        retry_ids = [p["message_id"] for p in pending if p["times_delivered"] < self.max_deliveries]
+        dead_ids = [p["message_id"] for p in pending if p["times_delivered"] >= self.max_deliveries]
+        if dead_ids:
+            for entry_id, fields in await self.redis.xclaim(
+                self.stream, self.group, self.name, self.claim_idle_ms, dead_ids
+            ):
+                await self._dead_letter(entry_id, fields, "too many deliveries")
+        if retry_ids:
+            entries = await self.redis.xclaim(
+                self.stream, self.group, self.name, self.claim_idle_ms, retry_ids
+            )
+            await self.process([entry for entry in entries if entry[1]])
+
+    async def _dead_letter(self, entry_id: Any, fields: Dict[Any, Any], reason: str) -> None:
+        logger.error("이벤트를 dead letter로 옮김 (%s): %s", entry_id, reason)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(DEAD_LETTER_STREAM, {**fields, "entry_id": entry_id, "reason": reason})
+            pipe.xack(self.stream, self.group, entry_id)
+            await pipe.execute()
+        self.stats.dead += 1
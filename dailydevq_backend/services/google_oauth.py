@@ -2,9 +2,98 @@
 Google OAuth 서비스
 """
 
-import httpx
+import asyncio
+import logging
+import re
+import time
 from typing import Optional, Dict, Any
+
+import httpx
+from jose import JWTError, jwt
+
 from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.http import HTTPClient, http_client
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class GoogleJWKSCache:
+    """Google 공개키(JWKS) 캐시
+
+    Cache-Control max-age 동안 키를 메모리에 보관하고, 만료 전에 백그라운드에서
+    갱신한다. 모르는 kid가 오면 (키 교체 직후) 즉시 한 번 다시 받아온다.
+    """
+
+    DEFAULT_MAX_AGE = 3600
+    MIN_REFRESH_INTERVAL = 60
+    RETRY_INTERVAL = 30
+
+    def __init__(self, jwks_url: str, http: HTTPClient = http_client):
+        self.jwks_url = jwks_url
+        self._http = http
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = float("-inf")
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """키를 미리 받아오고 백그라운드 갱신 시작"""
+        if self._refresh_task is not None:
+            return
+        try:
+            await self.refresh()
+        except httpx.HTTPError as e:
+            logger.warning("Google JWKS prefetch failed: %s", e)
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+    async def _refresh_loop(self):
+        while True:
+            # 만료 10% 전에 미리 갱신
+            remaining = self._expires_at - time.monotonic()
+            await asyncio.sleep(max(self.MIN_REFRESH_INTERVAL, remaining * 0.9))
+            try:
+                await self.refresh()
+            except httpx.HTTPError as e:
+                logger.warning("Google JWKS refresh failed: %s", e)
+                await asyncio.sleep(self.RETRY_INTERVAL)
+
+    async def refresh(self, kid: Optional[str] = None):
+        """JWKS 다시 받아오기 (kid가 주어지면 이미 있을 때 생략)"""
+        async with self._lock:
+            if kid is not None and kid in self._keys:
+                return
+            response = await self._http.client.get(self.jwks_url)
+            response.raise_for_status()
+            match = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+            max_age = int(match.group(1)) if match else self.DEFAULT_MAX_AGE
+            self._keys = {key["kid"]: key for key in response.json().get("keys", [])}
+            self._fetched_at = time.monotonic()
+            self._expires_at = self._fetched_at + max_age
+
+    async def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        """kid에 해당하는 공개키 반환
+
+        만료된 키도 백그라운드 갱신 전까지는 그대로 쓴다. Google은 교체한 키를
+        한동안 함께 게시하므로 안전하다.
+        """
+        key = self._keys.get(kid)
+        recently_fetched = time.monotonic() - self._fetched_at < self.MIN_REFRESH_INTERVAL
+        if key is None and not recently_fetched:
+            await self.refresh(kid)
+            key = self._keys.get(kid)
+        return key
 
 
 class GoogleOAuthService:
@@ -12,42 +101,87 @@ class GoogleOAuthService:
 
     GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
     GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+    GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+
+    def __init__(
+        self,
+        token_url: str = GOOGLE_TOKEN_URL,
+        userinfo_url: str = GOOGLE_USERINFO_URL,
+        jwks_url: str = GOOGLE_JWKS_URL,
+        http: HTTPClient = http_client,
+    ):
+        self.token_url = token_url
+        self.userinfo_url = userinfo_url
+        self._http = http
+        self.jwks = GoogleJWKSCache(jwks_url, http)
+
+    async def start(self):
+        await self.jwks.start()
+
+    async def stop(self):
+        await self.jwks.stop()
 
     async def exchange_code_for_token(self, code: str, redirect_uri: str) -> Dict[str, Any]:
         """
         Authorization code를 access token으로 교환
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.GOOGLE_TOKEN_URL,
-                data={
-                    "code": code,
-                    "client_id": settings.GOOGLE_CLIENT_ID,
-                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code",
-                },
-            )
-
-            if response.status_code != 200:
-                raise Exception(f"Failed to exchange code for token: {response.text}")
-
-            return response.json()
+        response = await self._http.client.post(
+            self.token_url,
+            data={
+                "code": code,
+                "client_id": settings.GOOGLE_CLIENT_ID,
+                "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            },
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to exchange code for token: {response.text}")
+
+        return response.json()
 
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """
         Access token으로 사용자 정보 가져오기
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.GOOGLE_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
+        response = await self._http.client.get(
+            self.userinfo_url,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to get user info: {response.text}")
 
-            if response.status_code != 200:
-                raise Exception(f"Failed to get user info: {response.text}")
+        return response.json()
 
-            return response.json()
+    async def verify_id_token(
+        self, id_token: str, access_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        ID token을 캐시된 Google 공개키로 로컬 검증하고 claims 반환
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except JWTError as e:
+            raise Exception(f"Invalid id_token header: {str(e)}")
+
+        key = await self.jwks.get_key(header.get("kid", ""))
+        if key is None:
+            raise Exception(f"Unknown id_token key id: {header.get('kid')}")
+
+        try:
+            return jwt.decode(
+                id_token,
+                key,
+                algorithms=[key.get("alg", "RS256")],
+                audience=settings.GOOGLE_CLIENT_ID,
+                issuer=self.GOOGLE_ISSUERS,
+                access_token=access_token,
+            )
+        except JWTError as e:
+            raise Exception(f"Invalid id_token: {str(e)}")
 
     async def verify_and_get_user_info(
         self, code: str, redirect_uri: str
@@ -59,11 +193,23 @@ class GoogleOAuthService:
             # 1. Code를 Token으로 교환
             token_data = await self.exchange_code_for_token(code, redirect_uri)
             access_token = token_data.get("access_token")
+            id_token = token_data.get("id_token")
+
+            # 2. ID token이 있으면 로컬 검증만으로 사용자 정보 확보 (추가 호출 없음)
+            if id_token:
+                claims = await self.verify_id_token(id_token, access_token)
+                return {
+                    "id": claims.get("sub"),
+                    "email": claims.get("email"),
+                    "name": claims.get("name"),
+                    "picture": claims.get("picture"),
+                    "verified_email": claims.get("email_verified", False),
+                }
 
             if not access_token:
                 return None
 
-            # 2. Token으로 사용자 정보 가져오기
+            # 3. ID token이 없으면 userinfo 엔드포인트로 조회
             user_info = await self.get_user_info(access_token)
 
             return {
@@ -75,7 +221,7 @@ class GoogleOAuthService:
             }
 
         except Exception as e:
-            print(f"Google OAuth Error: {str(e)}")
+            logger.exception("Google OAuth Error: %s", e)
             return None
 
 
@@ -0,0 +1,199 @@
+"""
+LLM 제공자 (OpenAI, Anthropic, 테스트용 fake)와 프롬프트 응답 캐시
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Protocol, Tuple
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.storage import ObjectStore
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력). 목록에 없는 모델은 비용을 0으로 집계한다.
+PRICES_PER_MTOK: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "claude-3-5-haiku-latest": (0.80, 4.00),
+    "claude-3-5-sonnet-latest": (3.00, 15.00),
+}
+
+DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-latest",
+    "fake": "fake",
+}
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """LLM 호출 하나 (같은 요청이면 같은 캐시 키)"""
+
+    system: str
+    prompt: str
+    max_tokens: int = settings.QUESTION_LLM_MAX_TOKENS
+    temperature: float = 0.7
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def cost(self, model: str) -> float:
+        """호출 비용 (USD)"""
+        input_price, output_price = PRICES_PER_MTOK.get(model, (0.0, 0.0))
+        return (self.input_tokens * input_price + self.output_tokens * output_price) / 1_000_000
+
+
+class LLMProvider(Protocol):
+    name: str
+    model: str
+
+    async def complete(self, request: LLMRequest) -> LLMResponse: ...
+
+
+class OpenAIProvider:
+    """OpenAI Chat Completions (JSON 모드)"""
+
+    name = "openai"
+
+    def __init__(
+        self, model: Optional[str] = None, api_key: Optional[str] = settings.OPENAI_API_KEY
+    ):
+        from openai import AsyncOpenAI
+
+        if not api_key:
+            raise Exception("Failed to create OpenAI provider: OPENAI_API_KEY is not set")
+        self.model = model or DEFAULT_MODELS[self.name]
+        self._client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=settings.QUESTION_LLM_TIMEOUT_SECONDS,
+            max_retries=settings.QUESTION_LLM_MAX_RETRIES,
+        )
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        response = await self._client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": request.system},
+                {"role": "user", "content": request.prompt},
+            ],
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            response_format={"type": "json_object"},
+        )
+        return LLMResponse(
+            text=response.choices[0].message.content or "",
+            input_tokens=response.usage.prompt_tokens,
+            output_tokens=response.usage.completion_tokens,
+        )
+
+
+class AnthropicProvider:
+    """Anthropic Messages API"""
+
+    name = "anthropic"
+
+    def __init__(
+        self, model: Optional[str] = None, api_key: Optional[str] = settings.ANTHROPIC_API_KEY
+    ):
+        from anthropic import AsyncAnthropic
+
+        if not api_key:
+            raise Exception("Failed to create Anthropic provider: ANTHROPIC_API_KEY is not set")
+        self.model = model or DEFAULT_MODELS[self.name]
+        self._client = AsyncAnthropic(
+            api_key=api_key,
+            timeout=settings.QUESTION_LLM_TIMEOUT_SECONDS,
+            max_retries=settings.QUESTION_LLM_MAX_RETRIES,
+        )
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        response = await self._client.messages.create(
+            model=self.model,
+            system=request.system,
+            messages=[{"role": "user", "content": request.prompt}],
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+        )
+        return LLMResponse(
+            text="".join(block.text for block in response.content if block.type == "text"),
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+
+
+class FakeProvider:
+    """네트워크 없이 프롬프트로 정해지는 응답을 돌려주는 제공자 (테스트, 벤치마크용)
+
+    응답은 프롬프트 해시로 정해지고, latency초 기다린 뒤 돌려준다. 토큰 수는 글자 수 / 4로 어림한다.
+    """
+
+    name = "fake"
+
+    def __init__(self, model: Optional[str] = None, latency: float = 0.0):
+        self.model = model or DEFAULT_MODELS[self.name]
+        self.latency = latency
+        self.calls = 0
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        digest = hashlib.sha256(request.prompt.encode()).hexdigest()[:8]
+        text = json.dumps(
+            {
+                "title": f"질문 {digest}: 이 개념을 설명하세요",
+                "body": f"면접관이 묻는 질문입니다 ({digest}).",
+                "explanation": f"모범 답안 해설입니다 ({digest}).",
+                "difficulty": "medium",
+            },
+            ensure_ascii=False,
+        )
+        return LLMResponse(
+            text=text,
+            input_tokens=(len(request.system) + len(request.prompt)) // 4,
+            output_tokens=len(text) // 4,
+        )
+
+
+def get_provider(
+    name: str = settings.QUESTION_LLM_PROVIDER, model: Optional[str] = settings.QUESTION_LLM_MODEL
+) -> LLMProvider:
+    """이름으로 제공자 생성 (openai | anthropic | fake)"""
+    providers = {"openai": OpenAIProvider, "anthropic": AnthropicProvider, "fake": FakeProvider}
+    if name not in providers:
+        raise Exception(f"Failed to create LLM provider: unknown provider {name!r}")
+    return providers[name](model=model)
+
+
+class PromptCache:
+    """프롬프트 → 응답 캐시 (내용 주소 방식)
+
+    키는 제공자, 모델, 요청 내용 전체의 SHA-256이다. 같은 요청을 다시 보내면(재실행, 재시도)
+    저장소에 남은 응답을 쓰고 LLM을 호출하지 않는다. 프롬프트를 바꾸면 키가 바뀌므로
+    따로 무효화할 필요가 없다.
+    """
+
+    PREFIX = "llm-cache/"
+
+    def __init__(self, store: ObjectStore):
+        self.store = store
+
+    def key(self, provider: LLMProvider, request: LLMRequest) -> str:
+        payload = json.dumps(
+            {"provider": provider.name, "model": provider.model, **asdict(request)},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return f"{self.PREFIX}{hashlib.sha256(payload.encode()).hexdigest()}.json"
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        body = await self.store.get(key)
+        return LLMResponse(**json.loads(body)) if body is not None else None
+
+    async def put(self, key: str, response: LLMResponse) -> None:
+        await self.store.put(key, json.dumps(asdict(response), ensure_ascii=False).encode())
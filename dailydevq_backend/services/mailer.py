@@ -0,0 +1,128 @@
+"""
+비동기 SMTP 발송 서비스
+"""
+
+import asyncio
+import time
+from email.message import EmailMessage
+from typing import Any, Awaitable, Callable, List, Optional
+
+import aiosmtplib
+
+from dailydevq_backend.core.config import settings
+
+
+class RateLimiter:
+    """초당 처리량 제한 (토큰 버킷, rate가 0이면 제한 없음)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SMTPMailer:
+    """SMTP 커넥션 풀 + 발송 속도 제한
+
+    연결을 미리 열어 두고 재사용하므로 메시지마다 핸드셰이크하지 않는다.
+    끊어진 연결은 다음 발송 때 다시 연결한다.
+    """
+
+    def __init__(
+        self,
+        hostname: str = settings.SMTP_HOST,
+        port: int = settings.SMTP_PORT,
+        pool_size: int = settings.SMTP_POOL_SIZE,
+        rate_per_second: float = settings.SMTP_RATE_LIMIT_PER_SECOND,
+        username: Optional[str] = settings.SMTP_USERNAME,
+        password: Optional[str] = settings.SMTP_PASSWORD,
+        use_tls: bool = settings.SMTP_USE_TLS,
+        timeout: float = settings.SMTP_TIMEOUT_SECONDS,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.pool_size = pool_size
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(rate_per_second)
+        self._pool: Optional[asyncio.Queue] = None
+        self._connections: List[aiosmtplib.SMTP] = []
+
+    async def start(self):
+        """커넥션 풀 생성"""
+        if self._pool is not None:
+            return
+        self._pool = asyncio.Queue()
+        self._connections = [self._new_connection() for _ in range(self.pool_size)]
+        await asyncio.gather(*(self._connect(conn) for conn in self._connections))
+        for conn in self._connections:
+            self._pool.put_nowait(conn)
+
+    async def stop(self):
+        """커넥션 풀 정리"""
+        for conn in self._connections:
+            if conn.is_connected:
+                try:
+                    await conn.quit()
+                except aiosmtplib.SMTPException:
+                    conn.close()
+        self._connections = []
+        self._pool = None
+
+    def _new_connection(self) -> aiosmtplib.SMTP:
+        return aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+
+    async def _connect(self, conn: aiosmtplib.SMTP) -> None:
+        await conn.connect()
+        if self.username and self.password:
+            await conn.login(self.username, self.password)
+
+    async def send(self, message: EmailMessage) -> None:
+        """EmailMessage 발송"""
+        await self._send(lambda conn: conn.send_message(message))
+
+    async def send_raw(self, sender: str, recipients: List[str], data: bytes) -> None:
+        """이미 직렬화된 MIME 메시지 발송 (대량 발송용)"""
+        await self._send(lambda conn: conn.sendmail(sender, recipients, data))
+
+    async def _send(self, deliver: Callable[[aiosmtplib.SMTP], Awaitable[Any]]) -> None:
+        """풀에서 연결을 빌려 발송 (연결이 끊겼으면 한 번 재연결 후 재시도)"""
+        if self._pool is None:
+            raise RuntimeError("SMTPMailer가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+        await self.rate_limiter.acquire()
+        conn = await self._pool.get()
+        try:
+            if not conn.is_connected:
+                await self._connect(conn)
+            try:
+                await deliver(conn)
+            except aiosmtplib.SMTPServerDisconnected:
+                await self._connect(conn)
+                await deliver(conn)
+        finally:
+            self._pool.put_nowait(conn)
+
+
+mailer = SMTPMailer()
@@ -0,0 +1,317 @@
+"""
+뉴스레터 발송 서비스 (평일 오전 7시 발송)
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from email.header import Header
+from email.utils import formatdate, make_msgid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import redis.asyncio as redis
+from jinja2 import Environment, PackageLoader, select_autoescape
+from redis.exceptions import RedisError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.models.user import active_shards
+from dailydevq_backend.services.mailer import SMTPMailer, mailer
+from dailydevq_backend.services.user_service import UserService, user_service
+
+logger = logging.getLogger(__name__)
+
+
+def issue_key(issue_id: str) -> str:
+    """저장소(S3)에 미리 만들어 둔 호의 키 (utils/generate_questions.py가 쓴다)"""
+    return f"issues/{issue_id}.json"
+
+
+@dataclass
+class NewsletterIssue:
+    """발송할 뉴스레터 한 호"""
+
+    issue_id: str  # 발송 단위 식별자 (예: 2026-10-19)
+    subject: str
+    questions: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NewsletterIssue":
+        return cls(
+            issue_id=data["issue_id"],
+            subject=data["subject"],
+            questions=data.get("questions", []),
+        )
+
+
+@dataclass
+class SendReport:
+    """발송 결과 및 처리량"""
+
+    sent: int = 0
+    skipped: int = 0  # 이전 실행에서 이미 발송된 구독자
+    retried: int = 0  # 이전 실행에서 실패해 다시 보낸 구독자
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    messages_per_second: float = 0.0
+    failed_samples: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _mime_part(boundary: str, content_type: str, body: str) -> bytes:
+    encoded = base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n")
+    header = (
+        f"--{boundary}\r\n"
+        f'Content-Type: {content_type}; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n\r\n"
+    )
+    return header.encode() + encoded
+
+
+class NewsletterRenderer:
+    """Jinja2 렌더러
+
+    템플릿은 처음 한 번만 컴파일하고 Template 객체를 재사용한다.
+    """
+
+    def __init__(self, template_name: str = "newsletter.html"):
+        self.env = Environment(
+            loader=PackageLoader("dailydevq_backend", "templates"),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+        )
+        self.template = self.env.get_template(template_name)
+
+    def render(self, issue: NewsletterIssue, email: str, unsubscribe_url: str) -> str:
+        return self.template.render(issue=issue, email=email, unsubscribe_url=unsubscribe_url)
+
+
+class NewsletterCheckpoint:
+    """Redis 기반 발송 체크포인트
+
+    활성 구독자 인덱스 파티션별 읽기 위치와 발송 완료한 사용자 ID를 기록해 두고, 중단된 실행을
+    같은 run_id로 다시 시작하면 이미 보낸 구독자는 건너뛴다. 읽기 위치는 발송에 실패한 구독자도
+    지나가므로, 실패한 구독자는 재시도 목록(ID → 이메일)에 남겨 다음 실행에서 다시 보낸다.
+    """
+
+    DONE = "done"
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        run_id: str,
+        ttl: int = settings.NEWSLETTER_CHECKPOINT_TTL_SECONDS,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self._cursor_key = f"newsletter:{run_id}:cursor"
+        self._sent_key = f"newsletter:{run_id}:sent"
+        self._failed_key = f"newsletter:{run_id}:failed"
+
+    async def load_cursor(self, shard: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """(완료 여부, 이어서 읽을 시작 키)"""
+        raw = await self.client.hget(self._cursor_key, shard)
+        if raw is None:
+            return False, None
+        value = json.loads(raw)
+        if value == self.DONE:
+            return True, None
+        return False, value
+
+    async def save_cursor(self, shard: str, last_key: Optional[Dict[str, Any]]) -> None:
+        value = json.dumps(last_key if last_key else self.DONE)
+        await self.client.hset(self._cursor_key, shard, value)
+        await self.client.expire(self._cursor_key, self.ttl)
+
+    async def sent_flags(self, user_ids: List[str]) -> List[bool]:
+        if not user_ids:
+            return []
+        return [bool(flag) for flag in await self.client.smismember(self._sent_key, user_ids)]
+
+    async def mark_sent(self, user_id: str) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.sadd(self._sent_key, user_id)
+            pipe.expire(self._sent_key, self.ttl)
+            pipe.hdel(self._failed_key, user_id)
+            await pipe.execute()
+
+    async def mark_failed(self, user_id: str, email: str) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.hset(self._failed_key, user_id, email)
+            pipe.expire(self._failed_key, self.ttl)
+            await pipe.execute()
+
+    async def failed_recipients(self) -> List[Dict[str, str]]:
+        """재시도 목록 ({"id", "email"})"""
+        failed = await self.client.hgetall(self._failed_key)
+        return [
+            {"id": _text(user_id), "email": _text(email)} for user_id, email in failed.items()
+        ]
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class NewsletterService:
+    """활성 구독자 전체에 뉴스레터 발송
+
+    활성 구독자 인덱스의 파티션별 생산자가 구독자를 큐에 넣고, 발송 워커(소비자)가
+    SMTP 커넥션 풀로 보낸다. 한 페이지를 모두 처리한 뒤에만 읽기 위치를 저장한다.
+    이전 실행의 재시도 목록도 함께 큐에 넣는다.
+    """
+
+    def __init__(
+        self,
+        users: UserService = user_service,
+        smtp: SMTPMailer = mailer,
+        renderer: Optional[NewsletterRenderer] = None,
+    ):
+        self.users = users
+        self.smtp = smtp
+        self.renderer = renderer or NewsletterRenderer()
+
+    def build_message(self, issue: NewsletterIssue, email: str, boundary: str) -> bytes:
+        """MIME 메시지를 직접 직렬화
+
+        email 패키지의 EmailMessage 직렬화는 메시지당 수 ms가 걸려 대량 발송의 병목이
+        되므로, 구독자마다 달라지는 부분만 채워 바이트로 조립한다.
+        """
+        unsubscribe_url = f"{settings.NEWSLETTER_UNSUBSCRIBE_URL}?{urlencode({'email': email})}"
+        text = f"{issue.subject}\n\n구독 취소: {unsubscribe_url}"
+        html = self.renderer.render(issue, email, unsubscribe_url)
+        headers = (
+            f"From: {settings.SMTP_FROM}\r\n"
+            f"To: {email}\r\n"
+            f"Subject: {Header(issue.subject, 'utf-8').encode()}\r\n"
+            f"Date: {formatdate(usegmt=True)}\r\n"
+            f"Message-ID: {make_msgid(domain=settings.SMTP_FROM.rsplit('@', 1)[-1])}\r\n"
+            f"List-Unsubscribe: <{unsubscribe_url}>\r\n"
+            "MIME-Version: 1.0\r\n"
+            f'Content-Type: multipart/alternative; boundary="{boundary}"\r\n\r\n'
+        )
+        return b"".join(
+            [
+                headers.encode(),
+                _mime_part(boundary, "text/plain", text),
+                _mime_part(boundary, "text/html", html),
+                f"--{boundary}--\r\n".encode(),
+            ]
+        )
+
+    async def send_issue(
+        self,
+        issue: NewsletterIssue,
+        checkpoint: NewsletterCheckpoint,
+        on_progress: Optional[Callable[[SendReport], None]] = None,
+    ) -> SendReport:
+        """뉴스레터 발송 (같은 checkpoint로 재실행하면 이어서 발송하고 실패한 구독자도 다시 보낸다)"""
+        report = SendReport()
+        started = time.perf_counter()
+        boundary = f"=_dailydevq_{issue.issue_id}_{int(time.time())}"
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.smtp.pool_size * 4)
+
+        async def load(read, default):
+            # 체크포인트를 못 읽으면 처음부터, 보내지 않은 것으로 보고 계속한다 (중복 발송될 수 있다)
+            try:
+                return await read
+            except RedisError as e:
+                logger.warning("뉴스레터 체크포인트를 읽지 못했습니다: %s", e)
+                return default
+
+        async def record(write) -> None:
+            # 체크포인트를 못 남겨도 발송은 계속한다 (다음 실행에서 다시 보내거나 빠질 수 있다)
+            try:
+                await write
+            except RedisError as e:
+                logger.warning("뉴스레터 체크포인트를 기록하지 못했습니다: %s", e)
+
+        async def retry_failed() -> None:
+            recipients = await load(checkpoint.failed_recipients(), [])
+            ids = [item["id"] for item in recipients]
+            flags = await load(checkpoint.sent_flags(ids), [False] * len(ids))
+            futures = []
+            for item, already_sent in zip(recipients, flags):
+                if already_sent:
+                    continue
+                report.retried += 1
+                future = asyncio.get_running_loop().create_future()
+                await queue.put((item, future))
+                futures.append(future)
+            await asyncio.gather(*futures)
+
+        async def produce(shard: str) -> None:
+            done, start_key = await load(checkpoint.load_cursor(shard), (False, None))
+            if done:
+                return
+            pages = self.users.iter_active_subscriber_shard(
+                shard, projection=["id", "email"], start_key=start_key
+            )
+            async for items, last_key in pages:
+                ids = [item["id"] for item in items]
+                flags = await load(checkpoint.sent_flags(ids), [False] * len(ids))
+                futures = []
+                for item, already_sent in zip(items, flags):
+                    if already_sent:
+                        report.skipped += 1
+                        continue
+                    future = asyncio.get_running_loop().create_future()
+                    await queue.put((item, future))
+                    futures.append(future)
+                await asyncio.gather(*futures)
+                await record(checkpoint.save_cursor(shard, last_key))
+
+        stopping = asyncio.Event()
+
+        async def consume() -> None:
+            # aiosmtplib이 발송 중 취소를 삼키는 경우가 있어 종료 플래그도 함께 확인한다
+            while not stopping.is_set():
+                item, future = await queue.get()
+                try:
+                    message = self.build_message(issue, item["email"], boundary)
+                    await self.smtp.send_raw(settings.SMTP_FROM, [item["email"]], message)
+                except Exception as e:
+                    report.failed += 1
+                    if len(report.failed_samples) < 20:
+                        report.failed_samples.append(f"{item['email']}: {str(e)}")
+                    await record(checkpoint.mark_failed(item["id"], item["email"]))
+                else:
+                    report.sent += 1
+                    await record(checkpoint.mark_sent(item["id"]))
+                finally:
+                    if not future.done():
+                        future.set_result(None)
+                    queue.task_done()
+                if on_progress and (report.sent + report.failed) % 1000 == 0:
+                    on_progress(report)
+
+        consumers = [asyncio.create_task(consume()) for _ in range(self.smtp.pool_size * 2)]
+        producers = asyncio.ensure_future(
+            asyncio.gather(retry_failed(), *(produce(shard) for shard in active_shards()))
+        )
+        try:
+            # 소비자는 예외로만 끝나고, 그러면 생산자가 가득 찬 큐에서 영원히 기다리므로 함께 중단한다
+            await asyncio.wait([producers, *consumers], return_when=asyncio.FIRST_COMPLETED)
+            if not producers.done():
+                producers.cancel()
+                crashed = next(task for task in consumers if task.done())
+                crashed.result()
+            producers.result()
+        finally:
+            stopping.set()
+            for task in consumers:
+                task.cancel()
+            await asyncio.wait(consumers, timeout=self.smtp.timeout)
+
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        if report.elapsed_seconds:
+            report.messages_per_second = round(report.sent / report.elapsed_seconds, 1)
+        return report
+
+
+newsletter_service = NewsletterService()
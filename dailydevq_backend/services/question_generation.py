@@ -0,0 +1,183 @@
+"""
+오늘의 질문 생성 파이프라인 (LLM 호출, 프롬프트 캐시, S3 출력)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.storage import ObjectStore
+from dailydevq_backend.models.question import DailyQuestion
+from dailydevq_backend.schemas.question import GeneratedQuestion
+from dailydevq_backend.services.llm import LLMProvider, LLMRequest, LLMResponse, PromptCache
+from dailydevq_backend.services.newsletter_service import NewsletterIssue, issue_key
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = (
+    "당신은 한국 IT 기업의 시니어 개발자 면접관입니다. 주어진 분야와 날짜에 맞는 기술 면접 질문 "
+    "하나와 모범 답안 해설을 한국어로 작성합니다. 반드시 다음 키를 가진 JSON 객체 하나만 출력합니다: "
+    '"title"(한 문장 질문), "body"(질문의 배경과 요구 사항, 2~4문장), '
+    '"explanation"(모범 답안 해설, 핵심 개념과 흔한 오답 포함), '
+    '"difficulty"("easy" | "medium" | "hard").'
+)
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+def question_prompt(issue_date: str, category: str, index: int) -> str:
+    """(날짜, 분야) 질문 프롬프트 (난이도는 날짜와 분야 순서로 돌아가며 정한다)"""
+    difficulty = DIFFICULTIES[(sum(map(ord, issue_date)) + index) % len(DIFFICULTIES)]
+    return (
+        f"날짜: {issue_date}\n분야: {category}\n난이도: {difficulty}\n"
+        "이 분야에서 실무 경험을 확인할 수 있는 질문을 만들어 주세요."
+    )
+
+
+def parse_question(text: str) -> GeneratedQuestion:
+    """응답 텍스트에서 JSON 객체를 꺼내 검증 (코드 블록으로 감싼 응답 포함)"""
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError("no JSON object in response")
+    return GeneratedQuestion.model_validate_json(text[start : end + 1])
+
+
+@dataclass
+class GenerationStats:
+    """생성 실행 결과 (처리량, 토큰, 비용)"""
+
+    questions: int = 0
+    llm_requests: int = 0
+    cache_hits: int = 0
+    invalid_responses: int = 0  # 형식이 잘못돼 다시 요청한 응답
+    failed: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    elapsed_seconds: float = 0.0
+    questions_per_second: float = 0.0
+    failed_samples: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class QuestionGenerator:
+    """날짜별 뉴스레터 질문 생성
+
+    (날짜, 분야)마다 LLM을 한 번 호출하고, 동시 요청 수는 세마포어로 제한한다. 응답은
+    PromptCache에 저장되어 재실행이나 중단 후 다시 실행해도 이미 받은 응답에는 비용이 들지 않는다.
+    완성된 호는 저장소의 issues/{날짜}.json에 NewsletterIssue 형식으로 쓰고, 뉴스레터 발송
+    스크립트는 이 파일을 그대로 읽는다.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        store: ObjectStore,
+        concurrency: int = settings.QUESTION_LLM_CONCURRENCY,
+        max_attempts: int = settings.QUESTION_LLM_MAX_ATTEMPTS,
+    ):
+        self.provider = provider
+        self.store = store
+        self.cache = PromptCache(store)
+        self.max_attempts = max_attempts
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _complete(self, request: LLMRequest, stats: GenerationStats) -> GeneratedQuestion:
+        key = self.cache.key(self.provider, request)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            stats.cache_hits += 1
+            return parse_question(cached.text)
+
+        for attempt in range(self.max_attempts):
+            async with self._semaphore:
+                response: LLMResponse = await self.provider.complete(request)
+            stats.llm_requests += 1
+            stats.input_tokens += response.input_tokens
+            stats.output_tokens += response.output_tokens
+            stats.cost_usd += response.cost(self.provider.model)
+            try:
+                question = parse_question(response.text)
+            except (ValueError, ValidationError) as e:
+                stats.invalid_responses += 1
+                logger.warning("형식이 잘못된 응답 (%d/%d): %s", attempt + 1, self.max_attempts, e)
+                continue
+            # 검증을 통과한 응답만 캐시한다
+            await self.cache.put(key, response)
+            return question
+        raise Exception(
+            f"Failed to generate question: invalid response after {self.max_attempts} attempts"
+        )
+
+    async def generate_issue(
+        self, issue_date: str, categories: List[str], stats: GenerationStats
+    ) -> NewsletterIssue:
+        """하루치 질문(분야별 하나)을 생성해 저장소에 쓴다"""
+        questions = await asyncio.gather(
+            *(
+                self._complete(
+                    LLMRequest(system=SYSTEM_PROMPT, prompt=question_prompt(issue_date, c, i)),
+                    stats,
+                )
+                for i, c in enumerate(categories)
+            )
+        )
+        issue = NewsletterIssue(
+            issue_id=issue_date,
+            subject=f"[DailyDevQ] {issue_date} 오늘의 면접 질문",
+            questions=[
+                {"category": category, **question.model_dump(mode="json")}
+                for category, question in zip(categories, questions)
+            ],
+        )
+        body = json.dumps(asdict(issue), ensure_ascii=False, indent=2).encode()
+        await self.store.put(issue_key(issue_date), body)
+        stats.questions += len(questions)
+        return issue
+
+    async def run(
+        self, dates: List[str], categories: List[str]
+    ) -> Tuple[List[NewsletterIssue], GenerationStats]:
+        """여러 날짜를 동시에 생성 (실패한 날짜는 건너뛰고 stats.failed에 센다)"""
+        stats = GenerationStats()
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self.generate_issue(issue_date, categories, stats) for issue_date in dates),
+            return_exceptions=True,
+        )
+        issues = []
+        for issue_date, result in zip(dates, results):
+            if isinstance(result, Exception):
+                stats.failed += 1
+                if len(stats.failed_samples) < 20:
+                    stats.failed_samples.append(f"{issue_date}: {str(result)}")
+            else:
+                issues.append(result)
+
+        stats.elapsed_seconds = round(time.perf_counter() - started, 3)
+        stats.cost_usd = round(stats.cost_usd, 6)
+        if stats.elapsed_seconds:
+            stats.questions_per_second = round(stats.questions / stats.elapsed_seconds, 2)
+        return issues, stats
+
+
+def daily_question(issue: NewsletterIssue) -> Optional[DailyQuestion]:
+    """호의 첫 질문을 앱의 오늘의 질문으로 사용"""
+    if not issue.questions:
+        return None
+    question = issue.questions[0]
+    return DailyQuestion(
+        date=issue.issue_id,
+        title=question["title"],
+        body=question["body"],
+        category=question["category"],
+        difficulty=question["difficulty"],
+    )
@@ -0,0 +1,151 @@
+"""
+오늘의 질문 서비스 (질문 발행, 답변 제출, 스트릭)
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from dailydevq_backend.core.cache import MISSING, LRUCache
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.models.question import (
+    PK,
+    QUESTION_SK,
+    SK,
+    Answer,
+    DailyQuestion,
+    Streak,
+    question_pk,
+    today_kst,
+    user_pk,
+)
+from dailydevq_backend.repositories.single_table import (
+    NOT_EXISTS,
+    Put,
+    SingleTableRepository,
+    TransactionConflictError,
+    single_table_repository,
+)
+
+# 스트릭이 동시에 바뀌어 트랜잭션이 취소되면 다시 읽고 재시도하는 횟수
+ANSWER_ATTEMPTS = 3
+
+# 질문은 발행 후 거의 바뀌지 않으므로 워커별로 캐시한다 (없는 날짜는 캐시하지 않는다)
+question_cache = LRUCache(
+    maxsize=settings.QUESTION_CACHE_MAXSIZE, ttl=settings.QUESTION_CACHE_TTL_SECONDS
+)
+
+
+class AnswerExistsError(Exception):
+    """오늘의 질문에 이미 답했음"""
+
+
+@dataclass
+class TodayView:
+    """오늘의 질문 화면 (질문, 스트릭, 최근 답변 기록)"""
+
+    question: Optional[DailyQuestion]
+    streak: Streak
+    current_streak: int  # 오늘 기준 유효한 스트릭
+    today_answer: Optional[Answer] = None
+    history: List[Answer] = field(default_factory=list)
+
+
+class QuestionService:
+    """오늘의 질문 서비스"""
+
+    def __init__(
+        self,
+        repository: SingleTableRepository = single_table_repository,
+        cache: LRUCache = question_cache,
+    ):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_question(self, question_date: str) -> Optional[DailyQuestion]:
+        """날짜의 질문 조회 (캐시)"""
+        question = self.cache.get(question_date)
+        if question is MISSING:
+            question = await self.repository.get(
+                DailyQuestion, {PK: question_pk(question_date), SK: QUESTION_SK}
+            )
+            if question is not None:
+                self.cache.set(question_date, question)
+        return question
+
+    async def publish_question(self, question: DailyQuestion) -> DailyQuestion:
+        """질문 발행 (같은 날짜의 질문은 덮어쓴다)"""
+        await self.repository.put(question)
+        self.cache.set(question.date, question)
+        return question
+
+    async def get_today(
+        self, user_id: str, history_limit: int = settings.QUESTION_HISTORY_LIMIT
+    ) -> TodayView:
+        """오늘의 질문과 내 스트릭/답변 기록
+
+        사용자 파티션을 SK 내림차순으로 Query 한 번 (STREAK, 최근 답변 순서)에 읽는다.
+        질문은 캐시에서 읽으므로 캐시가 차 있으면 DynamoDB 호출은 이 Query 하나다.
+        """
+        today = today_kst()
+        question, collection = await asyncio.gather(
+            self.get_question(today),
+            self.repository.query_collection(
+                user_pk(user_id),
+                [Streak, Answer],
+                limit=history_limit + 1,  # STREAK 아이템 포함
+                newest_first=True,
+            ),
+        )
+        streaks = collection[Streak.TYPE]
+        streak = streaks[0] if streaks else Streak(user_id=user_id)
+        history = collection[Answer.TYPE][:history_limit]
+        return TodayView(
+            question=question,
+            streak=streak,
+            current_streak=streak.current_as_of(today),
+            today_answer=history[0] if history and history[0].date == today else None,
+            history=history,
+        )
+
+    async def submit_answer(self, user_id: str, text: str) -> Optional[Tuple[Answer, Streak]]:
+        """오늘의 질문에 답변 (오늘 질문이 없으면 None, 이미 답했으면 AnswerExistsError)
+
+        답변 저장과 스트릭 갱신을 한 트랜잭션으로 쓴다. 답변은 날짜당 하나만 생기고,
+        스트릭은 읽은 뒤 다른 요청이 바꿨으면(last_date 불일치) 다시 읽어 재시도한다.
+        """
+        today = today_kst()
+        question = await self.get_question(today)
+        if question is None:
+            return None
+
+        answer = Answer(
+            user_id=user_id,
+            date=today,
+            answer=text,
+            question_title=question.title,
+            category=question.category,
+        )
+        for attempt in range(ANSWER_ATTEMPTS):
+            streak = await self.repository.get(Streak, Streak(user_id=user_id).key)
+            if streak is None:
+                streak_put = Put(Streak(user_id=user_id).advance(today), NOT_EXISTS)
+            else:
+                streak_put = Put(
+                    streak.advance(today), "last_date = :last", {":last": streak.last_date}
+                )
+            try:
+                await self.repository.transact_put(Put(answer, NOT_EXISTS), streak_put)
+            except TransactionConflictError as e:
+                if e.reasons and e.reasons[0] == "ConditionalCheckFailed":
+                    raise AnswerExistsError(f"already answered {today}") from e
+                if attempt == ANSWER_ATTEMPTS - 1:
+                    raise Exception(f"Failed to submit answer: {str(e)}")
+                continue
+            break
+
+        return answer, streak_put.entity
+
+
+# 싱글톤 인스턴스
+question_service = QuestionService()
@@ -0,0 +1,227 @@
+"""
+로그인 세션 서비스 (refresh token 회전 + 세션 폐기 목록)
+"""
+
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import uuid4
+
+from redis.exceptions import RedisError
+
+from dailydevq_backend.core.bloom import BloomFilter
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.redis import RedisClient, redis_client
+from dailydevq_backend.utils.jwt import create_access_token
+
+logger = logging.getLogger(__name__)
+
+REVOKED_KEY = "auth:revoked"
+REVOCATION_CHANNEL = "auth:revocations"
+
+
+@dataclass
+class TokenPair:
+    """access token + refresh token"""
+
+    access_token: str
+    refresh_token: str
+    expires_in: int  # access token 유효 시간(초)
+
+
+class InvalidRefreshTokenError(Exception):
+    """없거나 만료·폐기된 refresh token"""
+
+
+def _hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class SessionService:
+    """refresh token 기반 로그인 세션
+
+    세션마다 ID(sid)를 두고 access token에 sid를 넣는다. refresh token은 쓸 때마다
+    새로 발급하고(회전), 이미 쓴 토큰이 다시 오면 탈취로 보고 세션을 폐기한다.
+
+    Redis 키:
+      auth:refresh:{해시}     → "{user_id}:{sid}" (refresh token, 해시로만 저장)
+      auth:used:{해시}        → "{user_id}:{sid}" (이미 회전된 토큰, 재사용 탐지용)
+      auth:session:{sid}      → 현재 refresh token 해시
+      auth:sessions:{user_id} → 사용자의 sid 집합 (전체 로그아웃용)
+      auth:revoked            → 폐기된 sid (ZSET, score는 access token이 모두 만료되는 시각)
+
+    폐기 여부는 ZSCORE 한 번(O(1))으로 확인한다. 워커마다 폐기된 sid의 Bloom filter를
+    두고 pub/sub으로 갱신하므로, 폐기되지 않은 대부분의 요청은 Redis를 거치지 않는다.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient = redis_client,
+        access_ttl: int = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        refresh_ttl: int = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
+        use_bloom: bool = settings.AUTH_REVOCATION_BLOOM,
+        bloom_capacity: int = settings.AUTH_REVOCATION_BLOOM_CAPACITY,
+        sync_interval: float = settings.AUTH_REVOCATION_SYNC_SECONDS,
+    ):
+        self._redis = redis
+        self.access_ttl = access_ttl
+        self.refresh_ttl = refresh_ttl
+        self.use_bloom = use_bloom
+        self.bloom_capacity = bloom_capacity
+        self.sync_interval = sync_interval
+        self._bloom: Optional[BloomFilter] = None
+        self._pubsub = None
+        self._sync_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """폐기 목록 Bloom filter 생성 및 동기화 시작"""
+        if not self.use_bloom or self._sync_task is not None:
+            return
+        # 구독을 먼저 해 두어야 재구성 중에 들어온 폐기도 놓치지 않는다
+        try:
+            self._pubsub = self._redis.client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(REVOCATION_CHANNEL)
+            await self._rebuild_bloom()
+        except (RedisError, OSError) as e:
+            logger.warning("세션 폐기 목록을 불러오지 못했습니다: %s", e)
+        self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self):
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        self._sync_task = None
+        self._pubsub = None
+        self._bloom = None
+
+    async def _rebuild_bloom(self) -> None:
+        """만료되지 않은 폐기 sid로 Bloom filter를 새로 만든다 (만료 항목 정리 포함)"""
+        now = time.time()
+        async with self._redis.client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(REVOKED_KEY, "-inf", now)
+            pipe.zrangebyscore(REVOKED_KEY, now, "+inf")
+            _, session_ids = await pipe.execute()
+        bloom = BloomFilter(max(self.bloom_capacity, len(session_ids) * 2))
+        for session_id in session_ids:
+            bloom.add(session_id.decode())
+        self._bloom = bloom
+
+    async def _sync_loop(self):
+        next_rebuild = time.monotonic() + self.sync_interval
+        while True:
+            try:
+                if self._pubsub is None or not self._pubsub.subscribed:
+                    self._pubsub = self._redis.client.pubsub(ignore_subscribe_messages=True)
+                    await self._pubsub.subscribe(REVOCATION_CHANNEL)
+                    next_rebuild = 0
+                message = await self._pubsub.get_message(timeout=1.0)
+                if message is not None and self._bloom is not None:
+                    for session_id in message["data"].decode().split(","):
+                        self._bloom.add(session_id)
+                if time.monotonic() >= next_rebuild:
+                    await self._rebuild_bloom()
+                    next_rebuild = time.monotonic() + self.sync_interval
+            except (RedisError, OSError) as e:
+                logger.warning("세션 폐기 목록 동기화 실패: %s", e)
+                self._pubsub = None
+                await asyncio.sleep(self.sync_interval / 10)
+
+    async def issue(self, user_id: str) -> TokenPair:
+        """새 세션 발급 (로그인)"""
+        return await self._issue(user_id, uuid4().hex)
+
+    async def _issue(self, user_id: str, session_id: str, used_hash: Optional[str] = None) -> TokenPair:
+        refresh_token = secrets.token_urlsafe(32)
+        refresh_hash = _hash(refresh_token)
+        value = f"{user_id}:{session_id}"
+        async with self._redis.client.pipeline(transaction=True) as pipe:
+            pipe.set(f"auth:refresh:{refresh_hash}", value, ex=self.refresh_ttl)
+            pipe.set(f"auth:session:{session_id}", refresh_hash, ex=self.refresh_ttl)
+            pipe.sadd(f"auth:sessions:{user_id}", session_id)
+            pipe.expire(f"auth:sessions:{user_id}", self.refresh_ttl)
+            if used_hash is not None:
+                pipe.set(f"auth:used:{used_hash}", value, ex=self.refresh_ttl)
+            await pipe.execute()
+
+        return TokenPair(
+            access_token=create_access_token(user_id, extra_claims={"sid": session_id}),
+            refresh_token=refresh_token,
+            expires_in=self.access_ttl,
+        )
+
+    async def rotate(self, refresh_token: str) -> TokenPair:
+        """refresh token을 새 토큰 쌍으로 교환 (기존 refresh token은 즉시 무효)"""
+        refresh_hash = _hash(refresh_token)
+        value = await self._redis.client.getdel(f"auth:refresh:{refresh_hash}")
+        if value is None:
+            reused = await self._redis.client.get(f"auth:used:{refresh_hash}")
+            if reused is not None:
+                # 이미 회전된 토큰이 다시 왔다: 탈취 가능성이 있으므로 세션 전체 폐기
+                user_id, session_id = reused.decode().split(":", 1)
+                logger.warning("refresh token 재사용 감지, 세션 폐기: %s", session_id)
+                await self.revoke_session(user_id, session_id)
+            raise InvalidRefreshTokenError("Invalid refresh token")
+
+        user_id, session_id = value.decode().split(":", 1)
+        tokens = await self._issue(user_id, session_id, used_hash=refresh_hash)
+        # 회전 도중 세션이 폐기됐으면 방금 만든 refresh token도 지운다
+        if await self._redis.client.zscore(REVOKED_KEY, session_id) is not None:
+            await self._revoke(user_id, [session_id])
+            raise InvalidRefreshTokenError("Session revoked")
+        return tokens
+
+    async def revoke_session(self, user_id: str, session_id: str) -> None:
+        """세션 하나 로그아웃"""
+        await self._revoke(user_id, [session_id])
+
+    async def revoke_all(self, user_id: str) -> int:
+        """사용자의 모든 세션 로그아웃 (폐기한 세션 수 반환)"""
+        session_ids = [sid.decode() for sid in await self._redis.client.smembers(f"auth:sessions:{user_id}")]
+        if session_ids:
+            await self._revoke(user_id, session_ids)
+        return len(session_ids)
+
+    async def _revoke(self, user_id: str, session_ids: List[str]) -> None:
+        client = self._redis.client
+        refresh_hashes = await client.mget([f"auth:session:{sid}" for sid in session_ids])
+        # 폐기 기록은 해당 세션의 access token이 모두 만료될 때까지만 유지
+        revoked_until = time.time() + self.access_ttl
+        async with client.pipeline(transaction=True) as pipe:
+            for refresh_hash in refresh_hashes:
+                if refresh_hash is not None:
+                    pipe.delete(f"auth:refresh:{refresh_hash.decode()}")
+            pipe.delete(*(f"auth:session:{sid}" for sid in session_ids))
+            pipe.srem(f"auth:sessions:{user_id}", *session_ids)
+            pipe.zadd(REVOKED_KEY, {sid: revoked_until for sid in session_ids})
+            pipe.publish(REVOCATION_CHANNEL, ",".join(session_ids))
+            await pipe.execute()
+        if self._bloom is not None:
+            for session_id in session_ids:
+                self._bloom.add(session_id)
+
+    async def is_revoked(self, session_id: str) -> bool:
+        """세션이 폐기되었는지 확인
+
+        Redis를 읽지 못하면 폐기된 것으로 본다 (Bloom filter가 "없다"고 한 세션만 Redis 없이
+        허용된다). 그래야 Redis 장애 중에 로그아웃하거나 탈취된 세션이 다시 쓰이지 않는다.
+        """
+        if self._bloom is not None and session_id not in self._bloom:
+            return False
+        try:
+            revoked_until = await self._redis.client.zscore(REVOKED_KEY, session_id)
+        except (RedisError, OSError) as e:
+            logger.warning("세션 폐기 여부를 확인하지 못해 거부합니다: %s", e)
+            return True
+        return revoked_until is not None and revoked_until > time.time()
+
+
+session_service = SessionService()
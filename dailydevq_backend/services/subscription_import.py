@@ -0,0 +1,233 @@
+"""
+구독자 대량 가져오기/내보내기 서비스
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.models.user import (
+    EMAIL_INDEX,
+    UserModel,
+    epoch_ms_to_iso,
+    to_epoch_ms,
+    user_id_for_email,
+)
+from dailydevq_backend.repositories.codec import WireItem
+from dailydevq_backend.repositories.user_repository import (
+    BATCH_GET_LIMIT,
+    BATCH_WRITE_LIMIT,
+    UserRepository,
+    user_repository,
+)
+from dailydevq_backend.schemas.user import SubscribeRequest
+from dailydevq_backend.services.email_filter import LegacyEmailFilter, legacy_email_filter
+from dailydevq_backend.services.user_service import UserService, user_service
+
+EXPORT_FIELDS = ["id", "email", "auth_provider", "subscription_status", "created_at"]
+
+
+@dataclass
+class ImportReport:
+    """가져오기 진행 상황"""
+
+    total: int = 0
+    invalid: int = 0
+    duplicates: int = 0  # 파일 안에서 중복된 주소
+    existing: int = 0  # 이미 가입된 주소 (쓰는 사이 가입한 주소 포함)
+    imported: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    invalid_samples: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 스트림을 줄 단위로 분리 (전체를 메모리에 올리지 않는다)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_emails(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[str]:
+    """CSV 또는 NDJSON 스트림에서 이메일 값 추출
+
+    CSV는 헤더에 email 컬럼이 있으면 그 컬럼을, 없으면 첫 번째 컬럼을 사용한다.
+    NDJSON은 줄마다 {"email": ...} 객체 또는 문자열을 받는다.
+    """
+    email_column: Optional[int] = None
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        if fmt == "ndjson":
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError:
+                yield line
+                continue
+            yield value.get("email", "") if isinstance(value, dict) else str(value)
+            continue
+
+        row = next(csv.reader([line]))
+        if email_column is None:
+            headers = [column.strip().lower() for column in row]
+            email_column = headers.index("email") if "email" in headers else 0
+            if "email" in headers:
+                continue
+        yield row[email_column].strip() if email_column < len(row) else ""
+
+
+class SubscriptionImportService:
+    """구독자 대량 가져오기/내보내기
+
+    조회는 BatchGetItem(100개) 단위로 묶어 이미 가입된 주소를 거르고, 남은 주소는 25개씩
+    청크로 나눠 동시에 쓰되 세마포어로 동시 청크 수를 제한한다. 조회와 쓰기 사이에 가입한
+    사용자를 덮어쓰지 않도록 BatchWriteItem 대신 아이템이 없을 때만 쓰는 조건부 PutItem을 보낸다.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository = user_repository,
+        users: UserService = user_service,
+        concurrency: int = settings.BULK_IMPORT_CONCURRENCY,
+        email_filter: LegacyEmailFilter = legacy_email_filter,
+    ):
+        self.repository = repository
+        self.users = users
+        self.concurrency = concurrency
+        self.email_filter = email_filter
+
+    async def import_emails(
+        self,
+        emails: AsyncIterator[str],
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """이메일 스트림을 검증, 중복 제거 후 저장"""
+        report = ImportReport()
+        started = time.perf_counter()
+        seen: set[str] = set()
+        pending: List[str] = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: set[asyncio.Task] = set()
+
+        async def write_chunk(chunk: List[WireItem]) -> None:
+            try:
+                results = await asyncio.gather(
+                    *(self.repository.put_new_item(item) for item in chunk),
+                    return_exceptions=True,
+                )
+            finally:
+                semaphore.release()
+            created = [item for item, result in zip(chunk, results) if result is True]
+            report.imported += len(created)
+            report.existing += sum(result is False for result in results)
+            report.failed += sum(isinstance(result, BaseException) for result in results)
+            # 이전에 캐싱된 "없는 사용자" 항목 제거
+            await asyncio.gather(
+                *(self.users.invalidate(item["id"]["S"], item["email"]["S"]) for item in created)
+            )
+            if on_progress:
+                on_progress(report)
+
+        async def flush() -> None:
+            ids = {user_id_for_email(email): email for email in pending}
+            pending.clear()
+            existing = await self.repository.batch_get(list(ids), projection=["id"])
+            for item in existing:
+                ids.pop(item["id"], None)
+            report.existing += len(existing)
+
+            # 이메일로 id를 알 수 없는 기존 사용자일 수 있는 주소만 인덱스로 확인한다
+            candidates = [
+                (user_id, email)
+                for user_id, email in ids.items()
+                if self.email_filter.might_contain(email)
+            ]
+            found = await asyncio.gather(
+                *(
+                    self.repository.query_index(EMAIL_INDEX, "email", email, projection=["id"])
+                    for _, email in candidates
+                )
+            )
+            for (user_id, _), items in zip(candidates, found):
+                if items:
+                    del ids[user_id]
+                    report.existing += 1
+
+            items = [UserModel(email=email).to_wire() for email in ids.values()]
+            for i in range(0, len(items), BATCH_WRITE_LIMIT):
+                await semaphore.acquire()
+                task = asyncio.create_task(write_chunk(items[i : i + BATCH_WRITE_LIMIT]))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+        async for raw_email in emails:
+            report.total += 1
+            try:
+                email = SubscribeRequest(email=raw_email).email
+            except ValidationError:
+                report.invalid += 1
+                if len(report.invalid_samples) < 20:
+                    report.invalid_samples.append(raw_email)
+                continue
+            if email in seen:
+                report.duplicates += 1
+                continue
+            seen.add(email)
+            pending.append(email)
+            if len(pending) >= BATCH_GET_LIMIT:
+                await flush()
+
+        if pending:
+            await flush()
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        return report
+
+    async def export(self, fmt: str = "csv", status: Optional[str] = None) -> AsyncIterator[str]:
+        """테이블을 페이지 단위로 읽어 CSV/NDJSON 줄을 생성"""
+        from boto3.dynamodb.conditions import Attr
+
+        filter_condition = Attr("subscription_status").eq(status) if status else None
+
+        if fmt == "csv":
+            yield ",".join(EXPORT_FIELDS) + "\n"
+        async for page in self.repository.scan_pages(EXPORT_FIELDS, filter_condition):
+            lines = []
+            for item in page:
+                row = {name: item.get(name) for name in EXPORT_FIELDS}
+                if row["created_at"] is not None:
+                    row["created_at"] = epoch_ms_to_iso(to_epoch_ms(row["created_at"]))
+                if fmt == "csv":
+                    lines.append(",".join(_csv_field(row[name]) for name in EXPORT_FIELDS) + "\n")
+                else:
+                    lines.append(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+            yield "".join(lines)
+
+
+def _csv_field(value: Any) -> str:
+    text = "" if value is None else str(value)
+    if any(ch in text for ch in ',"\n'):
+        text = '"' + text.replace('"', '""') + '"'
+    return text
+
+
+subscription_import_service = SubscriptionImportService()
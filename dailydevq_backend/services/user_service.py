@@ -2,109 +2,329 @@
 사용자 서비스
 """
 
-from typing import Optional
-from botocore.exceptions import ClientError
-from dailydevq_backend.core.database import dynamodb_client
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from botocore.exceptions import BotoCoreError, ClientError
+from dailydevq_backend.core.cache import TwoTierCache
+from dailydevq_backend.core.circuit_breaker import CircuitOpenError
 from dailydevq_backend.core.config import settings
-from dailydevq_backend.models.user import UserModel
-from dailydevq_backend.schemas.user import UserCreate, AuthProvider, SubscriptionStatus
+from dailydevq_backend.models.user import (
+    ACTIVE_SUBSCRIBERS_INDEX,
+    EMAIL_INDEX,
+    GOOGLE_ID_INDEX,
+    UserModel,
+    active_shard_for,
+    active_shards,
+    now_ms,
+    user_id_for_email,
+)
+from dailydevq_backend.repositories.user_repository import (
+    ConditionalCheckFailedError,
+    UserRepository,
+    user_repository,
+)
+from dailydevq_backend.schemas.user import (
+    AuthProvider,
+    SubscriptionStatus,
+    UserCreate,
+    normalize_email,
+)
+from dailydevq_backend.services.email_filter import LegacyEmailFilter, legacy_email_filter
+
+
+# 캐시 값은 저수준 DynamoDB 아이템 형식이다 (형식을 바꾸면 namespace도 바꿔 예전 값을 읽지 않게 한다)
+# 서킷이 열렸거나 타임아웃/연결 오류면 만료된 값이라도 대신 반환한다 (TimeoutError: 호출 시간 제한)
+user_cache = TwoTierCache(
+    namespace="user:v2",
+    local_maxsize=settings.USER_CACHE_LOCAL_MAXSIZE,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    redis_ttl=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    negative_ttl=settings.USER_CACHE_NEGATIVE_TTL_SECONDS,
+    stale_ttl=settings.USER_CACHE_STALE_TTL_SECONDS,
+    serve_stale_on=(CircuitOpenError, BotoCoreError, TimeoutError),
+)
+
+
+STATUS_PROJECTION = ["subscription_status"]
+
+
+def _cache_keys(
+    user_id: Optional[str] = None, email: Optional[str] = None, google_id: Optional[str] = None
+) -> List[str]:
+    keys = []
+    if user_id:
+        keys.append(f"id:{user_id}")
+    if email:
+        keys.append(f"email:{email}")
+        keys.append(f"status:{email}")
+    if google_id:
+        keys.append(f"google:{google_id}")
+    return keys
 
 
 class UserService:
-    """사용자 서비스"""
+    """사용자 서비스
+
+    이메일을 받는 메서드는 정규화한 이메일(normalize_email)로 id와 캐시 키를 만든다.
+    """
 
-    def __init__(self):
-        self.table = dynamodb_client.get_table(settings.DYNAMODB_USERS_TABLE)
+    CREATE_MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        repository: UserRepository = user_repository,
+        cache: TwoTierCache = user_cache,
+        email_filter: LegacyEmailFilter = legacy_email_filter,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.email_filter = email_filter
+
+    async def _invalidate(self, user: UserModel) -> None:
+        """사용자에 대한 모든 조회 키 무효화"""
+        await self.invalidate(user.id, user.email, user.google_id)
+
+    async def invalidate(
+        self, user_id: str, email: Optional[str] = None, google_id: Optional[str] = None
+    ) -> None:
+        """서비스를 거치지 않고 바뀐 사용자(가져오기, 콘솔 수정 등)의 조회 캐시 무효화"""
+        await self.cache.invalidate(*_cache_keys(user_id, email, google_id))
 
     async def create_user(self, user_data: UserCreate) -> UserModel:
-        """사용자 생성"""
-        # 이메일 중복 체크
-        existing_user = await self.get_user_by_email(user_data.email)
-        if existing_user:
-            # 이미 존재하는 경우 활성화 상태로 업데이트
-            if existing_user.subscription_status == SubscriptionStatus.UNSUBSCRIBED.value:
-                existing_user.subscription_status = SubscriptionStatus.ACTIVE.value
-                await self.update_user(existing_user)
-            return existing_user
-
-        # 새 사용자 생성
+        """사용자 생성 또는 재구독
+
+        이메일로 결정되는 기본 키에 조건부 UpdateItem을 한 번만 보낸다. 새 사용자이거나
+        구독 취소 상태일 때만 기록되고, 그 외에는 조건 실패 응답에 담긴 기존 아이템을
+        그대로 반환하므로 같은 이메일로 동시에 요청해도 사용자는 하나만 생긴다.
+        이메일 기반 ID 도입 전 사용자(임의 id)가 있으면 새로 만들지 않고 그 사용자의 id에 쓴다.
+        """
+        email = normalize_email(user_data.email)
+        user_id = await self._legacy_user_id(email) or user_id_for_email(email)
         user = UserModel(
-            email=user_data.email,
+            id=user_id,
+            email=email,
             auth_provider=user_data.auth_provider,
             google_id=user_data.google_id,
             name=user_data.name,
             profile_image=user_data.profile_image,
         )
+        item = user.to_dict()
+        updates = {
+            "subscription_status": SubscriptionStatus.ACTIVE.value,
+            "active_shard": item["active_shard"],
+            "updated_at": item["updated_at"],
+        }
+        defaults = {
+            key: value
+            for key, value in item.items()
+            if key != "id" and key not in updates and value is not None
+        }
 
-        # DynamoDB에 저장
-        try:
-            self.table.put_item(Item=user.to_dict())
-            return user
-        except ClientError as e:
-            raise Exception(f"Failed to create user: {str(e)}")
+        from boto3.dynamodb.conditions import Attr
+
+        # 조건 실패 후 다시 읽기 전에 아이템이 삭제되면 조건부 쓰기를 다시 시도한다
+        for _ in range(self.CREATE_MAX_ATTEMPTS):
+            try:
+                new_item = await self.repository.update_item(
+                    user.id,
+                    updates=updates,
+                    defaults=defaults,
+                    condition=(
+                        Attr("id").not_exists()
+                        | Attr("subscription_status").eq(SubscriptionStatus.UNSUBSCRIBED.value)
+                    ),
+                )
+                break
+            except ConditionalCheckFailedError as e:
+                # 이미 활성 상태인 사용자: 쓰기 없이 기존 아이템 반환
+                # (조건 실패 시 기존 아이템을 돌려주지 않는 에뮬레이터에서는 다시 읽는다)
+                try:
+                    existing = e.item or await self.repository.get_item(user.id)
+                except ClientError as read_error:
+                    raise Exception(f"Failed to create user: {str(read_error)}")
+                if existing is not None:
+                    return UserModel.from_wire(existing)
+            except ClientError as e:
+                raise Exception(f"Failed to create user: {str(e)}")
+        else:
+            raise Exception(
+                f"Failed to create user: {user.id} was deleted during "
+                f"{self.CREATE_MAX_ATTEMPTS} attempts"
+            )
+
+        created_user = UserModel.from_dict(new_item)
+        await self._invalidate(created_user)
+        return created_user
 
     async def get_user_by_id(self, user_id: str) -> Optional[UserModel]:
         """ID로 사용자 조회"""
-        try:
-            response = self.table.get_item(Key={"id": user_id})
-            if "Item" in response:
-                return UserModel.from_dict(response["Item"])
+
+        async def load():
+            try:
+                return await self.repository.get_item(user_id)
+            except ClientError as e:
+                raise Exception(f"Failed to get user by id: {str(e)}")
+
+        item = await self.cache.get_or_load(f"id:{user_id}", load)
+        return UserModel.from_wire(item) if item else None
+
+    async def _find_email_index_item(self, email: str) -> Optional[Dict[str, Any]]:
+        """email-status-index 아이템 (id, email, subscription_status만 있다)
+
+        이메일로 id를 알 수 없는 사용자(이메일 필터가 "있을 수 있다"고 한 경우)를 찾을 때만 쓴다.
+        """
+
+        async def load():
+            try:
+                items = await self.repository.query_index(EMAIL_INDEX, "email", email)
+            except ClientError as e:
+                raise Exception(f"Failed to get user by email: {str(e)}")
+            return items[0] if items else None
+
+        return await self.cache.get_or_load(f"email:{email}", load)
+
+    async def _legacy_user_id(self, email: str) -> Optional[str]:
+        """이메일로 id를 알 수 없는 기존 사용자의 id (없으면 None)
+
+        이메일 필터가 "없다"고 하면 인덱스를 조회하지 않는다.
+        """
+        if not self.email_filter.might_contain(email):
             return None
-        except ClientError as e:
-            raise Exception(f"Failed to get user by id: {str(e)}")
+        item = await self._find_email_index_item(email)
+        return item["id"]["S"] if item else None
 
     async def get_user_by_email(self, email: str) -> Optional[UserModel]:
-        """이메일로 사용자 조회"""
-        try:
-            response = self.table.query(
-                IndexName="email-index",
-                KeyConditionExpression="email = :email",
-                ExpressionAttributeValues={":email": email},
-            )
-            if response["Items"]:
-                return UserModel.from_dict(response["Items"][0])
-            return None
-        except ClientError as e:
-            raise Exception(f"Failed to get user by email: {str(e)}")
+        """이메일로 사용자 조회 (이메일로 정해지는 id로 먼저 GetItem, 없으면 인덱스로 id를 찾는다)"""
+        email = normalize_email(email)
+        user = await self.get_user_by_id(user_id_for_email(email))
+        if user is not None:
+            return user
+        legacy_id = await self._legacy_user_id(email)
+        return await self.get_user_by_id(legacy_id) if legacy_id else None
+
+    async def get_subscription_status(self, email: str) -> Optional[str]:
+        """구독 상태만 조회 (없는 사용자면 None)
+
+        subscription_status만 프로젝션한 GetItem 한 번으로 끝나고, 응답에 다른 속성은 담기지 않는다.
+        이메일 기반 ID 도입 전 사용자는 email-status-index 조회로 상태까지 바로 얻는다.
+        """
+        email = normalize_email(email)
+
+        async def load():
+            try:
+                item = await self.repository.get_item(
+                    user_id_for_email(email), projection=STATUS_PROJECTION
+                )
+            except ClientError as e:
+                raise Exception(f"Failed to get subscription status: {str(e)}")
+            if item is None and self.email_filter.might_contain(email):
+                item = await self._find_email_index_item(email)
+            return {"subscription_status": item["subscription_status"]} if item else None
+
+        item = await self.cache.get_or_load(f"status:{email}", load)
+        return item["subscription_status"]["S"] if item else None
 
     async def get_user_by_google_id(self, google_id: str) -> Optional[UserModel]:
         """Google ID로 사용자 조회"""
+
+        async def load():
+            try:
+                items = await self.repository.query_index(GOOGLE_ID_INDEX, "google_id", google_id)
+            except ClientError as e:
+                raise Exception(f"Failed to get user by google id: {str(e)}")
+            return items[0] if items else None
+
+        item = await self.cache.get_or_load(f"google:{google_id}", load)
+        return UserModel.from_wire(item) if item else None
+
+    async def update_user(self, user_id: str, **changes) -> Optional[UserModel]:
+        """사용자 업데이트 (변경된 속성만 기록)"""
+        changes["updated_at"] = now_ms()
+        removes = []
+        # 구독 상태가 바뀌면 활성 구독자 인덱스 키도 함께 넣거나 뺀다
+        if changes.get("subscription_status") == SubscriptionStatus.ACTIVE.value:
+            changes["active_shard"] = active_shard_for(user_id)
+        elif "subscription_status" in changes:
+            removes.append("active_shard")
+        from boto3.dynamodb.conditions import Attr
+
         try:
-            response = self.table.query(
-                IndexName="google-id-index",
-                KeyConditionExpression="google_id = :google_id",
-                ExpressionAttributeValues={":google_id": google_id},
+            item = await self.repository.update_item(
+                user_id, updates=changes, condition=Attr("id").exists(), removes=removes
             )
-            if response["Items"]:
-                return UserModel.from_dict(response["Items"][0])
+        except ConditionalCheckFailedError:
             return None
-        except ClientError:
-            # google-id-index가 없으면 scan으로 조회 (비효율적이지만 fallback)
-            response = self.table.scan(
-                FilterExpression="google_id = :google_id",
-                ExpressionAttributeValues={":google_id": google_id},
-            )
-            if response["Items"]:
-                return UserModel.from_dict(response["Items"][0])
-            return None
-
-    async def update_user(self, user: UserModel) -> UserModel:
-        """사용자 업데이트"""
-        try:
-            self.table.put_item(Item=user.to_dict())
-            return user
         except ClientError as e:
             raise Exception(f"Failed to update user: {str(e)}")
 
+        user = UserModel.from_dict(item)
+        await self._invalidate(user)
+        return user
+
     async def unsubscribe_user(self, email: str) -> bool:
         """구독 취소"""
-        user = await self.get_user_by_email(email)
-        if not user:
-            return False
+        email = normalize_email(email)
+        unsubscribed = SubscriptionStatus.UNSUBSCRIBED.value
+        user = await self.update_user(user_id_for_email(email), subscription_status=unsubscribed)
+        if user is None:
+            # 이메일로 id를 알 수 없는 사용자는 email-status-index로 찾는다
+            legacy_id = await self._legacy_user_id(email)
+            if legacy_id is None:
+                return False
+            user = await self.update_user(legacy_id, subscription_status=unsubscribed)
+        return user is not None
+
+    async def iter_active_subscriber_shard(
+        self,
+        shard: str,
+        projection: Optional[List[str]] = None,
+        start_key: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """활성 구독자 인덱스의 파티션 하나를 (아이템, 다음 시작 키) 단위로 순회
+
+        시작 키를 저장해 두면 중단된 지점부터 이어서 읽을 수 있다.
+        """
+        async for page in self.repository.query_index_pages(
+            ACTIVE_SUBSCRIBERS_INDEX, "active_shard", shard, projection, start_key
+        ):
+            yield page
 
-        user.subscription_status = SubscriptionStatus.UNSUBSCRIBED.value
-        await self.update_user(user)
-        return True
+    async def iter_active_subscribers(
+        self, projection: Optional[List[str]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """활성 구독자 전체를 페이지 단위로 순회
+
+        모든 파티션에서 다음 페이지를 동시에 읽어 오므로, 비용은 테이블 크기가 아니라
+        활성 구독자 수에 비례하고 읽기는 파티션에 고르게 분산된다.
+        """
+        pages = {
+            shard: aiter(self.iter_active_subscriber_shard(shard, projection))
+            for shard in active_shards()
+        }
+        try:
+            while pages:
+                results = await asyncio.gather(*(anext(page, None) for page in pages.values()))
+                for shard, result in zip(list(pages), results):
+                    if result is None:
+                        del pages[shard]
+                    elif result[0]:
+                        yield result[0]
+        finally:
+            for page in pages.values():
+                await page.aclose()
+
+    async def count_active_subscribers(self) -> int:
+        """활성 구독자 수 (파티션별 COUNT 쿼리를 병렬로 실행)"""
+        try:
+            counts = await asyncio.gather(
+                *(
+                    self.repository.count_index(ACTIVE_SUBSCRIBERS_INDEX, "active_shard", shard)
+                    for shard in active_shards()
+                )
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to count active subscribers: {str(e)}")
+        return sum(counts)
 
 
 user_service = UserService()
@@ -0,0 +1,85 @@
+"""
+사용자 이벤트 워커 (환영 메일, 구독 통계, 캐시 무효화)
+
+API 서버와 별도 프로세스로 실행한다. users 테이블의 DynamoDB 스트림을 Redis 스트림으로 중계하고
+(여러 워커 중 하나만), 소비자 그룹으로 이벤트를 나눠 처리한다. Redis의 이메일 필터가 없거나
+오래됐으면 (여러 워커 중 하나가) 테이블을 천천히 스캔해 다시 만든다.
+
+    python -m dailydevq_backend.utils.event_worker --consumers 4
+    python -m dailydevq_backend.utils.event_worker --no-relay  # 처리만 늘릴 때
+
+처리량은 소비자 수(프로세스 × --consumers)에 비례해 늘어난다. SIGTERM을 받으면 처리 중인
+배치를 마치고 종료하며, ACK하지 못한 이벤트는 다른 소비자가 EVENTS_CLAIM_IDLE_SECONDS 뒤 가져간다.
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import sys
+
+import redis.asyncio as redis
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.services.email_filter import maintain_email_filter
+from dailydevq_backend.services.event_handlers import default_handlers
+from dailydevq_backend.services.events import EVENT_STREAM, EventConsumer, StreamRelay
+from dailydevq_backend.services.mailer import mailer
+from dailydevq_backend.services.user_service import user_cache, user_service
+
+
+async def main(args: argparse.Namespace) -> int:
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+
+    redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    handlers = default_handlers(redis_client, mailer, user_service)
+    prefix = f"{socket.gethostname()}-{os.getpid()}"
+    consumers = [
+        EventConsumer(redis_client, handlers, name=f"{prefix}-{i}") for i in range(args.consumers)
+    ]
+    relay = None if args.no_relay else StreamRelay(redis_client)
+
+    print(f"📬 이벤트 워커 시작: {EVENT_STREAM} (소비자 {args.consumers}개)")
+    print(f"   핸들러: {', '.join(handler.name for handler in handlers)}")
+
+    await async_dynamodb_client.start()
+    await user_cache.start()
+    if settings.WELCOME_EMAIL_ENABLED:
+        await mailer.start()
+    email_filter_task = None
+    if settings.USER_EMAIL_FILTER_ENABLED:
+        email_filter_task = asyncio.create_task(maintain_email_filter(redis_client))
+    try:
+        tasks = [consumer.run(stopping) for consumer in consumers]
+        if relay is not None:
+            await relay.start()
+            tasks.append(relay.run(stopping))
+        await asyncio.gather(*tasks)
+    finally:
+        if email_filter_task is not None:
+            email_filter_task.cancel()
+            await asyncio.gather(email_filter_task, return_exceptions=True)
+        if relay is not None:
+            await relay.stop()
+        await mailer.stop()
+        await user_cache.stop()
+        await async_dynamodb_client.stop()
+        await redis_client.aclose()
+
+    processed = sum(consumer.stats.processed for consumer in consumers)
+    dead = sum(consumer.stats.dead for consumer in consumers)
+    relayed = relay.relayed if relay is not None else 0
+    print(f"✅ 종료: 중계 {relayed} | 처리 {processed} | dead letter {dead}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 이벤트 워커")
+    parser.add_argument("--consumers", type=int, default=4, help="프로세스당 소비자 수")
+    parser.add_argument("--no-relay", action="store_true", help="DynamoDB 스트림 중계를 하지 않음")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,86 @@
+"""
+오늘의 질문 생성 스크립트
+
+발송 전날 스케줄러로 실행해 날짜별 뉴스레터 호를 S3(S3_BUCKET_NAME)의 issues/{날짜}.json에
+만들어 둔다. 뉴스레터 발송은 `send_newsletter --date`로 이 파일을 읽는다.
+
+    python -m dailydevq_backend.utils.generate_questions --start 2026-10-19 --days 5
+    python -m dailydevq_backend.utils.generate_questions --provider fake --store ./out  # 로컬 확인
+    python -m dailydevq_backend.utils.generate_questions --publish  # 첫 질문을 앱의 오늘의 질문으로 발행
+
+LLM 응답은 저장소의 llm-cache/에 프롬프트 해시로 저장되므로, 중단된 실행을 다시 돌리면
+이미 받은 응답은 다시 요청하지 않는다.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.core.storage import object_store
+from dailydevq_backend.models.question import today_kst
+from dailydevq_backend.services.llm import get_provider
+from dailydevq_backend.services.newsletter_service import issue_key
+from dailydevq_backend.services.question_generation import QuestionGenerator, daily_question
+
+
+async def main(args: argparse.Namespace) -> int:
+    start = date.fromisoformat(args.start or today_kst())
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(args.days)]
+    categories = [c.strip() for c in args.categories.split(",") if c.strip()]
+    provider = get_provider(args.provider, args.model)
+    store = object_store(args.store)
+
+    print(f"🤖 질문 생성: {dates[0]} ~ {dates[-1]} ({len(dates)}일 × {len(categories)}개 분야)")
+    print(f"   LLM: {provider.name}/{provider.model} (동시 요청 {args.concurrency})")
+
+    generator = QuestionGenerator(provider, store, concurrency=args.concurrency)
+    try:
+        issues, stats = await generator.run(dates, categories)
+        for issue in issues:
+            print(f"   📝 {issue.issue_id}: {store.url(issue_key(issue.issue_id))}")
+
+        if args.publish and issues:
+            from dailydevq_backend.services.question_service import question_service
+
+            await async_dynamodb_client.start()
+            try:
+                for issue in issues:
+                    question = daily_question(issue)
+                    if question is not None:
+                        await question_service.publish_question(question)
+            finally:
+                await async_dynamodb_client.stop()
+            print(f"   📢 오늘의 질문 발행: {len(issues)}일")
+    finally:
+        await store.stop()
+
+    print(
+        f"✅ 완료: 질문 {stats.questions}개, {stats.elapsed_seconds}s ({stats.questions_per_second}/s)"
+    )
+    print(
+        f"   LLM 요청 {stats.llm_requests} | 캐시 적중 {stats.cache_hits} | "
+        f"형식 오류 {stats.invalid_responses} | 실패 {stats.failed}"
+    )
+    print(
+        f"   토큰 입력 {stats.input_tokens} / 출력 {stats.output_tokens} | "
+        f"비용 ${stats.cost_usd:.4f}"
+    )
+    for sample in stats.failed_samples[:5]:
+        print(f"   ❌ {sample}")
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오늘의 질문 생성")
+    parser.add_argument("--start", default=None, help="시작 날짜 (기본값: 오늘, KST)")
+    parser.add_argument("--days", type=int, default=1)
+    parser.add_argument("--provider", default=settings.QUESTION_LLM_PROVIDER, help="openai | anthropic | fake")
+    parser.add_argument("--model", default=settings.QUESTION_LLM_MODEL)
+    parser.add_argument("--concurrency", type=int, default=settings.QUESTION_LLM_CONCURRENCY)
+    parser.add_argument("--categories", default=settings.QUESTION_CATEGORIES)
+    parser.add_argument("--store", default=None, help="출력 저장소 (기본값: S3, 로컬 디렉터리)")
+    parser.add_argument("--publish", action="store_true", help="첫 질문을 앱의 오늘의 질문으로 발행")
+    sys.exit(asyncio.run(main(parser.parse_args())))
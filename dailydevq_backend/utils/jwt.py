@@ -2,41 +2,188 @@
 JWT 토큰 생성 및 검증
 """
 
+import hashlib
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
-from dailydevq_backend.core.config import settings
+from typing import Optional, Dict, Any, List
+from jose import JWTError, jwk, jwt
+from dailydevq_backend.core.cache import MISSING, LRUCache
+from dailydevq_backend.core.config import Settings, settings
+from dailydevq_backend.core.runtime_config import runtime_config
 
+# 비대칭 알고리즘 (공개키만으로 다른 서비스가 검증할 수 있다)
+ASYMMETRIC_ALGORITHMS = ("ES256", "ES384", "ES512", "RS256", "RS384", "RS512")
 
-def create_access_token(user_id: str, expires_delta: Optional[timedelta] = None) -> str:
+
+class JWTKeyRing:
+    """kid별 서명/검증 키
+
+    현재 키(JWT_KEY_ID)로 서명하고, 토큰 헤더의 kid로 검증 키를 고른다. 교체 전 키는
+    JWT_VERIFY_KEYS에 남겨 두면 기존 토큰이 만료될 때까지 계속 검증된다.
+    비대칭 알고리즘이면 JWT_PRIVATE_KEY(PEM)로 서명하고 공개키를 JWKS로 공개한다.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = settings.JWT_ALGORITHM,
+        key_id: str = settings.JWT_KEY_ID,
+        secret: str = settings.JWT_SECRET,
+        private_key: Optional[str] = settings.JWT_PRIVATE_KEY,
+        verify_keys: Optional[Dict[str, str]] = None,
+    ):
+        self.algorithm = algorithm
+        self.key_id = key_id
+        self.asymmetric = algorithm in ASYMMETRIC_ALGORITHMS
+        if self.asymmetric:
+            if not private_key:
+                raise ValueError(f"JWT_PRIVATE_KEY is required for {algorithm}")
+            self.signing_key = jwk.construct(private_key, algorithm)
+            current_verify_key = self.signing_key.public_key()
+        else:
+            self.signing_key = jwk.construct(secret, algorithm)
+            current_verify_key = self.signing_key
+
+        # 검증 키는 미리 파싱해 두어 요청마다 PEM/시크릿을 다시 읽지 않는다
+        self.verify_keys = {
+            kid: jwk.construct(key, algorithm)
+            for kid, key in (settings.JWT_VERIFY_KEYS if verify_keys is None else verify_keys).items()
+        }
+        self.verify_keys[key_id] = current_verify_key
+
+    def get_verify_key(self, kid: Optional[str]):
+        # kid가 없는 토큰(kid 도입 전 발급)은 현재 키로 검증
+        return self.verify_keys.get(kid or self.key_id)
+
+    def public_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """공개 검증 키 목록 (대칭키는 공개하지 않는다)"""
+        if not self.asymmetric:
+            return {"keys": []}
+        keys = []
+        for kid, key in self.verify_keys.items():
+            keys.append({**key.to_dict(), "kid": kid, "use": "sig", "alg": self.algorithm})
+        return {"keys": keys}
+
+
+class ClaimsCache:
+    """검증을 통과한 토큰의 claims 캐시
+
+    키는 토큰 해시이고, 항목은 설정한 TTL과 토큰의 exp 중 먼저 오는 시점에 만료된다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.JWT_CLAIMS_CACHE_SIZE,
+        ttl: float = settings.JWT_CLAIMS_CACHE_TTL_SECONDS,
+    ):
+        self._cache = LRUCache(maxsize, ttl)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        claims = self._cache.get(self._key(token))
+        return None if claims is MISSING else claims
+
+    def set(self, token: str, claims: Dict[str, Any]) -> None:
+        remaining = claims.get("exp", 0) - time.time()
+        if remaining > 0:
+            self._cache.set(self._key(token), claims, ttl=min(self._cache.ttl, remaining))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+@dataclass(frozen=True)
+class JWTKeys:
+    """현재 키와 그 키로 검증한 claims 캐시 (키가 바뀌면 캐시도 새로 만든다)"""
+
+    ring: JWTKeyRing
+    claims: ClaimsCache
+
+
+# 설정을 다시 읽을 때 이 값이 바뀌면 키를 새로 만든다 (runtime_config.derive)
+KEY_SETTINGS = (
+    "JWT_ALGORITHM",
+    "JWT_KEY_ID",
+    "JWT_SECRET",
+    "JWT_PRIVATE_KEY",
+    "JWT_VERIFY_KEYS",
+    "JWT_CLAIMS_CACHE_SIZE",
+    "JWT_CLAIMS_CACHE_TTL_SECONDS",
+)
+
+
+def build_keys(config: Settings) -> JWTKeys:
+    ring = JWTKeyRing(
+        algorithm=config.JWT_ALGORITHM,
+        key_id=config.JWT_KEY_ID,
+        secret=config.JWT_SECRET,
+        private_key=config.JWT_PRIVATE_KEY,
+        verify_keys=config.JWT_VERIFY_KEYS,
+    )
+    claims = ClaimsCache(config.JWT_CLAIMS_CACHE_SIZE, config.JWT_CLAIMS_CACHE_TTL_SECONDS)
+    return JWTKeys(ring, claims)
+
+
+runtime_config.derive("jwt", KEY_SETTINGS, build_keys)
+
+
+def current_keys() -> JWTKeys:
+    """현재 설정 스냅샷의 JWT 키"""
+    return runtime_config.current.derived["jwt"]
+
+
+def create_access_token(
+    user_id: str,
+    expires_delta: Optional[timedelta] = None,
+    extra_claims: Optional[Dict[str, Any]] = None,
+) -> str:
     """
     JWT Access Token 생성
     """
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(hours=settings.JWT_EXPIRE_HOURS)
+        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode = {
+        **(extra_claims or {}),
         "sub": user_id,
         "exp": expire,
         "iat": datetime.utcnow(),
     }
 
+    key_ring = current_keys().ring
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+        to_encode,
+        key_ring.signing_key,
+        algorithm=key_ring.algorithm,
+        headers={"kid": key_ring.key_id},
     )
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[Dict[str, Any]]:
+def verify_token(token: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
     """
-    JWT Token 검증
+    JWT Token 검증 (검증된 claims는 만료 전까지 캐시)
     """
+    keys = current_keys()
+    key_ring, claims_cache = keys.ring, keys.claims
+    if use_cache:
+        claims = claims_cache.get(token)
+        if claims is not None:
+            return claims
+
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        return payload
+        key = key_ring.get_verify_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            return None
+        payload = jwt.decode(token, key, algorithms=[key_ring.algorithm])
     except JWTError:
         return None
+
+    if use_cache:
+        claims_cache.set(token, payload)
+    return payload
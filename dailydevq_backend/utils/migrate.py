@@ -0,0 +1,45 @@
+"""
+DynamoDB 스키마 마이그레이션 스크립트
+
+    python -m dailydevq_backend.utils.migrate            # 최신 버전까지 적용
+    python -m dailydevq_backend.utils.migrate --status   # 적용 현황만 출력
+"""
+
+import argparse
+import sys
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.migrations.runner import MigrationRunner
+from dailydevq_backend.migrations.versions import MIGRATIONS
+
+
+def main(args: argparse.Namespace) -> int:
+    print("🚀 DynamoDB 마이그레이션")
+    print(f"   Endpoint: {settings.DYNAMODB_ENDPOINT}")
+    print(f"   Prefix: {settings.DYNAMODB_TABLE_PREFIX}")
+    print()
+
+    runner = MigrationRunner(MIGRATIONS)
+    if args.status:
+        applied = runner.applied_versions()
+        for migration in runner.migrations:
+            mark = "✅" if migration.version in applied else "⏳"
+            print(f"{mark} {migration.version:04d} {migration.description}")
+        return 0
+
+    try:
+        applied = runner.migrate(target=args.target)
+    except Exception as e:
+        print(f"❌ 마이그레이션 실패: {str(e)}")
+        return 1
+
+    print()
+    print(f"✨ 마이그레이션 완료! ({len(applied)}개 적용)")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DynamoDB 스키마 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    sys.exit(main(parser.parse_args()))
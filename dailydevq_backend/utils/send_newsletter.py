@@ -0,0 +1,93 @@
+"""
+뉴스레터 발송 스크립트
+
+평일 오전 7시(KST)에 스케줄러(cron, Railway Cron 등)로 실행한다.
+
+    python -m dailydevq_backend.utils.send_newsletter --issue issue.json
+    python -m dailydevq_backend.utils.send_newsletter --date 2026-10-19  # S3의 issues/2026-10-19.json
+
+--date는 utils/generate_questions.py가 미리 만들어 S3(S3_BUCKET_NAME)에 올린 호를 읽는다.
+
+issue.json 형식:
+    {"issue_id": "2026-10-19", "subject": "...", "questions": [{"category": "...", "title": "...", "body": "..."}]}
+
+같은 --run-id(기본값: issue_id)로 다시 실행하면 중단된 지점부터 이어서 보내며,
+이미 발송된 구독자에게는 다시 보내지 않고, 이전 실행에서 발송에 실패한 구독자에게는 다시 보낸다.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+import redis.asyncio as redis
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.core.storage import object_store
+from dailydevq_backend.services.mailer import mailer
+from dailydevq_backend.services.newsletter_service import (
+    NewsletterCheckpoint,
+    NewsletterIssue,
+    SendReport,
+    issue_key,
+    newsletter_service,
+)
+
+
+def _print_progress(report: SendReport) -> None:
+    print(
+        f"   발송 {report.sent} | 건너뜀 {report.skipped} | 재시도 {report.retried} "
+        f"| 실패 {report.failed}",
+        flush=True,
+    )
+
+
+async def load_issue(args: argparse.Namespace) -> NewsletterIssue:
+    if args.issue:
+        with open(args.issue, encoding="utf-8") as f:
+            return NewsletterIssue.from_dict(json.load(f))
+    store = object_store(args.store)
+    try:
+        body = await store.get(issue_key(args.date))
+    finally:
+        await store.stop()
+    if body is None:
+        raise SystemExit(f"❌ 생성된 호가 없습니다: {store.url(issue_key(args.date))}")
+    return NewsletterIssue.from_dict(json.loads(body))
+
+
+async def main(args: argparse.Namespace) -> int:
+    issue = await load_issue(args)
+    run_id = args.run_id or issue.issue_id
+
+    print(f"📨 뉴스레터 발송 시작: {issue.issue_id} (run_id={run_id})")
+    print(f"   SMTP: {settings.SMTP_HOST}:{settings.SMTP_PORT} (pool={mailer.pool_size})")
+
+    redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    await async_dynamodb_client.start()
+    await mailer.start()
+    try:
+        report = await newsletter_service.send_issue(
+            issue, NewsletterCheckpoint(redis_client, run_id), on_progress=_print_progress
+        )
+    finally:
+        await mailer.stop()
+        await async_dynamodb_client.stop()
+        await redis_client.aclose()
+
+    _print_progress(report)
+    print(f"✅ 완료: {report.elapsed_seconds}s, {report.messages_per_second} msg/s")
+    for sample in report.failed_samples[:5]:
+        print(f"   ❌ {sample}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="뉴스레터 발송")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--issue", help="뉴스레터 내용 JSON 파일")
+    source.add_argument("--date", help="미리 생성된 호의 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--store", default=None, help="--date로 읽을 저장소 (기본값: S3, 로컬 디렉터리)")
+    parser.add_argument("--run-id", default=None, help="체크포인트 식별자 (기본값: issue_id)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
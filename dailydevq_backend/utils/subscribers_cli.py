@@ -0,0 +1,92 @@
+"""
+구독자 대량 가져오기/내보내기 CLI
+
+    python -m dailydevq_backend.utils.subscribers_cli import subscribers.csv
+    python -m dailydevq_backend.utils.subscribers_cli import subscribers.ndjson --format ndjson
+    python -m dailydevq_backend.utils.subscribers_cli export out.csv --status active
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator
+
+from dailydevq_backend.core.database import async_dynamodb_client
+from dailydevq_backend.core.redis import redis_client
+from dailydevq_backend.services.email_filter import legacy_email_filter
+from dailydevq_backend.services.subscription_import import (
+    ImportReport,
+    iter_emails,
+    subscription_import_service,
+)
+from dailydevq_backend.services.user_service import user_cache
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def _read_file(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _print_progress(report: ImportReport) -> None:
+    print(
+        f"\r   처리 {report.total} | 저장 {report.imported} | 기존 {report.existing} "
+        f"| 중복 {report.duplicates} | 오류 {report.invalid} | 실패 {report.failed}",
+        end="",
+        flush=True,
+    )
+
+
+async def run_import(path: str, fmt: str) -> int:
+    print(f"📥 구독자 가져오기: {path}")
+    # 필터가 없으면 새 주소마다 email-status-index를 조회한다 (이벤트 워커가 만들어 Redis에 저장)
+    if await legacy_email_filter.load():
+        print("   이메일 필터: Redis에서 읽음")
+    else:
+        print("   이메일 필터: 없음 (새 주소마다 인덱스 조회)")
+    report = await subscription_import_service.import_emails(
+        iter_emails(_read_file(path), fmt), on_progress=_print_progress
+    )
+    _print_progress(report)
+    print()
+    print(f"✅ 완료 ({report.elapsed_seconds}s)")
+    if report.invalid_samples:
+        print(f"   잘못된 이메일 예시: {', '.join(report.invalid_samples[:5])}")
+    return 1 if report.failed else 0
+
+
+async def run_export(path: str, fmt: str, status: str) -> int:
+    print(f"📤 구독자 내보내기: {path}", file=sys.stderr)
+    out = sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+    try:
+        async for lines in subscription_import_service.export(fmt, status):
+            out.write(lines)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print("✅ 완료", file=sys.stderr)
+    return 0
+
+
+async def main(args: argparse.Namespace) -> int:
+    await async_dynamodb_client.start()
+    await user_cache.start()
+    try:
+        if args.command == "import":
+            return await run_import(args.path, args.format)
+        return await run_export(args.path, args.format, args.status)
+    finally:
+        await user_cache.stop()
+        await redis_client.stop()
+        await async_dynamodb_client.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="구독자 대량 가져오기/내보내기")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("path", help="입력/출력 파일 경로 (내보내기는 - 이면 표준 출력)")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--status", default=None, help="내보낼 구독 상태 (예: active)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,95 @@
+"""
+테스트 공통 설정
+
+DynamoDB/S3는 프로세스 안에서 띄운 moto 서버를 쓰고, Redis/SMTP는 연결이 바로 거부되는
+주소로 두어 로컬 fallback 경로를 탄다 (Redis가 필요한 테스트는 redis fixture의 fakeredis를
+쓴다). 설정은 import 시점에 읽으므로 앱 모듈을 불러오기 전(pytest_configure)에 환경 변수를 정한다.
+"""
+
+import os
+import socket
+
+import pytest
+
+_moto_server = None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def pytest_configure(config):
+    global _moto_server
+    from moto.server import ThreadedMotoServer
+
+    port = free_port()
+    _moto_server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    _moto_server.start()
+    endpoint = f"http://127.0.0.1:{port}"
+    os.environ.update(
+        {
+            # 개발자의 .env.local을 읽지 않는다
+            "CONFIG_FILE": os.devnull,
+            "LOG_LEVEL": "WARNING",
+            "DYNAMODB_ENDPOINT": endpoint,
+            "DYNAMODB_TABLE_PREFIX": "test",
+            "S3_ENDPOINT": endpoint,
+            "AWS_ENDPOINT_URL": endpoint,
+            "REDIS_URL": f"redis://127.0.0.1:{free_port()}/0",
+            "SMTP_HOST": "127.0.0.1",
+            "SMTP_PORT": str(free_port()),
+            "SCHEMA_CHECK_MODE": "off",
+            "WELCOME_EMAIL_ENABLED": "false",
+        }
+    )
+
+
+def pytest_unconfigure(config):
+    if _moto_server is not None:
+        _moto_server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dynamodb_tables():
+    """moto에 모든 마이그레이션 적용 (테스트 세션마다 한 번)"""
+    from dailydevq_backend.migrations.runner import MigrationRunner
+    from dailydevq_backend.migrations.versions import MIGRATIONS
+
+    MigrationRunner(MIGRATIONS).migrate()
+
+
+@pytest.fixture
+async def dynamodb():
+    """테스트 이벤트 루프에서 공유 클라이언트를 열고 닫는다 (루프마다 새 커넥션 풀)"""
+    from dailydevq_backend.core.database import async_dynamodb_client
+    from dailydevq_backend.core.redis import redis_client
+
+    await async_dynamodb_client.start()
+    yield async_dynamodb_client
+    await async_dynamodb_client.stop()
+    await redis_client.stop()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    """공유 Redis 클라이언트를 테스트마다 빈 fakeredis 서버로 바꾼다"""
+    import fakeredis
+
+    from dailydevq_backend.core.redis import redis_client
+
+    fake = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+    monkeypatch.setattr(redis_client, "_client", fake)
+    return fake
+
+
+@pytest.fixture
+def client():
+    """lifespan까지 실행하는 앱 테스트 클라이언트"""
+    from fastapi.testclient import TestClient
+
+    from dailydevq_backend.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
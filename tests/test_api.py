@@ -0,0 +1,42 @@
+"""
+API 엔드포인트 스모크 테스트 (lifespan 포함)
+"""
+
+import uuid
+
+from dailydevq_backend.core.config import settings
+
+
+def test_cache_stats_requires_admin_key(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-key")
+
+    assert client.get("/api/v1/cache/stats").status_code == 401
+    assert client.get("/api/v1/cache/stats", headers={"X-Admin-Key": "wrong"}).status_code == 401
+
+    response = client.get("/api/v1/cache/stats", headers={"X-Admin-Key": "admin-key"})
+    assert response.status_code == 200
+    assert "hit_ratio" in response.json()
+
+
+def test_cache_stats_disabled_without_admin_key(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", None)
+
+    assert client.get("/api/v1/cache/stats").status_code == 403
+
+
+def test_subscribe_with_rate_limit(client, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    email = f"rate-{uuid.uuid4().hex[:12]}@example.com"
+
+    response = client.post("/api/v1/subscribe/email", json={"email": email})
+    assert response.status_code == 200
+    assert response.json()["user"]["email"] == email
+
+    response = client.delete("/api/v1/subscribe/unsubscribe", params={"email": email})
+    assert response.status_code == 200
+
+    # 이메일 제한은 정규화한 주소 기준이라 대소문자를 바꿔도 같은 버킷을 쓴다
+    for _ in range(settings.RATE_LIMIT_EMAIL_PER_HOUR - 2):
+        client.post("/api/v1/subscribe/email", json={"email": email.upper()})
+    response = client.post("/api/v1/subscribe/email", json={"email": email.upper()})
+    assert response.status_code == 429
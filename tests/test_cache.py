@@ -0,0 +1,67 @@
+"""
+2단계 캐시 테스트 (워커 간 LRU 무효화)
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from dailydevq_backend.core import cache as cache_module
+from dailydevq_backend.core.cache import TwoTierCache
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    """워커마다 만드는 Redis 클라이언트가 같은 fakeredis 서버를 보게 한다"""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        cache_module.redis.Redis,
+        "from_url",
+        lambda url: fakeredis.FakeAsyncRedis(server=server),
+    )
+    return server
+
+
+def new_cache() -> TwoTierCache:
+    # 로컬 TTL을 길게 두어 무효화 알림 없이는 예전 값이 남게 한다
+    return TwoTierCache("test-users", local_maxsize=100, local_ttl=60, redis_ttl=60, negative_ttl=5)
+
+
+async def wait_until(condition) -> None:
+    for _ in range(200):
+        if await condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_invalidation_reaches_other_workers(redis_server):
+    writer, reader = new_cache(), new_cache()
+    await writer.start("redis://fake")
+    await reader.start("redis://fake")
+    try:
+        async def subscribed():
+            [(_, count)] = await writer._redis.pubsub_numsub(writer._channel)
+            return count == 2
+
+        await wait_until(subscribed)
+
+        async def active():
+            return {"subscription_status": "active"}
+
+        assert await reader.get_or_load("email:a@example.com", active) is not None
+        await writer.invalidate("email:a@example.com")
+        async def delivered():
+            return reader.stats()["remote_invalidations"] > 0
+
+        await wait_until(delivered)
+
+        async def unsubscribed():
+            return {"subscription_status": "unsubscribed"}
+
+        value = await reader.get_or_load("email:a@example.com", unsubscribed)
+        assert value == {"subscription_status": "unsubscribed"}
+    finally:
+        await writer.stop()
+        await reader.stop()
+
@@ -0,0 +1,263 @@
+"""
+DynamoDB 장애 주입 테스트 (서킷 브레이커, 호출 시간 제한, stale 캐시)
+
+DynamoDB JSON 프로토콜을 흉내 내는 로컬 스텁 서버를 장애 모드(throttle, slow, error)로 바꿔 가며
+저장소/서비스 호출이 바로 실패하거나 캐시된 값으로 버티는지 확인한다.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from botocore.exceptions import BotoCoreError, ClientError
+from prometheus_client import REGISTRY
+
+from dailydevq_backend.core.cache import TwoTierCache
+from dailydevq_backend.core.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.database import AsyncDynamoDBClient
+from dailydevq_backend.core.metrics import tracing
+from dailydevq_backend.repositories.user_repository import UserRepository
+from dailydevq_backend.services.user_service import UserService
+
+ERROR_TYPE = "com.amazonaws.dynamodb.v20120810#{}"
+RESET_SECONDS = 0.3
+
+
+class StubDynamoDB:
+    """장애 모드를 바꿀 수 있는 DynamoDB 스텁 (ok | throttle | slow | error)"""
+
+    def __init__(self):
+        self.mode = "ok"
+        self.requests = 0
+        self.slow_seconds = 2.0
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/x-amz-json-1.0")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                stub.requests += 1
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if stub.mode == "throttle":
+                    code = "ProvisionedThroughputExceededException"
+                    return self._send(400, {"__type": ERROR_TYPE.format(code), "message": code})
+                if stub.mode == "error":
+                    code = "InternalServerError"
+                    return self._send(500, {"__type": ERROR_TYPE.format(code), "message": code})
+                if stub.mode == "slow":
+                    time.sleep(stub.slow_seconds)
+                key = body.get("Key", {}).get("id", {}).get("S", "")
+                item = {
+                    "id": {"S": key},
+                    "email": {"S": f"{key}@example.com"},
+                    "subscription_status": {"S": "active"},
+                }
+                self._send(200, {"Item": item} if key else {})
+
+        return Handler
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    stub = StubDynamoDB()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stub.handler())
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "DYNAMODB_ENDPOINT", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker("test-dynamodb", failure_threshold=3, reset_timeout=RESET_SECONDS)
+
+
+@pytest.fixture
+async def repository(stub, breaker):
+    client = AsyncDynamoDBClient(breaker=breaker)
+    await client.start()
+    yield UserRepository(client)
+    await client.stop()
+
+
+def test_breaker_opens_after_consecutive_failures(breaker):
+    opened = []
+    breaker.on_open(lambda: opened.append(True))
+
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert opened == [True]
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_half_open_allows_one_probe(breaker):
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(RESET_SECONDS)
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+async def test_throttle_storm_opens_breaker_and_fails_fast(stub, breaker, repository, monkeypatch):
+    # 시도마다 서킷 실패로 세므로 첫 호출의 재시도 안에서 서킷이 열린다
+    monkeypatch.setattr(settings, "DYNAMODB_REQUEST_DEADLINE_SECONDS", 5.0)
+    stub.mode = "throttle"
+
+    started = time.perf_counter()
+    with pytest.raises((CircuitOpenError, ClientError)):
+        await repository.get_item("user-1")
+    assert breaker.state == OPEN
+
+    requests = stub.requests
+    with pytest.raises(CircuitOpenError):
+        await repository.get_item("user-2")
+    assert stub.requests == requests
+    assert time.perf_counter() - started < settings.DYNAMODB_REQUEST_DEADLINE_SECONDS
+
+
+async def test_breaker_recovers_after_reset_timeout(stub, breaker, repository):
+    stub.mode = "error"
+    with pytest.raises((CircuitOpenError, ClientError)):
+        await repository.get_item("user-1")
+    assert breaker.state == OPEN
+
+    stub.mode = "ok"
+    time.sleep(RESET_SECONDS)
+    assert (await repository.get_item("user-1"))["id"]["S"] == "user-1"
+    assert breaker.state == CLOSED
+
+
+async def test_slow_dynamodb_is_bounded_by_the_deadline(stub, breaker, monkeypatch):
+    monkeypatch.setattr(settings, "DYNAMODB_REQUEST_DEADLINE_SECONDS", 0.5)
+    client = AsyncDynamoDBClient(breaker=breaker)
+    await client.start()
+    try:
+        stub.mode = "slow"
+        started = time.perf_counter()
+        with pytest.raises((TimeoutError, BotoCoreError, CircuitOpenError)):
+            await UserRepository(client).get_item("user-1")
+        assert time.perf_counter() - started < stub.slow_seconds
+    finally:
+        await client.stop()
+
+
+class RecordingSpans:
+    """열린 span과 닫힌 span의 오류를 기록"""
+
+    def __init__(self, monkeypatch):
+        self.open = 0
+        self.errors = []
+        monkeypatch.setattr(tracing, "start_client_span", self.start)
+        monkeypatch.setattr(tracing, "end_span", self.end)
+
+    def start(self, name, attributes):
+        self.open += 1
+        return self
+
+    def set_attribute(self, key, value):
+        pass
+
+    def end(self, span, error=None):
+        self.open -= 1
+        self.errors.append(error)
+
+
+def latency_count(client: AsyncDynamoDBClient) -> float:
+    labels = {"operation": "GetItem", "table": client.table_name(settings.DYNAMODB_USERS_TABLE)}
+    return REGISTRY.get_sample_value("dynamodb_operation_duration_seconds_count", labels) or 0
+
+
+async def test_timed_out_call_records_latency_and_ends_span(stub, breaker, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "DYNAMODB_REQUEST_DEADLINE_SECONDS", 0.5)
+    spans = RecordingSpans(monkeypatch)
+    client = AsyncDynamoDBClient(breaker=breaker)
+    await client.start()
+    try:
+        before = latency_count(client)
+        stub.mode = "slow"
+        with pytest.raises(TimeoutError):
+            await UserRepository(client).get_item("user-1")
+
+        assert latency_count(client) == before + 1
+        assert (spans.open, spans.errors) == (0, ["TimeoutError"])
+    finally:
+        await client.stop()
+
+
+async def test_transport_error_records_latency_and_ends_span(breaker, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "DYNAMODB_ENDPOINT", "http://127.0.0.1:1")
+    monkeypatch.setattr(settings, "DYNAMODB_REQUEST_DEADLINE_SECONDS", 5.0)
+    spans = RecordingSpans(monkeypatch)
+    client = AsyncDynamoDBClient(breaker=breaker)
+    await client.start()
+    try:
+        before = latency_count(client)
+        with pytest.raises((BotoCoreError, CircuitOpenError)):
+            await UserRepository(client).get_item("user-1")
+
+        assert latency_count(client) == before + 1
+        assert spans.open == 0 and spans.errors[0]
+    finally:
+        await client.stop()
+
+
+async def test_cached_users_are_served_stale_while_circuit_is_open(stub, breaker, repository):
+    cache = TwoTierCache(
+        namespace="test-faults",
+        local_maxsize=100,
+        local_ttl=0.01,
+        redis_ttl=60,
+        negative_ttl=1,
+        stale_ttl=60,
+        serve_stale_on=(CircuitOpenError, BotoCoreError, TimeoutError),
+    )
+    users = UserService(repository=repository, cache=cache)
+    assert (await users.get_user_by_id("user-1")).id == "user-1"
+    time.sleep(0.02)
+
+    stub.mode = "throttle"
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert (await users.get_user_by_id("user-1")).id == "user-1"
+    with pytest.raises(CircuitOpenError):
+        await users.get_user_by_id("user-2")
@@ -0,0 +1,129 @@
+"""
+이메일 필터 테스트 (이벤트 워커가 만들어 Redis에 저장하고 API 워커는 읽기만 한다)
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from dailydevq_backend.core.bloom import BloomFilter
+from dailydevq_backend.core.database import dynamodb_breaker
+from dailydevq_backend.models.user import UserModel, user_id_for_email
+from dailydevq_backend.repositories.user_repository import user_repository
+from dailydevq_backend.services.email_filter import (
+    FILTER_KEY,
+    VERSION_KEY,
+    LegacyEmailFilter,
+    publish_email_filter,
+    store_email_filter,
+)
+
+
+def new_email() -> str:
+    return f"filter-{uuid.uuid4().hex[:12]}@example.com"
+
+
+def test_bloom_filter_round_trip():
+    bloom = BloomFilter(1000, 0.01)
+    for i in range(100):
+        bloom.add(f"user{i}@example.com")
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+    assert all(f"user{i}@example.com" in restored for i in range(100))
+    assert (restored.size, restored.hash_count) == (bloom.size, bloom.hash_count)
+    assert restored.count == 100
+
+
+async def test_worker_loads_published_filter(dynamodb, redis):
+    legacy, current = new_email(), new_email()
+    await user_repository.put_item(UserModel(id=str(uuid.uuid4()), email=legacy).to_dict())
+    await user_repository.put_item(UserModel(email=current).to_dict())
+    failures = dynamodb_breaker.stats()["consecutive_failures"]
+
+    assert await publish_email_filter(redis, page_size=50, interval=0)
+    # 이미 저장돼 있으면 다시 스캔하지 않는다
+    assert not await publish_email_filter(redis, page_size=50, interval=0)
+    assert dynamodb_breaker.stats()["consecutive_failures"] == failures
+
+    email_filter = LegacyEmailFilter(SimpleNamespace(client=redis))
+    await email_filter.start()
+    try:
+        assert email_filter.ready
+        assert email_filter.might_contain(legacy)
+        assert not email_filter.might_contain(current)
+        assert not email_filter.might_contain(new_email())
+    finally:
+        await email_filter.stop()
+
+
+async def test_worker_reloads_until_filter_is_published(redis):
+    email_filter = LegacyEmailFilter(SimpleNamespace(client=redis), reload_interval=0.01)
+    await email_filter.start()
+    try:
+        assert not email_filter.ready
+        assert email_filter.might_contain(new_email())
+
+        await store_email_filter(redis, BloomFilter(100), ttl=60)
+        for _ in range(100):
+            if email_filter.ready:
+                break
+            await asyncio.sleep(0.01)
+
+        assert not email_filter.might_contain(new_email())
+    finally:
+        await email_filter.stop()
+
+
+async def test_stale_filter_is_rebuilt_with_users_from_old_workers(dynamodb, redis):
+    assert await publish_email_filter(redis, page_size=50, interval=0)
+    email_filter = LegacyEmailFilter(SimpleNamespace(client=redis), reload_interval=0.01)
+    await email_filter.start()
+    try:
+        # 배포 중 예전 코드의 워커가 정규화 전 이메일로 id를 만든 사용자
+        raw = new_email().replace("filter-", "Filter-")
+        await user_repository.put_item(UserModel(id=user_id_for_email(raw), email=raw).to_dict())
+        assert not email_filter.might_contain(raw.lower())
+
+        assert not await publish_email_filter(redis, page_size=50, interval=0)
+        assert await publish_email_filter(redis, page_size=50, interval=0, rebuild_interval=0)
+        for _ in range(100):
+            if email_filter.might_contain(raw.lower()):
+                break
+            await asyncio.sleep(0.01)
+
+        assert email_filter.might_contain(raw.lower())
+        assert await redis.ttl(FILTER_KEY) > 0
+    finally:
+        await email_filter.stop()
+
+
+async def test_expired_filter_falls_back_to_index(redis):
+    await store_email_filter(redis, BloomFilter(100), ttl=60)
+    email_filter = LegacyEmailFilter(SimpleNamespace(client=redis), reload_interval=60)
+    await email_filter.start()
+    try:
+        assert not email_filter.might_contain(new_email())
+
+        await redis.delete(FILTER_KEY, VERSION_KEY)
+
+        assert not await email_filter.load()
+        assert email_filter.might_contain(new_email())
+    finally:
+        await email_filter.stop()
+
+
+async def test_redis_error_falls_back_to_index(redis, monkeypatch):
+    async def get(key):
+        raise RedisConnectionError("connection refused")
+
+    monkeypatch.setattr(redis, "get", get)
+    email_filter = LegacyEmailFilter(SimpleNamespace(client=redis), reload_interval=60)
+    await email_filter.start()
+    try:
+        assert not email_filter.ready
+        assert email_filter.might_contain(new_email())
+    finally:
+        await email_filter.stop()
@@ -0,0 +1,222 @@
+"""
+사용자 이벤트 테스트 (스트림 중계 체크포인트/부모 샤드 순서, 소비자 ACK/회수/dead letter)
+"""
+
+import asyncio
+import uuid
+
+from botocore.exceptions import EndpointConnectionError
+
+from dailydevq_backend.models.user import UserModel
+from dailydevq_backend.repositories.user_repository import user_repository
+from dailydevq_backend.services.events import (
+    CONSUMER_GROUP,
+    DEAD_LETTER_STREAM,
+    EVENT_STREAM,
+    RELAY_CHECKPOINT,
+    SHARD_DONE,
+    SUBSCRIBED,
+    EventConsumer,
+    StreamRelay,
+    UserEvent,
+)
+
+
+def record(user_id: str, sequence: str) -> dict:
+    return {
+        "eventID": f"event-{sequence}",
+        "eventName": "INSERT",
+        "dynamodb": {
+            "Keys": {"id": {"S": user_id}},
+            "NewImage": {"id": {"S": user_id}, "subscription_status": {"S": "active"}},
+            "SequenceNumber": sequence,
+        },
+    }
+
+
+class FakeStreams:
+    """닫힌 부모 샤드와 열린 자식 샤드가 있는 DynamoDB Streams (첫 describe_stream은 연결 실패)"""
+
+    def __init__(self, shards, records, fail_first: bool = False):
+        self.shards = shards
+        self.records = records
+        self.fail_first = fail_first
+
+    async def describe_stream(self, **params):
+        if self.fail_first:
+            self.fail_first = False
+            raise EndpointConnectionError(endpoint_url="http://streams.local")
+        return {"StreamDescription": {"Shards": self.shards}}
+
+    async def get_shard_iterator(self, **params):
+        return {"ShardIterator": f"{params['ShardId']}|{params.get('SequenceNumber', '')}"}
+
+    async def get_records(self, **params):
+        shard_id, after = params["ShardIterator"].split("|")
+        records = [r for r in self.records[shard_id] if r["dynamodb"]["SequenceNumber"] > after]
+        closed = any(s["ShardId"] == shard_id and s.get("closed") for s in self.shards)
+        last = records[-1]["dynamodb"]["SequenceNumber"] if records else after
+        return {"Records": records, "NextShardIterator": None if closed else f"{shard_id}|{last}"}
+
+
+def fake_relay(redis, dynamodb, streams: FakeStreams) -> StreamRelay:
+    relay = StreamRelay(redis, dynamodb, poll_seconds=0.01)
+    relay._streams = streams
+    relay._stream_arn = "arn:fake"
+    return relay
+
+
+async def relayed_users(redis):
+    return [fields[b"user_id"].decode() for _, fields in await redis.xrange(EVENT_STREAM)]
+
+
+async def test_child_shard_waits_for_parent(redis, dynamodb):
+    streams = FakeStreams(
+        shards=[
+            {"ShardId": "child", "ParentShardId": "parent"},
+            {"ShardId": "parent", "closed": True},
+        ],
+        records={"parent": [record("u1", "001")], "child": [record("u1", "002")]},
+    )
+    relay = fake_relay(redis, dynamodb, streams)
+
+    assert await relay.relay_once() == 1
+    assert await redis.hget(RELAY_CHECKPOINT, "parent") == SHARD_DONE.encode()
+    assert await relay.relay_once() == 1
+
+    events = [UserEvent.from_fields(fields) for _, fields in await redis.xrange(EVENT_STREAM)]
+    assert [event.event_id for event in events] == ["event-001", "event-002"]
+
+
+async def test_restarted_relay_resumes_from_checkpoint(redis, dynamodb):
+    streams = FakeStreams(shards=[{"ShardId": "shard"}], records={"shard": [record("u1", "001")]})
+    assert await fake_relay(redis, dynamodb, streams).relay_once() == 1
+
+    streams.records["shard"].append(record("u2", "002"))
+    assert await fake_relay(redis, dynamodb, streams).relay_once() == 1
+
+    assert await relayed_users(redis) == ["u1", "u2"]
+    assert await redis.hget(RELAY_CHECKPOINT, "shard") == b"002"
+
+
+async def test_relay_survives_connection_errors(redis, dynamodb):
+    streams = FakeStreams(
+        shards=[{"ShardId": "shard"}], records={"shard": [record("u1", "001")]}, fail_first=True
+    )
+    relay = fake_relay(redis, dynamodb, streams)
+    stopping = asyncio.Event()
+    task = asyncio.create_task(relay.run(stopping))
+    for _ in range(100):
+        if relay.relayed:
+            break
+        await asyncio.sleep(0.01)
+    stopping.set()
+    await task
+
+    assert relay.relayed == 1
+    await relay.stop()
+
+
+async def test_relays_dynamodb_stream(redis, dynamodb):
+    relay = StreamRelay(redis, dynamodb)
+    await relay.start()
+    try:
+        while await relay.relay_once():
+            pass
+        user = UserModel(id=str(uuid.uuid4()), email=f"{uuid.uuid4().hex[:12]}@example.com")
+        await user_repository.put_item(user.to_dict())
+
+        assert await relay.relay_once() >= 1
+        assert user.id in await relayed_users(redis)
+        assert await redis.hlen(RELAY_CHECKPOINT) >= 1
+    finally:
+        await relay.stop()
+
+
+class RecordingHandler:
+    name = "recording"
+    types = frozenset({SUBSCRIBED})
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.handled = []
+
+    async def handle(self, event: UserEvent) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("temporary failure")
+        self.handled.append(event.event_id)
+
+
+async def add_event(redis, event_id: str) -> None:
+    event = UserEvent(event_id=event_id, type=SUBSCRIBED, user_id="u1", occurred_at=0)
+    await redis.xadd(EVENT_STREAM, event.to_fields())
+
+
+def consumer(redis, handler, name: str, **options) -> EventConsumer:
+    return EventConsumer(redis, [handler], name=name, block_ms=10, **options)
+
+
+async def read(consumer: EventConsumer, redis) -> None:
+    response = await redis.xreadgroup(CONSUMER_GROUP, consumer.name, {EVENT_STREAM: ">"}, count=10)
+    for _, entries in response:
+        await consumer.process(entries)
+
+
+async def claim_stale(consumer: EventConsumer) -> None:
+    await asyncio.sleep(0.01)  # claim_idle_seconds보다 오래 처리되지 않은 이벤트
+    await consumer.claim_stale()
+
+
+async def pending(redis) -> int:
+    return (await redis.xpending(EVENT_STREAM, CONSUMER_GROUP))["pending"]
+
+
+async def test_consumer_acks_processed_events(redis):
+    handler = RecordingHandler()
+    worker = consumer(redis, handler, "c1")
+    await worker.ensure_group()
+    await add_event(redis, "e1")
+
+    await read(worker, redis)
+
+    assert handler.handled == ["e1"]
+    assert worker.stats.processed == 1
+    assert await pending(redis) == 0
+
+
+async def test_failed_event_is_claimed_and_not_repeated(redis):
+    handler = RecordingHandler(failures=1)
+    first = consumer(redis, handler, "c1", claim_idle_seconds=0.001)
+    second = consumer(redis, handler, "c2", claim_idle_seconds=0.001)
+    await first.ensure_group()
+    await add_event(redis, "e1")
+
+    await read(first, redis)
+    assert await pending(redis) == 1
+
+    # 다른 소비자가 회수해 처리하고, 처리 기록이 있으면 다시 처리하지 않는다
+    await claim_stale(second)
+    assert handler.handled == ["e1"]
+    assert await pending(redis) == 0
+
+    await add_event(redis, "e1")
+    await read(second, redis)
+    assert handler.handled == ["e1"]
+    assert second.stats.duplicates == 1
+
+
+async def test_event_is_dead_lettered_after_max_deliveries(redis):
+    handler = RecordingHandler(failures=10)
+    worker = consumer(redis, handler, "c1", claim_idle_seconds=0.001, max_deliveries=2)
+    await worker.ensure_group()
+    await add_event(redis, "e1")
+
+    await read(worker, redis)
+    await claim_stale(worker)
+    await claim_stale(worker)
+
+    assert worker.stats.dead == 1
+    assert await pending(redis) == 0
+    [(_, fields)] = await redis.xrange(DEAD_LETTER_STREAM)
+    assert fields[b"reason"] == b"too many deliveries"
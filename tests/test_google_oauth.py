@@ -0,0 +1,201 @@
+"""
+Google OAuth 테스트 (로컬 스텁 서버: 토큰/userinfo/JWKS 엔드포인트)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.http import HTTPClient
+from dailydevq_backend.services.google_oauth import GoogleJWKSCache, GoogleOAuthService
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+
+
+def signing_key(kid: str):
+    """(PEM 개인키, 공개 JWK)"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public = jwk.construct(pem, "RS256").public_key().to_dict()
+    return pem, {**public, "kid": kid, "alg": "RS256", "use": "sig"}
+
+
+class StubGoogle:
+    """요청 수와 TCP 연결 수를 세는 Google OAuth 스텁"""
+
+    def __init__(self):
+        self.requests = {"/token": 0, "/userinfo": 0, "/certs": 0}
+        self.connections = set()
+        self.keys = {}
+        self.max_age = 3600
+        self.token_response = {}
+        self.rotate("k1")
+
+    def rotate(self, kid: str) -> None:
+        self.keys[kid] = signing_key(kid)
+        self.kid = kid
+
+    def id_token(self, **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": CLIENT_ID,
+            "sub": "1234567890",
+            "email": "google-user@example.com",
+            "email_verified": True,
+            "name": "구글 사용자",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        pem, _ = self.keys[self.kid]
+        return jwt.encode(payload, pem, algorithm="RS256", headers={"kid": self.kid})
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body, headers=None):
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _count(self):
+                stub.requests[self.path] += 1
+                stub.connections.add(self.client_address)
+
+            def do_GET(self):
+                self._count()
+                if self.path == "/certs":
+                    keys = [public for _, public in stub.keys.values()]
+                    cache_control = f"public, max-age={stub.max_age}, must-revalidate"
+                    self._send({"keys": keys}, {"Cache-Control": cache_control})
+                else:
+                    self._send({"id": "1234567890", "email": "google-user@example.com"})
+
+            def do_POST(self):
+                self._count()
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self._send(stub.token_response)
+
+        return Handler
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setattr(settings, "GOOGLE_CLIENT_ID", CLIENT_ID)
+    stub = StubGoogle()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stub.handler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.url = f"http://127.0.0.1:{server.server_port}"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def oauth(stub):
+    http = HTTPClient()
+    service = GoogleOAuthService(
+        token_url=f"{stub.url}/token",
+        userinfo_url=f"{stub.url}/userinfo",
+        jwks_url=f"{stub.url}/certs",
+        http=http,
+    )
+    await service.start()
+    yield service
+    await service.stop()
+    await http.stop()
+
+
+async def test_login_with_id_token_makes_one_call(stub, oauth):
+    stub.token_response = {"access_token": "at", "id_token": stub.id_token()}
+
+    user_info = await oauth.verify_and_get_user_info("code", "http://localhost/callback")
+
+    assert user_info["id"] == "1234567890"
+    assert user_info["email"] == "google-user@example.com"
+    assert user_info["verified_email"] is True
+    # JWKS는 시작할 때 받아 두었으므로 로그인에는 토큰 교환 한 번만 필요하다
+    assert stub.requests == {"/token": 1, "/userinfo": 0, "/certs": 1}
+
+
+async def test_logins_share_one_connection(stub, oauth):
+    for _ in range(3):
+        stub.token_response = {"access_token": "at", "id_token": stub.id_token()}
+        assert await oauth.verify_and_get_user_info("code", "http://localhost/callback")
+
+    assert stub.requests["/token"] == 3
+    assert len(stub.connections) == 1
+
+
+async def test_falls_back_to_userinfo_without_id_token(stub, oauth):
+    stub.token_response = {"access_token": "at"}
+
+    user_info = await oauth.verify_and_get_user_info("code", "http://localhost/callback")
+
+    assert user_info["email"] == "google-user@example.com"
+    assert stub.requests["/userinfo"] == 1
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"aud": "another-client"},
+        {"iss": "https://evil.example.com"},
+        {"exp": int(time.time()) - 60},
+    ],
+)
+async def test_rejects_invalid_id_token(stub, oauth, claims):
+    stub.token_response = {"access_token": "at", "id_token": stub.id_token(**claims)}
+
+    assert await oauth.verify_and_get_user_info("code", "http://localhost/callback") is None
+
+
+async def test_jwks_expiry_follows_cache_control(stub):
+    stub.max_age = 120
+    http = HTTPClient()
+    cache = GoogleJWKSCache(f"{stub.url}/certs", http)
+    try:
+        await cache.refresh()
+    finally:
+        await http.stop()
+
+    assert cache._expires_at - cache._fetched_at == 120
+
+
+async def test_unknown_kid_refreshes_jwks(stub, oauth, monkeypatch):
+    monkeypatch.setattr(GoogleJWKSCache, "MIN_REFRESH_INTERVAL", 0)
+    stub.rotate("k2")
+    stub.token_response = {"access_token": "at", "id_token": stub.id_token()}
+
+    assert await oauth.verify_and_get_user_info("code", "http://localhost/callback")
+    assert stub.requests["/certs"] == 2
+
+
+async def test_unknown_kid_is_not_refetched_within_min_interval(stub, oauth):
+    stub.rotate("k2")
+    stub.token_response = {"access_token": "at", "id_token": stub.id_token()}
+
+    assert await oauth.verify_and_get_user_info("code", "http://localhost/callback") is None
+    assert stub.requests["/certs"] == 1
@@ -0,0 +1,53 @@
+"""
+HealthMonitor 테스트 (필수/선택 의존성별 readiness)
+"""
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.health import HealthMonitor, health_monitor
+
+
+async def ok() -> None:
+    pass
+
+
+async def down() -> None:
+    raise ConnectionError("connection refused")
+
+
+async def test_optional_dependency_failure_is_degraded():
+    monitor = HealthMonitor(interval=60, timeout=1)
+    monitor.register("dynamodb", ok)
+    monitor.register("redis", down, required=False)
+
+    await monitor.check()
+
+    assert monitor.is_ready
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "degraded"
+    assert snapshot["checks"]["redis"]["healthy"] is False
+
+
+async def test_required_dependency_failure_is_not_ready():
+    monitor = HealthMonitor(interval=60, timeout=1)
+    monitor.register("dynamodb", down)
+    monitor.register("redis", ok, required=False)
+
+    await monitor.check()
+
+    assert not monitor.is_ready
+    assert monitor.snapshot()["status"] == "not_ready"
+
+
+async def test_all_healthy_is_ready():
+    monitor = HealthMonitor(interval=60, timeout=1)
+    monitor.register("dynamodb", ok)
+    monitor.register("redis", ok, required=False)
+
+    await monitor.check()
+
+    assert monitor.snapshot()["status"] == "ready"
+
+
+def test_redis_is_optional_by_default():
+    assert settings.HEALTH_REQUIRED_DEPENDENCIES == "dynamodb"
+    assert health_monitor._required == {"dynamodb": True, "redis": False, "smtp": False}
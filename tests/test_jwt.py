@@ -0,0 +1,125 @@
+"""
+JWT 키 테스트 (kid로 검증 키 선택, 키 교체, 만료 토큰, claims 캐시 만료)
+"""
+
+import time
+from dataclasses import replace
+from datetime import timedelta
+from types import MappingProxyType
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import jwt
+
+from dailydevq_backend.core.config import settings
+from dailydevq_backend.core.runtime_config import runtime_config
+from dailydevq_backend.utils.jwt import (
+    ClaimsCache,
+    JWTKeyRing,
+    build_keys,
+    create_access_token,
+    current_keys,
+    verify_token,
+)
+
+
+def use_keys(monkeypatch, **overrides) -> None:
+    """JWT 설정만 바꾼 스냅샷으로 교체 (설정 다시 읽기와 같은 효과)"""
+    keys = build_keys(settings.model_copy(update=overrides))
+    current = runtime_config.current
+    derived = MappingProxyType({**current.derived, "jwt": keys})
+    monkeypatch.setattr(runtime_config, "current", replace(current, derived=derived))
+
+
+def kid(token: str) -> str:
+    return jwt.get_unverified_header(token).get("kid")
+
+
+def test_token_is_verified_with_the_key_named_by_kid(monkeypatch):
+    use_keys(monkeypatch, JWT_KEY_ID="k2", JWT_SECRET="new", JWT_VERIFY_KEYS={"k1": "old"})
+    ring = current_keys().ring
+    old_token = jwt.encode({"sub": "user-1"}, "old", algorithm="HS256", headers={"kid": "k1"})
+    legacy_token = jwt.encode({"sub": "user-1"}, "new", algorithm="HS256")
+
+    assert ring.get_verify_key("k1") is ring.verify_keys["k1"]
+    assert ring.get_verify_key(None) is ring.verify_keys["k2"]
+    assert verify_token(old_token, use_cache=False)["sub"] == "user-1"
+    # kid가 없는 토큰은 현재 키로 검증한다
+    assert verify_token(legacy_token, use_cache=False)["sub"] == "user-1"
+
+
+def test_rotation_keeps_old_tokens_until_the_old_key_is_dropped(monkeypatch):
+    use_keys(monkeypatch, JWT_KEY_ID="k1", JWT_SECRET="old", JWT_VERIFY_KEYS={})
+    old_token = create_access_token("user-1")
+    assert kid(old_token) == "k1"
+
+    use_keys(monkeypatch, JWT_KEY_ID="k2", JWT_SECRET="new", JWT_VERIFY_KEYS={"k1": "old"})
+    new_token = create_access_token("user-1")
+
+    assert kid(new_token) == "k2"
+    assert verify_token(old_token)["sub"] == "user-1"
+    assert verify_token(new_token)["sub"] == "user-1"
+
+    # 키가 바뀌면 claims 캐시도 새로 만들므로 이전 키를 빼는 즉시 이전 토큰은 거부된다
+    use_keys(monkeypatch, JWT_KEY_ID="k2", JWT_SECRET="new", JWT_VERIFY_KEYS={})
+    assert verify_token(old_token) is None
+    assert verify_token(new_token)["sub"] == "user-1"
+
+
+def test_unknown_kid_and_wrong_key_are_rejected(monkeypatch):
+    use_keys(monkeypatch, JWT_KEY_ID="k1", JWT_SECRET="secret", JWT_VERIFY_KEYS={})
+    unknown = jwt.encode({"sub": "user-1"}, "secret", algorithm="HS256", headers={"kid": "k9"})
+    forged = jwt.encode({"sub": "user-1"}, "other", algorithm="HS256", headers={"kid": "k1"})
+
+    assert verify_token(unknown) is None
+    assert verify_token(forged) is None
+    assert verify_token("not-a-token") is None
+
+
+def test_expired_token_is_rejected_and_not_cached(monkeypatch):
+    use_keys(monkeypatch, JWT_KEY_ID="k1", JWT_SECRET="secret", JWT_VERIFY_KEYS={})
+    token = create_access_token("user-1", expires_delta=timedelta(seconds=-1))
+
+    assert verify_token(token) is None
+    cache = ClaimsCache(maxsize=10, ttl=60)
+    cache.set(token, {"sub": "user-1", "exp": time.time() - 1})
+    assert cache.get(token) is None
+
+
+def test_claims_cache_expires_at_ttl_or_token_exp():
+    cache = ClaimsCache(maxsize=10, ttl=0.05)
+    cache.set("short-ttl", {"sub": "user-1", "exp": time.time() + 60})
+    limited = ClaimsCache(maxsize=10, ttl=60)
+    limited.set("short-exp", {"sub": "user-1", "exp": time.time() + 0.05})
+
+    assert cache.get("short-ttl")["sub"] == "user-1"
+    assert limited.get("short-exp")["sub"] == "user-1"
+    time.sleep(0.1)
+    assert cache.get("short-ttl") is None
+    assert limited.get("short-exp") is None
+
+
+def test_verified_claims_are_served_from_cache(monkeypatch):
+    use_keys(monkeypatch, JWT_KEY_ID="k1", JWT_SECRET="secret", JWT_VERIFY_KEYS={})
+    token = create_access_token("user-1")
+
+    claims = verify_token(token)
+
+    assert current_keys().claims.get(token) is claims
+    assert verify_token(token) is claims
+
+
+def test_asymmetric_ring_publishes_only_public_keys():
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    ring = JWTKeyRing(algorithm="ES256", key_id="ec1", private_key=pem, verify_keys={})
+
+    [key] = ring.public_jwks()["keys"]
+
+    assert (key["kid"], key["alg"], key["use"]) == ("ec1", "ES256", "sig")
+    assert "d" not in key
+    assert JWTKeyRing(algorithm="HS256", secret="s", verify_keys={}).public_jwks() == {"keys": []}
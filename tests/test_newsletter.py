@@ -0,0 +1,107 @@
+"""
+뉴스레터 발송 테스트 (fakeredis 체크포인트, 가짜 SMTP/구독자)
+"""
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from dailydevq_backend.services.newsletter_service import (
+    NewsletterCheckpoint,
+    NewsletterIssue,
+    NewsletterService,
+)
+
+SUBSCRIBERS = [{"id": f"u{i}", "email": f"u{i}@example.com"} for i in range(10)]
+ISSUE = NewsletterIssue(issue_id="2026-10-19", subject="오늘의 질문")
+
+
+class FakeUsers:
+    """첫 번째 파티션에만 구독자가 있는 활성 구독자 인덱스"""
+
+    async def iter_active_subscriber_shard(self, shard, projection=None, start_key=None):
+        if shard == "0" and start_key is None:
+            yield SUBSCRIBERS, None
+
+
+class FakeSMTP:
+    pool_size = 2
+    timeout = 1
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+
+    async def send_raw(self, sender, recipients, message):
+        if recipients[0] in self.failing:
+            raise OSError("550 mailbox unavailable")
+        self.sent.extend(recipients)
+
+
+class BrokenPipeline:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args: None
+
+    async def execute(self):
+        raise RedisConnectionError("connection lost")
+
+
+class BrokenRedis:
+    """모든 명령이 연결 오류로 실패하는 Redis"""
+
+    def pipeline(self, **kwargs):
+        return BrokenPipeline()
+
+    def __getattr__(self, name):
+        async def command(*args):
+            raise RedisConnectionError("connection lost")
+
+        return command
+
+
+@pytest.fixture
+def checkpoint():
+    return NewsletterCheckpoint(fakeredis.FakeAsyncRedis(), "test-run")
+
+
+async def test_resume_retries_failed_recipients(checkpoint):
+    smtp = FakeSMTP(failing={"u3@example.com", "u7@example.com"})
+    service = NewsletterService(users=FakeUsers(), smtp=smtp)
+
+    first = await service.send_issue(ISSUE, checkpoint)
+    assert (first.sent, first.failed) == (8, 2)
+
+    # 두 번째 실행: 읽기 위치는 끝났지만 실패한 구독자만 다시 보낸다
+    smtp.failing.clear()
+    smtp.sent.clear()
+    second = await service.send_issue(ISSUE, checkpoint)
+
+    assert sorted(smtp.sent) == ["u3@example.com", "u7@example.com"]
+    assert (second.sent, second.retried, second.failed) == (2, 2, 0)
+    assert await checkpoint.failed_recipients() == []
+
+
+async def test_checkpoint_redis_error_does_not_stop_sending(checkpoint, monkeypatch):
+    monkeypatch.setattr(checkpoint.client, "pipeline", lambda **kwargs: BrokenPipeline())
+    smtp = FakeSMTP(failing={"u5@example.com"})
+    service = NewsletterService(users=FakeUsers(), smtp=smtp)
+
+    report = await service.send_issue(ISSUE, checkpoint)
+
+    assert (report.sent, report.failed) == (9, 1)
+
+
+async def test_unreadable_checkpoint_does_not_stop_sending():
+    smtp = FakeSMTP()
+    service = NewsletterService(users=FakeUsers(), smtp=smtp)
+
+    report = await service.send_issue(ISSUE, NewsletterCheckpoint(BrokenRedis(), "test-run"))
+
+    assert report.sent == len(SUBSCRIBERS)
+    assert sorted(smtp.sent) == sorted(item["email"] for item in SUBSCRIBERS)
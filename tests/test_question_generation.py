@@ -0,0 +1,114 @@
+"""
+질문 생성 파이프라인 테스트 (fake 제공자, 프롬프트 캐시, 형식 오류 재요청)
+"""
+
+import json
+
+import pytest
+
+from dailydevq_backend.core.storage import LocalObjectStore
+from dailydevq_backend.services.llm import FakeProvider, LLMRequest, LLMResponse, get_provider
+from dailydevq_backend.services.newsletter_service import issue_key
+from dailydevq_backend.services.question_generation import (
+    SYSTEM_PROMPT,
+    QuestionGenerator,
+    daily_question,
+    parse_question,
+)
+
+CATEGORIES = ["backend", "frontend"]
+
+
+class FlakyProvider(FakeProvider):
+    """처음 invalid번은 형식이 잘못된 응답을 돌려주는 제공자"""
+
+    def __init__(self, invalid: int):
+        super().__init__()
+        self.invalid = invalid
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        response = await super().complete(request)
+        if self.calls <= self.invalid:
+            return LLMResponse(text="잠시만요, 생각 중입니다", input_tokens=10, output_tokens=5)
+        return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalObjectStore(str(tmp_path))
+
+
+def test_get_provider():
+    assert isinstance(get_provider("fake", None), FakeProvider)
+    with pytest.raises(Exception, match="unknown provider"):
+        get_provider("unknown", None)
+
+
+def test_parse_question_accepts_code_block():
+    text = '```json\n{"title": "t", "body": "b", "explanation": "e", "difficulty": "hard"}\n```'
+
+    assert parse_question(text).difficulty == "hard"
+    with pytest.raises(ValueError):
+        parse_question("JSON이 없습니다")
+
+
+async def test_generates_issue_and_writes_it_to_store(store):
+    provider = FakeProvider()
+    generator = QuestionGenerator(provider, store)
+
+    issues, stats = await generator.run(["2026-10-19"], CATEGORIES)
+
+    assert (stats.questions, stats.llm_requests, stats.cache_hits) == (2, 2, 0)
+    assert stats.input_tokens > 0 and stats.failed == 0
+    stored = json.loads(await store.get(issue_key("2026-10-19")))
+    assert stored["issue_id"] == "2026-10-19"
+    assert [q["category"] for q in stored["questions"]] == CATEGORIES
+    question = daily_question(issues[0])
+    assert (question.date, question.category) == ("2026-10-19", "backend")
+
+
+async def test_rerun_uses_prompt_cache(store):
+    provider = FakeProvider()
+    first, _ = await QuestionGenerator(provider, store).run(["2026-10-19"], CATEGORIES)
+
+    second, stats = await QuestionGenerator(provider, store).run(["2026-10-19"], CATEGORIES)
+
+    assert provider.calls == 2
+    assert (stats.llm_requests, stats.cache_hits) == (0, 2)
+    assert second[0].questions == first[0].questions
+
+
+async def test_cache_key_depends_on_model_and_prompt(store):
+    generator = QuestionGenerator(FakeProvider(), store)
+    request = LLMRequest(system=SYSTEM_PROMPT, prompt="날짜: 2026-10-19")
+
+    key = generator.cache.key(generator.provider, request)
+
+    assert key == generator.cache.key(FakeProvider(), request)
+    assert key != generator.cache.key(FakeProvider(model="other"), request)
+    assert key != generator.cache.key(
+        generator.provider, LLMRequest(system=SYSTEM_PROMPT, prompt="날짜: 2026-10-20")
+    )
+
+
+async def test_invalid_response_is_retried_and_not_cached(store):
+    provider = FlakyProvider(invalid=1)
+    generator = QuestionGenerator(provider, store, concurrency=1, max_attempts=2)
+
+    issues, stats = await generator.run(["2026-10-19"], ["backend"])
+
+    assert len(issues) == 1
+    assert (stats.llm_requests, stats.invalid_responses) == (2, 1)
+    _, stats = await generator.run(["2026-10-19"], ["backend"])
+    assert stats.cache_hits == 1
+
+
+async def test_failed_date_is_skipped(store):
+    provider = FlakyProvider(invalid=1)
+    generator = QuestionGenerator(provider, store, concurrency=1, max_attempts=1)
+
+    issues, stats = await generator.run(["2026-10-19", "2026-10-20"], ["backend"])
+
+    assert len(issues) == 1
+    assert stats.failed == 1
+    assert "invalid response after 1 attempts" in stats.failed_samples[0]
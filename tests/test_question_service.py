@@ -0,0 +1,112 @@
+"""
+답변 제출 테스트 (moto: 하루 한 번, 날짜를 넘는 스트릭, 동시에 바뀐 스트릭 재시도)
+"""
+
+import uuid
+
+import pytest
+
+from dailydevq_backend.core.cache import LRUCache
+from dailydevq_backend.models.question import DailyQuestion, Streak
+from dailydevq_backend.repositories.single_table import single_table_repository
+from dailydevq_backend.services import question_service as question_service_module
+from dailydevq_backend.services.question_service import AnswerExistsError, QuestionService
+
+DAY_1, DAY_2, DAY_4 = "2031-03-01", "2031-03-02", "2031-03-04"
+BEFORE_DAY_1 = "2031-02-28"
+
+
+class RacingRepository:
+    """스트릭을 읽은 직후 races번까지 다른 요청이 같은 스트릭을 바꾸는 저장소
+
+    마지막으로 끼어든 요청은 DAY_1 전날까지 이어진 6일 스트릭을 남긴다.
+    """
+
+    def __init__(self, user_id: str, races: int):
+        self.user_id = user_id
+        self.races = races
+        self.streak_reads = 0
+
+    def __getattr__(self, name):
+        return getattr(single_table_repository, name)
+
+    async def get(self, entity_type, key):
+        entity = await single_table_repository.get(entity_type, key)
+        if entity_type is Streak:
+            self.streak_reads += 1
+            if self.races:
+                self.races -= 1
+                last_date = f"2031-02-{10 + self.races}" if self.races else BEFORE_DAY_1
+                other = Streak(self.user_id, current=6, longest=6, last_date=last_date)
+                await single_table_repository.put(other)
+        return entity
+
+
+@pytest.fixture
+async def service(dynamodb):
+    service = QuestionService(cache=LRUCache(maxsize=10, ttl=60))
+    for day in (DAY_1, DAY_2, DAY_4):
+        question = DailyQuestion(date=day, title=f"{day} 질문", body="본문", category="backend")
+        await service.publish_question(question)
+    return service
+
+
+def answer_on(monkeypatch, day: str) -> None:
+    monkeypatch.setattr(question_service_module, "today_kst", lambda: day)
+
+
+def new_user() -> str:
+    return f"user-{uuid.uuid4().hex[:12]}"
+
+
+async def test_second_answer_on_the_same_day_is_rejected(service, monkeypatch):
+    user_id = new_user()
+    answer_on(monkeypatch, DAY_1)
+
+    answer, streak = await service.submit_answer(user_id, "첫 답변")
+    assert (answer.date, answer.question_title) == (DAY_1, f"{DAY_1} 질문")
+    assert streak.current == 1
+
+    with pytest.raises(AnswerExistsError):
+        await service.submit_answer(user_id, "두 번째 답변")
+    view = await service.get_today(user_id)
+    assert [a.answer for a in view.history] == ["첫 답변"]
+    assert view.streak.current == 1
+
+
+async def test_streak_continues_across_days_and_resets_after_a_gap(service, monkeypatch):
+    user_id = new_user()
+
+    answer_on(monkeypatch, DAY_1)
+    await service.submit_answer(user_id, "1일차")
+    answer_on(monkeypatch, DAY_2)
+    _, streak = await service.submit_answer(user_id, "2일차")
+    assert (streak.current, streak.longest) == (2, 2)
+
+    answer_on(monkeypatch, DAY_4)
+    _, streak = await service.submit_answer(user_id, "4일차")
+    assert (streak.current, streak.longest, streak.last_date) == (1, 2, DAY_4)
+
+
+async def test_streak_changed_concurrently_is_reread_and_retried(service, monkeypatch):
+    user_id = new_user()
+    answer_on(monkeypatch, DAY_1)
+    racing = RacingRepository(user_id, races=1)
+    service.repository = racing
+
+    _, streak = await service.submit_answer(user_id, "답변")
+
+    # 다른 요청이 어제까지의 스트릭(6일)을 쓴 뒤 다시 읽어 이어 붙인다
+    assert racing.streak_reads == 2
+    assert (streak.current, streak.longest) == (7, 7)
+    stored = await single_table_repository.get(Streak, Streak(user_id=user_id).key)
+    assert stored.current == 7
+
+
+async def test_answer_fails_after_repeated_streak_conflicts(service, monkeypatch):
+    user_id = new_user()
+    answer_on(monkeypatch, DAY_1)
+    service.repository = RacingRepository(user_id, races=question_service_module.ANSWER_ATTEMPTS)
+
+    with pytest.raises(Exception, match="Failed to submit answer"):
+        await service.submit_answer(user_id, "답변")
@@ -0,0 +1,45 @@
+"""
+속도 제한 테스트 (신뢰하는 프록시 뒤의 클라이언트 IP별 버킷)
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from dailydevq_backend.core.rate_limit import RateLimiter, RateLimitMiddleware, RateLimitRule
+from dailydevq_backend.server import server_options
+
+PROXY = ("10.0.3.7", 40000)
+
+
+def proxied_app(forwarded_allow_ips: str):
+    """uvicorn --proxy-headers와 같은 순서로 감싼 앱 (Redis 없이 로컬 버킷으로 제한)"""
+    rule = RateLimitRule("test", limit=1, period=60)
+    app = RateLimitMiddleware(PlainTextResponse("ok"), limiter=RateLimiter(), rules={"/": rule})
+    trusted = server_options(1, "127.0.0.1", 8000, forwarded_allow_ips)["forwarded_allow_ips"]
+    return ProxyHeadersMiddleware(app, trusted_hosts=trusted)
+
+
+def get(client: TestClient, forwarded_for: str) -> int:
+    return client.get("/", headers={"X-Forwarded-For": forwarded_for}).status_code
+
+
+def test_trusted_proxy_clients_get_separate_buckets():
+    client = TestClient(proxied_app("10.0.0.0/16"), client=PROXY)
+
+    assert get(client, "203.0.113.1") == 200
+    assert get(client, "203.0.113.2") == 200
+    assert get(client, "203.0.113.1") == 429
+
+
+def test_untrusted_proxy_shares_one_bucket():
+    client = TestClient(proxied_app("127.0.0.1"), client=PROXY)
+
+    assert get(client, "198.51.100.1") == 200
+    assert get(client, "198.51.100.2") == 429
+
+
+def test_server_requires_forwarded_allow_ips():
+    with pytest.raises(Exception, match="SERVER_FORWARDED_ALLOW_IPS"):
+        server_options(1, "127.0.0.1", 8000, None)
@@ -0,0 +1,91 @@
+"""
+설정 다시 읽기 테스트 (잘못된 설정은 버림, 재시작이 필요한 설정은 무시, CORS 즉시 반영)
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse
+
+from dailydevq_backend.core.config import Settings
+from dailydevq_backend.core.cors import DynamicCORSMiddleware
+from dailydevq_backend.core.runtime_config import RuntimeConfig
+from dailydevq_backend.utils.jwt import KEY_SETTINGS, build_keys
+
+ORIGIN = "https://app.example.com"
+NEW_ORIGIN = "https://new.example.com"
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / "reload.env"
+    path.write_text(f"CORS_ORIGINS={ORIGIN}\nJWT_SECRET=first\n")
+    return path
+
+
+@pytest.fixture
+def config(env_file):
+    config = RuntimeConfig(initial=Settings(_env_file=str(env_file)), path=str(env_file))
+    config.derive("jwt", KEY_SETTINGS, build_keys)
+    return config
+
+
+def test_invalid_reload_keeps_previous_snapshot(config, env_file):
+    snapshot = config.current
+
+    env_file.write_text(f"CORS_ORIGINS={NEW_ORIGIN}\nJWT_CLAIMS_CACHE_SIZE=many\n")
+    assert not config.reload()
+    assert config.current is snapshot
+
+    # 검증은 통과해도 파생 값을 만들지 못하면(서명 키 없음) 새 설정 전체를 버린다
+    env_file.write_text(f"CORS_ORIGINS={NEW_ORIGIN}\nJWT_ALGORITHM=ES256\n")
+    assert not config.reload()
+    assert config.current is snapshot
+    assert config.current.cors_origins == {ORIGIN}
+
+
+def test_non_reloadable_settings_are_ignored(config, env_file, caplog):
+    snapshot = config.current
+
+    env_file.write_text(
+        f"CORS_ORIGINS={ORIGIN}\nJWT_SECRET=first\nJWT_ACCESS_TOKEN_EXPIRE_MINUTES=60\n"
+    )
+
+    assert not config.reload()
+    assert config.current is snapshot
+    assert "JWT_ACCESS_TOKEN_EXPIRE_MINUTES" in caplog.text
+
+
+def test_reload_rebuilds_only_changed_derived_values(config, env_file):
+    keys = config.current.derived["jwt"]
+
+    env_file.write_text(f"CORS_ORIGINS={NEW_ORIGIN}\nJWT_SECRET=first\n")
+    assert config.reload()
+    assert config.current.version == 2
+    assert config.current.derived["jwt"] is keys
+
+    env_file.write_text(f"CORS_ORIGINS={NEW_ORIGIN}\nJWT_SECRET=second\n")
+    assert config.reload()
+    assert config.current.derived["jwt"] is not keys
+    assert config.current.settings.JWT_SECRET == "second"
+
+
+def test_cors_change_takes_effect_without_restart(config, env_file):
+    app = DynamicCORSMiddleware(
+        PlainTextResponse("ok"),
+        config=config,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    client = TestClient(app)
+
+    def allowed(origin: str) -> bool:
+        response = client.get("/", headers={"Origin": origin})
+        return response.headers.get("access-control-allow-origin") == origin
+
+    assert allowed(ORIGIN) and not allowed(NEW_ORIGIN)
+
+    env_file.write_text(f"CORS_ORIGINS={NEW_ORIGIN}\nJWT_SECRET=first\n")
+    assert config.reload()
+
+    assert allowed(NEW_ORIGIN) and not allowed(ORIGIN)
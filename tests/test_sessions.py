@@ -0,0 +1,116 @@
+"""
+로그인 세션 테스트 (refresh token 회전, 재사용 탐지, 전체 로그아웃, 폐기 확인)
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from dailydevq_backend.api.deps import get_current_claims
+from dailydevq_backend.services.session_service import (
+    InvalidRefreshTokenError,
+    SessionService,
+    session_service,
+)
+from dailydevq_backend.utils.jwt import verify_token
+
+
+def session_id(access_token: str) -> str:
+    return verify_token(access_token)["sid"]
+
+
+async def claims_for(access_token: str):
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+    return await get_current_claims(credentials)
+
+
+async def test_rotate_issues_new_pair_and_invalidates_old_token(redis):
+    first = await session_service.issue("user-1")
+
+    second = await session_service.rotate(first.refresh_token)
+
+    assert second.refresh_token != first.refresh_token
+    assert session_id(second.access_token) == session_id(first.access_token)
+    assert (await session_service.rotate(second.refresh_token)).refresh_token
+    with pytest.raises(InvalidRefreshTokenError):
+        await session_service.rotate("unknown-token")
+
+
+async def test_reused_refresh_token_revokes_session(redis):
+    first = await session_service.issue("user-1")
+    second = await session_service.rotate(first.refresh_token)
+
+    # 이미 회전된 토큰이 다시 오면 세션 전체를 폐기한다
+    with pytest.raises(InvalidRefreshTokenError):
+        await session_service.rotate(first.refresh_token)
+
+    assert await session_service.is_revoked(session_id(first.access_token))
+    with pytest.raises(InvalidRefreshTokenError):
+        await session_service.rotate(second.refresh_token)
+
+
+async def test_revoke_all_logs_out_every_session(redis):
+    pairs = [await session_service.issue("user-1") for _ in range(2)]
+    other = await session_service.issue("user-2")
+
+    assert await session_service.revoke_all("user-1") == 2
+
+    for pair in pairs:
+        assert await session_service.is_revoked(session_id(pair.access_token))
+        with pytest.raises(InvalidRefreshTokenError):
+            await session_service.rotate(pair.refresh_token)
+    assert not await session_service.is_revoked(session_id(other.access_token))
+    assert await session_service.revoke_all("user-1") == 0
+
+
+async def test_current_claims_rejects_revoked_session(redis):
+    tokens = await session_service.issue("user-1")
+    assert (await claims_for(tokens.access_token))["sub"] == "user-1"
+
+    await session_service.revoke_session("user-1", session_id(tokens.access_token))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await claims_for(tokens.access_token)
+    assert exc_info.value.status_code == 401
+
+
+async def test_revocation_check_fails_closed_without_redis(redis, monkeypatch):
+    tokens = await session_service.issue("user-1")
+
+    async def zscore(key, member):
+        raise RedisConnectionError("connection refused")
+
+    monkeypatch.setattr(redis, "zscore", zscore)
+
+    assert await SessionService(use_bloom=False).is_revoked(session_id(tokens.access_token))
+    with pytest.raises(HTTPException):
+        await claims_for(tokens.access_token)
+
+
+async def test_bloom_skips_redis_and_follows_other_workers(redis):
+    worker = SessionService(use_bloom=True, sync_interval=60)
+    await worker.start()
+    try:
+        tokens = await session_service.issue("user-1")
+        sid = session_id(tokens.access_token)
+
+        async def zscore(key, member):
+            raise RedisConnectionError("connection refused")
+
+        # 폐기되지 않은 세션은 Bloom filter만 보고 허용한다
+        redis.zscore = zscore
+        assert not await worker.is_revoked(sid)
+        del redis.zscore
+
+        # 다른 워커가 폐기하면 pub/sub으로 전달된다
+        await session_service.revoke_session("user-1", sid)
+        for _ in range(100):
+            if sid in worker._bloom:
+                break
+            await asyncio.sleep(0.01)
+        assert await worker.is_revoked(sid)
+    finally:
+        await worker.stop()
@@ -0,0 +1,50 @@
+"""
+콜드 스타트 회귀 테스트 (무거운 import 지연, 워밍업을 기다리지 않는 기동)
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+from dailydevq_backend.core.database import async_dynamodb_client
+
+# 처음 쓸 때만 불러와야 하는 모듈 (import 시간의 대부분을 차지한다)
+DEFERRED_MODULES = ["aioboto3", "aiobotocore", "boto3", "botocore.session", "aiosmtplib"]
+
+
+def test_importing_app_defers_heavy_modules():
+    # 이미 불러온 모듈이 섞이지 않게 새 프로세스에서 확인한다
+    code = (
+        "import sys\n"
+        "import dailydevq_backend.main\n"
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "OTEL_ENABLED": "false"},
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_serves_requests_before_warm_up_finishes(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from dailydevq_backend.main import app
+
+    warmed_up = []
+    start = async_dynamodb_client.start
+
+    async def slow_start():
+        await asyncio.sleep(0.5)
+        await start()
+        warmed_up.append(True)
+
+    monkeypatch.setattr(async_dynamodb_client, "start", slow_start)
+    with TestClient(app) as client:
+        assert client.get("/health/live").status_code == 200
+        assert not warmed_up
@@ -0,0 +1,62 @@
+"""
+구독자 대량 가져오기 테스트 (기존 사용자 보존, 캐시 무효화)
+"""
+
+import uuid
+
+from dailydevq_backend.repositories.user_repository import user_repository
+from dailydevq_backend.schemas.user import SubscriptionStatus, UserCreate
+from dailydevq_backend.services.email_filter import legacy_email_filter
+from dailydevq_backend.services.subscription_import import subscription_import_service
+from dailydevq_backend.services.user_service import user_service
+
+
+def new_email() -> str:
+    return f"import-{uuid.uuid4().hex[:12]}@example.com"
+
+
+async def stream(*emails: str):
+    for email in emails:
+        yield email
+
+
+async def test_import_skips_existing_users(dynamodb):
+    existing, new = new_email(), new_email()
+    await user_service.create_user(UserCreate(email=existing, name="기존 사용자"))
+
+    report = await subscription_import_service.import_emails(stream(existing, new))
+
+    assert (report.imported, report.existing) == (1, 1)
+    user = await user_service.get_user_by_email(existing)
+    assert user.name == "기존 사용자"
+
+
+async def test_import_does_not_overwrite_user_created_after_lookup(dynamodb, monkeypatch):
+    email = new_email()
+    user = await user_service.create_user(UserCreate(email=email, name="방금 가입"))
+    await user_service.unsubscribe_user(email)
+
+    # 조회와 쓰기 사이에 가입한 경우: 조회 단계에서는 보이지 않는다
+    async def batch_get(user_ids, projection=None):
+        return []
+
+    monkeypatch.setattr(user_repository, "batch_get", batch_get)
+    monkeypatch.setattr(legacy_email_filter, "might_contain", lambda email: False)
+    report = await subscription_import_service.import_emails(stream(email))
+
+    assert (report.imported, report.existing, report.failed) == (0, 1, 0)
+    stored = await user_service.get_user_by_id(user.id)
+    assert stored.name == "방금 가입"
+    assert stored.subscription_status == SubscriptionStatus.UNSUBSCRIBED.value
+
+
+async def test_import_invalidates_cached_misses(dynamodb):
+    email = new_email()
+    assert await user_service.get_subscription_status(email) is None
+    assert await user_service.get_user_by_email(email) is None
+
+    report = await subscription_import_service.import_emails(stream(email))
+
+    assert report.imported == 1
+    assert await user_service.get_subscription_status(email) == SubscriptionStatus.ACTIVE.value
+    assert (await user_service.get_user_by_email(email)).email == email
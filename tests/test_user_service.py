@@ -0,0 +1,105 @@
+"""
+UserService 조건부 쓰기 테스트 (이메일 기반 ID, 이전 사용자)
+"""
+
+import asyncio
+import uuid
+
+from dailydevq_backend.models.user import EMAIL_INDEX, UserModel, user_id_for_email
+from dailydevq_backend.repositories.user_repository import (
+    ConditionalCheckFailedError,
+    user_repository,
+)
+from dailydevq_backend.schemas.user import SubscriptionStatus, UserCreate
+from dailydevq_backend.services.user_service import user_service
+
+
+def new_email() -> str:
+    return f"user-{uuid.uuid4().hex[:12]}@example.com"
+
+
+async def put_legacy_user(email: str, status: str = "active") -> str:
+    """이메일 기반 ID 도입 전처럼 임의 id로 저장한 사용자"""
+    user = UserModel(id=str(uuid.uuid4()), email=email, subscription_status=status)
+    await user_repository.put_item(user.to_dict())
+    return user.id
+
+
+async def users_with_email(email: str):
+    return await user_repository.query_index(EMAIL_INDEX, "email", email)
+
+
+async def test_create_user_uses_email_derived_id(dynamodb):
+    email = new_email()
+
+    user = await user_service.create_user(UserCreate(email=email))
+
+    assert user.id == user_id_for_email(email)
+    assert user.subscription_status == SubscriptionStatus.ACTIVE.value
+
+
+async def test_concurrent_subscribes_create_one_user(dynamodb):
+    email = new_email()
+    request = UserCreate(email=email)
+
+    users = await asyncio.gather(*(user_service.create_user(request) for _ in range(10)))
+
+    assert {user.id for user in users} == {user_id_for_email(email)}
+    assert len(await users_with_email(email)) == 1
+
+
+async def test_create_user_retries_when_item_is_deleted_before_reread(dynamodb, monkeypatch):
+    email = new_email()
+    update_item = user_repository.update_item
+    calls = []
+
+    # 조건 실패 직후 다른 요청이 아이템을 지운 경우: 다시 읽으면 없다
+    async def deleted_once(*args, **kwargs):
+        calls.append(True)
+        if len(calls) == 1:
+            raise ConditionalCheckFailedError()
+        return await update_item(*args, **kwargs)
+
+    monkeypatch.setattr(user_repository, "update_item", deleted_once)
+    user = await user_service.create_user(UserCreate(email=email))
+
+    assert len(calls) == 2
+    assert user.id == user_id_for_email(email)
+    assert user.subscription_status == SubscriptionStatus.ACTIVE.value
+
+
+async def test_resubscribe_legacy_user_keeps_its_id(dynamodb):
+    email = new_email()
+    legacy_id = await put_legacy_user(email, SubscriptionStatus.UNSUBSCRIBED.value)
+
+    user = await user_service.create_user(UserCreate(email=email))
+
+    assert user.id == legacy_id
+    assert user.subscription_status == SubscriptionStatus.ACTIVE.value
+    assert await user_repository.get_item(user_id_for_email(email)) is None
+    assert len(await users_with_email(email)) == 1
+
+
+async def test_subscribe_active_legacy_user_returns_existing(dynamodb):
+    email = new_email()
+    legacy_id = await put_legacy_user(email)
+
+    user = await user_service.create_user(UserCreate(email=email))
+
+    assert user.id == legacy_id
+    assert len(await users_with_email(email)) == 1
+
+
+async def test_unsubscribe_legacy_user(dynamodb):
+    email = new_email()
+    legacy_id = await put_legacy_user(email)
+
+    assert await user_service.unsubscribe_user(email)
+
+    user = await user_service.get_user_by_id(legacy_id)
+    assert user.subscription_status == SubscriptionStatus.UNSUBSCRIBED.value
+    assert await user_service.get_subscription_status(email) == "unsubscribed"
+
+
+async def test_unsubscribe_unknown_email(dynamodb):
+    assert not await user_service.unsubscribe_user(new_email())